@@ -7,34 +7,180 @@ Public API of this module is defined by __all__.
 """
 
 import asyncio
-from collections.abc import Callable, Collection
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Callable, Collection, Hashable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures._base import CancelledError
 import contextlib
+import contextvars
+from dataclasses import replace
 from functools import wraps
+import itertools
 import logging
+import threading
 from time import monotonic
 from typing import Any, Final, cast
 
-from aiohomematic.const import BLOCK_LOG_TIMEOUT
+from aiohomematic.const import (
+    BLOCK_LOG_TIMEOUT,
+    DEFAULT_EXECUTOR_LANE_SIZES,
+    DEFAULT_TASK_BUDGETS,
+    TASK_DROP_WARN_INTERVAL,
+    ExecutorLane,
+    TaskBudget,
+    TaskBudgetPolicy,
+    TaskCategory,
+)
 from aiohomematic.exceptions import AioHomematicException
 from aiohomematic.interfaces import TaskSchedulerProtocol
+from aiohomematic.metrics._protocols import ExecutorPoolForMetricsProtocol, TaskSchedulerForMetricsProtocol
+from aiohomematic.metrics.stats import ExecutorLaneStats, TaskCategoryStats
 import aiohomematic.support as hms
 from aiohomematic.support import extract_exc_args
 from aiohomematic.type_aliases import AsyncTaskFactoryAny, CallableAny, CoroutineAny
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+# Categories whose tasks carry values or events; dropping one loses a state change
+_VALUE_TASK_CATEGORIES: Final = frozenset({TaskCategory.EVENT, TaskCategory.RPC_CALLBACK})
 
-class Looper(TaskSchedulerProtocol):
-    """Helper class for event loop support."""
 
-    __slots__ = ("_loop_store", "_tasks")
+class ExecutorPool(ExecutorPoolForMetricsProtocol):
+    """
+    Process-wide thread pools for blocking work, split into lanes.
+
+    Every lane has its own ThreadPoolExecutor, so slow jobs of one lane (e.g. storage
+    writes) never delay the jobs of another lane (e.g. XML-RPC requests). The pools are
+    created on first use and shared by all Looper instances of the process, so the number
+    of threads does not grow with the number of interfaces and centrals.
+
+    Every central registers the lane sizes of its configuration. The RPC lane gets the sum
+    of the registered sizes, because the blocking requests of all centrals run at the same
+    time; the other lanes get the largest registered size.
+    """
+
+    __slots__ = ("_default_lane_sizes", "_executors", "_lane_sizes", "_lock", "_registered", "_stats")
+
+    def __init__(self, *, lane_sizes: Mapping[ExecutorLane, int] = DEFAULT_EXECUTOR_LANE_SIZES) -> None:
+        """Initialize the executor pool."""
+        self._lock: Final = threading.Lock()
+        self._default_lane_sizes: Final[Mapping[ExecutorLane, int]] = {
+            lane: max(1, lane_sizes.get(lane, DEFAULT_EXECUTOR_LANE_SIZES[lane])) for lane in ExecutorLane
+        }
+        self._lane_sizes: Final[dict[ExecutorLane, int]] = dict(self._default_lane_sizes)
+        self._registered: Final[dict[str, Mapping[ExecutorLane, int]]] = {}
+        self._executors: Final[dict[ExecutorLane, ThreadPoolExecutor]] = {}
+        self._stats: Final = {lane: ExecutorLaneStats(max_workers=size) for lane, size in self._lane_sizes.items()}
+
+    @property
+    def lane_stats(self) -> Mapping[str, ExecutorLaneStats]:
+        """Return a copy of the load statistics per lane."""
+        with self._lock:
+            return {str(lane): replace(stats) for lane, stats in self._stats.items()}
+
+    def register(self, *, name: str, lane_sizes: Mapping[ExecutorLane, int]) -> None:
+        """Register the lane sizes requested by a central and resize the lanes."""
+        with self._lock:
+            self._registered[name] = {
+                lane: max(1, lane_sizes.get(lane, DEFAULT_EXECUTOR_LANE_SIZES[lane])) for lane in ExecutorLane
+            }
+            self._resize()
+
+    def submit[T](self, *, lane: ExecutorLane, target: Callable[..., T], args: tuple[Any, ...] = ()) -> Future[T]:
+        """Submit a job to a lane and track its queue and wait time."""
+        stats = self._stats[lane]
+        submitted_at = monotonic()
+
+        def _run() -> T:
+            with self._lock:
+                stats.record_start(wait_ms=(monotonic() - submitted_at) * 1000)
+            try:
+                return target(*args)
+            finally:
+                with self._lock:
+                    stats.record_done()
+
+        with self._lock:
+            if (executor := self._executors.get(lane)) is None:
+                executor = self._executors[lane] = ThreadPoolExecutor(
+                    max_workers=self._lane_sizes[lane], thread_name_prefix=f"aiohomematic-{lane}"
+                )
+            stats.record_submit()
+            try:
+                # Run in a copy of the caller's context, like asyncio.to_thread
+                future = executor.submit(contextvars.copy_context().run, _run)
+            except RuntimeError:
+                stats.record_cancel()
+                raise
+        future.add_done_callback(self._on_job_done(stats=stats))
+        return future
+
+    def unregister(self, *, name: str) -> None:
+        """Remove the lane sizes requested by a central and resize the lanes."""
+        with self._lock:
+            if self._registered.pop(name, None) is not None:
+                self._resize()
+
+    def _on_job_done(self, *, stats: ExecutorLaneStats) -> Callable[[Future[Any]], None]:
+        """Return a done callback that releases the queue slot of a job cancelled before it started."""
+
+        def _callback(future: Future[Any]) -> None:
+            if future.cancelled():
+                with self._lock:
+                    stats.record_cancel()
+
+        return _callback
+
+    def _resize(self) -> None:
+        """
+        Set the number of worker threads per lane from the registered lane sizes.
+
+        The pool of a resized lane is shut down without waiting; running and queued jobs
+        still complete, new jobs go to a pool with the new size. Must hold the lock.
+        """
+        for lane in ExecutorLane:
+            requested = [lane_sizes[lane] for lane_sizes in self._registered.values()]
+            if not requested:
+                size = self._default_lane_sizes[lane]
+            else:
+                size = sum(requested) if lane == ExecutorLane.RPC else max(requested)
+            if size == self._lane_sizes[lane]:
+                continue
+            self._lane_sizes[lane] = size
+            self._stats[lane].max_workers = size
+            if (executor := self._executors.pop(lane, None)) is not None:
+                executor.shutdown(wait=False)
+
+
+EXECUTOR_POOL: Final = ExecutorPool()
+
+
+class Looper(TaskSchedulerProtocol, TaskSchedulerForMetricsProtocol):
+    """
+    Helper class for event loop support.
 
-    def __init__(self) -> None:
+    Background tasks are counted per TaskCategory. A category with a budget runs at
+    most budget.limit tasks at the same time; further tasks are dropped, or wait in
+    a queue of the category until a running task finished (AWAIT: in order of
+    creation, COALESCE: one waiting task per name, the latest wins).
+    """
+
+    __slots__ = ("_budgets", "_drop_warned", "_loop_store", "_queue_keys", "_queued", "_stats", "_tasks")
+
+    def __init__(self, *, task_budgets: Mapping[TaskCategory, TaskBudget] = DEFAULT_TASK_BUDGETS) -> None:
         """Initialize the loop helper."""
         self._tasks: Final[set[asyncio.Future[Any]]] = set()
         self._loop_store: asyncio.AbstractEventLoop | None = None
+        self._budgets: Final[dict[TaskCategory, TaskBudget]] = dict(task_budgets)
+        self._queued: Final[dict[TaskCategory, dict[Hashable, tuple[CoroutineAny | AsyncTaskFactoryAny, str]]]] = {
+            category: {} for category in TaskCategory
+        }
+        self._queue_keys: Final = itertools.count()
+        self._stats: Final = {
+            category: TaskCategoryStats(limit=budget.limit if (budget := self._budgets.get(category)) else 0)
+            for category in TaskCategory
+        }
+        # Time and drop count of the last warning about dropped tasks per category
+        self._drop_warned: Final[dict[TaskCategory, tuple[float, int]]] = {}
 
     @property
     def _loop(self) -> asyncio.AbstractEventLoop:
@@ -53,16 +199,21 @@ class Looper(TaskSchedulerProtocol):
                 self._loop_store = asyncio.get_event_loop()
         return self._loop_store
 
+    @property
+    def task_stats(self) -> Mapping[str, TaskCategoryStats]:
+        """Return a copy of the background task statistics per category."""
+        return {str(category): replace(stats) for category, stats in self._stats.items()}
+
     def async_add_executor_job[T](
         self,
         target: Callable[..., T],
         *args: Any,
         name: str,
-        executor: ThreadPoolExecutor | None = None,
+        lane: ExecutorLane = ExecutorLane.CPU,
     ) -> asyncio.Future[T]:
-        """Add an executor job from within the event_loop."""
+        """Add an executor job to a lane of the shared executor pool from within the event_loop."""
         try:
-            task = self._loop.run_in_executor(executor, target, *args)
+            task = asyncio.wrap_future(EXECUTOR_POOL.submit(lane=lane, target=target, args=args), loop=self._loop)
             self._tasks.add(task)
             task.add_done_callback(self._tasks.remove)
         except (TimeoutError, CancelledError) as err:  # pragma: no cover
@@ -117,12 +268,23 @@ class Looper(TaskSchedulerProtocol):
                     _LOGGER.debug("Waiting for task: %s", task)
 
     def cancel_tasks(self) -> None:
-        """Cancel running tasks."""
+        """Cancel running tasks and drop waiting ones."""
+        for category, queued in self._queued.items():
+            for target, _name in queued.values():
+                self._stats[category].record_dequeue()
+                _close_target(target=target)
+            queued.clear()
         for task in self._tasks.copy():
             if not task.cancelled():
                 task.cancel()
 
-    def create_task(self, *, target: CoroutineAny | AsyncTaskFactoryAny, name: str) -> None:
+    def create_task(
+        self,
+        *,
+        target: CoroutineAny | AsyncTaskFactoryAny,
+        name: str,
+        category: TaskCategory = TaskCategory.DEFAULT,
+    ) -> None:
         """
         Schedule a coroutine to run in the loop.
 
@@ -130,15 +292,14 @@ class Looper(TaskSchedulerProtocol):
         callable that returns a coroutine. The callable form defers coroutine
         creation until inside the event loop, which avoids "was never awaited"
         warnings if callers only inspect the parameters (e.g. in tests).
+        The task counts against the budget of its category.
         """
         try:
-            self._loop.call_soon_threadsafe(self._async_create_task, target, name)
+            self._loop.call_soon_threadsafe(self._async_create_task, target, name, category)
         except CancelledError:
             # Scheduling failed; if a coroutine object was provided, close it to
             # avoid 'was never awaited' warnings.
-            if asyncio.iscoroutine(target):
-                with contextlib.suppress(Exception):
-                    getattr(target, "close", lambda: None)()
+            _close_target(target=target)
             _LOGGER.debug("create_task: task cancelled for %s", name)
             return
 
@@ -154,16 +315,20 @@ class Looper(TaskSchedulerProtocol):
             return None
 
     def _async_create_task(  # kwonly: disable
-        self, target: CoroutineAny | AsyncTaskFactoryAny, name: str
-    ) -> asyncio.Task[Any]:
-        """Create a task from within the event loop. Must be run in the event loop."""
-        # If target is a callable, call it here to create the coroutine inside the loop
-        coro: CoroutineAny = target if asyncio.iscoroutine(target) else target()
-        task = self._loop.create_task(coro, name=name)
-        self._tasks.add(task)
-        task.add_done_callback(self._tasks.remove)
-        task.add_done_callback(_log_task_exception)
-        return task
+        self,
+        target: CoroutineAny | AsyncTaskFactoryAny,
+        name: str,
+        category: TaskCategory = TaskCategory.DEFAULT,
+    ) -> asyncio.Task[Any] | None:
+        """
+        Create a task from within the event loop. Must be run in the event loop.
+
+        Return None if the category is over budget and the task was queued or dropped.
+        """
+        if (budget := self._budgets.get(category)) is not None and self._stats[category].running >= budget.limit:
+            self._defer_task(target=target, name=name, category=category, budget=budget)
+            return None
+        return self._start_task(target=target, name=name, category=category)
 
     async def _await_and_log_pending(
         self, *, pending: Collection[asyncio.Future[Any]], deadline: float | None
@@ -195,6 +360,88 @@ class Looper(TaskSchedulerProtocol):
                 return pending_set
         return set()
 
+    def _defer_task(
+        self, *, target: CoroutineAny | AsyncTaskFactoryAny, name: str, category: TaskCategory, budget: TaskBudget
+    ) -> None:
+        """Queue or drop a task of a category that is at its limit."""
+        stats = self._stats[category]
+        queued = self._queued[category]
+        if budget.policy == TaskBudgetPolicy.COALESCE and name in queued:
+            _close_target(target=queued[name][0])
+            queued[name] = (target, name)
+            stats.record_coalesce()
+            return
+        if budget.policy == TaskBudgetPolicy.DROP or (
+            budget.max_queued is not None and len(queued) >= budget.max_queued
+        ):
+            _close_target(target=target)
+            stats.record_drop()
+            if category in _VALUE_TASK_CATEGORIES:
+                self._warn_dropped(name=name, category=category, waiting=len(queued))
+            else:
+                _LOGGER.debug(
+                    "CREATE_TASK: Dropped task %s, category %s is over budget (%i running, %i waiting)",
+                    name,
+                    category,
+                    stats.running,
+                    len(queued),
+                )
+            return
+        key: Hashable = name if budget.policy == TaskBudgetPolicy.COALESCE else next(self._queue_keys)
+        queued[key] = (target, name)
+        stats.record_enqueue()
+
+    def _on_task_done(self, *, category: TaskCategory) -> Callable[[asyncio.Future[Any]], None]:
+        """Return a done callback that frees the slot of a task and starts the next waiting task."""
+
+        def _callback(task: asyncio.Future[Any]) -> None:
+            self._tasks.discard(task)
+            self._stats[category].record_done()
+            if queued := self._queued[category]:
+                target, name = queued.pop(next(iter(queued)))
+                self._stats[category].record_dequeue()
+                self._start_task(target=target, name=name, category=category)
+
+        return _callback
+
+    def _start_task(
+        self, *, target: CoroutineAny | AsyncTaskFactoryAny, name: str, category: TaskCategory
+    ) -> asyncio.Task[Any]:
+        """Start a task and track it until it is done."""
+        # If target is a callable, call it here to create the coroutine inside the loop
+        coro: CoroutineAny = target if asyncio.iscoroutine(target) else target()
+        task = self._loop.create_task(coro, name=name)
+        self._tasks.add(task)
+        self._stats[category].record_start()
+        task.add_done_callback(self._on_task_done(category=category))
+        task.add_done_callback(_log_task_exception)
+        return task
+
+    def _warn_dropped(self, *, name: str, category: TaskCategory, waiting: int) -> None:
+        """Log a warning about dropped events or callbacks, at most once per TASK_DROP_WARN_INTERVAL."""
+        stats = self._stats[category]
+        now = monotonic()
+        warned_at, warned_dropped = self._drop_warned.get(category, (None, 0))
+        if warned_at is not None and now - warned_at < TASK_DROP_WARN_INTERVAL:
+            return
+        self._drop_warned[category] = (now, stats.dropped)
+        _LOGGER.warning(  # i18n-log: ignore
+            "CREATE_TASK: Dropped %i task(s) of category %s since the last warning, last %s "
+            "(%i running, %i waiting). Values or events are lost",
+            stats.dropped - warned_dropped,
+            category,
+            name,
+            stats.running,
+            waiting,
+        )
+
+
+def _close_target(*, target: CoroutineAny | AsyncTaskFactoryAny) -> None:
+    """Close a coroutine that will not run to avoid 'was never awaited' warnings."""
+    if asyncio.iscoroutine(target):
+        with contextlib.suppress(Exception):
+            target.close()
+
 
 def _log_task_exception(task: asyncio.Task[Any]) -> None:  # kwonly: disable
     """Log unhandled exceptions in background tasks."""
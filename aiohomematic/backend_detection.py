@@ -117,7 +117,7 @@ async def detect_backend(
     validate_host(host=effective_config.host)
 
     _LOGGER.info(
-        i18n.tr(
+        i18n.lazy_tr(
             key="log.backend_detection.detect_backend.starting",
             host=effective_config.host,
             total_timeout=effective_config.total_timeout,
@@ -129,7 +129,7 @@ async def detect_backend(
             return await _do_detect_backend(config=effective_config, client_session=client_session)
     except TimeoutError:
         _LOGGER.warning(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.backend_detection.detect_backend.total_timeout",
                 host=effective_config.host,
                 total_timeout=effective_config.total_timeout,
@@ -158,7 +158,7 @@ async def _do_detect_backend(
 
     for interface, port, tls in ports_to_probe:
         _LOGGER.info(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.backend_detection.detect_backend.probing",
                 host=config.host,
                 port=port,
@@ -180,7 +180,7 @@ async def _do_detect_backend(
         # Check if detection should abort (host unreachable)
         if version is _ABORT_DETECTION:
             _LOGGER.info(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.backend_detection.detect_backend.aborting",
                     host=config.host,
                 )
@@ -193,11 +193,11 @@ async def _do_detect_backend(
         # Type narrowing: version is now str (not _ABORT_DETECTION or None)
         assert isinstance(version, str)  # noqa: S101
 
-        _LOGGER.info(i18n.tr(key="log.backend_detection.detect_backend.found_version", version=version, port=port))
+        _LOGGER.info(i18n.lazy_tr(key="log.backend_detection.detect_backend.found_version", version=version, port=port))
 
         # Determine backend type from version string
         backend = _determine_backend(version=version)
-        _LOGGER.info(i18n.tr(key="log.backend_detection.detect_backend.backend_type", backend=backend))
+        _LOGGER.info(i18n.lazy_tr(key="log.backend_detection.detect_backend.backend_type", backend=backend))
 
         if backend in (Backend.HOMEGEAR, Backend.PYDEVCCU):
             # Homegear/PyDevCCU only supports BidCos-RF
@@ -222,10 +222,12 @@ async def _do_detect_backend(
         )
 
         if interfaces:
-            _LOGGER.info(i18n.tr(key="log.backend_detection.detect_backend.found_interfaces", interfaces=interfaces))
+            _LOGGER.info(
+                i18n.lazy_tr(key="log.backend_detection.detect_backend.found_interfaces", interfaces=interfaces)
+            )
         else:
             # Fallback: use the interface we connected to
-            _LOGGER.info(i18n.tr(key="log.backend_detection.detect_backend.json_rpc_fallback"))
+            _LOGGER.info(i18n.lazy_tr(key="log.backend_detection.detect_backend.json_rpc_fallback"))
             interfaces = (interface,)
 
         return BackendDetectionResult(
@@ -239,7 +241,7 @@ async def _do_detect_backend(
             https_redirect_enabled=https_redirect_enabled,
         )
 
-    _LOGGER.info(i18n.tr(key="log.backend_detection.detect_backend.no_backend_found", host=config.host))
+    _LOGGER.info(i18n.lazy_tr(key="log.backend_detection.detect_backend.no_backend_found", host=config.host))
     return None
 
 
@@ -310,7 +312,7 @@ async def _probe_xml_rpc_port(
     except NoConnectionException as exc:
         # Connection failed on this port - log and try next port
         _LOGGER.info(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.backend_detection.xml_rpc.probe_failed",
                 host=host,
                 port=port,
@@ -322,7 +324,7 @@ async def _probe_xml_rpc_port(
     except TimeoutError:
         # Timeout likely means host is unreachable - abort detection
         _LOGGER.info(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.backend_detection.xml_rpc.probe_timeout_abort",
                 host=host,
                 port=port,
@@ -334,7 +336,7 @@ async def _probe_xml_rpc_port(
         if oserr.errno in (errno.ETIMEDOUT, errno.EHOSTUNREACH, errno.ENETUNREACH):
             # Fatal error: host/network unreachable - abort detection
             _LOGGER.info(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.backend_detection.xml_rpc.probe_unreachable",
                     host=host,
                     port=port,
@@ -345,7 +347,7 @@ async def _probe_xml_rpc_port(
             return _ABORT_DETECTION
         # ECONNREFUSED or other - port closed, but host might be reachable
         _LOGGER.info(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.backend_detection.xml_rpc.probe_failed",
                 host=host,
                 port=port,
@@ -356,7 +358,7 @@ async def _probe_xml_rpc_port(
         return None
     except BaseHomematicException as exc:
         _LOGGER.info(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.backend_detection.xml_rpc.probe_failed",
                 host=host,
                 port=port,
@@ -367,7 +369,7 @@ async def _probe_xml_rpc_port(
         return None
     except Exception as exc:  # noqa: BLE001 - probe must not propagate; any failure = not this backend
         _LOGGER.info(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.backend_detection.xml_rpc.probe_error",
                 host=host,
                 port=port,
@@ -446,7 +448,7 @@ async def _query_json_rpc_interfaces(
     scheme = "https" if tls else "http"
     device_url = f"{scheme}://{host}:{port}"
 
-    _LOGGER.info(i18n.tr(key="log.backend_detection.json_rpc.querying", url=device_url))
+    _LOGGER.info(i18n.lazy_tr(key="log.backend_detection.json_rpc.querying", url=device_url))
 
     json_rpc_client: AioJsonRpcAioHttpClient | None = None
     try:
@@ -468,7 +470,7 @@ async def _query_json_rpc_interfaces(
             try:
                 installed_interfaces.append(Interface(iface_name))
             except ValueError:
-                _LOGGER.info(i18n.tr(key="log.backend_detection.json_rpc.unknown_interface", interface=iface_name))
+                _LOGGER.info(i18n.lazy_tr(key="log.backend_detection.json_rpc.unknown_interface", interface=iface_name))
 
         # Verify each interface is actually running via is_present check
         present_interfaces: list[Interface] = []
@@ -477,21 +479,21 @@ async def _query_json_rpc_interfaces(
                 if await json_rpc_client.is_present(interface=interface):
                     present_interfaces.append(interface)
                     _LOGGER.debug(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.backend_detection.json_rpc.interface_present",
                             interface=interface.value,
                         )
                     )
                 else:
                     _LOGGER.warning(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.backend_detection.json_rpc.interface_not_present",
                             interface=interface.value,
                         )
                     )
             except Exception as exc:  # noqa: BLE001 - per-interface probe; log and continue checking others
                 _LOGGER.warning(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.backend_detection.json_rpc.is_present_failed",
                         interface=interface.value,
                         reason=str(exc),
@@ -502,15 +504,15 @@ async def _query_json_rpc_interfaces(
 
     except AuthFailure:
         # Re-raise authentication failures so they can be handled by the caller
-        _LOGGER.warning(i18n.tr(key="log.backend_detection.json_rpc.auth_failed", url=device_url))
+        _LOGGER.warning(i18n.lazy_tr(key="log.backend_detection.json_rpc.auth_failed", url=device_url))
         raise
     except NoConnectionException:
         # Connection failed on this port - log and try next port
-        _LOGGER.info(i18n.tr(key="log.backend_detection.json_rpc.connection_failed", url=device_url))
+        _LOGGER.info(i18n.lazy_tr(key="log.backend_detection.json_rpc.connection_failed", url=device_url))
         return None
     except Exception as exc:  # noqa: BLE001 - query must not propagate; any failure = not this backend
         _LOGGER.info(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.backend_detection.json_rpc.query_failed",
                 url=device_url,
                 exc_type=type(exc).__name__,
@@ -74,6 +74,7 @@ from aiohomematic.central.device_registry import DeviceRegistry
 from aiohomematic.central.health import CentralHealth, ConnectionHealth, HealthTracker
 from aiohomematic.central.query_facade import DeviceQueryFacade
 from aiohomematic.central.registry import CENTRAL_REGISTRY
+from aiohomematic.central.resync import ResyncPlan
 from aiohomematic.central.scheduler import BackgroundScheduler, SchedulerJob
 
 __all__ = [
@@ -99,6 +100,8 @@ __all__ = [
     "DeviceQueryFacade",
     # Registry
     "DeviceRegistry",
+    # Resync
+    "ResyncPlan",
     # Scheduler
     "BackgroundScheduler",
     "SchedulerJob",
@@ -9,11 +9,12 @@ channels, data points, events, and background jobs for a Homematic CCU.
 
 import asyncio
 from collections.abc import Callable, Mapping, Set as AbstractSet
+from datetime import datetime
 import logging
 from typing import Any, Final, Self
 
 from aiohomematic import client as hmcl, i18n
-from aiohomematic.async_support import Looper
+from aiohomematic.async_support import EXECUTOR_POOL, Looper
 from aiohomematic.central import rpc_server as rpc
 from aiohomematic.central.connection_state import CentralConnectionState
 from aiohomematic.central.coordinators import (
@@ -31,16 +32,21 @@ from aiohomematic.central.events import CentralStateChangedEvent, EventBus, Syst
 from aiohomematic.central.health import CentralHealth, HealthTracker
 from aiohomematic.central.query_facade import DeviceQueryFacade
 from aiohomematic.central.registry import CENTRAL_REGISTRY
+from aiohomematic.central.resync import ResyncPlan, execute_resync, plan_resync
 from aiohomematic.central.scheduler import BackgroundScheduler
 from aiohomematic.central.state_machine import CentralStateMachine
 from aiohomematic.client import AioJsonRpcAioHttpClient
 from aiohomematic.const import (
     CATEGORIES,
     DATA_POINT_EVENTS,
+    FILE_STARTUP_TRACE,
+    INTERFACES_SKIPPING_INIT_GETVALUE_FALLBACK,
     IP_ANY_V4,
     LOCAL_HOST,
+    MAX_CONCURRENT_DEVICE_REFRESHES,
     PORT_ANY,
     PRIMARY_CLIENT_CANDIDATE_INTERFACES,
+    SUB_DIRECTORY_TRACE,
     BackupData,
     CentralState,
     ClientState,
@@ -52,6 +58,7 @@ from aiohomematic.const import (
     SystemInformation,
 )
 from aiohomematic.decorators import inspector
+from aiohomematic.easymode_data import load_easymode_data
 from aiohomematic.exceptions import AioHomematicException, BaseHomematicException, NoClientsException
 from aiohomematic.interfaces.central import CentralConfigProtocol, CentralProtocol
 from aiohomematic.interfaces.client import ClientProtocol
@@ -61,7 +68,14 @@ from aiohomematic.interfaces.model import (
     GenericDataPointProtocolAny,
     GenericEventProtocolAny,
 )
-from aiohomematic.metrics import MetricsAggregator, MetricsObserver
+from aiohomematic.metrics import (
+    MemoryMetrics,
+    MetricsAggregator,
+    MetricsObserver,
+    StartupProfiler,
+    collect_memory_metrics,
+    profile_phase,
+)
 from aiohomematic.model.hub import InstallModeDpType
 from aiohomematic.property_decorators import DelegatedProperty, hm_property
 from aiohomematic.store import LocalStorageFactory, StorageFactoryProtocol
@@ -123,7 +137,8 @@ class CentralUnit(
         i18n.set_locale(locale=self._config.locale)
         self._url: Final = self._config.create_central_url()
         self._model: str | None = None
-        self._looper = Looper()
+        self._looper = Looper(task_budgets=self._config.task_budgets)
+        EXECUTOR_POOL.register(name=self.name, lane_sizes=self._config.executor_lane_sizes)
         self._xml_rpc_server: rpc.AsyncXmlRpcServer | None = None
 
         # -- 2. Event infrastructure (needed by all coordinators) --
@@ -191,6 +206,7 @@ class CentralUnit(
             session_recorder=self._cache_coordinator.recorder,
             event_bus=self._event_bus,
             incident_recorder=self._cache_coordinator.incident_store,
+            compression=self._config.json_rpc_compression,
         )
 
         # -- 6. Device management (depends on cache + event coordinators) --
@@ -214,6 +230,7 @@ class CentralUnit(
             incident_recorder=self._cache_coordinator.incident_store,
             parameter_visibility_provider=self._cache_coordinator.parameter_visibility,
             paramset_description_provider=self._cache_coordinator.paramset_descriptions,
+            schedule_cache=self._cache_coordinator.schedules,
             task_scheduler=self.looper,
         )
         self._hub_coordinator: Final = HubCoordinator(
@@ -276,6 +293,7 @@ class CentralUnit(
 
         # -- 9. Observability --
         self._metrics_observer: Final = MetricsObserver(event_bus=self._event_bus)
+        self._startup_profiler: Final = StartupProfiler(central_name=self.name)
         self._metrics_aggregator: Final = MetricsAggregator(
             central_name=self.name,
             client_provider=self._client_coordinator,
@@ -287,6 +305,10 @@ class CentralUnit(
             hub_data_point_manager=self._hub_coordinator,
             cache_provider=self._cache_coordinator,
             recovery_provider=self._connection_recovery_coordinator,
+            executor_pool=EXECUTOR_POOL,
+            startup_profiler=self._startup_profiler,
+            task_scheduler=self._looper,
+            json_rpc_client=self._json_rpc_client,
         )
 
         # -- 10. Event subscriptions and runtime state --
@@ -325,6 +347,9 @@ class CentralUnit(
     )
     connection_state: Final = DelegatedProperty["CentralConnectionState"](path="_connection_state")
     device_coordinator: Final = DelegatedProperty[DeviceCoordinator](path="_device_coordinator")
+    device_counts_by_interface: Final = DelegatedProperty[Mapping[str, int]](
+        path="_device_registry.device_counts_by_interface"
+    )
     device_registry: Final = DelegatedProperty[DeviceRegistry](path="_device_registry")
     devices: Final = DelegatedProperty[tuple[DeviceProtocol, ...]](path="_device_registry.devices")
     event_bus: Final = DelegatedProperty[EventBus](path="_event_bus")
@@ -342,6 +367,7 @@ class CentralUnit(
     metrics_aggregator: Final = DelegatedProperty[MetricsAggregator](path="_metrics_aggregator")
     name: Final = DelegatedProperty[str](path="_config.name", log_context=True)
     query_facade: Final = DelegatedProperty[DeviceQueryFacade](path="_query_facade")
+    startup_profiler: Final = DelegatedProperty[StartupProfiler](path="_startup_profiler")
     state: Final = DelegatedProperty[CentralState](path="_central_state_machine.state")
     url: Final = DelegatedProperty[str](path="_url", log_context=True)
 
@@ -396,7 +422,7 @@ class CentralUnit(
         """
         if not (client := self._client_coordinator.primary_client):
             _LOGGER.warning(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.accept_device_in_inbox.no_client", device_address=device_address, name=self.name
                 )
             )
@@ -442,6 +468,26 @@ class CentralUnit(
             interface_config=interface_config,
         )
 
+    async def execute_resync(self, *, plan: ResyncPlan) -> int:
+        """
+        Re-read the stale channels of a resync plan.
+
+        Returns:
+            Number of data points that have been re-read.
+
+        """
+        return await execute_resync(plan=plan, max_concurrent_devices=MAX_CONCURRENT_DEVICE_REFRESHES)
+
+    async def export_startup_trace(self) -> None:
+        """
+        Export the phases of the last start as Chrome trace file.
+
+        The file can be loaded in Perfetto (ui.perfetto.dev) or chrome://tracing.
+        """
+        storage = self._storage_factory.create_storage(key=FILE_STARTUP_TRACE, sub_directory=SUB_DIRECTORY_TRACE)
+        await storage.save(data=self._startup_profiler.to_chrome_trace())
+        _LOGGER.debug("EXPORT_STARTUP_TRACE: Saved startup trace of %s", self.name)
+
     def get_readable_generic_data_points(
         self, *, paramset_key: ParamsetKey | None = None, interface: Interface | None = None
     ) -> tuple[GenericDataPointProtocolAny, ...]:
@@ -472,6 +518,26 @@ class CentralUnit(
             paramset_key=paramset_key, interface=interface, direct_call=direct_call
         )
 
+    async def load_device_data(self, *, interface: Interface) -> None:
+        """Fetch all device values of an interface, regardless of the cache age."""
+        await self._cache_coordinator.data_cache.load(direct_call=True, interface=interface)
+
+    def memory_report(self) -> MemoryMetrics:
+        """
+        Return object count and approximate size per type of the runtime model.
+
+        Walks all devices, channels, data points, events, hub data points and
+        EventBus subscriptions, so it is meant for diagnostics, not for polling.
+        """
+        return collect_memory_metrics(
+            devices=self._device_registry.devices,
+            hub_data_points=(*self._hub_coordinator.program_data_points, *self._hub_coordinator.sysvar_data_points),
+            groups={
+                "EventBus.subscription": self._event_bus.iter_subscriptions(),
+                "EventBus.field_subscription": self._event_bus.data_point_notifier.iter_field_subscriptions(),
+            },
+        )
+
     def on_state_transition(
         self,
         *,
@@ -508,6 +574,44 @@ class CentralUnit(
             handler=_filtered_handler,
         )
 
+    def plan_resync(self, *, interface_id: str, gap_started_at: datetime) -> ResyncPlan:
+        """
+        Plan the resync of the channels of an interface after an event gap.
+
+        Data points refreshed since gap_started_at are skipped. A full refresh is
+        planned for interfaces without a reliable getValue or if most data points
+        are stale.
+        """
+        client = self._client_coordinator.get_client(interface_id=interface_id)
+        return plan_resync(
+            interface_id=interface_id,
+            channels=(
+                channel
+                for device in self._device_registry.get_devices(interface_id=interface_id)
+                for channel in device.channels.values()
+            ),
+            gap_started_at=gap_started_at,
+            targeted=client.interface not in INTERFACES_SKIPPING_INIT_GETVALUE_FALLBACK,
+        )
+
+    async def refresh_stale_data_point_data(self, *, interface: Interface, refreshed_before: datetime) -> int:
+        """
+        Re-read the data points of an interface not refreshed since refreshed_before.
+
+        Used after a reconnect: values that arrived by event in the meantime are
+        current and skipped, the others are taken from the device data cache or
+        read from the backend, several devices in parallel.
+
+        Returns:
+            Number of data points that have been re-read.
+
+        """
+        return await self._cache_coordinator.data_cache.refresh_data_point_data(
+            interface=interface,
+            refreshed_before=refreshed_before,
+            max_concurrent_devices=MAX_CONCURRENT_DEVICE_REFRESHES,
+        )
+
     async def rename_device(self, *, device_address: str, name: str, include_channels: bool = False) -> bool:
         """
         Rename a device on the CCU.
@@ -523,7 +627,7 @@ class CentralUnit(
         """
         if (device := self._device_coordinator.get_device(address=device_address)) is None:
             _LOGGER.warning(
-                i18n.tr(key="log.central.rename_device.not_found", device_address=device_address, name=self.name)
+                i18n.lazy_tr(key="log.central.rename_device.not_found", device_address=device_address, name=self.name)
             )
             return False
 
@@ -606,75 +710,8 @@ class CentralUnit(
                 reason="start() called",
             )
 
-        if self._config.session_recorder_start:
-            await self._cache_coordinator.recorder.deactivate(
-                delay=self._config.session_recorder_start_for_seconds,
-                auto_save=True,
-                randomize_output=self._config.session_recorder_randomize_output,
-                use_ts_in_file_name=False,
-            )
-            _LOGGER.debug("START: Starting Recorder for %s seconds", self._config.session_recorder_start_for_seconds)
-
-        _LOGGER.debug("START: Initializing Central %s", self.name)
-        if self._config.enabled_interface_configs and (
-            ip_addr := await self._identify_ip_addr(port=self._config.connection_check_port)
-        ):
-            self._rpc_callback_ip = ip_addr
-            self._listen_ip_addr = self._config.listen_ip_addr or ip_addr
-
-        port_xml_rpc: int = (
-            self._config.listen_port_xml_rpc
-            or self._config.callback_port_xml_rpc
-            or self._config.default_callback_port_xml_rpc
-        )
-        try:
-            if self._config.enable_xml_rpc_server:
-                async_server = await rpc.create_async_xml_rpc_server(ip_addr=self._listen_ip_addr, port=port_xml_rpc)
-                self._xml_rpc_server = async_server
-                self._listen_port_xml_rpc = async_server.listen_port
-                async_server.add_central(central=self)
-        except OSError as oserr:  # pragma: no cover - environment/OS-specific socket binding failures are not reliably reproducible in CI
-            if self._central_state_machine.can_transition_to(target=CentralState.FAILED):
-                self._central_state_machine.transition_to(
-                    target=CentralState.FAILED,
-                    reason=f"XML-RPC server failed: {extract_exc_args(exc=oserr)}",
-                    failure_reason=FailureReason.INTERNAL,
-                )
-            raise AioHomematicException(
-                i18n.tr(
-                    key="exception.central.start.failed",
-                    name=self.name,
-                    reason=extract_exc_args(exc=oserr),
-                )
-            ) from oserr
-
-        if self._config.start_direct:
-            if await self._client_coordinator.start_clients():
-                await asyncio.gather(
-                    *(
-                        self._device_coordinator.refresh_device_descriptions_and_create_missing_devices(
-                            client=client,
-                            refresh_only_existing=False,
-                        )
-                        for client in self._client_coordinator.clients
-                    )
-                )
-        else:
-            # Device creation is now done inside start_clients() before hub init
-            await self._client_coordinator.start_clients()
-            if self._config.enable_xml_rpc_server:
-                self._start_scheduler()
-
-        # Transition central state machine based on client status
-        clients = self._client_coordinator.clients
-        _LOGGER.debug(
-            "START: Central %s is %s, clients: %s",
-            self.name,
-            self.state,
-            {c.interface_id: c.state.value for c in clients},
-        )
-        self._evaluate_central_state(trigger="start() completed", from_start=True)
-        self._health_tracker.sync_central_state()
+        with self._startup_profiler.profile(name="central.start"):
+            await self._start_central()
 
     async def stop(self) -> None:
         """Stop processing of the central unit."""
@@ -687,6 +724,7 @@ class CentralUnit(
         _LOGGER.debug("STOP: Stopping Central %s", self.name)
 
         await self.save_files(save_device_descriptions=True, save_paramset_descriptions=True)
+        await self._cache_coordinator.save_if_changed(save_schedules=True)
         await self._stop_scheduler()
         self._metrics_observer.stop()
         self._connection_recovery_coordinator.stop()
@@ -707,6 +745,7 @@ class CentralUnit(
 
         _LOGGER.debug("STOP: Removing instance")
         CENTRAL_REGISTRY.unregister(name=self.name)
+        EXECUTOR_POOL.unregister(name=self.name)
 
         # Clear cache coordinator subscriptions (device removed event subscription)
         self._cache_coordinator.stop()
@@ -776,7 +815,7 @@ class CentralUnit(
                 client = await hmcl.create_client(client_deps=self, interface_config=interface_config)
             except BaseHomematicException as bhexc:
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.central.validate_config_and_get_system_information.client_failed",
                         interface=str(interface_config.interface),
                         reason=extract_exc_args(exc=bhexc),
@@ -919,9 +958,8 @@ class CentralUnit(
         # Only if the current state is still disconnected/failed (to handle race conditions)
         if new_state in (ClientState.DISCONNECTED, ClientState.FAILED):
             if current_client_state in (ClientState.DISCONNECTED, ClientState.FAILED):
-                for device in self._device_registry.devices:
-                    if device.interface_id == interface_id:
-                        device.set_forced_availability(forced_availability=ForcedDeviceAvailability.FORCE_FALSE)
+                for device in self._device_registry.get_devices(interface_id=interface_id):
+                    device.set_forced_availability(forced_availability=ForcedDeviceAvailability.FORCE_FALSE)
                 _LOGGER.debug(
                     "CLIENT_STATE_CHANGE: Marked all devices unavailable for %s (state=%s)",
                     interface_id,
@@ -945,9 +983,8 @@ class CentralUnit(
             ClientState.FAILED,
             ClientState.RECONNECTING,
         ):
-            for device in self._device_registry.devices:
-                if device.interface_id == interface_id:
-                    device.set_forced_availability(forced_availability=ForcedDeviceAvailability.NOT_SET)
+            for device in self._device_registry.get_devices(interface_id=interface_id):
+                device.set_forced_availability(forced_availability=ForcedDeviceAvailability.NOT_SET)
             _LOGGER.debug(
                 "CLIENT_STATE_CHANGE: Reset device availability for %s (reconnected)",
                 interface_id,
@@ -965,6 +1002,86 @@ class CentralUnit(
             return device.name
         return None
 
+    async def _start_central(self) -> None:
+        """Start the XML-RPC server, the clients and the scheduler; recorded by the startup profiler."""
+        # The easymode archive is not read at import time. Load it off the event loop
+        # before anything can look it up, so no lookup has to read it on the loop.
+        await self._looper.async_add_executor_job(load_easymode_data, name="load-easymode-data")
+
+        if self._config.session_recorder_start:
+            await self._cache_coordinator.recorder.deactivate(
+                delay=self._config.session_recorder_start_for_seconds,
+                auto_save=True,
+                randomize_output=self._config.session_recorder_randomize_output,
+                use_ts_in_file_name=False,
+            )
+            _LOGGER.debug("START: Starting Recorder for %s seconds", self._config.session_recorder_start_for_seconds)
+
+        _LOGGER.debug("START: Initializing Central %s", self.name)
+        if self._config.enabled_interface_configs and (
+            ip_addr := await self._identify_ip_addr(port=self._config.connection_check_port)
+        ):
+            self._rpc_callback_ip = ip_addr
+            self._listen_ip_addr = self._config.listen_ip_addr or ip_addr
+
+        port_xml_rpc: int = (
+            self._config.listen_port_xml_rpc
+            or self._config.callback_port_xml_rpc
+            or self._config.default_callback_port_xml_rpc
+        )
+        try:
+            if self._config.enable_xml_rpc_server:
+                with profile_phase(name="xml_rpc_server"):
+                    async_server = await rpc.create_async_xml_rpc_server(
+                        ip_addr=self._listen_ip_addr, port=port_xml_rpc
+                    )
+                self._xml_rpc_server = async_server
+                self._listen_port_xml_rpc = async_server.listen_port
+                async_server.add_central(central=self)
+        except OSError as oserr:  # pragma: no cover - environment/OS-specific socket binding failures are not reliably reproducible in CI
+            if self._central_state_machine.can_transition_to(target=CentralState.FAILED):
+                self._central_state_machine.transition_to(
+                    target=CentralState.FAILED,
+                    reason=f"XML-RPC server failed: {extract_exc_args(exc=oserr)}",
+                    failure_reason=FailureReason.INTERNAL,
+                )
+            raise AioHomematicException(
+                i18n.tr(
+                    key="exception.central.start.failed",
+                    name=self.name,
+                    reason=extract_exc_args(exc=oserr),
+                )
+            ) from oserr
+
+        if self._config.start_direct:
+            if await self._client_coordinator.start_clients():
+                with profile_phase(name="devices.refresh_descriptions"):
+                    await asyncio.gather(
+                        *(
+                            self._device_coordinator.refresh_device_descriptions_and_create_missing_devices(
+                                client=client,
+                                refresh_only_existing=False,
+                            )
+                            for client in self._client_coordinator.clients
+                        )
+                    )
+        else:
+            # Device creation is now done inside start_clients() before hub init
+            await self._client_coordinator.start_clients()
+            if self._config.enable_xml_rpc_server:
+                self._start_scheduler()
+
+        # Transition central state machine based on client status
+        clients = self._client_coordinator.clients
+        _LOGGER.debug(
+            "START: Central %s is %s, clients: %s",
+            self.name,
+            self.state,
+            {c.interface_id: c.state.value for c in clients},
+        )
+        self._evaluate_central_state(trigger="start() completed", from_start=True)
+        self._health_tracker.sync_central_state()
+
     def _start_scheduler(self) -> None:
         """Start the background scheduler."""
         _LOGGER.debug(
@@ -10,7 +10,7 @@ This module provides CentralConfig for configuring and creating CentralUnit inst
 __kwonly_check__ = False
 
 import asyncio
-from collections.abc import Set as AbstractSet
+from collections.abc import Mapping, Set as AbstractSet
 from typing import Any
 
 from aiohttp import ClientSession
@@ -23,8 +23,10 @@ from aiohomematic.const import (
     DEFAULT_ENABLE_DEVICE_FIRMWARE_CHECK,
     DEFAULT_ENABLE_PROGRAM_SCAN,
     DEFAULT_ENABLE_SYSVAR_SCAN,
+    DEFAULT_EXECUTOR_LANE_SIZES,
     DEFAULT_IGNORE_CUSTOM_DEVICE_DEFINITION_MODELS,
     DEFAULT_INTERFACES_REQUIRING_PERIODIC_REFRESH,
+    DEFAULT_JSON_RPC_COMPRESSION,
     DEFAULT_LOCALE,
     DEFAULT_MAX_READ_WORKERS,
     DEFAULT_OPTIONAL_SETTINGS,
@@ -33,6 +35,7 @@ from aiohomematic.const import (
     DEFAULT_SESSION_RECORDER_START_FOR_SECONDS,
     DEFAULT_STORAGE_DIRECTORY,
     DEFAULT_SYSVAR_MARKERS,
+    DEFAULT_TASK_BUDGETS,
     DEFAULT_TIMEOUT_CONFIG,
     DEFAULT_TLS,
     DEFAULT_UN_IGNORES,
@@ -42,10 +45,13 @@ from aiohomematic.const import (
     PORT_ANY,
     PRIMARY_CLIENT_CANDIDATE_INTERFACES,
     DescriptionMarker,
+    ExecutorLane,
     Interface,
     OptionalSettings,
     RpcServerType,
     ScheduleTimerConfig,
+    TaskBudget,
+    TaskCategory,
     TimeoutConfig,
     get_interface_default_port,
     get_json_rpc_default_port,
@@ -105,6 +111,9 @@ class CentralConfig(BaseModel):
     enable_sysvar_scan: bool = DEFAULT_ENABLE_SYSVAR_SCAN
     """Enable scanning of CCU system variables."""
 
+    executor_lane_sizes: Mapping[ExecutorLane, int] = Field(default_factory=lambda: dict(DEFAULT_EXECUTOR_LANE_SIZES))
+    """Worker threads per lane of the process-wide executor pool."""
+
     ignore_custom_device_definition_models: frozenset[str] = DEFAULT_IGNORE_CUSTOM_DEVICE_DEFINITION_MODELS
     """Device models to ignore for custom definitions."""
 
@@ -114,6 +123,9 @@ class CentralConfig(BaseModel):
     json_port: int | None = None
     """Port for JSON-RPC communication."""
 
+    json_rpc_compression: bool = DEFAULT_JSON_RPC_COMPRESSION
+    """Request compressed (gzip/deflate) JSON-RPC responses from the backend."""
+
     listen_ip_addr: str | None = None
     """IP address to listen on for callback server."""
 
@@ -144,6 +156,9 @@ class CentralConfig(BaseModel):
     sysvar_markers: tuple[DescriptionMarker | str, ...] = DEFAULT_SYSVAR_MARKERS
     """Markers to filter system variables."""
 
+    task_budgets: Mapping[TaskCategory, TaskBudget] = Field(default_factory=lambda: dict(DEFAULT_TASK_BUDGETS))
+    """Budget per category of Looper background tasks (running limit and over-budget policy)."""
+
     timeout_config: TimeoutConfig = DEFAULT_TIMEOUT_CONFIG
     """Timeout configuration for various operations."""
 
@@ -4,7 +4,8 @@
 Cache coordinator for managing all cache operations.
 
 This module provides centralized cache management for device descriptions,
-paramset descriptions, device details, data cache, and session recording.
+paramset descriptions, week profile schedules, device details, data cache, and
+session recording.
 
 The CacheCoordinator provides:
 - Unified cache loading and saving
@@ -25,6 +26,7 @@ from aiohomematic.const import (
     FILE_DEVICES,
     FILE_INCIDENTS,
     FILE_PARAMSETS,
+    FILE_SCHEDULES,
     SUB_DIRECTORY_CACHE,
     CacheInvalidationReason,
     CacheType,
@@ -43,6 +45,7 @@ from aiohomematic.interfaces import (
     TaskSchedulerProtocol,
 )
 from aiohomematic.interfaces.model import DeviceRemovalInfoProtocol
+from aiohomematic.metrics import profile_phase
 from aiohomematic.metrics._protocols import CacheProviderForMetricsProtocol
 from aiohomematic.property_decorators import DelegatedProperty
 from aiohomematic.store import CacheStatistics, StorageFactoryProtocol
@@ -51,6 +54,7 @@ from aiohomematic.store.persistent import (
     DeviceDescriptionRegistry,
     IncidentStore,
     ParamsetDescriptionRegistry,
+    ScheduleRegistry,
     SessionRecorder,
 )
 from aiohomematic.store.visibility import ParameterVisibilityRegistry
@@ -94,6 +98,7 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
         "_incident_store",
         "_parameter_visibility_registry",
         "_paramset_descriptions_registry",
+        "_schedule_registry",
         "_session_recorder",
         "_unsubscribers",
     )
@@ -144,6 +149,10 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
             key=FILE_INCIDENTS,
             sub_directory=SUB_DIRECTORY_CACHE,
         )
+        schedule_storage = storage_factory.create_storage(
+            key=FILE_SCHEDULES,
+            sub_directory=SUB_DIRECTORY_CACHE,
+        )
 
         # Initialize all caches with protocol interfaces
         self._data_cache: Final = CentralDataCache(
@@ -171,6 +180,10 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
             storage=incident_storage,
             config_provider=config_provider,
         )
+        self._schedule_registry: Final = ScheduleRegistry(
+            storage=schedule_storage,
+            config_provider=config_provider,
+        )
         self._session_recorder: Final = SessionRecorder(
             central_info=central_info,
             config_provider=config_provider,
@@ -215,6 +228,7 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
     )
     paramset_descriptions_size: Final = DelegatedProperty[int](path="_paramset_descriptions_registry.size")
     recorder: Final = DelegatedProperty[SessionRecorder](path="_session_recorder")
+    schedules: Final = DelegatedProperty[ScheduleRegistry](path="_schedule_registry")
     visibility_cache_size: Final = DelegatedProperty[int](path="_parameter_visibility_registry.size")
 
     async def clear_all(
@@ -234,6 +248,7 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
 
         await self._device_descriptions_registry.clear()
         await self._paramset_descriptions_registry.clear()
+        await self._schedule_registry.clear()
         await self._session_recorder.clear()
         data_cache_size = self._data_cache.size
         self._device_details_cache.clear()
@@ -285,8 +300,10 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
         """
         _LOGGER.debug("LOAD_ALL: Loading caches for %s", self._central_info.name)
 
-        device_result = await self._device_descriptions_registry.load()
-        paramset_result = await self._paramset_descriptions_registry.load()
+        with profile_phase(name="cache.device_descriptions"):
+            device_result = await self._device_descriptions_registry.load()
+        with profile_phase(name="cache.paramset_descriptions"):
+            paramset_result = await self._paramset_descriptions_registry.load()
 
         # Check for load failures
         if DataOperationResult.LOAD_FAIL in (device_result, paramset_result):
@@ -306,8 +323,18 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
             await self.clear_all()
             return False  # Signal that caches need to be rebuilt from CCU
 
-        await self._device_details_cache.load()
-        await self._data_cache.load()
+        # Schedules are independent of the description caches; a broken file only costs a re-read.
+        with profile_phase(name="cache.schedules"):
+            if (await self._schedule_registry.load()) in (
+                DataOperationResult.LOAD_FAIL,
+                DataOperationResult.VERSION_MISMATCH,
+            ):
+                await self._schedule_registry.clear()
+
+        with profile_phase(name="cache.device_details"):
+            await self._device_details_cache.load()
+        with profile_phase(name="cache.data"):
+            await self._data_cache.load()
         return True
 
     async def load_data_cache(self, *, interface: Interface | None = None) -> None:
@@ -339,6 +366,7 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
         )
         self._device_descriptions_registry.remove_device(device=device)
         self._paramset_descriptions_registry.remove_device(device=device)
+        self._schedule_registry.remove_device(device=device)
         self._device_details_cache.remove_device(device=device)
 
     async def save_all(
@@ -346,6 +374,7 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
         *,
         save_device_descriptions: bool = False,
         save_paramset_descriptions: bool = False,
+        save_schedules: bool = False,
     ) -> None:
         """
         Save persistent caches to disk.
@@ -354,25 +383,30 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
         ----
             save_device_descriptions: Whether to save device descriptions
             save_paramset_descriptions: Whether to save paramset descriptions
+            save_schedules: Whether to save week profile schedules
 
         """
         _LOGGER.debug(
-            "SAVE_ALL: Saving caches for %s (device_desc=%s, paramset_desc=%s)",
+            "SAVE_ALL: Saving caches for %s (device_desc=%s, paramset_desc=%s, schedules=%s)",
             self._central_info.name,
             save_device_descriptions,
             save_paramset_descriptions,
+            save_schedules,
         )
 
         if save_device_descriptions:
             await self._device_descriptions_registry.save()
         if save_paramset_descriptions:
             await self._paramset_descriptions_registry.save()
+        if save_schedules:
+            await self._schedule_registry.save()
 
     async def save_if_changed(
         self,
         *,
         save_device_descriptions: bool = False,
         save_paramset_descriptions: bool = False,
+        save_schedules: bool = False,
     ) -> None:
         """
         Save caches only if they have unsaved changes.
@@ -384,6 +418,7 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
         ----
             save_device_descriptions: Whether to check and save device descriptions
             save_paramset_descriptions: Whether to check and save paramset descriptions
+            save_schedules: Whether to check and save week profile schedules
 
         """
         if save_device_descriptions and self._device_descriptions_registry.has_unsaved_changes:
@@ -400,6 +435,13 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
             )
             await self._paramset_descriptions_registry.save()
 
+        if save_schedules and self._schedule_registry.has_unsaved_changes:
+            _LOGGER.debug(
+                "SAVE_IF_CHANGED: Saving schedules for %s",
+                self._central_info.name,
+            )
+            await self._schedule_registry.save()
+
     def set_data_cache_initialization_complete(self) -> None:
         """
         Mark data cache initialization as complete.
@@ -473,4 +515,5 @@ class CacheCoordinator(SessionRecorderProviderProtocol, CacheProviderForMetricsP
         )
         self._device_descriptions_registry.remove_device(device=removal_info)  # type: ignore[arg-type]
         self._paramset_descriptions_registry.remove_device(device=removal_info)  # type: ignore[arg-type]
+        self._schedule_registry.remove_device(device=removal_info)  # type: ignore[arg-type]
         self._device_details_cache.remove_device(device=removal_info)  # type: ignore[arg-type]
@@ -35,6 +35,7 @@ from aiohomematic.interfaces import (
     SystemInfoProviderProtocol,
 )
 from aiohomematic.interfaces.central import HealthTrackerProtocol
+from aiohomematic.metrics import profile_phase
 from aiohomematic.property_decorators import DelegatedProperty
 from aiohomematic.support import extract_exc_args
 
@@ -235,7 +236,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
         await self.stop_clients()
         if await self.start_clients():
             _LOGGER.info(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.restart_clients.restarted",
                     name=self._central_info.name,
                 )
@@ -254,8 +255,9 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
         self._last_failure_reason = FailureReason.NONE
         self._last_failure_interface_id = None
 
-        if not await self._create_clients():
-            return False
+        with profile_phase(name="clients.create"):
+            if not await self._create_clients():
+                return False
 
         # Set primary interface on health tracker after all clients are created
         if primary_client := self.primary_client:
@@ -266,13 +268,16 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
             )
 
         # Load caches after clients are created
-        await self._coordinator_provider.cache_coordinator.load_all()
+        with profile_phase(name="cache.load_all"):
+            await self._coordinator_provider.cache_coordinator.load_all()
 
         # Initialize clients (sets them to CONNECTED state)
-        await self._init_clients()
+        with profile_phase(name="clients.init"):
+            await self._init_clients()
 
         # Create devices from cache BEFORE hub init - required for sysvar-to-channel association
-        await self._coordinator_provider.device_coordinator.check_and_create_devices_from_cache()
+        with profile_phase(name="devices.create_from_cache"):
+            await self._coordinator_provider.device_coordinator.check_and_create_devices_from_cache()
 
         # Enable cache expiration now that device creation is complete.
         # During device creation, cache expiration was disabled to prevent getValue
@@ -280,7 +285,8 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
         self._coordinator_provider.cache_coordinator.set_data_cache_initialization_complete()
 
         # Initialize hub (requires connected clients and devices to fetch programs/sysvars)
-        await self._coordinator_provider.hub_coordinator.init_hub()
+        with profile_phase(name="hub.init"):
+            await self._coordinator_provider.hub_coordinator.init_hub()
 
         self._clients_started = True
         return True
@@ -359,7 +365,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
                     )
                     if not tcp_ready:
                         _LOGGER.warning(
-                            i18n.tr(
+                            i18n.lazy_tr(
                                 key="log.central.startup.tcp_not_ready",
                                 interface_id=interface_config.interface_id,
                             )
@@ -398,7 +404,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
                 if attempt < max_attempts:
                     retry_delay = self._calculate_startup_retry_delay(attempt=attempt)
                     _LOGGER.warning(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.central.startup.auth_retry",
                             interface_id=interface_config.interface_id,
                             attempt=attempt,
@@ -412,7 +418,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
 
                 # Last attempt exhausted - true auth error
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.central.startup.auth_failed",
                         interface_id=interface_config.interface_id,
                         max_attempts=max_attempts,
@@ -428,7 +434,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
                 self._last_failure_reason = exception_to_failure_reason(exc=bhexc)
                 self._last_failure_interface_id = interface_config.interface_id
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.central.create_client.no_connection",
                         interface_id=interface_config.interface_id,
                         reason=extract_exc_args(exc=bhexc),
@@ -449,7 +455,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
         """
         if len(self._clients) > 0:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.create_clients.already_created",
                     name=self._central_info.name,
                 )
@@ -458,7 +464,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
 
         if len(self._config_provider.config.enabled_interface_configs) == 0:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.create_clients.no_interfaces",
                     name=self._central_info.name,
                 )
@@ -477,7 +483,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
             )
             if not json_port_ready:
                 _LOGGER.warning(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.central.startup.json_port_not_ready",
                         host=self._config_provider.config.host,
                         port=json_port,
@@ -500,7 +506,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
                     and interface_config.interface not in self.primary_client.system_information.available_interfaces
                 ):
                     _LOGGER.error(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.central.create_clients.interface_not_available",
                             interface=interface_config.interface,
                             name=self._central_info.name,
@@ -514,7 +520,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
 
         if not self.all_clients_active:
             _LOGGER.warning(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.create_clients.created_count_failed",
                     created=len(self._clients),
                     total=len(self._config_provider.config.enabled_interface_configs),
@@ -524,7 +530,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
 
         if self.primary_client is None:
             _LOGGER.warning(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.create_clients.no_primary_identified",
                     name=self._central_info.name,
                 )
@@ -574,7 +580,9 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
 
         # Second pass: initialize proxies in parallel (each interface is independent)
         async def _init_single_client(client: ClientProtocol) -> None:
-            if await client.init_proxy() == ProxyInitState.INIT_SUCCESS:
+            with profile_phase(name="client.init_proxy", interface_id=client.interface_id):
+                init_state = await client.init_proxy()
+            if init_state == ProxyInitState.INIT_SUCCESS:
                 _LOGGER.debug(
                     "INIT_CLIENTS: client %s initialized for %s", client.interface_id, self._central_info.name
                 )
@@ -634,7 +642,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
 
             except (OSError, TimeoutError) as exc:
                 _LOGGER.debug(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.central.startup.tcp_check_failed",
                         host=host,
                         port=port,
@@ -645,7 +653,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
                 await asyncio.sleep(check_interval)
             else:
                 _LOGGER.debug(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.central.startup.tcp_ready",
                         host=host,
                         port=port,
@@ -655,7 +663,7 @@ class ClientCoordinator(ClientCoordinationProtocol, ClientProviderProtocol):
                 return True
 
         _LOGGER.warning(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.central.startup.tcp_timeout",
                 host=host,
                 port=port,
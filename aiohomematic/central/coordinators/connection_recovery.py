@@ -17,9 +17,13 @@ Architecture
 The coordinator:
 1. Subscribes to connection-related events (ConnectionLostEvent, CircuitBreakerTrippedEvent, CentralStateChangedEvent)
 2. Executes staged recovery (TCP check → RPC check → warmup → reconnect → data load)
+   The data load fetches the device data and refreshes the hub data in parallel,
+   then re-reads only the data points that did not receive an event since the reconnect
+   If only some channels are stale, they are re-read without the bulk fetch (see central.resync)
 3. Tracks retry attempts with exponential backoff
 4. Manages central state transitions (RECOVERING, RUNNING, DEGRADED, FAILED)
 5. Provides heartbeat retry in FAILED state (including startup failures)
+6. Re-reads the stale channels after an event gap (EventGapDetectedEvent) without a reconnect
 
 Event Flow
 ----------
@@ -65,23 +69,27 @@ from aiohomematic.central.events.internal import (
     CircuitBreakerStateChangedEvent,
     CircuitBreakerTrippedEvent,
     ConnectionLostEvent,
+    EventGapDetectedEvent,
     HeartbeatTimerFiredEvent,
     RecoveryAttemptedEvent,
 )
 from aiohomematic.client import CircuitState
 from aiohomematic.const import (
+    INIT_DATETIME,
     INTERFACES_REQUIRING_JSON_RPC_CLIENT,
     INTERFACES_REQUIRING_XML_RPC,
     CentralState,
     FailureReason,
+    RecoveryReloadStep,
     RecoveryStage,
+    TaskCategory,
     get_json_rpc_default_port,
 )
 from aiohomematic.metrics._protocols import RecoveryProviderForMetricsProtocol
 from aiohomematic.store.types import IncidentSeverity, IncidentType
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable
 
     from aiohomematic.central.events import EventBus
     from aiohomematic.central.state_machine import CentralStateMachine
@@ -131,6 +139,8 @@ class InterfaceRecoveryState:
     stage_entered_at: datetime = field(default_factory=datetime.now)
     stages_completed: list[RecoveryStage] = field(default_factory=list)
     recovery_start_time: float | None = None
+    stage_durations_ms: dict[RecoveryStage, float] = field(default_factory=dict)
+    reload_durations_ms: dict[RecoveryReloadStep, float] = field(default_factory=dict)
 
     @property
     def can_retry(self) -> bool:
@@ -146,6 +156,10 @@ class InterfaceRecoveryState:
         delay: float = BASE_RETRY_DELAY * (2 ** (self.consecutive_failures - 1))
         return float(min(delay, MAX_RETRY_DELAY))
 
+    def record_reload_step(self, *, step: RecoveryReloadStep, duration_ms: float) -> None:
+        """Record the duration of a data reload step."""
+        self.reload_durations_ms[step] = duration_ms
+
     def record_failure(self) -> None:
         """Record a failed recovery attempt."""
         self.consecutive_failures += 1
@@ -171,6 +185,8 @@ class InterfaceRecoveryState:
         """Start a new recovery cycle."""
         self.recovery_start_time = time.perf_counter()
         self.stages_completed.clear()
+        self.stage_durations_ms.clear()
+        self.reload_durations_ms.clear()
 
     def transition_to_stage(self, *, new_stage: RecoveryStage) -> float:
         """
@@ -186,6 +202,7 @@ class InterfaceRecoveryState:
         duration_ms = (datetime.now() - self.stage_entered_at).total_seconds() * 1000
         if self.current_stage not in (RecoveryStage.IDLE, RecoveryStage.RECOVERED, RecoveryStage.FAILED):
             self.stages_completed.append(self.current_stage)
+            self.stage_durations_ms[self.current_stage] = duration_ms
         self.current_stage = new_stage
         self.stage_entered_at = datetime.now()
         return duration_ms
@@ -236,6 +253,8 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
         "_event_bus",
         "_heartbeat_task",
         "_hub_data_fetcher",
+        "_hub_refresh_lock",
+        "_hub_refreshed_at",
         "_in_failed_state",
         "_incident_recorder",
         "_recovery_semaphore",
@@ -294,6 +313,8 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
         self._in_failed_state: bool = False
         self._shutdown: bool = False
         self._heartbeat_task: asyncio.Task[None] | None = None
+        self._hub_refresh_lock: Final = asyncio.Lock()
+        self._hub_refreshed_at: datetime = INIT_DATETIME
         self._unsubscribers: list[Callable[[], None]] = []
 
         # Subscribe to connection-related events
@@ -507,12 +528,14 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
 
             # Stage: (STABILITY_CHECK or TCP_CHECKING) → RECONNECTING
             await self._transition_stage(interface_id=interface_id, new_stage=RecoveryStage.RECONNECTING)
+            # Values received by event from here on are current and need no re-read
+            reconnect_started_at = datetime.now()
             if not await self._stage_reconnect(interface_id=interface_id):
                 return False
 
             # Stage: RECONNECTING → DATA_LOADING
             await self._transition_stage(interface_id=interface_id, new_stage=RecoveryStage.DATA_LOADING)
-            if not await self._stage_data_load(interface_id=interface_id):
+            if not await self._stage_data_load(interface_id=interface_id, refreshed_since=reconnect_started_at):
                 return False
 
             # Stage: DATA_LOADING → RECOVERED
@@ -652,6 +675,9 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
 
         # Only act on recovery: HALF_OPEN → CLOSED
         if event.old_state == CircuitState.HALF_OPEN and event.new_state == CircuitState.CLOSED:
+            if event.interface_id in self._active_recoveries:
+                # The data load stage of the running recovery reloads the data
+                return
             _LOGGER.info(  # i18n-log: ignore
                 "CONNECTION_RECOVERY: Circuit breaker recovered for %s, triggering data refresh",
                 event.interface_id,
@@ -722,6 +748,30 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
             name=f"recovery_{interface_id}",
         )
 
+    def _on_event_gap_detected(self, *, event: EventGapDetectedEvent) -> None:
+        """Handle event gap detected event."""
+        if self._shutdown:
+            return
+
+        if (interface_id := event.interface_id) in self._active_recoveries:
+            # The data load stage of the running recovery reloads the data
+            return
+
+        _LOGGER.info(  # i18n-log: ignore
+            "CONNECTION_RECOVERY: Events of %s may have been lost since %s, re-reading stale channels",
+            interface_id,
+            event.gap_started_at,
+        )
+        gap_started_at = event.gap_started_at
+
+        async def resync() -> None:
+            await self._resync_after_event_gap(interface_id=interface_id, gap_started_at=gap_started_at)
+
+        self._task_scheduler.create_task(
+            target=resync,
+            name=f"resync_{interface_id}",
+        )
+
     def _on_heartbeat_timer_fired(self, *, event: HeartbeatTimerFiredEvent) -> None:
         """Handle heartbeat timer fired event."""
         if self._shutdown or not self._in_failed_state:
@@ -796,6 +846,7 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
         self._task_scheduler.create_task(
             target=_record(),
             name=f"record_connection_lost_incident_{interface_id}",
+            category=TaskCategory.INCIDENT,
         )
 
     def _record_connection_restored_incident(
@@ -853,6 +904,7 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
         self._task_scheduler.create_task(
             target=_record(),
             name=f"record_connection_restored_incident_{interface_id}",
+            category=TaskCategory.INCIDENT,
         )
 
     async def _recover_all_interfaces(self, *, interface_ids: list[str]) -> None:
@@ -891,48 +943,53 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
         elif success_count > 0:
             self._transition_to_degraded(failed_count=failed_count)
 
-    async def _refresh_hub_data_after_recovery(self) -> None:
-        """Refresh hub data (system update, programs, sysvars) after recovery."""
-        if self._hub_data_fetcher is None:
+    async def _refresh_hub_data_after_recovery(self, *, refreshed_since: datetime | None = None) -> None:
+        """
+        Refresh hub data (system update, programs, sysvars) after recovery.
+
+        The parts are fetched in parallel. Interfaces recovering at the same time
+        share one refresh: if the hub data has been refreshed since refreshed_since,
+        nothing is fetched again.
+        """
+        if (hub_data_fetcher := self._hub_data_fetcher) is None:
             return
 
-        _LOGGER.debug(
-            "CONNECTION_RECOVERY: Refreshing hub data for %s",
-            self._central_info.name,
-        )
+        async with self._hub_refresh_lock:
+            if refreshed_since is not None and self._hub_refreshed_at >= refreshed_since:
+                _LOGGER.debug(
+                    "CONNECTION_RECOVERY: Hub data for %s already refreshed",
+                    self._central_info.name,
+                )
+                return
 
-        # Refresh system update data first - most important after CCU restart/update
+            _LOGGER.debug(
+                "CONNECTION_RECOVERY: Refreshing hub data for %s",
+                self._central_info.name,
+            )
+            self._hub_refreshed_at = datetime.now()
+
+            # System update data is most important after CCU restart/update
+            fetches: list[Awaitable[None]] = [
+                self._refresh_hub_data_part(name="System update", fetch=hub_data_fetcher.fetch_system_update_data)
+            ]
+            if self._config_provider.config.enable_program_scan:
+                fetches.append(self._refresh_hub_data_part(name="Program", fetch=hub_data_fetcher.fetch_program_data))
+            if self._config_provider.config.enable_sysvar_scan:
+                fetches.append(self._refresh_hub_data_part(name="Sysvar", fetch=hub_data_fetcher.fetch_sysvar_data))
+            await asyncio.gather(*fetches)
+
+    async def _refresh_hub_data_part(self, *, name: str, fetch: Callable[..., Awaitable[None]]) -> None:
+        """Refresh one part of the hub data, logging failures."""
         try:
-            await self._hub_data_fetcher.fetch_system_update_data(scheduled=False)
-            _LOGGER.debug("CONNECTION_RECOVERY: System update data refreshed")
+            await fetch(scheduled=False)
+            _LOGGER.debug("CONNECTION_RECOVERY: %s data refreshed", name)
         except Exception:
             _LOGGER.debug(  # i18n-log: ignore
-                "CONNECTION_RECOVERY: Failed to refresh system update data",
+                "CONNECTION_RECOVERY: Failed to refresh %s data",
+                name.lower(),
                 exc_info=True,
             )
 
-        # Refresh programs if enabled
-        if self._config_provider.config.enable_program_scan:
-            try:
-                await self._hub_data_fetcher.fetch_program_data(scheduled=False)
-                _LOGGER.debug("CONNECTION_RECOVERY: Program data refreshed")
-            except Exception:
-                _LOGGER.debug(  # i18n-log: ignore
-                    "CONNECTION_RECOVERY: Failed to refresh program data",
-                    exc_info=True,
-                )
-
-        # Refresh sysvars if enabled
-        if self._config_provider.config.enable_sysvar_scan:
-            try:
-                await self._hub_data_fetcher.fetch_sysvar_data(scheduled=False)
-                _LOGGER.debug("CONNECTION_RECOVERY: Sysvar data refreshed")
-            except Exception:
-                _LOGGER.debug(  # i18n-log: ignore
-                    "CONNECTION_RECOVERY: Failed to refresh sysvar data",
-                    exc_info=True,
-                )
-
     async def _refresh_interface_data(self, *, interface_id: str) -> None:
         """Refresh data for a specific interface after recovery."""
         try:
@@ -945,16 +1002,98 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
                 interface_id,
             )
 
-    async def _stage_data_load(self, *, interface_id: str) -> bool:
-        """Stage: Load device and paramset data, then refresh hub data."""
+    async def _reload_device_data(
+        self,
+        *,
+        interface_id: str,
+        refreshed_since: datetime,
+        state: InterfaceRecoveryState | None = None,
+    ) -> None:
+        """
+        Reload the device data of an interface that may have missed events since refreshed_since.
+
+        Channels that received an event since refreshed_since are skipped. If the
+        resync plan asks for a full refresh, the device data is fetched in bulk
+        before the data points without a newer value are re-read; otherwise only
+        the stale channels are re-read. Durations are recorded on state, if given.
+        """
+        interface = self._client_provider.get_client(interface_id=interface_id).interface
+        plan = self._device_data_refresher.plan_resync(interface_id=interface_id, gap_started_at=refreshed_since)
+
+        if plan.full_refresh:
+            started_at = time.perf_counter()
+            await self._device_data_refresher.load_device_data(interface=interface)
+            if state is not None:
+                state.record_reload_step(
+                    step=RecoveryReloadStep.DEVICE_DATA, duration_ms=(time.perf_counter() - started_at) * 1000
+                )
+            started_at = time.perf_counter()
+            reread_count = await self._device_data_refresher.refresh_stale_data_point_data(
+                interface=interface, refreshed_before=refreshed_since
+            )
+        else:
+            started_at = time.perf_counter()
+            reread_count = await self._device_data_refresher.execute_resync(plan=plan)
+        if state is not None:
+            state.record_reload_step(
+                step=RecoveryReloadStep.CHANNEL_DATA, duration_ms=(time.perf_counter() - started_at) * 1000
+            )
+        _LOGGER.debug(
+            "CONNECTION_RECOVERY: Re-read %d data points of %s (full refresh: %s, fresh channels skipped: %d)",
+            reread_count,
+            interface_id,
+            plan.full_refresh,
+            plan.fresh_count,
+        )
+
+    async def _resync_after_event_gap(self, *, interface_id: str, gap_started_at: datetime) -> None:
+        """Re-read the channels of an interface without an event since gap_started_at."""
         try:
-            client = self._client_provider.get_client(interface_id=interface_id)
-            interface = client.interface
-            await self._device_data_refresher.load_and_refresh_data_point_data(interface=interface)
+            await self._reload_device_data(interface_id=interface_id, refreshed_since=gap_started_at)
         except Exception:
             _LOGGER.exception(  # i18n-log: ignore
+                "CONNECTION_RECOVERY: Resync after event gap failed for %s",
+                interface_id,
+            )
+
+    async def _refresh_hub_data_timed(self, *, interface_id: str, refreshed_since: datetime) -> None:
+        """Refresh the hub data and record the duration for the interface."""
+        started_at = time.perf_counter()
+        await self._refresh_hub_data_after_recovery(refreshed_since=refreshed_since)
+        if (state := self._recovery_states.get(interface_id)) is not None:
+            state.record_reload_step(
+                step=RecoveryReloadStep.HUB_DATA, duration_ms=(time.perf_counter() - started_at) * 1000
+            )
+
+    async def _stage_data_load(self, *, interface_id: str, refreshed_since: datetime | None = None) -> bool:
+        """
+        Stage: Reload device data and hub data in parallel.
+
+        Data points refreshed at or after refreshed_since (by an event received
+        after the reconnect) are not re-read. Defaults to the start of this stage.
+        """
+        if refreshed_since is None:
+            refreshed_since = datetime.now()
+
+        # Refresh hub data alongside the device data
+        # This ensures System Update, Programs, and Sysvars reflect CCU state
+        # (e.g., after CCU performed firmware update during disconnect)
+        device_result, _ = await asyncio.gather(
+            self._reload_device_data(
+                interface_id=interface_id,
+                refreshed_since=refreshed_since,
+                state=self._recovery_states.get(interface_id),
+            ),
+            self._refresh_hub_data_timed(interface_id=interface_id, refreshed_since=refreshed_since),
+            return_exceptions=True,
+        )
+        if isinstance(device_result, BaseException):
+            if isinstance(device_result, asyncio.CancelledError):
+                raise device_result
+            _LOGGER.error(  # i18n-log: ignore
                 "CONNECTION_RECOVERY: Data load failed for %s",
                 interface_id,
+                exc_info=device_result,
             )
             return False
 
@@ -962,13 +1101,6 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
             "CONNECTION_RECOVERY: Data load completed for %s",
             interface_id,
         )
-
-        # Refresh hub data after successful reconnect
-        # This ensures System Update, Programs, and Sysvars reflect CCU state
-        # (e.g., after CCU performed firmware update during disconnect)
-        if self._hub_data_fetcher is not None:
-            await self._refresh_hub_data_after_recovery()
-
         return True
 
     async def _stage_reconnect(self, *, interface_id: str) -> bool:
@@ -1281,6 +1413,13 @@ class ConnectionRecoveryCoordinator(RecoveryProviderForMetricsProtocol):
                 handler=self._on_circuit_breaker_state_changed,
             )
         )
+        self._unsubscribers.append(
+            self._event_bus.subscribe(
+                event_type=EventGapDetectedEvent,
+                event_key=None,
+                handler=self._on_event_gap_detected,
+            )
+        )
         self._unsubscribers.append(
             self._event_bus.subscribe(
                 event_type=HeartbeatTimerFiredEvent,
@@ -19,6 +19,7 @@ from collections import defaultdict
 from collections.abc import Mapping
 from datetime import datetime
 import logging
+import time
 from typing import Any, Final
 
 from aiohomematic import i18n
@@ -28,6 +29,7 @@ from aiohomematic.central.events import DeviceRemovedEvent, IntegrationIssue, Sy
 from aiohomematic.central.events.internal import DataFetchCompletedEvent, DataFetchOperation
 from aiohomematic.const import (
     CATEGORIES,
+    MAX_CONCURRENT_DEVICE_INITS,
     DataPointCategory,
     DeviceDescription,
     DeviceFirmwareState,
@@ -35,6 +37,7 @@ from aiohomematic.const import (
     IntegrationIssueType,
     ParamsetKey,
     ProductGroup,
+    RxMode,
     SourceOfDeviceCreation,
     SystemEventType,
 )
@@ -60,10 +63,12 @@ from aiohomematic.interfaces import (
     IncidentRecorderProtocol,
     ParameterVisibilityProviderProtocol,
     ParamsetDescriptionProviderProtocol,
+    ScheduleCacheProtocol,
     TaskSchedulerProtocol,
 )
 from aiohomematic.interfaces.central import FirmwareDataRefresherProtocol
 from aiohomematic.interfaces.client import DeviceDiscoveryAndMetadataProtocol, DeviceDiscoveryWithIdentityProtocol
+from aiohomematic.metrics import MetricKeys, emit_latency, profile_phase
 from aiohomematic.model import create_data_points_and_events
 from aiohomematic.model.custom import create_custom_data_points
 from aiohomematic.model.device import Device
@@ -97,6 +102,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         "_incident_recorder",
         "_parameter_visibility_provider",
         "_paramset_description_provider",
+        "_schedule_cache",
         "_task_scheduler",
     )
 
@@ -118,6 +124,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         incident_recorder: IncidentRecorderProtocol | None = None,
         parameter_visibility_provider: ParameterVisibilityProviderProtocol,
         paramset_description_provider: ParamsetDescriptionProviderProtocol,
+        schedule_cache: ScheduleCacheProtocol | None = None,
         task_scheduler: TaskSchedulerProtocol,
     ) -> None:
         """
@@ -140,6 +147,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
             incident_recorder: Optional incident recorder for diagnostics
             parameter_visibility_provider: Provider for parameter visibility rules
             paramset_description_provider: Provider for paramset descriptions
+            schedule_cache: Optional persistent cache for week profile schedules
             task_scheduler: Scheduler for async tasks
 
         """
@@ -158,6 +166,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         self._incident_recorder: Final = incident_recorder
         self._parameter_visibility_provider: Final = parameter_visibility_provider
         self._paramset_description_provider: Final = paramset_description_provider
+        self._schedule_cache: Final = schedule_cache
         self._task_scheduler: Final = task_scheduler
         self._delayed_device_descriptions: Final[dict[str, dict[str, list[DeviceDescription]]]] = defaultdict(
             lambda: defaultdict(list)
@@ -370,6 +379,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
 
         expected_device_count = sum(len(addresses) for addresses in new_device_addresses.values())
         new_devices = set[DeviceProtocol]()
+        construct_started = time.perf_counter()
 
         # The per-device ``except Exception`` blocks below deliberately swallow recoverable errors
         # so a single broken device does not abort bulk processing. They do NOT catch
@@ -407,6 +417,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
                             data_cache_provider=self._data_cache_provider,
                             data_point_provider=self._data_point_provider,
                             channel_lookup=self,
+                            schedule_cache=self._schedule_cache,
                         )
                         device = Device(context=context)
                     except Exception as exc:  # noqa: BLE001 - device creation must not abort bulk device processing
@@ -444,10 +455,14 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
                     self._central_info.name,
                 )
 
+        self._emit_creation_stage_latency(stage="construct", started=construct_started)
         _LOGGER.debug("CREATE_DEVICES: Finished creating devices for %s", self._central_info.name)
 
         if new_devices:
-            await asyncio.gather(*(device.finalize_init() for device in new_devices))
+            finalize_started = time.perf_counter()
+            with profile_phase(name="devices.finalize", device_count=len(new_devices)):
+                await self._finalize_new_devices(new_devices=new_devices)
+            self._emit_creation_stage_latency(stage="finalize", started=finalize_started)
             new_dps: dict[DataPointCategory, Any] = _get_new_data_points(new_devices=new_devices)
             new_dps[DataPointCategory.EVENT_GROUP] = _get_new_event_groups(new_devices=new_devices)
             self._coordinator_provider.event_coordinator.publish_system_event(
@@ -501,6 +516,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         await self._coordinator_provider.cache_coordinator.save_all(
             save_device_descriptions=True,
             save_paramset_descriptions=True,
+            save_schedules=True,
         )
 
     def get_channel(self, *, channel_address: str) -> ChannelProtocol | None:
@@ -620,6 +636,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         await self._coordinator_provider.cache_coordinator.save_all(
             save_device_descriptions=True,
             save_paramset_descriptions=True,
+            save_schedules=True,
         )
 
     async def refresh_device_descriptions_and_create_missing_devices(
@@ -647,7 +664,8 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         ):
             device_descriptions = (device_description,)
         else:
-            device_descriptions = await client.list_devices()
+            with profile_phase(name="devices.list", interface_id=client.interface_id):
+                device_descriptions = await client.list_devices()
 
         if (
             device_descriptions
@@ -831,6 +849,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         await self._coordinator_provider.cache_coordinator.save_all(
             save_device_descriptions=True,
             save_paramset_descriptions=True,
+            save_schedules=True,
         )
 
     @callback_backend_system(system_event=SystemEventType.UPDATE_DEVICE)
@@ -880,6 +899,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         await self._coordinator_provider.cache_coordinator.save_all(
             save_device_descriptions=True,
             save_paramset_descriptions=True,
+            save_schedules=True,
         )
 
     @inspector(measure_performance=True)
@@ -1188,7 +1208,7 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
         # Log warnings for each affected device
         for dev_addr, missing_params in all_inconsistencies.items():
             _LOGGER.warning(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.device.paramset_consistency.inconsistency_detected",
                     device_address=dev_addr,
                     interface_id=interface_id,
@@ -1234,6 +1254,39 @@ class DeviceCoordinator(FirmwareDataRefresherProtocol):
             )
         )
 
+    def _emit_creation_stage_latency(self, *, stage: str, started: float) -> None:
+        """Emit the duration of a device creation stage."""
+        duration_ms = (time.perf_counter() - started) * 1000
+        _LOGGER.debug("CREATE_DEVICES: Stage %s took %.1fms for %s", stage, duration_ms, self._central_info.name)
+        emit_latency(
+            event_bus=self._event_bus_provider.event_bus,
+            key=MetricKeys.device_creation_stage(stage=stage),
+            duration_ms=duration_ms,
+        )
+
+    async def _finalize_new_devices(self, *, new_devices: set[DeviceProtocol]) -> None:
+        """
+        Finalize new devices with bounded concurrency.
+
+        Finalizing loads the initial values of a device from the backend, so
+        devices are processed in parallel instead of one after another. Each
+        interface gets its own limit, so a large installation does not flood a
+        single backend. Devices that are not always listening (battery devices
+        with WAKEUP/BURST/CONFIG rx modes) are finalized one at a time per
+        interface, as their backend reads are answered from the backend queue.
+        """
+        semaphores: dict[tuple[str, bool], asyncio.Semaphore] = {}
+
+        async def _finalize(*, device: DeviceProtocol) -> None:
+            always_listening = not device.rx_modes or RxMode.ALWAYS in device.rx_modes
+            lane = (device.interface_id, always_listening)
+            if (semaphore := semaphores.get(lane)) is None:
+                semaphore = semaphores[lane] = asyncio.Semaphore(MAX_CONCURRENT_DEVICE_INITS if always_listening else 1)
+            async with semaphore:
+                await device.finalize_init()
+
+        await asyncio.gather(*(_finalize(device=device) for device in new_devices))
+
     def _identify_devices_missing_paramsets(
         self, *, interface_id: str, device_descriptions: tuple[DeviceDescription, ...]
     ) -> tuple[DeviceDescription, ...]:
@@ -39,6 +39,7 @@ from aiohomematic.const import (
     Parameter,
     ParamsetKey,
     SystemEventType,
+    TaskCategory,
 )
 from aiohomematic.interfaces import (
     ClientProviderProtocol,
@@ -57,6 +58,9 @@ from aiohomematic.property_decorators import DelegatedProperty
 _LOGGER: Final = logging.getLogger(__name__)
 _LOGGER_EVENT: Final = logging.getLogger(f"{__package__}.event")
 
+# Radio load parameters of access points, fed into the command throttle
+_RADIO_LOAD_PARAMETERS: Final[frozenset[str]] = frozenset({Parameter.CARRIER_SENSE_LEVEL, Parameter.DUTY_CYCLE_LEVEL})
+
 
 class SystemEventArgs(TypedDict, total=False):
     """Arguments for all system events (DEVICES_CREATED, DELETE_DEVICES, HUB_REFRESHED)."""
@@ -215,6 +219,12 @@ class EventCoordinator(
                     client.ping_pong_tracker.handle_received_pong(pong_token=token)
             return
 
+        # Feed radio load of access points into the adaptive command throttle
+        if parameter in _RADIO_LOAD_PARAMETERS:
+            self._client_provider.get_client(interface_id=interface_id).command_throttle.update_radio_load(
+                source=channel_address, parameter=parameter, value=value
+            )
+
         received_at = datetime.now()
 
         # Check if this is a STATUS parameter (e.g., LEVEL_STATUS)
@@ -321,6 +331,7 @@ class EventCoordinator(
         self._task_scheduler.create_task(
             target=partial(_publish_backend_parameter_event),
             name=f"event-bus-backend-param-{channel_address}-{parameter}",
+            category=TaskCategory.EVENT,
         )
 
     @loop_check
@@ -362,6 +373,7 @@ class EventCoordinator(
         self._task_scheduler.create_task(
             target=partial(_publish_device_trigger_event),
             name=f"event-bus-device-trigger-{event_data.device_address}-{event_data.channel_no}-{event_data.parameter}",
+            category=TaskCategory.EVENT,
         )
 
     @loop_check
@@ -454,6 +466,7 @@ class EventCoordinator(
         self._task_scheduler.create_task(
             target=partial(_publish_event),
             name="event-bus-devices-removed",
+            category=TaskCategory.EVENT,
         )
 
     def _emit_devices_created_events(self, *, timestamp: datetime, **kwargs: Unpack[DevicesCreatedEventArgs]) -> None:
@@ -496,6 +509,7 @@ class EventCoordinator(
         self._task_scheduler.create_task(
             target=partial(_publish_events),
             name="event-bus-devices-created",
+            category=TaskCategory.EVENT,
         )
 
     def _emit_devices_delayed_event(self, *, timestamp: datetime, **kwargs: Unpack[SystemEventArgs]) -> None:
@@ -519,6 +533,7 @@ class EventCoordinator(
         self._task_scheduler.create_task(
             target=partial(_publish_event),
             name="event-bus-devices-delayed",
+            category=TaskCategory.EVENT,
         )
 
     def _emit_hub_refreshed_event(self, *, timestamp: datetime, **kwargs: Unpack[HubRefreshedEventArgs]) -> None:
@@ -539,4 +554,5 @@ class EventCoordinator(
         self._task_scheduler.create_task(
             target=partial(_publish_event),
             name="event-bus-hub-refreshed",
+            category=TaskCategory.EVENT,
         )
@@ -20,7 +20,7 @@ from typing import Any, Final
 
 from aiohomematic import i18n
 from aiohomematic.central.events.internal import ProgramExecutedEvent
-from aiohomematic.const import DataPointCategory, Interface, ProgramTrigger
+from aiohomematic.const import DataPointCategory, DataRefreshType, Interface, ProgramTrigger
 from aiohomematic.decorators import inspector
 from aiohomematic.interfaces import (
     CentralInfoProtocol,
@@ -278,6 +278,24 @@ class HubCoordinator(HubDataFetcherProtocol, HubDataPointManagerProtocol):
         """
         self._hub.fetch_connectivity_data(scheduled=scheduled)
 
+    @inspector(re_raise=False, no_raise_return=frozenset())
+    async def fetch_hub_data(self, *, scheduled: bool) -> frozenset[DataRefreshType] | None:
+        """
+        Fetch programs, sysvars, inbox, service and alarm messages with one hub snapshot.
+
+        Args:
+        ----
+            scheduled: Whether this is a scheduled refresh
+
+        Returns:
+        -------
+            The refreshed data categories, empty if the fetch failed, or None if the
+            backend provides no hub snapshot and the separate fetch methods must be
+            used instead
+
+        """
+        return await self._hub.fetch_hub_data(scheduled=scheduled)
+
     @inspector(re_raise=False)
     async def fetch_inbox_data(self, *, scheduled: bool) -> None:
         """
@@ -465,11 +483,12 @@ class HubCoordinator(HubDataFetcherProtocol, HubDataPointManagerProtocol):
     async def init_hub(self) -> None:
         """Initialize the hub by fetching program, sysvar, inbox, install mode, metrics, and connectivity data."""
         _LOGGER.debug("INIT_HUB: Initializing hub for %s", self._central_info.name)
-        await self._hub.fetch_program_data(scheduled=True)
-        await self._hub.fetch_sysvar_data(scheduled=True)
-        await self._hub.fetch_inbox_data(scheduled=False)
-        await self._hub.fetch_service_messages_data(scheduled=False)
-        await self._hub.fetch_alarm_messages_data(scheduled=False)
+        if await self._hub.fetch_hub_data(scheduled=False) is None:
+            await self._hub.fetch_program_data(scheduled=True)
+            await self._hub.fetch_sysvar_data(scheduled=True)
+            await self._hub.fetch_inbox_data(scheduled=False)
+            await self._hub.fetch_service_messages_data(scheduled=False)
+            await self._hub.fetch_alarm_messages_data(scheduled=False)
         await self._hub.init_install_mode()
         self._hub.init_metrics()
         self._hub.init_connectivity()
@@ -559,7 +578,7 @@ class HubCoordinator(HubDataFetcherProtocol, HubDataPointManagerProtocol):
             await dp.send_variable(value=value)
         else:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.set_system_variable.not_found",
                     legacy_name=legacy_name,
                     name=self._central_info.name,
@@ -10,7 +10,7 @@ import logging
 from typing import Any, Final, cast
 
 from aiohomematic import client as hmcl, i18n
-from aiohomematic.const import SystemEventType
+from aiohomematic.const import SystemEventType, TaskCategory
 from aiohomematic.exceptions import AioHomematicException
 from aiohomematic.support import extract_exc_args
 from aiohomematic.type_aliases import CallableAny, CallableNone
@@ -55,10 +55,11 @@ def callback_backend_system(system_event: SystemEventType) -> Callable[[Callable
                     looper.create_task(
                         target=partial(_exec_backend_system_callback, *args, **kwargs),
                         name="wrapper_backend_system_callback",
+                        category=TaskCategory.RPC_CALLBACK,
                     )
             except Exception as exc:  # noqa: BLE001 - XML-RPC callback must never propagate to backend
                 _LOGGER.warning(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="exception.central.decorators.backend_system_handler.identify_central_failed",
                         reason=extract_exc_args(exc=exc),
                     )
@@ -146,6 +147,7 @@ def callback_event[**P, R](func: Callable[P, R]) -> Callable[P, R | Awaitable[R]
                 looper.create_task(
                     target=partial(_async_wrap_sync, _exec_event_callback, *args, **kwargs),
                     name="wrapper_event_callback",
+                    category=TaskCategory.RPC_CALLBACK,
                 )
                 return
         except Exception:  # noqa: BLE001, S110 - must not break event delivery; any scheduler fault falls back to inline execution
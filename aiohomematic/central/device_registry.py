@@ -7,7 +7,7 @@ This module provides a centralized registry for device management within the cen
 It separates device storage concerns from device lifecycle management.
 
 The DeviceRegistry provides:
-- Device storage and lookup by address
+- Device storage and lookup by address, sharded per interface
 - Channel lookup by channel address
 - Device iteration and filtering
 - Channel identification within text
@@ -15,23 +15,134 @@ The DeviceRegistry provides:
 """
 
 import asyncio
+from collections import defaultdict
+from collections.abc import Iterable, Mapping
 import logging
-from typing import Final
-
-from aiohomematic.interfaces import CentralInfoProtocol, ChannelProtocol, ClientProviderProtocol, DeviceProtocol
+import re
+from typing import Final, TypeVar
+
+from aiohomematic.const import DataPointCategory, DataPointUsage, Interface
+from aiohomematic.interfaces import (
+    CallbackDataPointProtocol,
+    CentralInfoProtocol,
+    ChannelProtocol,
+    ClientProviderProtocol,
+    DeviceProtocol,
+)
 from aiohomematic.support.address import get_device_address
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Same token boundaries as Device.identify_channel (alphanumeric or underscore).
+_WORD_PATTERN: Final = re.compile(r"\w+")
+
+
+class _DeviceIndex:
+    """
+    Secondary indexes over the registered devices.
+
+    Built on first use after the registry changed, so repeated queries (e.g. one
+    per Home Assistant platform) only touch the matching data points instead of
+    walking every device and channel.
+    """
+
+    __slots__ = (
+        "_address_lengths",
+        "_by_category",
+        "_by_interface",
+        "_by_interface_category",
+        "_by_type",
+        "_channels_by_address",
+        "_channels_by_ise_id",
+        "_data_points",
+    )
+
+    def __init__(self, *, devices: Iterable[DeviceProtocol]) -> None:
+        """Build the indexes from the devices in registry order."""
+        data_points: list[CallbackDataPointProtocol] = []
+        by_interface: defaultdict[Interface, list[CallbackDataPointProtocol]] = defaultdict(list)
+        by_category: defaultdict[DataPointCategory, list[CallbackDataPointProtocol]] = defaultdict(list)
+        by_interface_category: defaultdict[tuple[Interface, DataPointCategory], list[CallbackDataPointProtocol]] = (
+            defaultdict(list)
+        )
+        # Channels are stored with their position in registry order, so lookups
+        # return the same channel as a scan over all devices would.
+        self._channels_by_address: Final[dict[str, tuple[int, ChannelProtocol]]] = {}
+        self._channels_by_ise_id: Final[dict[str, tuple[int, ChannelProtocol]]] = {}
+
+        position = 0
+        for device in devices:
+            for dp in device.get_data_points(exclude_no_create=False):
+                data_points.append(dp)
+                by_interface[device.interface].append(dp)
+                by_category[dp.category].append(dp)
+                by_interface_category[(device.interface, dp.category)].append(dp)
+            for channel_address, channel in device.channels.items():
+                entry = (position, channel)
+                position += 1
+                self._channels_by_address.setdefault(channel_address, entry)
+                self._channels_by_ise_id.setdefault(str(channel.ise_id), entry)
+                self._channels_by_ise_id.setdefault(str(device.ise_id), entry)
+
+        self._data_points: Final = tuple(data_points)
+        self._by_interface: Final = {key: tuple(dps) for key, dps in by_interface.items()}
+        self._by_category: Final = {key: tuple(dps) for key, dps in by_category.items()}
+        self._by_interface_category: Final = {key: tuple(dps) for key, dps in by_interface_category.items()}
+        self._by_type: Final[dict[tuple[type, DataPointCategory | None, Interface | None], tuple[object, ...]]] = {}
+        self._address_lengths: Final = frozenset(len(address) for address in self._channels_by_address)
+
+    def get_data_points(
+        self, *, category: DataPointCategory | None, interface: Interface | None
+    ) -> tuple[CallbackDataPointProtocol, ...]:
+        """Return all data points of a category and/or interface."""
+        if category is None:
+            return self._data_points if interface is None else self._by_interface.get(interface, ())
+        if interface is None:
+            return self._by_category.get(category, ())
+        return self._by_interface_category.get((interface, category), ())
+
+    def get_data_points_by_type(
+        self, *, data_point_class: type[_T], category: DataPointCategory | None, interface: Interface | None
+    ) -> tuple[_T, ...]:
+        """Return all data points of a class, category and/or interface."""
+        key = (data_point_class, category, interface)
+        if (cached := self._by_type.get(key)) is None:
+            cached = self._by_type[key] = tuple(
+                dp
+                for dp in self.get_data_points(category=category, interface=interface)
+                if isinstance(dp, data_point_class)
+            )
+        return cached  # type: ignore[return-value]
+
+    def identify_channel(self, *, text: str) -> ChannelProtocol | None:
+        """Return the first channel (in registry order) whose address ends the text or whose ise_id is a word of it."""
+        best: tuple[int, ChannelProtocol] | None = None
+        candidates = [
+            self._channels_by_address.get(text[-length:]) for length in self._address_lengths if len(text) >= length
+        ]
+        candidates.extend(self._channels_by_ise_id.get(token) for token in _WORD_PATTERN.findall(text))
+        for candidate in candidates:
+            if candidate is not None and (best is None or candidate[0] < best[0]):
+                best = candidate
+        return best[1] if best is not None else None
+
 
 class DeviceRegistry:
     """Registry for device and channel management."""
 
     __slots__ = (
+        "_addresses_view",
         "_central_info",
         "_client_provider",
         "_devices",
+        "_devices_view",
+        "_index",
         "_lock",
+        "_models_view",
+        "_shard_views",
+        "_shards",
     )
 
     def __init__(
@@ -53,6 +164,14 @@ class DeviceRegistry:
         self._client_provider: Final = client_provider
         # {device_address, device}
         self._devices: Final[dict[str, DeviceProtocol]] = {}
+        # {interface_id, {device_address, device}}
+        self._shards: Final[dict[str, dict[str, DeviceProtocol]]] = {}
+        # Immutable views, built on first access and dropped on add/remove
+        self._devices_view: tuple[DeviceProtocol, ...] | None = None
+        self._addresses_view: frozenset[str] | None = None
+        self._models_view: tuple[str, ...] | None = None
+        self._shard_views: Final[dict[str, tuple[DeviceProtocol, ...]]] = {}
+        self._index: _DeviceIndex | None = None
         self._lock: Final = asyncio.Lock()
 
     @property
@@ -67,17 +186,33 @@ class DeviceRegistry:
         """
         return len(self._devices)
 
+    @property
+    def device_counts_by_interface(self) -> Mapping[str, int]:
+        """
+        Return the count of devices per interface.
+
+        Returns
+        -------
+            Mapping of interface_id to number of devices
+
+        """
+        return {interface_id: len(shard) for interface_id, shard in self._shards.items()}
+
     @property
     def devices(self) -> tuple[DeviceProtocol, ...]:
         """
         Return all devices as a tuple.
 
+        The tuple is cached until a device is added or removed.
+
         Returns
         -------
             Tuple of all Device instances
 
         """
-        return tuple(self._devices.values())
+        if self._devices_view is None:
+            self._devices_view = tuple(self._devices.values())
+        return self._devices_view
 
     @property
     def models(self) -> tuple[str, ...]:
@@ -89,7 +224,9 @@ class DeviceRegistry:
             Models of all devices
 
         """
-        return tuple(sorted({d.model for d in self.devices}))
+        if self._models_view is None:
+            self._models_view = tuple(sorted({d.model for d in self._devices.values()}))
+        return self._models_view
 
     async def add_device(self, *, device: DeviceProtocol) -> None:
         """
@@ -101,7 +238,11 @@ class DeviceRegistry:
 
         """
         async with self._lock:
+            if (existing := self._devices.get(device.address)) is not None:
+                self._remove_from_shard(device=existing)
             self._devices[device.address] = device
+            self._shards.setdefault(device.interface_id, {})[device.address] = device
+            self._invalidate_views()
         _LOGGER.debug(
             "ADD_DEVICE: Added device %s to registry for %s",
             device.address,
@@ -112,6 +253,8 @@ class DeviceRegistry:
         """Clear all devices from the registry."""
         async with self._lock:
             self._devices.clear()
+            self._shards.clear()
+            self._invalidate_views()
         _LOGGER.debug("CLEAR: Cleared device registry for %s", self._central_info.name)
 
     def get_channel(self, *, channel_address: str) -> ChannelProtocol | None:
@@ -131,6 +274,68 @@ class DeviceRegistry:
             return device.get_channel(channel_address=channel_address)
         return None
 
+    def get_data_points(
+        self,
+        *,
+        category: DataPointCategory | None = None,
+        interface: Interface | None = None,
+        exclude_no_create: bool = True,
+        registered: bool | None = None,
+    ) -> tuple[CallbackDataPointProtocol, ...]:
+        """
+        Get the data points of all devices.
+
+        Args:
+        ----
+            category: Only return data points of this category
+            interface: Only return data points of devices on this interface
+            exclude_no_create: Exclude data points with usage NO_CREATE
+            registered: Only return data points with this registration state
+
+        Returns:
+        -------
+            Tuple of data points in registry order
+
+        """
+        return _filter_data_points(
+            data_points=self._get_index().get_data_points(category=category, interface=interface),
+            exclude_no_create=exclude_no_create,
+            registered=registered,
+        )
+
+    def get_data_points_by_type(
+        self,
+        *,
+        data_point_class: type[_T],
+        category: DataPointCategory | None = None,
+        interface: Interface | None = None,
+        exclude_no_create: bool = True,
+        registered: bool | None = None,
+    ) -> tuple[_T, ...]:
+        """
+        Get the data points of all devices that are instances of a class.
+
+        Args:
+        ----
+            data_point_class: Class (or runtime checkable protocol) to filter by
+            category: Only return data points of this category
+            interface: Only return data points of devices on this interface
+            exclude_no_create: Exclude data points with usage NO_CREATE
+            registered: Only return data points with this registration state
+
+        Returns:
+        -------
+            Tuple of data points in registry order
+
+        """
+        return _filter_data_points(  # type: ignore[return-value]
+            data_points=self._get_index().get_data_points_by_type(
+                data_point_class=data_point_class, category=category, interface=interface
+            ),
+            exclude_no_create=exclude_no_create,
+            registered=registered,
+        )
+
     def get_device(self, *, address: str) -> DeviceProtocol | None:
         """
         Get a device by address.
@@ -156,7 +361,43 @@ class DeviceRegistry:
             Frozen set of device addresses
 
         """
-        return frozenset(self._devices.keys())
+        if self._addresses_view is None:
+            self._addresses_view = frozenset(self._devices)
+        return self._addresses_view
+
+    def get_device_count(self, *, interface_id: str) -> int:
+        """
+        Get the number of devices of an interface.
+
+        Args:
+        ----
+            interface_id: Interface identifier
+
+        Returns:
+        -------
+            Number of devices of the interface
+
+        """
+        return len(self._shards.get(interface_id, ()))
+
+    def get_devices(self, *, interface_id: str) -> tuple[DeviceProtocol, ...]:
+        """
+        Get all devices of an interface.
+
+        The tuple is cached until a device is added or removed.
+
+        Args:
+        ----
+            interface_id: Interface identifier
+
+        Returns:
+        -------
+            Tuple of the Device instances of the interface
+
+        """
+        if (view := self._shard_views.get(interface_id)) is None:
+            view = self._shard_views[interface_id] = tuple(self._shards.get(interface_id, {}).values())
+        return view
 
     def get_virtual_remotes(self) -> tuple[DeviceProtocol, ...]:
         """
@@ -197,10 +438,7 @@ class DeviceRegistry:
             Channel instance or None if not found
 
         """
-        for device in self._devices.values():
-            if channel := device.identify_channel(text=text):
-                return channel
-        return None
+        return self._get_index().identify_channel(text=text)
 
     async def remove_device(self, *, device_address: str) -> None:
         """
@@ -219,9 +457,45 @@ class DeviceRegistry:
                     self._central_info.name,
                 )
                 return
-            del self._devices[device_address]
+            self._remove_from_shard(device=self._devices.pop(device_address))
+            self._invalidate_views()
         _LOGGER.debug(
             "REMOVE_DEVICE: Removed device %s from registry for %s",
             device_address,
             self._central_info.name,
         )
+
+    def _get_index(self) -> _DeviceIndex:
+        """Return the secondary indexes, rebuilding them after the registry changed."""
+        if self._index is None:
+            self._index = _DeviceIndex(devices=self._devices.values())
+        return self._index
+
+    def _invalidate_views(self) -> None:
+        """Drop the cached views and indexes after the registry changed."""
+        self._devices_view = None
+        self._addresses_view = None
+        self._models_view = None
+        self._shard_views.clear()
+        self._index = None
+
+    def _remove_from_shard(self, *, device: DeviceProtocol) -> None:
+        """Remove a device from the shard of its interface."""
+        if (shard := self._shards.get(device.interface_id)) is not None:
+            shard.pop(device.address, None)
+            if not shard:
+                del self._shards[device.interface_id]
+
+
+def _filter_data_points(
+    *, data_points: tuple[CallbackDataPointProtocol, ...], exclude_no_create: bool, registered: bool | None
+) -> tuple[CallbackDataPointProtocol, ...]:
+    """Filter data points by their usage and registration state, which can change at runtime."""
+    if not exclude_no_create and registered is None:
+        return data_points
+    return tuple(
+        dp
+        for dp in data_points
+        if (not exclude_no_create or dp.usage != DataPointUsage.NO_CREATE)
+        and (registered is None or dp.is_registered == registered)
+    )
@@ -17,7 +17,10 @@ part of the stable public API.
 """
 
 from aiohomematic.central.events.bus import (
+    DataPointsRefreshedEvent,
+    DataPointStateChangedBatchEvent,
     DataPointStateChangedEvent,
+    DataPointUpdateNotifier,
     DeviceRemovedEvent,
     EventBatch,
     EventBus,
@@ -47,6 +50,7 @@ from aiohomematic.central.events.internal import (
     DataRefreshCompletedEvent,
     DataRefreshTriggeredEvent,
     DeviceStateChangedEvent,
+    EventGapDetectedEvent,
     FirmwareStateChangedEvent,
     HeartbeatTimerFiredEvent,
     LinkPeerChangedEvent,
@@ -71,10 +75,13 @@ from aiohomematic.central.events.types import (
 # consumers should not depend on them.
 __all__ = [
     # Data point state events
+    "DataPointStateChangedBatchEvent",
     "DataPointStateChangedEvent",
+    "DataPointsRefreshedEvent",
     "DeviceRemovedEvent",
     "OptimisticRollbackEvent",
     # EventBus core
+    "DataPointUpdateNotifier",
     "Event",
     "EventBatch",
     "EventBus",
@@ -110,6 +117,7 @@ __all__ = [
     "DataRefreshCompletedEvent",
     "DataRefreshTriggeredEvent",
     "DeviceStateChangedEvent",
+    "EventGapDetectedEvent",
     "FirmwareStateChangedEvent",
     "HealthRecordedEvent",
     "HeartbeatTimerFiredEvent",
@@ -103,8 +103,9 @@ Example Usage
 import asyncio
 import bisect
 from collections import defaultdict
-from collections.abc import Coroutine, Sequence
+from collections.abc import Coroutine, Hashable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field as dataclass_field
+from datetime import datetime
 import logging
 import time
 import types
@@ -117,10 +118,10 @@ from aiohomematic.central.events.internal import (
     LinkPeerChangedEvent,
 )
 from aiohomematic.central.events.types import Event, EventPriority
-from aiohomematic.const import DataPointKey, FailureReason, ParamsetKey, RecoveryStage
+from aiohomematic.const import DataPointKey, FailureReason, ParamsetKey, RecoveryStage, TaskCategory
 from aiohomematic.interfaces import TaskSchedulerProtocol
 from aiohomematic.property_decorators import DelegatedProperty
-from aiohomematic.type_aliases import UnsubscribeCallback
+from aiohomematic.type_aliases import FieldsChangedHandler, UnsubscribeCallback
 
 if TYPE_CHECKING:
     from typing import Self
@@ -164,6 +165,15 @@ class _PrioritizedHandler:
         self.sort_key = (-self.priority, self.order)
 
 
+@dataclass(frozen=True, slots=True, eq=False)
+class _FieldSubscription:
+    """Internal subscription of a dependent data point on one of its source fields."""
+
+    dependent_unique_id: str
+    field: Hashable
+    handler: FieldsChangedHandler
+
+
 @dataclass(slots=True)
 class HandlerStats:
     """
@@ -278,6 +288,47 @@ class DataPointStateChangedEvent(Event):
         return self.unique_id
 
 
+@dataclass(frozen=True, slots=True)
+class DataPointStateChangedBatchEvent(Event):
+    """
+    All data point updates of one event loop tick.
+
+    Key is None.
+
+    Published by DataPointUpdateNotifier after the single
+    DataPointStateChangedEvents of a tick, and only if this event type has
+    subscribers. Consumers that update many entities at once (e.g. a bulk
+    state write) can handle one event instead of one per data point.
+    """
+
+    events: tuple[DataPointStateChangedEvent, ...]
+
+    @property
+    def key(self) -> Any:
+        """Key identifier for this event."""
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class DataPointsRefreshedEvent(Event):
+    """
+    Data points were refreshed without a value change.
+
+    Key is None.
+
+    Published once per event loop tick for all data points whose value was
+    confirmed by the backend but did not change. This replaces one
+    DataPointStateChangedEvent per refreshed data point.
+    """
+
+    unique_ids: frozenset[str]
+
+    @property
+    def key(self) -> Any:
+        """Key identifier for this event."""
+        return None
+
+
 @dataclass(frozen=True, slots=True)
 class OptimisticRollbackEvent(Event):
     """
@@ -439,6 +490,161 @@ class RecoveryFailedEvent(Event):
         return self.interface_id or self.central_name
 
 
+class DataPointUpdateNotifier:
+    """
+    Coalesce data point update notifications per event loop tick.
+
+    Data points mark themselves as changed or refreshed instead of creating
+    one publish task per write. The first mark within a tick schedules a
+    single flush task, which publishes:
+
+    - one DataPointStateChangedEvent per changed data point, carrying the
+      old_value of the first and the new_value of the last change,
+    - one DataPointStateChangedBatchEvent with these events, if subscribed,
+    - one DataPointsRefreshedEvent for all data points that were only refreshed.
+
+    Custom, combined and calculated data points subscribe to their source
+    fields with subscribe_fields. Before the events are published, the flush
+    collects the changed fields per dependent data point and calls its handler
+    once with all of them, so a putParamset that changes LEVEL, LEVEL_2 and
+    ACTIVITY_STATE of a blind recomputes the cover once. Dependents whose
+    sources were only refreshed are marked as refreshed themselves.
+    """
+
+    __slots__ = (
+        "_changed",
+        "_event_bus",
+        "_field_subscriptions",
+        "_flush_scheduled",
+        "_refreshed",
+        "_task_scheduler",
+    )
+
+    def __init__(self, *, event_bus: EventBus, task_scheduler: TaskSchedulerProtocol) -> None:
+        """Initialize the data point update notifier."""
+        self._event_bus: Final = event_bus
+        self._task_scheduler: Final = task_scheduler
+        self._changed: dict[str, tuple[Any, Any]] = {}
+        self._refreshed: set[str] = set()
+        self._field_subscriptions: Final[dict[str, list[_FieldSubscription]]] = defaultdict(list)
+        self._flush_scheduled = False
+
+    @property
+    def field_subscription_count(self) -> int:
+        """Return the number of field subscriptions of dependent data points."""
+        return sum(len(subscriptions) for subscriptions in self._field_subscriptions.values())
+
+    @property
+    def pending_count(self) -> int:
+        """Return the number of data points waiting for the next flush."""
+        return len(self._changed) + len(self._refreshed)
+
+    def clear_field_subscriptions(self, *, unique_id: str | None = None) -> int:
+        """Remove the field subscriptions on a source data point (or all) and return their number."""
+        if unique_id is None:
+            count = self.field_subscription_count
+            self._field_subscriptions.clear()
+            return count
+        return len(self._field_subscriptions.pop(unique_id, ()))
+
+    async def flush(self) -> None:
+        """Publish the notifications of all data points marked since the last flush."""
+        self._flush_scheduled = False
+        changed, self._changed = self._changed, {}
+        refreshed, self._refreshed = self._refreshed, set()
+        if self._field_subscriptions:
+            self._notify_dependents(changed=changed, refreshed=refreshed)
+        now = datetime.now()
+        if changed:
+            events = tuple(
+                DataPointStateChangedEvent(timestamp=now, unique_id=unique_id, old_value=old_value, new_value=new_value)
+                for unique_id, (old_value, new_value) in changed.items()
+            )
+            await self._event_bus.publish_batch(events=events)
+            if self._event_bus.get_subscription_count(event_type=DataPointStateChangedBatchEvent) > 0:
+                await self._event_bus.publish(event=DataPointStateChangedBatchEvent(timestamp=now, events=events))
+        if refreshed:
+            await self._event_bus.publish(
+                event=DataPointsRefreshedEvent(timestamp=now, unique_ids=frozenset(refreshed))
+            )
+
+    def iter_field_subscriptions(self) -> Iterator[object]:
+        """Yield the records of all field subscriptions (e.g. for memory accounting)."""
+        for subscriptions in self._field_subscriptions.values():
+            yield from subscriptions
+
+    def mark_changed(self, *, unique_id: str, old_value: Any = None, new_value: Any = None) -> None:
+        """Mark a data point as changed; the first old_value within a tick is kept."""
+        if (pending := self._changed.get(unique_id)) is not None:
+            old_value = pending[0]
+        self._changed[unique_id] = (old_value, new_value)
+        self._refreshed.discard(unique_id)
+        self._schedule_flush()
+
+    def mark_refreshed(self, *, unique_id: str) -> None:
+        """Mark a data point as refreshed; ignored if it already changed within this tick."""
+        if unique_id in self._changed:
+            return
+        self._refreshed.add(unique_id)
+        self._schedule_flush()
+
+    def subscribe_fields(
+        self, *, unique_id: str, dependent_unique_id: str, field: Hashable, handler: FieldsChangedHandler
+    ) -> UnsubscribeCallback:
+        """
+        Subscribe a dependent data point to a field backed by the data point unique_id.
+
+        The handler is called as handler(fields=...) once per flush with the
+        frozenset of all fields of the dependent that changed within the tick.
+        """
+        subscription = _FieldSubscription(dependent_unique_id=dependent_unique_id, field=field, handler=handler)
+        self._field_subscriptions[unique_id].append(subscription)
+
+        def unsubscribe() -> None:
+            """Remove this field subscription."""
+            if (subscriptions := self._field_subscriptions.get(unique_id)) and subscription in subscriptions:
+                subscriptions.remove(subscription)
+                if not subscriptions:
+                    del self._field_subscriptions[unique_id]
+
+        return unsubscribe
+
+    def _notify_dependents(self, *, changed: Mapping[str, Any], refreshed: set[str]) -> None:
+        """Call each dependent once with its changed fields and mark refresh-only dependents as refreshed."""
+        fields_changed: dict[str, tuple[FieldsChangedHandler, set[Hashable]]] = {}
+        for unique_id in changed:
+            for subscription in self._field_subscriptions.get(unique_id, ()):
+                if (entry := fields_changed.get(subscription.dependent_unique_id)) is None:
+                    entry = fields_changed[subscription.dependent_unique_id] = (subscription.handler, set())
+                entry[1].add(subscription.field)
+        for dependent_unique_id, (handler, fields) in fields_changed.items():
+            try:
+                handler(fields=frozenset(fields))
+            except Exception:
+                _LOGGER.exception(  # i18n-log: ignore
+                    "NOTIFY_DEPENDENTS: Field handler of %s failed",
+                    dependent_unique_id,
+                )
+        for unique_id in refreshed:
+            for subscription in self._field_subscriptions.get(unique_id, ()):
+                if subscription.dependent_unique_id not in fields_changed:
+                    self.mark_refreshed(unique_id=subscription.dependent_unique_id)
+
+    def _schedule_flush(self) -> None:
+        """
+        Schedule one flush task for the current tick.
+
+        The flush does not count against the EVENT budget: a dropped flush task would
+        leave _flush_scheduled set and swallow every later update.
+        """
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        self._task_scheduler.create_task(
+            target=self.flush, name="publish-data-point-updates", category=TaskCategory.DEFAULT
+        )
+
+
 class EventBus:
     """
     Async-first, type-safe event bus for decoupled communication.
@@ -481,6 +687,9 @@ class EventBus:
         self._task_scheduler: Final = task_scheduler
         # Handler execution statistics for metrics
         self._handler_stats: Final = HandlerStats()
+        self._data_point_notifier: Final = DataPointUpdateNotifier(event_bus=self, task_scheduler=task_scheduler)
+
+    data_point_notifier: Final = DelegatedProperty[DataPointUpdateNotifier](path="_data_point_notifier")
 
     def clear_event_stats(self) -> None:
         """Clear event statistics counters to free memory."""
@@ -536,6 +745,7 @@ class EventBus:
         if event_type is None:
             self._subscriptions.clear()
             self._event_count.clear()
+            self._data_point_notifier.clear_field_subscriptions()
             _LOGGER.debug("CLEAR_SUBSCRIPTION: Cleared all event subscriptions and statistics")
         else:
             self._subscriptions[event_type].clear()
@@ -557,7 +767,7 @@ class EventBus:
             Number of handlers removed
 
         """
-        total_removed = 0
+        total_removed = self._data_point_notifier.clear_field_subscriptions(unique_id=event_key)
         for event_type, keys_handlers in self._subscriptions.items():
             if event_key in keys_handlers and (count := len(keys_handlers[event_key])) > 0:
                 total_removed += count
@@ -621,6 +831,12 @@ class EventBus:
             len(handlers) for event_handlers in self._subscriptions.values() for handlers in event_handlers.values()
         )
 
+    def iter_subscriptions(self) -> Iterator[object]:
+        """Yield the records of all active subscriptions (e.g. for memory accounting)."""
+        for event_handlers in self._subscriptions.values():
+            for handlers in event_handlers.values():
+                yield from handlers
+
     def log_leaked_subscriptions(self) -> int:
         """
         Log any remaining subscriptions for debugging memory leaks.
@@ -842,6 +1058,7 @@ class EventBus:
         self._task_scheduler.create_task(
             target=lambda: self.publish(event=event),
             name=f"event_bus_publish_{type(event).__name__}",
+            category=TaskCategory.EVENT,
         )
 
     def subscribe(
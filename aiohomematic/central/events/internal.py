@@ -61,6 +61,7 @@ __all__ = [
     "ConnectionHealthChangedEvent",
     "ConnectionLostEvent",
     "ConnectionStageChangedEvent",
+    "EventGapDetectedEvent",
     # Cache
     "CacheInvalidatedEvent",
     # Data refresh
@@ -255,6 +256,28 @@ class ConnectionLostEvent(Event):
         return self.interface_id
 
 
+@dataclass(frozen=True, slots=True)
+class EventGapDetectedEvent(Event):
+    """
+    Events of an interface may have been lost.
+
+    Key is interface_id.
+
+    Emitted by the PingPongTracker when the pending PONGs of an interface
+    return to normal after exceeding the threshold. Events sent by the backend
+    since gap_started_at may be missing, the ConnectionRecoveryCoordinator
+    re-reads the channels without a newer event.
+    """
+
+    interface_id: str
+    gap_started_at: datetime
+
+    @property
+    def key(self) -> Any:
+        """Key identifier for this event."""
+        return self.interface_id
+
+
 # =============================================================================
 # Cache Events
 # =============================================================================
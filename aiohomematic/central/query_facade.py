@@ -127,16 +127,12 @@ class DeviceQueryFacade(DeviceQueryFacadeProtocol):
         registered: bool | None = None,
     ) -> tuple[CallbackDataPointProtocol, ...]:
         """Return all externally registered data points."""
-        all_data_points: list[CallbackDataPointProtocol] = []
-        for device in self._device_registry.devices:
-            if interface and interface != device.interface:
-                continue
-            all_data_points.extend(
-                device.get_data_points(category=category, exclude_no_create=exclude_no_create, registered=registered)
-            )
+        data_points = self._device_registry.get_data_points(
+            category=category, interface=interface, exclude_no_create=exclude_no_create, registered=registered
+        )
         if data_point_type is not None:
-            return tuple(dp for dp in all_data_points if dp.data_point_type == data_point_type)
-        return tuple(all_data_points)
+            return tuple(dp for dp in data_points if dp.data_point_type == data_point_type)
+        return data_points
 
     def get_data_points_by_type(
         self,
@@ -174,15 +170,12 @@ class DeviceQueryFacade(DeviceQueryFacadeProtocol):
             Tuple of data points matching the given class.
 
         """
-        return tuple(
-            dp
-            for dp in self.get_data_points(
-                category=category,
-                interface=interface,
-                exclude_no_create=exclude_no_create,
-                registered=registered,
-            )
-            if isinstance(dp, data_point_class)
+        return self._device_registry.get_data_points_by_type(
+            data_point_class=data_point_class,
+            category=category,
+            interface=interface,
+            exclude_no_create=exclude_no_create,
+            registered=registered,
         )
 
     def get_devices(
@@ -378,12 +371,8 @@ class DeviceQueryFacade(DeviceQueryFacadeProtocol):
         """Return the readable generic data points."""
         return tuple(
             ge
-            for ge in self.get_data_points(interface=interface)
-            if (
-                isinstance(ge, GenericDataPointProtocol)
-                and ge.is_readable
-                and ((paramset_key and ge.paramset_key == paramset_key) or paramset_key is None)
-            )
+            for ge in self.get_data_points_by_type(data_point_class=GenericDataPointProtocol, interface=interface)
+            if ge.is_readable and ((paramset_key and ge.paramset_key == paramset_key) or paramset_key is None)
         )
 
     def get_schedule_capable_devices(self) -> tuple[ScheduleInfo, ...]:
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Targeted resync of channels after an event gap.
+
+Events of an interface can get lost: the event stream stalls, PINGs stay
+unanswered, or the connection is re-established after a short network blip.
+Re-reading every data point afterwards puts a lot of load on the CCU, although
+channels that received an event after the gap began are already current.
+
+plan_resync uses the refresh time of every readable data point to split the
+channels of an interface into fresh and stale ones. A data point refreshed by
+an event or a read after the gap began is current. Only the stale data points
+of stale channels are re-read by execute_resync, actuators before sensors and
+several devices at a time. If most data points are stale, one bulk fetch of
+the device data is cheaper than reading them one by one, and the plan asks for
+a full refresh instead.
+
+Public API of this module is defined by __all__.
+"""
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import Final
+
+from aiohomematic.const import (
+    MAX_CONCURRENT_DEVICE_REFRESHES,
+    RESYNC_MAX_STALE_RATIO,
+    CallSource,
+    ParamsetKey,
+    ResyncPriority,
+)
+from aiohomematic.interfaces import ChannelProtocol
+
+__all__ = [
+    "ResyncPlan",
+    "execute_resync",
+    "get_resync_priority",
+    "plan_resync",
+]
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ResyncPlan:
+    """Channels of an interface to re-read after an event gap."""
+
+    interface_id: str
+    """Interface of the channels."""
+
+    gap_started_at: datetime
+    """Start of the event gap. Data points refreshed at or after it are fresh."""
+
+    stale_channels: tuple[ChannelProtocol, ...]
+    """Channels with a data point not refreshed since the gap began, actuators first."""
+
+    fresh_count: int
+    """Number of readable data points skipped because they were refreshed since the gap began."""
+
+    full_refresh: bool
+    """Whether a full refresh of the interface is preferred over re-reading the stale channels."""
+
+
+def get_resync_priority(*, channel: ChannelProtocol) -> ResyncPriority:
+    """Return the resync priority of a channel: channels that can be switched before sensors."""
+    if channel.custom_data_point is not None or any(dp.is_writable for dp in channel.generic_data_points):
+        return ResyncPriority.ACTUATOR
+    return ResyncPriority.SENSOR
+
+
+def plan_resync(
+    *,
+    interface_id: str,
+    channels: Iterable[ChannelProtocol],
+    gap_started_at: datetime,
+    targeted: bool = True,
+    max_stale_ratio: float = RESYNC_MAX_STALE_RATIO,
+) -> ResyncPlan:
+    """
+    Plan the resync of the channels of an interface after an event gap.
+
+    Only readable data points are considered. A data point is fresh if it was
+    refreshed at or after gap_started_at; a channel is stale if any of its data
+    points is not. A full refresh is planned if targeted reads are not possible
+    for the interface or if the share of stale data points exceeds max_stale_ratio.
+    """
+    readable_count = 0
+    stale_count = 0
+    stale: list[ChannelProtocol] = []
+    for channel in channels:
+        if not (data_points := channel.get_readable_data_points(paramset_key=ParamsetKey.VALUES)):
+            continue
+        readable_count += len(data_points)
+        if channel_stale_count := sum(1 for dp in data_points if dp.refreshed_at < gap_started_at):
+            stale_count += channel_stale_count
+            stale.append(channel)
+
+    stale.sort(key=lambda channel: (get_resync_priority(channel=channel), channel.address))
+    return ResyncPlan(
+        interface_id=interface_id,
+        gap_started_at=gap_started_at,
+        stale_channels=tuple(stale),
+        fresh_count=readable_count - stale_count,
+        full_refresh=stale_count > 0 and (not targeted or stale_count > readable_count * max_stale_ratio),
+    )
+
+
+async def execute_resync(*, plan: ResyncPlan, max_concurrent_devices: int = MAX_CONCURRENT_DEVICE_REFRESHES) -> int:
+    """
+    Re-read the values of the stale data points of a plan from the backend.
+
+    Data points refreshed since the gap began, also after the plan was made, are
+    skipped. Actuator channels are read before sensor channels. Within a priority
+    up to max_concurrent_devices devices are read in parallel, the channels of a
+    device one after another.
+
+    Returns:
+        Number of data points that have been re-read.
+
+    """
+    semaphore = asyncio.Semaphore(max_concurrent_devices)
+
+    async def _read_device(*, channels: list[ChannelProtocol]) -> int:
+        count = 0
+        async with semaphore:
+            for channel in channels:
+                for dp in channel.get_readable_data_points(paramset_key=ParamsetKey.VALUES):
+                    if dp.refreshed_at >= plan.gap_started_at:
+                        continue
+                    await dp.load_data_point_value(call_source=CallSource.MANUAL_OR_SCHEDULED, direct_call=True)
+                    count += 1
+        return count
+
+    count = 0
+    for priority in ResyncPriority:
+        by_device: dict[str, list[ChannelProtocol]] = {}
+        for channel in plan.stale_channels:
+            if get_resync_priority(channel=channel) == priority:
+                by_device.setdefault(channel.device.address, []).append(channel)
+        count += sum(await asyncio.gather(*(_read_device(channels=channels) for channels in by_device.values())))
+
+    _LOGGER.debug(
+        "RESYNC: Re-read %d data points of %d stale channels of %s (%d fresh data points skipped)",
+        count,
+        len(plan.stale_channels),
+        plan.interface_id,
+        plan.fresh_count,
+    )
+    return count
@@ -104,7 +104,7 @@ class AsyncXmlRpcDispatcher:
                 allow_none=True,
             ).encode("utf-8")
         except Exception as err:
-            _LOGGER.exception(i18n.tr(key="log.central.rpc_server.method_failed", method_name=method_name))
+            _LOGGER.exception(i18n.lazy_tr(key="log.central.rpc_server.method_failed", method_name=method_name))
             fault = xmlrpc.client.Fault(
                 faultCode=-32603,
                 faultString=str(err),
@@ -273,7 +273,7 @@ class AsyncRPCFunctions:
                 log_context={"interface_id": interface_id, "error_code": int(error_code)},
             )
         _LOGGER.error(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.central.rpc_server.error",
                 interface_id=interface_id,
                 error_code=int(error_code),
@@ -446,7 +446,7 @@ class AsyncRPCFunctions:
         """Create a background task and track it to prevent garbage collection."""
         if len(self._background_tasks) >= MAX_RPC_BACKGROUND_TASKS:
             _LOGGER.warning(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.rpc_server.background_task_limit_reached",
                     limit=MAX_RPC_BACKGROUND_TASKS,
                     task_name=name,
@@ -468,7 +468,7 @@ class AsyncRPCFunctions:
             return
         if exc := task.exception():
             _LOGGER.warning(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.rpc_server.background_task_failed",
                     task_name=task.get_name(),
                     error=exc,
@@ -592,7 +592,7 @@ class AsyncXmlRpcServer:
             if entry.central.client_coordinator.has_client(interface_id=interface_id):
                 return entry
         _LOGGER.warning(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.central.rpc_server.unknown_interface_id",
                 interface_id=interface_id,
             )
@@ -744,7 +744,7 @@ class AsyncXmlRpcServer:
             self._error_count += 1
             if event_bus := self._event_bus:
                 emit_counter(event_bus=event_bus, key=MetricKeys.rpc_server_error())
-            _LOGGER.warning(i18n.tr(key="log.central.rpc_server.protocol_error", error=err))
+            _LOGGER.warning(i18n.lazy_tr(key="log.central.rpc_server.protocol_error", error=err))
             return web.Response(
                 status=400,
                 text="XML-RPC protocol error",
@@ -753,7 +753,7 @@ class AsyncXmlRpcServer:
             self._error_count += 1
             if event_bus := self._event_bus:
                 emit_counter(event_bus=event_bus, key=MetricKeys.rpc_server_error())
-            _LOGGER.exception(i18n.tr(key="log.central.rpc_server.unexpected_error"))
+            _LOGGER.exception(i18n.lazy_tr(key="log.central.rpc_server.unexpected_error"))
             return web.Response(
                 status=500,
                 text="Internal Server Error",
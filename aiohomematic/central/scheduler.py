@@ -7,7 +7,8 @@ This module provides a modern asyncio-based scheduler that manages periodic
 background tasks such as:
 
 - Connection health checks (detection only - emits ConnectionLostEvent)
-- Data refreshes (client data, programs, system variables)
+- Data refreshes (client data, combined hub snapshot of programs, system
+  variables, inbox, service and alarm messages)
 - Firmware update checks
 - Metrics refresh
 
@@ -60,6 +61,9 @@ _LOGGER: Final = logging.getLogger(__name__)
 # Type alias for async task factory
 _AsyncTaskFactory = Callable[[], Awaitable[None]]
 
+# Hub data categories that are fetched even while the central is unavailable
+_CENTRAL_INDEPENDENT_HUB_DATA: Final = frozenset({DataRefreshType.PROGRAM, DataRefreshType.SYSVAR})
+
 
 class SchedulerJob:
     """Represents a scheduled job with interval-based execution."""
@@ -185,23 +189,7 @@ class BackgroundScheduler:
                 run_interval=self._config_provider.config.schedule_timer_config.periodic_refresh_interval,
             ),
             SchedulerJob(
-                task=self._refresh_program_data,
-                run_interval=self._config_provider.config.schedule_timer_config.sys_scan_interval,
-            ),
-            SchedulerJob(
-                task=self._refresh_sysvar_data,
-                run_interval=self._config_provider.config.schedule_timer_config.sys_scan_interval,
-            ),
-            SchedulerJob(
-                task=self._refresh_inbox_data,
-                run_interval=self._config_provider.config.schedule_timer_config.sys_scan_interval,
-            ),
-            SchedulerJob(
-                task=self._refresh_service_messages_data,
-                run_interval=self._config_provider.config.schedule_timer_config.sys_scan_interval,
-            ),
-            SchedulerJob(
-                task=self._refresh_alarm_messages_data,
+                task=self._refresh_hub_data,
                 run_interval=self._config_provider.config.schedule_timer_config.sys_scan_interval,
             ),
             SchedulerJob(
@@ -289,7 +277,7 @@ class BackgroundScheduler:
         try:
             if not self._client_coordinator.all_clients_active:
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.central.scheduler.check_connection.no_clients",
                         name=self._central_info.name,
                     )
@@ -319,7 +307,7 @@ class BackgroundScheduler:
                         reason=reason,
                     )
                     _LOGGER.info(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.central.scheduler.check_connection.connection_loss_detected",
                             name=self._central_info.name,
                         )
@@ -327,14 +315,14 @@ class BackgroundScheduler:
 
         except NoConnectionException as nex:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.scheduler.check_connection.no_connection",
                     reason=extract_exc_args(exc=nex),
                 )
             )
         except Exception as exc:  # noqa: BLE001 - scheduled connection check must never kill the scheduler thread
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.central.scheduler.check_connection.failed",
                     exc_type=type(exc).__name__,
                     reason=extract_exc_args(exc=exc),
@@ -352,6 +340,26 @@ class BackgroundScheduler:
             )
         )
 
+    async def _emit_hub_data_refreshed(
+        self,
+        *,
+        refresh_types: tuple[DataRefreshType, ...],
+        refreshed: frozenset[DataRefreshType],
+        start_time: datetime,
+        error_message: str | None = None,
+    ) -> None:
+        """Emit the completed event of every hub data category, successful only for the refreshed ones."""
+        duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+        for refresh_type in refresh_types:
+            success = refresh_type in refreshed
+            await self._emit_refresh_completed(
+                refresh_type=refresh_type,
+                interface_id=None,
+                success=success,
+                duration_ms=duration_ms,
+                error_message=None if success else (error_message or "Data not refreshed"),
+            )
+
     async def _emit_refresh_completed(
         self,
         *,
@@ -469,6 +477,36 @@ class BackgroundScheduler:
             )
         )
 
+    async def _fetch_hub_data_separately(
+        self, *, refresh_types: tuple[DataRefreshType, ...]
+    ) -> frozenset[DataRefreshType]:
+        """Fetch the hub data categories one by one and return the refreshed ones."""
+        fetcher = self._hub_data_fetcher
+        refreshed: set[DataRefreshType] = set()
+        for refresh_type, fetch in (
+            (DataRefreshType.PROGRAM, fetcher.fetch_program_data),
+            (DataRefreshType.SYSVAR, fetcher.fetch_sysvar_data),
+            (DataRefreshType.INBOX, fetcher.fetch_inbox_data),
+            (DataRefreshType.SERVICE_MESSAGES, fetcher.fetch_service_messages_data),
+            (DataRefreshType.ALARM_MESSAGES, fetcher.fetch_alarm_messages_data),
+        ):
+            if refresh_type not in refresh_types:
+                continue
+            # Inbox, service and alarm messages are not fetched while the central is unavailable
+            if refresh_type not in _CENTRAL_INDEPENDENT_HUB_DATA and not self._central_info.available:
+                continue
+            try:
+                await fetch(scheduled=True)
+            except Exception:
+                _LOGGER.exception(  # i18n-log: ignore
+                    "REFRESH_HUB_DATA: Fetching %s failed for %s",
+                    refresh_type,
+                    self._central_info.name,
+                )
+            else:
+                refreshed.add(refresh_type)
+        return frozenset(refreshed)
+
     def _on_device_lifecycle_event(self, *, event: DeviceLifecycleEvent) -> None:
         """
         Handle device lifecycle events.
@@ -554,6 +592,47 @@ class BackgroundScheduler:
             )
             raise
 
+    async def _refresh_hub_data(self) -> None:
+        """
+        Refresh programs, sysvars, inbox, service and alarm messages.
+
+        One hub snapshot is fetched per scan interval, so the backend runs a single
+        ReGa script instead of one per data category. Each data category still
+        reports its own refresh events, which are successful only for the categories
+        that were actually refreshed. Backends without snapshot support fall back to
+        the separate fetches.
+        """
+        # Check primary client availability instead of central availability
+        # to allow hub operations when secondary clients (e.g., CUxD) fail
+        if not self._primary_client_avaliable or not self.devices_created:
+            return
+
+        _LOGGER.debug("REFRESH_HUB_DATA: For %s", self._central_info.name)
+        config = self._config_provider.config
+        refresh_types = tuple(
+            refresh_type
+            for refresh_type, enabled in (
+                (DataRefreshType.PROGRAM, config.enable_program_scan),
+                (DataRefreshType.SYSVAR, config.enable_sysvar_scan),
+                (DataRefreshType.INBOX, True),
+                (DataRefreshType.SERVICE_MESSAGES, True),
+                (DataRefreshType.ALARM_MESSAGES, True),
+            )
+            if enabled
+        )
+        start_time = datetime.now()
+        for refresh_type in refresh_types:
+            self._emit_refresh_triggered(refresh_type=refresh_type, interface_id=None, scheduled=True)
+        try:
+            if (refreshed := await self._hub_data_fetcher.fetch_hub_data(scheduled=True)) is None:
+                refreshed = await self._fetch_hub_data_separately(refresh_types=refresh_types)
+        except Exception as exc:
+            await self._emit_hub_data_refreshed(
+                refresh_types=refresh_types, refreshed=frozenset(), start_time=start_time, error_message=str(exc)
+            )
+            raise
+        await self._emit_hub_data_refreshed(refresh_types=refresh_types, refreshed=refreshed, start_time=start_time)
+
     async def _refresh_inbox_data(self) -> None:
         """Refresh inbox data."""
         # Check primary client availability instead of central availability
@@ -27,6 +27,7 @@ from aiohomematic.const import (
     DescriptionMarker,
     DeviceDescription,
     DeviceDetail,
+    HubSnapshotData,
     InboxDeviceData,
     Interface,
     ParameterData,
@@ -36,6 +37,7 @@ from aiohomematic.const import (
     ServiceMessageType,
     SystemInformation,
     SystemUpdateData,
+    SystemVariableChangesData,
     SystemVariableData,
 )
 from aiohomematic.property_decorators import DelegatedProperty
@@ -192,6 +194,17 @@ class BaseBackend(BackendOperationsProtocol, ABC):
         """Return device details (unsupported by default)."""
         return None
 
+    async def get_hub_snapshot(
+        self,
+        *,
+        program_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_since: int = 0,
+        sysvar_checksum: str | None = None,
+    ) -> HubSnapshotData | None:
+        """Return the hub snapshot (unsupported by default)."""
+        return None
+
     async def get_inbox_devices(self) -> tuple[InboxDeviceData, ...]:
         """Return inbox devices (unsupported by default)."""
         return ()
@@ -252,6 +265,10 @@ class BaseBackend(BackendOperationsProtocol, ABC):
         """Return system variable value (unsupported by default)."""
         return None
 
+    async def get_system_variable_changes(self, *, since: int) -> SystemVariableChangesData | None:
+        """Return changed system variable values (unsupported by default)."""
+        return None
+
     @abstractmethod
     async def get_value(self, *, channel_address: str, parameter: str) -> Any:
         """Return parameter value."""
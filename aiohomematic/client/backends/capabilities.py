@@ -58,7 +58,9 @@ class BackendCapabilities(BaseModel):
     install_mode: bool = False
 
     # Programs & System Variables
+    hub_snapshot: bool = False
     programs: bool = False
+    sysvar_changes: bool = False
 
     # Backup
     backup: bool = False
@@ -88,7 +90,9 @@ CCU_CAPABILITIES: Final = BackendCapabilities(
     system_update_info=True,
     inbox_devices=True,
     install_mode=True,
+    hub_snapshot=True,
     programs=True,
+    sysvar_changes=True,
     backup=True,
     ping_pong=True,
     push_updates=True,
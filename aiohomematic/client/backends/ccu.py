@@ -30,6 +30,7 @@ from aiohomematic.const import (
     DescriptionMarker,
     DeviceDescription,
     DeviceDetail,
+    HubSnapshotData,
     InboxDeviceData,
     Interface,
     ParameterData,
@@ -38,6 +39,7 @@ from aiohomematic.const import (
     ServiceMessageData,
     ServiceMessageType,
     SystemUpdateData,
+    SystemVariableChangesData,
     SystemVariableData,
 )
 from aiohomematic.exceptions import BaseHomematicException
@@ -227,7 +229,7 @@ class CcuBackend(BaseBackend):
 
     async def get_all_device_data(self, *, interface: Interface) -> dict[str, Any] | None:
         """Return all device data via JSON-RPC."""
-        return dict(await self._json_rpc.get_all_device_data(interface=interface))
+        return await self._json_rpc.get_all_device_data(interface=interface)
 
     async def get_all_functions(self) -> dict[str, set[str]]:
         """Return all functions with their assigned channel addresses."""
@@ -285,6 +287,22 @@ class CcuBackend(BaseBackend):
         """
         return list(await self._json_rpc.get_device_details())
 
+    async def get_hub_snapshot(
+        self,
+        *,
+        program_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_since: int = 0,
+        sysvar_checksum: str | None = None,
+    ) -> HubSnapshotData | None:
+        """Return the hub snapshot via one ReGa script run."""
+        return await self._json_rpc.get_hub_snapshot(
+            program_markers=program_markers,
+            sysvar_markers=sysvar_markers,
+            sysvar_since=sysvar_since,
+            sysvar_checksum=sysvar_checksum,
+        )
+
     async def get_inbox_devices(self) -> tuple[InboxDeviceData, ...]:
         """Return inbox devices."""
         return await self._json_rpc.get_inbox_devices()
@@ -371,6 +389,10 @@ class CcuBackend(BaseBackend):
         """Return system variable value."""
         return await self._json_rpc.get_system_variable(name=name)
 
+    async def get_system_variable_changes(self, *, since: int) -> SystemVariableChangesData | None:
+        """Return the system variable values changed since the given backend timestamp."""
+        return await self._json_rpc.get_system_variable_changes(since=since)
+
     async def get_value(self, *, channel_address: str, parameter: str) -> Any:
         """Return a parameter value."""
         return await self._proxy_read.getValue(channel_address, parameter)
@@ -96,7 +96,7 @@ class JsonCcuBackend(BaseBackend):
 
     async def get_all_device_data(self, *, interface: Interface) -> dict[str, Any] | None:
         """Return all device data via JSON-RPC."""
-        return dict(await self._json_rpc.get_all_device_data(interface=interface))
+        return await self._json_rpc.get_all_device_data(interface=interface)
 
     async def get_device_description(self, *, address: str) -> DeviceDescription | None:
         """Return device description via JSON-RPC."""
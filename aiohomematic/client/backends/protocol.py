@@ -24,6 +24,7 @@ if TYPE_CHECKING:
         DescriptionMarker,
         DeviceDescription,
         DeviceDetail,
+        HubSnapshotData,
         InboxDeviceData,
         Interface,
         ParameterData,
@@ -33,6 +34,7 @@ if TYPE_CHECKING:
         ServiceMessageType,
         SystemInformation,
         SystemUpdateData,
+        SystemVariableChangesData,
         SystemVariableData,
     )
 
@@ -191,6 +193,17 @@ class BackendOperationsProtocol(Protocol):
         """
         ...
 
+    async def get_hub_snapshot(
+        self,
+        *,
+        program_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_since: int = 0,
+        sysvar_checksum: str | None = None,
+    ) -> HubSnapshotData | None:
+        """Return the hub data of one scan interval, read with a single backend script run."""
+        ...
+
     async def get_inbox_devices(self) -> tuple[InboxDeviceData, ...]:
         """Return devices in the inbox (not yet configured)."""
         ...
@@ -249,6 +262,10 @@ class BackendOperationsProtocol(Protocol):
         """Return the value of a system variable."""
         ...
 
+    async def get_system_variable_changes(self, *, since: int) -> SystemVariableChangesData | None:
+        """Return the system variable values changed since the given backend timestamp and a metadata checksum."""
+        ...
+
     async def get_value(self, *, channel_address: str, parameter: str) -> Any:
         """Return a single parameter value."""
         ...
@@ -67,7 +67,7 @@ from typing import TYPE_CHECKING, Any, Final
 
 from aiohomematic import i18n
 from aiohomematic.central.events.internal import CircuitBreakerStateChangedEvent, CircuitBreakerTrippedEvent
-from aiohomematic.const import CircuitState
+from aiohomematic.const import CircuitState, TaskCategory
 from aiohomematic.metrics import MetricKeys, emit_counter
 from aiohomematic.property_decorators import DelegatedProperty
 from aiohomematic.store.types import IncidentSeverity, IncidentType
@@ -342,6 +342,7 @@ class CircuitBreaker:
         self._task_scheduler.create_task(
             target=_record(),
             name=f"record_circuit_breaker_recovered_incident_{interface_id}",
+            category=TaskCategory.INCIDENT,
         )
 
     def _record_tripped_incident(self, *, old_state: CircuitState) -> None:
@@ -384,6 +385,7 @@ class CircuitBreaker:
         self._task_scheduler.create_task(
             target=_record(),
             name=f"record_circuit_breaker_tripped_incident_{interface_id}",
+            category=TaskCategory.INCIDENT,
         )
 
     def _transition_to(self, *, new_state: CircuitState) -> None:
@@ -415,7 +417,7 @@ class CircuitBreaker:
         else:
             # Problem detected (CLOSED→OPEN) or testing recovery (OPEN→HALF_OPEN)
             _LOGGER.info(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.circuit_breaker.state_transition",
                     old_state=old_state,
                     new_state=new_state,
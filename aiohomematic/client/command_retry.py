@@ -13,6 +13,7 @@ Key features:
 - Circuit breaker integration (aborts retry if breaker opens)
 - Per-DataPointKey active retry tracking (new command supersedes old retry)
 - Purge support (CRITICAL commands cancel all device retries)
+- Fault feedback to the command throttle (DutyCycle / transmission pending)
 
 Public API of this module is defined by __all__.
 """
@@ -43,6 +44,7 @@ if TYPE_CHECKING:
 
     from aiohomematic.central.events.bus import EventBus
     from aiohomematic.const import DataPointKey, TimeoutConfig
+    from aiohomematic.interfaces.client import CommandThrottleProtocol
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -150,7 +152,8 @@ class CommandRetryHandler:
     Integrates with:
     - Circuit Breaker: Aborts retry if circuit opens
     - Connection Recovery: Waits for RecoveryCompletedEvent on NoConnectionException
-    - Command Throttle: Throttle is acquired once by the caller before retry begins
+    - Command Throttle: Throttle is acquired once by the caller before retry begins;
+      the outcome of every attempt is reported back to adapt the send rate
     - Optimistic Updates: Keeps optimistic value active during retries
 
     Concurrency
@@ -165,6 +168,7 @@ class CommandRetryHandler:
 
     __slots__ = (
         "_active_retries",
+        "_command_throttle",
         "_event_bus",
         "_interface_id",
         "_metrics",
@@ -177,11 +181,13 @@ class CommandRetryHandler:
         interface_id: str,
         timeout_config: TimeoutConfig,
         event_bus: EventBus,
+        command_throttle: CommandThrottleProtocol | None = None,
     ) -> None:
         """Initialize command retry handler."""
         self._interface_id: Final = interface_id
         self._timeout_config: Final = timeout_config
         self._event_bus: Final = event_bus
+        self._command_throttle: Final = command_throttle
         self._metrics: Final = CommandRetryMetrics()
         self._active_retries: Final[dict[DataPointKey, asyncio.Event]] = {}
 
@@ -250,7 +256,7 @@ class CommandRetryHandler:
 
         # Short-circuit: retry disabled globally or per-call
         if not retry or max_attempts <= 0:
-            return await operation()
+            return await self._run_operation(operation=operation)
 
         # Register this retry — supersedes any existing retry for the same dpk
         cancel_event = self._register_retry(dpk=dpk)
@@ -264,7 +270,7 @@ class CommandRetryHandler:
                     raise CommandSupersededError
 
                 try:
-                    result = await operation()
+                    result = await self._run_operation(operation=operation)
                 except BaseException as exc:
                     last_exception = exc
 
@@ -377,6 +383,19 @@ class CommandRetryHandler:
         self._active_retries[dpk] = cancel_event
         return cancel_event
 
+    async def _run_operation[T](self, *, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run a single attempt and report its outcome to the command throttle."""
+        if self._command_throttle is None:
+            return await operation()
+        try:
+            result = await operation()
+        except BaseException as exc:
+            if (fault_code := _get_fault_code(exc=exc)) is not None:
+                self._command_throttle.report_fault(fault_code=fault_code)
+            raise
+        self._command_throttle.report_success()
+        return result
+
     async def _wait_for_recovery(self, *, cancel_event: asyncio.Event) -> bool:
         """
         Wait for connection recovery event instead of blind retry.
@@ -19,11 +19,28 @@ How It Works
 3. HIGH/LOW commands are enqueued in a priority queue (heapq)
 4. Background worker processes queue with throttle interval
 5. Within same priority, FIFO order is maintained
+6. A queued command for the same DataPointKey is replaced by a newer one
+   (last write wins); the superseded caller receives CommandSupersededError
+
+Adaptive Mode
+-------------
+With ``adaptive=True`` the fixed interval is replaced by a token bucket. Up to
+``bucket_size`` commands are granted without delay, which lets scenes go out
+at once. The bucket refills at ``1 / interval`` tokens per second, scaled down by:
+
+- Radio load: the highest DUTY_CYCLE_LEVEL / CARRIER_SENSE_LEVEL reported on the
+  interface (see update_radio_load). The rate drops linearly from half of
+  ``duty_cycle_target`` and reaches its minimum at the target.
+- Fault feedback: INSUFFICIENT_DUTYCYCLE (-8) pauses sending for
+  ``duty_cycle_backoff`` seconds and halves the rate; TRANSMISSION_PENDING (-10)
+  pauses for ``transmission_pending_backoff`` seconds. Each successful command
+  restores part of the rate (see report_fault / report_success).
 
 Configuration
 -------------
 The throttle interval is configured via TimeoutConfig.command_throttle_interval.
-A value of 0.0 (the default) disables throttling entirely.
+A value of 0.0 (the default) disables throttling entirely unless
+TimeoutConfig.command_throttle_adaptive is set.
 
 Thread Safety
 -------------
@@ -40,17 +57,30 @@ from enum import IntEnum
 import heapq
 import logging
 import time
-from typing import Final
+from typing import Any, Final
 
 from aiohomematic import i18n
+from aiohomematic.const import DataPointKey, Parameter
 from aiohomematic.exceptions import CommandSupersededError
 from aiohomematic.interfaces.client import CommandThrottleProtocol
+from aiohomematic.metrics.stats import ThrottleStats
 from aiohomematic.property_decorators import DelegatedProperty
 
 __all__ = ["CommandPriority", "CommandThrottle", "PrioritizedCommand"]
 
 _LOGGER: Final = logging.getLogger(__name__)
 
+# XML-RPC fault codes fed back into the adaptive throttle
+_FAULT_CODE_DUTY_CYCLE: Final = -8
+_FAULT_CODE_TRANSMISSION_PENDING: Final = -10
+
+# Refill interval of the token bucket if no command_throttle_interval is configured
+_DEFAULT_ADAPTIVE_INTERVAL: Final = 0.2
+# Lower bound of the rate factors (radio load and fault feedback)
+_MIN_RATE_FACTOR: Final = 0.05
+# Rate factor restored per successful command after a duty cycle fault
+_RATE_RECOVERY_STEP: Final = 0.1
+
 
 class CommandPriority(IntEnum):
     """
@@ -78,6 +108,7 @@ class PrioritizedCommand:
     timestamp: float = field(compare=True)
     future: asyncio.Future[None] = field(compare=False, repr=False)
     device_address: str = field(compare=False)
+    dpk: DataPointKey | None = field(default=None, compare=False)
 
 
 class CommandThrottle(CommandThrottleProtocol):
@@ -89,24 +120,42 @@ class CommandThrottle(CommandThrottleProtocol):
     - CRITICAL commands bypass throttle and queue
     - HIGH/LOW commands respect throttle interval and queue
     - Per-interface throttling to reduce RF duty cycle
+    - Last-write-wins coalescing of queued commands per DataPointKey
+    - Optional adaptive token bucket driven by radio load and fault feedback
     - Background worker processes queue continuously
     """
 
     __slots__ = (
+        "_adaptive",
+        "_backoff_until",
+        "_base_rate",
+        "_bucket_size",
         "_burst_count",
         "_burst_threshold",
         "_burst_timestamps",
         "_burst_window",
+        "_carrier_sense_levels",
+        "_coalesced_count",
         "_command_available",
         "_critical_count",
+        "_duty_cycle_backoff",
+        "_duty_cycle_faults",
+        "_duty_cycle_levels",
+        "_duty_cycle_target",
+        "_fault_factor",
         "_interface_id",
         "_interval",
         "_last_command_time",
+        "_last_refill",
         "_lock",
+        "_pending_by_dpk",
         "_purged_count",
         "_queue",
         "_stopped",
         "_throttled_count",
+        "_tokens",
+        "_transmission_pending_backoff",
+        "_transmission_pending_faults",
         "_worker_task",
     )
 
@@ -117,22 +166,34 @@ class CommandThrottle(CommandThrottleProtocol):
         interval: float,
         burst_threshold: int = 5,
         burst_window: float = 0.5,
+        adaptive: bool = False,
+        bucket_size: int = 10,
+        duty_cycle_target: float = 80.0,
+        duty_cycle_backoff: float = 40.0,
+        transmission_pending_backoff: float = 5.0,
     ) -> None:
         """
         Initialize priority-aware command throttle.
 
         Args:
             interface_id: Interface identifier (e.g., "HmIP-RF")
-            interval: Minimum delay between commands in seconds (0.0 = disabled)
+            interval: Minimum delay between commands in seconds (0.0 = disabled).
+                In adaptive mode the refill interval of the token bucket.
             burst_threshold: Number of commands within burst_window that triggers burst
                 detection (0 = disabled)
             burst_window: Time window in seconds for burst detection
+            adaptive: Use the duty-cycle-aware token bucket instead of the fixed interval
+            bucket_size: Number of commands granted without delay in adaptive mode
+            duty_cycle_target: Radio load in percent the adaptive mode keeps below
+            duty_cycle_backoff: Pause in seconds after an INSUFFICIENT_DUTYCYCLE fault
+            transmission_pending_backoff: Pause in seconds after a TRANSMISSION_PENDING fault
 
         """
         self._interface_id: Final = interface_id
         self._interval: Final = interval
         self._last_command_time: float = 0.0
         self._queue: list[PrioritizedCommand] = []
+        self._pending_by_dpk: Final[dict[DataPointKey, PrioritizedCommand]] = {}
         self._lock: Final = asyncio.Lock()
         self._command_available: Final = asyncio.Event()
         self._stopped: bool = False
@@ -147,10 +208,27 @@ class CommandThrottle(CommandThrottleProtocol):
         self._critical_count: int = 0
         self._burst_count: int = 0
         self._purged_count: int = 0
+        self._coalesced_count: int = 0
+
+        # Adaptive token bucket
+        self._adaptive: Final = adaptive
+        self._bucket_size: Final = max(1, bucket_size)
+        self._base_rate: Final = 1.0 / (interval if interval > 0.0 else _DEFAULT_ADAPTIVE_INTERVAL)
+        self._duty_cycle_target: Final = duty_cycle_target
+        self._duty_cycle_backoff: Final = duty_cycle_backoff
+        self._transmission_pending_backoff: Final = transmission_pending_backoff
+        self._tokens: float = float(self._bucket_size)
+        self._last_refill: float = time.monotonic()
+        self._backoff_until: float = 0.0
+        self._fault_factor: float = 1.0
+        self._duty_cycle_levels: Final[dict[str, float]] = {}
+        self._carrier_sense_levels: Final[dict[str, float]] = {}
+        self._duty_cycle_faults: int = 0
+        self._transmission_pending_faults: int = 0
 
         # Start background worker if throttling enabled
         self._worker_task: asyncio.Task[None] | None = None
-        if self._interval > 0.0:
+        if self.is_enabled:
             self._worker_task = asyncio.create_task(
                 self._worker(),
                 name=f"CommandThrottle-{interface_id}",
@@ -165,34 +243,83 @@ class CommandThrottle(CommandThrottleProtocol):
             f"throttled={self._throttled_count}, "
             f"critical={self._critical_count}, "
             f"burst={self._burst_count}, "
-            f"purged={self._purged_count})"
+            f"purged={self._purged_count}, "
+            f"coalesced={self._coalesced_count})"
         )
 
+    adaptive: Final = DelegatedProperty[bool](path="_adaptive")
     burst_count: Final = DelegatedProperty[int](path="_burst_count")
     burst_threshold: Final = DelegatedProperty[int](path="_burst_threshold")
     burst_window: Final = DelegatedProperty[float](path="_burst_window")
+    coalesced_count: Final = DelegatedProperty[int](path="_coalesced_count")
     critical_count: Final = DelegatedProperty[int](path="_critical_count")
+    duty_cycle_faults: Final = DelegatedProperty[int](path="_duty_cycle_faults")
     interface_id: Final = DelegatedProperty[str](path="_interface_id")
     interval: Final = DelegatedProperty[float](path="_interval")
     purged_count: Final = DelegatedProperty[int](path="_purged_count")
     throttled_count: Final = DelegatedProperty[int](path="_throttled_count")
+    transmission_pending_faults: Final = DelegatedProperty[int](path="_transmission_pending_faults")
+
+    @property
+    def backoff_remaining(self) -> float:
+        """Return seconds until commands are sent again after a backend fault."""
+        return max(0.0, self._backoff_until - time.monotonic())
+
+    @property
+    def carrier_sense_level(self) -> float | None:
+        """Return the highest reported carrier sense level in percent."""
+        return max(self._carrier_sense_levels.values(), default=None)
+
+    @property
+    def duty_cycle_level(self) -> float | None:
+        """Return the highest reported duty cycle level in percent."""
+        return max(self._duty_cycle_levels.values(), default=None)
 
     @property
     def is_enabled(self) -> bool:
         """Return True if throttling is active."""
-        return self._interval > 0.0
+        return self._interval > 0.0 or self._adaptive
 
     @property
     def queue_size(self) -> int:
         """Return current queue size."""
         return len(self._queue)
 
+    @property
+    def send_rate(self) -> float:
+        """Return the currently allowed commands per second (0.0 = unthrottled)."""
+        if not self.is_enabled:
+            return 0.0
+        if not self._adaptive:
+            return 1.0 / self._interval
+        return self._base_rate * self._get_load_factor() * self._fault_factor
+
+    @property
+    def stats(self) -> ThrottleStats:
+        """Return a snapshot of the throttle state."""
+        if self._adaptive:
+            self._refill_tokens()
+        return ThrottleStats(
+            adaptive=self._adaptive,
+            send_rate=self.send_rate,
+            tokens=self._tokens if self._adaptive else 0.0,
+            duty_cycle_level=self.duty_cycle_level,
+            carrier_sense_level=self.carrier_sense_level,
+            backoff_remaining=self.backoff_remaining,
+            duty_cycle_faults=self._duty_cycle_faults,
+            transmission_pending_faults=self._transmission_pending_faults,
+            throttled_count=self._throttled_count,
+            coalesced_count=self._coalesced_count,
+            queue_size=len(self._queue),
+        )
+
     async def acquire(
         self,
         *,
         priority: CommandPriority = CommandPriority.HIGH,
         device_address: str = "",
         purge_addresses: frozenset[str] = frozenset(),
+        dpk: DataPointKey | None = None,
     ) -> None:
         """
         Acquire permission to send device command with priority.
@@ -201,19 +328,22 @@ class CommandThrottle(CommandThrottleProtocol):
             priority: Command priority level
             device_address: Device address (for logging/debugging)
             purge_addresses: Channel addresses to purge from queue (for CRITICAL commands)
+            dpk: Target data point; a queued command for the same key is superseded
 
         Behavior:
         - Throttling disabled (interval=0.0): Return immediately
         - CRITICAL priority: Purge matching queue entries, bypass queue and throttle
         - HIGH priority during burst: Downgraded to LOW, then enqueued
         - HIGH/LOW priority: Enqueue and wait for worker to grant permission
+        - Queued command for the same dpk: Replaced in its queue slot (last write wins)
 
         Raises:
             asyncio.CancelledError: If throttle is stopped while waiting
+            CommandSupersededError: If a newer command for the same dpk replaced this one
 
         """
         # Throttling disabled
-        if not self._interval:
+        if not self.is_enabled:
             return
 
         # CRITICAL commands bypass everything
@@ -232,7 +362,7 @@ class CommandThrottle(CommandThrottleProtocol):
         if priority == CommandPriority.HIGH and self._detect_burst():
             self._burst_count += 1
             _LOGGER.info(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.command_throttle.burst_downgrade",
                     interface_id=self._interface_id,
                     device_address=device_address,
@@ -253,11 +383,15 @@ class CommandThrottle(CommandThrottleProtocol):
             timestamp=time.monotonic(),
             future=future,
             device_address=device_address,
+            dpk=dpk,
         )
 
-        # Enqueue command and wake worker
+        # Enqueue command (or replace a queued one for the same data point) and wake worker
         async with self._lock:
-            heapq.heappush(self._queue, cmd)
+            if dpk is None or not self._replace_pending(cmd=cmd):
+                heapq.heappush(self._queue, cmd)
+                if dpk is not None:
+                    self._pending_by_dpk[dpk] = cmd
             queue_size = len(self._queue)
             self._command_available.set()
 
@@ -272,12 +406,52 @@ class CommandThrottle(CommandThrottleProtocol):
         # Wait for worker to grant permission
         await future
 
+    def report_fault(self, *, fault_code: int) -> None:
+        """
+        Feed a backend fault of a sent command back into the throttle.
+
+        INSUFFICIENT_DUTYCYCLE and TRANSMISSION_PENDING are counted in every mode.
+        In adaptive mode they empty the token bucket and pause sending; a duty
+        cycle fault also halves the send rate until commands succeed again.
+        """
+        if fault_code == _FAULT_CODE_DUTY_CYCLE:
+            self._duty_cycle_faults += 1
+            delay = self._duty_cycle_backoff
+            self._fault_factor = max(_MIN_RATE_FACTOR, self._fault_factor / 2)
+        elif fault_code == _FAULT_CODE_TRANSMISSION_PENDING:
+            self._transmission_pending_faults += 1
+            delay = self._transmission_pending_backoff
+        else:
+            return
+
+        if not self._adaptive:
+            return
+
+        self._tokens = 0.0
+        self._last_refill = time.monotonic()
+        self._backoff_until = max(self._backoff_until, self._last_refill + delay)
+        _LOGGER.info(
+            i18n.lazy_tr(
+                key="log.client.command_throttle.fault_backoff",
+                interface_id=self._interface_id,
+                fault_code=fault_code,
+                delay=delay,
+                factor=self._fault_factor,
+            )
+        )
+
+    def report_success(self) -> None:
+        """Restore part of the send rate after a command was accepted by the backend."""
+        if self._adaptive and self._fault_factor < 1.0:
+            self._refill_tokens()
+            self._fault_factor = min(1.0, self._fault_factor + _RATE_RECOVERY_STEP)
+
     def stop(self) -> None:
         """Stop background worker and reject pending commands."""
         if self._stopped:
             return
 
-        _LOGGER.info(i18n.tr(key="log.client.command_throttle.stopping_worker", interface_id=self._interface_id))
+        _LOGGER.info(i18n.lazy_tr(key="log.client.command_throttle.stopping_worker", interface_id=self._interface_id))
         self._stopped = True
         self._command_available.set()
 
@@ -286,11 +460,37 @@ class CommandThrottle(CommandThrottleProtocol):
             self._worker_task.cancel()
 
         # Reject all pending commands
+        self._pending_by_dpk.clear()
         while self._queue:
             cmd = heapq.heappop(self._queue)
             if not cmd.future.done():
                 cmd.future.set_exception(asyncio.CancelledError(i18n.tr(key="log.client.command_throttle.stopped")))
 
+    def update_radio_load(self, *, source: str, parameter: str, value: Any) -> None:
+        """
+        Update the radio load reported by an access point of this interface.
+
+        Args:
+            source: Channel address that reported the value
+            parameter: DUTY_CYCLE_LEVEL or CARRIER_SENSE_LEVEL
+            value: Level in percent (non-numeric values clear the source)
+
+        """
+        if parameter == Parameter.DUTY_CYCLE_LEVEL:
+            levels = self._duty_cycle_levels
+        elif parameter == Parameter.CARRIER_SENSE_LEVEL:
+            levels = self._carrier_sense_levels
+        else:
+            return
+
+        # Tokens accumulated so far are credited at the previous rate
+        if self._adaptive:
+            self._refill_tokens()
+        if isinstance(value, int | float) and not isinstance(value, bool):
+            levels[source] = float(value)
+        else:
+            levels.pop(source, None)
+
     def _detect_burst(self) -> bool:
         """Detect command burst using sliding window."""
         if not self._burst_threshold:
@@ -306,6 +506,28 @@ class CommandThrottle(CommandThrottleProtocol):
 
         return len(self._burst_timestamps) > self._burst_threshold
 
+    def _get_load_factor(self) -> float:
+        """Return the rate factor for the reported radio load."""
+        if (load := max(self.duty_cycle_level or 0.0, self.carrier_sense_level or 0.0)) <= (
+            low := self._duty_cycle_target / 2
+        ):
+            return 1.0
+        if load >= self._duty_cycle_target:
+            return _MIN_RATE_FACTOR
+        return 1.0 - (load - low) / (self._duty_cycle_target - low) * (1.0 - _MIN_RATE_FACTOR)
+
+    def _get_send_delay(self) -> float:
+        """Return seconds to wait before the next command may be sent."""
+        now = time.monotonic()
+        if not self._adaptive:
+            return max(0.0, self._interval - (now - self._last_command_time))
+        if self._backoff_until > now:
+            return self._backoff_until - now
+        self._refill_tokens()
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.send_rate
+
     async def _purge_commands(self, *, purge_addresses: frozenset[str]) -> None:
         """Cancel and remove pending commands matching any of the given channel addresses."""
         async with self._lock:
@@ -314,6 +536,7 @@ class CommandThrottle(CommandThrottleProtocol):
 
             for cmd in self._queue:
                 if cmd.device_address in purge_addresses:
+                    self._release_pending(cmd=cmd)
                     if not cmd.future.done():
                         cmd.future.set_exception(
                             CommandSupersededError(f"Superseded by CRITICAL command (channel group: {purge_addresses})")
@@ -327,13 +550,63 @@ class CommandThrottle(CommandThrottleProtocol):
                 heapq.heapify(self._queue)
                 self._purged_count += purged_count
                 _LOGGER.info(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.client.command_throttle.purged_commands",
                         interface_id=self._interface_id,
                         purged_count=purged_count,
                     )
                 )
 
+    def _refill_tokens(self) -> None:
+        """Add the tokens earned since the last refill at the current send rate."""
+        now = time.monotonic()
+        if now > self._backoff_until:
+            elapsed = now - max(self._last_refill, self._backoff_until)
+            self._tokens = min(float(self._bucket_size), self._tokens + elapsed * self.send_rate)
+        self._last_refill = now
+
+    def _release_pending(self, *, cmd: PrioritizedCommand) -> None:
+        """Forget a command that left the queue as pending command of its data point."""
+        if cmd.dpk is not None and self._pending_by_dpk.get(cmd.dpk) is cmd:
+            del self._pending_by_dpk[cmd.dpk]
+
+    def _replace_pending(self, *, cmd: PrioritizedCommand) -> bool:
+        """
+        Replace the queued command for the same data point with a newer one.
+
+        The newer command takes over the queue slot of the older one, so a stream of
+        updates to one data point is not starved, and keeps the higher of both
+        priorities. The older caller receives CommandSupersededError.
+
+        Return False if no command for the data point is queued.
+        """
+        if cmd.dpk is None or (old := self._pending_by_dpk.get(cmd.dpk)) is None:
+            return False
+
+        index = next(i for i, queued in enumerate(self._queue) if queued is old)
+        new = PrioritizedCommand(
+            priority=min(old.priority, cmd.priority),
+            timestamp=old.timestamp,
+            future=cmd.future,
+            device_address=cmd.device_address,
+            dpk=cmd.dpk,
+        )
+        self._queue[index] = new
+        if new.priority < old.priority:
+            heapq.heapify(self._queue)
+        self._pending_by_dpk[cmd.dpk] = new
+        self._coalesced_count += 1
+
+        if not old.future.done():
+            old.future.set_exception(CommandSupersededError(f"Superseded by newer command for {cmd.dpk.parameter}"))
+        _LOGGER.debug(
+            "COMMAND_THROTTLE[%s]: Coalesced queued command (device=%s, parameter=%s)",
+            self._interface_id,
+            cmd.device_address,
+            cmd.dpk.parameter,
+        )
+        return True
+
     async def _worker(self) -> None:
         """
         Background worker that processes queue with throttling.
@@ -346,7 +619,7 @@ class CommandThrottle(CommandThrottleProtocol):
         5. Repeat
         """
         _LOGGER.info(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.client.command_throttle.worker_started",
                 interface_id=self._interface_id,
                 interval=self._interval,
@@ -368,12 +641,15 @@ class CommandThrottle(CommandThrottleProtocol):
                     if not self._queue:
                         continue
                     cmd = heapq.heappop(self._queue)
+                    self._release_pending(cmd=cmd)
                     queue_size = len(self._queue)
 
-                # Apply throttle delay if needed
-                if (elapsed := time.monotonic() - self._last_command_time) < self._interval:
-                    delay = self._interval - elapsed
-                    self._throttled_count += 1
+                # Apply throttle delay if needed (re-checked, a fault may extend the backoff)
+                throttled = False
+                while (delay := self._get_send_delay()) > 0.0:
+                    if not throttled:
+                        throttled = True
+                        self._throttled_count += 1
 
                     _LOGGER.debug(
                         "COMMAND_THROTTLE[%s]: Delaying %s command by %.3fs (device=%s, queue_size=%d)",
@@ -388,19 +664,21 @@ class CommandThrottle(CommandThrottleProtocol):
 
                 # Update timestamp and grant permission
                 self._last_command_time = time.monotonic()
+                if self._adaptive:
+                    self._tokens = max(0.0, self._tokens - 1.0)
 
                 if not cmd.future.done():
                     cmd.future.set_result(None)
 
             except asyncio.CancelledError:
                 _LOGGER.info(
-                    i18n.tr(key="log.client.command_throttle.worker_cancelled", interface_id=self._interface_id)
+                    i18n.lazy_tr(key="log.client.command_throttle.worker_cancelled", interface_id=self._interface_id)
                 )
                 break
 
             except Exception:
                 _LOGGER.exception(
-                    i18n.tr(key="log.client.command_throttle.worker_error", interface_id=self._interface_id)
+                    i18n.lazy_tr(key="log.client.command_throttle.worker_error", interface_id=self._interface_id)
                 )
 
-        _LOGGER.info(i18n.tr(key="log.client.command_throttle.worker_stopped", interface_id=self._interface_id))
+        _LOGGER.info(i18n.lazy_tr(key="log.client.command_throttle.worker_stopped", interface_id=self._interface_id))
@@ -46,6 +46,7 @@ from aiohomematic.const import (
     DeviceDescription,
     FailureReason,
     ForcedDeviceAvailability,
+    HubSnapshotData,
     InboxDeviceData,
     Interface,
     Operations,
@@ -59,7 +60,9 @@ from aiohomematic.const import (
     ServiceMessageType,
     SystemInformation,
     SystemUpdateData,
+    SystemVariableChangesData,
     SystemVariableData,
+    TaskCategory,
 )
 from aiohomematic.decorators import inspector
 from aiohomematic.exceptions import BaseHomematicException, ClientException, CommandSupersededError, ValidationException
@@ -163,16 +166,23 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
             event_bus=central.event_bus,
             interface_id=backend.interface_id,
         )
-        self._command_retry_handler: Final = CommandRetryHandler(
+        timeout_config = central.config.timeout_config
+        self._command_throttle: Final = CommandThrottle(
             interface_id=backend.interface_id,
-            timeout_config=central.config.timeout_config,
-            event_bus=central.event_bus,
+            interval=timeout_config.command_throttle_interval,
+            burst_threshold=timeout_config.burst_threshold,
+            burst_window=timeout_config.burst_window,
+            adaptive=timeout_config.command_throttle_adaptive,
+            bucket_size=timeout_config.command_throttle_bucket_size,
+            duty_cycle_target=timeout_config.command_throttle_duty_cycle_target,
+            duty_cycle_backoff=timeout_config.command_retry_duty_cycle_delay,
+            transmission_pending_backoff=timeout_config.command_retry_transmission_pending_delay,
         )
-        self._command_throttle: Final = CommandThrottle(
+        self._command_retry_handler: Final = CommandRetryHandler(
             interface_id=backend.interface_id,
-            interval=central.config.timeout_config.command_throttle_interval,
-            burst_threshold=central.config.timeout_config.burst_threshold,
-            burst_window=central.config.timeout_config.burst_window,
+            timeout_config=timeout_config,
+            event_bus=central.event_bus,
+            command_throttle=self._command_throttle,
         )
         self._modified_at: datetime = INIT_DATETIME
         self._modified_at_monotonic: float = 0.0
@@ -439,16 +449,11 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
         # Root devices don't have PARENT_TYPE, so fall back to TYPE.
         device_type = device_description.get("PARENT_TYPE") or device_description["TYPE"]
 
-        data = await self.get_paramset_descriptions(device_description=device_description)
-        for address, paramsets in data.items():
-            for paramset_key, paramset_description in paramsets.items():
-                self._central.cache_coordinator.paramset_descriptions.add(
-                    interface_id=self.interface_id,
-                    channel_address=address,
-                    paramset_key=paramset_key,
-                    paramset_description=paramset_description,
-                    device_type=device_type,
-                )
+        self._central.cache_coordinator.paramset_descriptions.add_device_paramsets(
+            interface_id=self.interface_id,
+            paramset_descriptions=await self.get_paramset_descriptions(device_description=device_description),
+            device_type=device_type,
+        )
 
     async def get_alarm_messages(self) -> tuple[AlarmMessageData, ...]:
         """Get all active alarm messages from the backend."""
@@ -523,6 +528,24 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
 
         return await self._device_description_coalescer.execute(key=key, executor=_fetch)
 
+    async def get_hub_snapshot(
+        self,
+        *,
+        program_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_since: int = 0,
+        sysvar_checksum: str | None = None,
+    ) -> HubSnapshotData | None:
+        """Get the hub data of one scan interval with a single backend script run, if supported."""
+        if not self._backend.capabilities.hub_snapshot:
+            return None
+        return await self._backend.get_hub_snapshot(
+            program_markers=program_markers,
+            sysvar_markers=sysvar_markers,
+            sysvar_since=sysvar_since,
+            sysvar_checksum=sysvar_checksum,
+        )
+
     async def get_inbox_devices(self) -> tuple[InboxDeviceData, ...]:
         """Get all devices in the inbox (not yet configured)."""
         if not self._backend.capabilities.inbox_devices:
@@ -675,6 +698,12 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
         """Get single system variable from the backend."""
         return await self._backend.get_system_variable(name=name)
 
+    async def get_system_variable_changes(self, *, since: int) -> SystemVariableChangesData | None:
+        """Get the system variable values changed since the given backend timestamp, if supported."""
+        if not self._backend.capabilities.sysvar_changes:
+            return None
+        return await self._backend.get_system_variable_changes(since=since)
+
     async def get_value(
         self,
         *,
@@ -698,8 +727,8 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
     def get_virtual_remote(self) -> DeviceProtocol | None:
         """Get the virtual remote for the Client."""
         for model in VIRTUAL_REMOTE_MODELS:
-            for device in self._central.device_registry.devices:
-                if device.interface_id == self.interface_id and device.model == model:
+            for device in self._central.device_registry.get_devices(interface_id=self.interface_id):
+                if device.model == model:
                     return device
         return None
 
@@ -819,7 +848,7 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
                         ),
                     )
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.client.is_callback_alive.no_events",
                         interface_id=self.interface_id,
                         seconds=int(seconds_since_last_event),
@@ -1062,7 +1091,7 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
                 self._reconnect_attempts = 0
                 self._connection_error_count = 0
                 _LOGGER.info(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.client.reconnect.reconnected",
                         interface_id=self.interface_id,
                     )
@@ -1205,12 +1234,7 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
                 else value
             )
 
-            # Acquire command throttle with priority
-            await self._command_throttle.acquire(
-                priority=priority, device_address=channel_address, purge_addresses=purge_addresses
-            )
-
-            # Build the DataPointKey for retry tracking
+            # Build the DataPointKey for throttle coalescing and retry tracking
             dpk = DataPointKey(
                 interface_id=self._backend.interface_id,
                 channel_address=channel_address,
@@ -1218,6 +1242,19 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
                 parameter=parameter,
             )
 
+            # Acquire command throttle with priority (a queued command for the same dpk is superseded).
+            # Every write of an ACTION parameter (PRESS_SHORT, ...) is a trigger of its own and is never superseded.
+            # Without throttling nothing is queued, so the parameter type is not looked up.
+            is_action = self._command_throttle.is_enabled and self._is_action_parameter(
+                channel_address=channel_address, paramset_key=paramset_key, parameter=parameter
+            )
+            await self._command_throttle.acquire(
+                priority=priority,
+                device_address=channel_address,
+                purge_addresses=purge_addresses,
+                dpk=None if is_action else dpk,
+            )
+
             # Define the backend operation as a retryable callable
             async def _do_set_value() -> None:
                 if rx_mode and (device := self._central.device_coordinator.get_device(address=channel_address)):
@@ -1268,7 +1305,7 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
                 )
         except CommandSupersededError:
             _LOGGER.debug(
-                "SET_VALUE: Command for %s/%s superseded by CRITICAL command",
+                "SET_VALUE: Command for %s/%s superseded by CRITICAL or newer command",
                 channel_address,
                 parameter,
             )
@@ -1559,13 +1596,23 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
 
         return await self._paramset_description_coalescer.execute(key=key, executor=_fetch)
 
+    def _is_action_parameter(self, *, channel_address: str, paramset_key: ParamsetKey, parameter: str) -> bool:
+        """Return True if the parameter is of type ACTION."""
+        if parameter_data := self._central.cache_coordinator.paramset_descriptions.get_parameter_data(
+            interface_id=self.interface_id,
+            channel_address=channel_address,
+            paramset_key=paramset_key,
+            parameter=parameter,
+        ):
+            return bool(parameter_data.get("TYPE") == ParameterType.ACTION)
+        return False
+
     def _mark_all_devices_forced_availability(self, *, forced_availability: ForcedDeviceAvailability) -> None:
         """Mark device's availability state for this interface."""
         available = forced_availability != ForcedDeviceAvailability.FORCE_FALSE
         if not available or self._state_machine.is_available != available:
-            for device in self._central.device_registry.devices:
-                if device.interface_id == self.interface_id:
-                    device.set_forced_availability(forced_availability=forced_availability)
+            for device in self._central.device_registry.get_devices(interface_id=self.interface_id):
+                device.set_forced_availability(forced_availability=forced_availability)
             _LOGGER.debug(
                 "MARK_ALL_DEVICES_FORCED_AVAILABILITY: marked all devices %s for %s",
                 "available" if available else "unavailable",
@@ -1640,6 +1687,7 @@ class InterfaceClient(ClientProtocol, LogContextMixin):
         self._central.looper.create_task(
             target=_record(),
             name=f"record_callback_timeout_incident_{self.interface_id}",
+            category=TaskCategory.INCIDENT,
         )
 
     def _stage_in_flight_paramset(
@@ -26,12 +26,18 @@ Notes
 - Some JSON-RPC methods are backend/firmware dependent. The client detects and
   store supported methods at runtime.
 - Binary/text encodings are handled carefully (UTF-8 / ISO-8859-1) for script IO.
+- The large response of the fetch_all_device_data script is decoded chunk by
+  chunk while it is received instead of being read and parsed as a whole.
+- Compressed responses (gzip/deflate) are requested unless disabled. Bytes and
+  latency are recorded per method (scripts per script name) in method_stats.
 
 """
 
 import asyncio
 from asyncio import Semaphore
+import codecs
 from collections.abc import Mapping
+from dataclasses import replace
 from datetime import datetime
 from enum import StrEnum, unique
 from functools import partial
@@ -39,6 +45,7 @@ import logging
 from pathlib import Path
 import re
 from ssl import SSLContext
+import time
 from typing import Any, Final
 from urllib.parse import unquote
 
@@ -63,8 +70,10 @@ from aiohomematic.const import (
     ALWAYS_ENABLE_SYSVARS_BY_ID,
     DEFAULT_INCLUDE_INTERNAL_PROGRAMS,
     DEFAULT_INCLUDE_INTERNAL_SYSVARS,
+    DEFAULT_JSON_RPC_COMPRESSION,
     IGNORE_SYSVARS_BY_ID,
     ISO_8859_1,
+    JSON_RPC_KEEPALIVE_TIMEOUT,
     JSON_SESSION_AGE,
     LOGIN_BACKOFF_MULTIPLIER,
     LOGIN_INITIAL_BACKOFF_SECONDS,
@@ -83,6 +92,8 @@ from aiohomematic.const import (
     DescriptionMarker,
     DeviceDescription,
     DeviceDetail,
+    ExecutorLane,
+    HubSnapshotData,
     HubValueType,
     InboxDeviceData,
     Interface,
@@ -94,7 +105,9 @@ from aiohomematic.const import (
     ServiceMessageType,
     SystemInformation,
     SystemUpdateData,
+    SystemVariableChangesData,
     SystemVariableData,
+    TaskCategory,
 )
 from aiohomematic.exceptions import (
     AuthFailure,
@@ -106,6 +119,8 @@ from aiohomematic.exceptions import (
     UnsupportedException,
 )
 from aiohomematic.interfaces import IncidentRecorderProtocol
+from aiohomematic.metrics import RpcMethodStats, record_rpc_transfer
+from aiohomematic.metrics._protocols import JsonRpcClientForMetricsProtocol
 from aiohomematic.model.support import convert_value
 from aiohomematic.property_decorators import DelegatedProperty
 from aiohomematic.store.persistent import SessionRecorder
@@ -115,6 +130,7 @@ from aiohomematic.support import (
     element_matches_key,
     extract_exc_args,
     get_tls_context,
+    hash_sha256,
     log_boundary_error,
     parse_sys_var,
 )
@@ -136,6 +152,25 @@ _JSON_STRING_PATTERN: Final = re.compile(r'"(?:[^"\\]|\\.)*"')
 # These must be escaped as \uXXXX per RFC 8259.
 _CONTROL_CHAR_PATTERN: Final = re.compile(r"[\x00-\x1f\x7f]")
 
+# Pattern to match the "result" key of a JSON-RPC response envelope up to its value.
+_RESULT_KEY_PATTERN: Final = re.compile(r'[{,]\s*"result"\s*:\s*')
+
+# Pattern to match the body of a JSON string up to its closing quote or an incomplete escape sequence.
+_STRING_BODY_PATTERN: Final = re.compile(r'[^"\\]*(?:(?:\\u[0-9a-fA-F]{4}|\\[^u])[^"\\]*)*')
+
+# Patterns to find the next token that changes the string state of the device data entries.
+_ENTRY_TOKEN_PATTERN: Final = re.compile(r'[",]')
+_STRING_TOKEN_PATTERN: Final = re.compile(r'["\\]')
+
+# Chunk size used when reading streamed JSON-RPC responses.
+_STREAM_CHUNK_SIZE: Final = 65536
+
+# Accept-Encoding values for JSON-RPC requests. The CCU webserver compresses
+# responses on request but does not accept compressed request bodies.
+_ACCEPT_ENCODING_COMPRESSED: Final = "gzip, deflate"
+_ACCEPT_ENCODING_IDENTITY: Final = "identity"
+_COMPRESSED_ENCODINGS: Final = frozenset({"deflate", "gzip"})
+
 
 def _escape_rega_string(*, value: str) -> str:
     """
@@ -185,6 +220,14 @@ def _sanitize_json_control_chars(*, data: str) -> str:
     return _JSON_STRING_PATTERN.sub(escape_control_chars_in_string, data)
 
 
+def _loads_sanitized(*, data: str) -> Any:
+    """Parse JSON, escaping unescaped control characters in string values if the first attempt fails."""
+    try:
+        return compat.loads(data=data)
+    except JSONDecodeError:
+        return compat.loads(data=_sanitize_json_control_chars(data=data))
+
+
 # Pattern to extract character position from JSON decode error messages.
 # Matches formats like "(char 10957)" used by orjson and stdlib json.
 _JSON_ERROR_CHAR_POS_PATTERN: Final = re.compile(r"\(char (\d+)\)")
@@ -201,7 +244,7 @@ def _log_json_parse_error_context(*, data: str, script_name: str, error: Excepti
             char = data[pos]
             context = f" at position {pos} (U+{ord(char):04X} {char!r}). Context: ...{data[start:end]!r}..."
     _LOGGER.warning(
-        i18n.tr(
+        i18n.lazy_tr(
             key="log.client.json_rpc.post_script.json_parse_error",
             script_name=script_name,
             context=context,
@@ -247,12 +290,14 @@ class _JsonKey(StrEnum):
 
     ACTION = "action"
     ADDRESS = "address"
+    ALARM_MESSAGES = "alarm_messages"
     AVAILABLE_FIRMWARE = "available_firmware"
     CHANNELS = "channels"
     CHANNEL_ADDRESS = "channelAddress"
     CHANNEL_IDS = "channelIds"
     CHN_ID = "chnID"
     CHECK_SCRIPT_AVAILABLE = "check_script_available"
+    CHECKSUM = "checksum"
     COUNTER = "counter"
     CURRENT_FIRMWARE = "current_firmware"
     DESCRIPTION = "description"
@@ -264,6 +309,7 @@ class _JsonKey(StrEnum):
     FUNCTIONS = "functions"
     HOSTNAME = "hostname"
     ID = "id"
+    INBOX_DEVICES = "inbox_devices"
     INIT_VAL = "init_val"
     INSTALL_MODE = "installMode"
     INTERFACE = "interface"
@@ -279,6 +325,8 @@ class _JsonKey(StrEnum):
     MAX_VALUE = "maxValue"
     MESSAGE = "message"
     MESSAGE_ID = "message_id"
+    META = "meta"
+    METADATA = "metadata"
     MIN_VALUE = "minValue"
     MODE = "mode"
     NAME = "name"
@@ -287,6 +335,7 @@ class _JsonKey(StrEnum):
     PARAMSET_KEY = "paramsetKey"
     PASSWORD = "password"  # noqa: S105  # nosec B105
     PRODUCT = "product"
+    PROGRAM_DESCRIPTIONS = "program_descriptions"
     QUITTABLE = "quittable"
     RESULT = "result"
     ROOMS = "rooms"
@@ -294,10 +343,16 @@ class _JsonKey(StrEnum):
     RECEIVER_ADDRESS = "receiverAddress"
     SENDER_ADDRESS = "senderAddress"
     SERIAL = "serial"
+    SERVICE_MESSAGES = "service_messages"
     SESSION_ID = "_session_id_"
     SET = "set"
     SUPPRESS = "suppress"
     SID = "sid"
+    SYSVAR_CHECKSUM = "sysvar_checksum"
+    SYSVAR_DESCRIPTIONS = "sysvar_descriptions"
+    SYSVAR_TIMESTAMP = "sysvar_timestamp"
+    SYSVAR_VALUES = "sysvar_values"
+    SINCE = "since"
     SIZE = "size"
     STATE = "state"
     STATUS = "status"
@@ -312,9 +367,23 @@ class _JsonKey(StrEnum):
     VALUE = "value"
     VALUE_KEY = "valueKey"
     VALUE_LIST = "valueList"
+    VALUES = "values"
     VERSION = "version"
 
 
+# Sections written by get_hub_snapshot.fn. A snapshot missing one of them is not used.
+_HUB_SNAPSHOT_SECTIONS: Final = (
+    _JsonKey.ALARM_MESSAGES,
+    _JsonKey.INBOX_DEVICES,
+    _JsonKey.PROGRAM_DESCRIPTIONS,
+    _JsonKey.SERVICE_MESSAGES,
+    _JsonKey.SYSVAR_CHECKSUM,
+    _JsonKey.SYSVAR_DESCRIPTIONS,
+    _JsonKey.SYSVAR_TIMESTAMP,
+    _JsonKey.SYSVAR_VALUES,
+)
+
+
 @unique
 class _JsonRpcMethod(StrEnum):
     """Enum for Homematic json rpc methods types."""
@@ -368,7 +437,181 @@ _CIRCUIT_BREAKER_BYPASS_METHODS: Final = (
 )
 
 
-class AioJsonRpcAioHttpClient(LogContextMixin):
+class _DeviceDataDecoder:
+    """
+    Incremental decoder for the response of the fetch_all_device_data script.
+
+    The script returns one JSON object with an entry per data point as a string
+    in the result of the JSON-RPC response. Large installations produce several
+    megabytes of data, so the response is decoded chunk by chunk while it is
+    received: the result string is unescaped in pieces, complete entries are
+    parsed in batches and written with unquoted names and values into
+    device_data. Neither the response body, the result string nor an
+    intermediate dict of the entries is held in memory as a whole.
+
+    Responses whose result is not a string are buffered and parsed as a whole.
+    """
+
+    __slots__ = (
+        "_device_data",
+        "_entries",
+        "_envelope_head",
+        "_envelope_tail",
+        "_escaped",
+        "_in_string",
+        "_object_started",
+        "_pending",
+        "_result_streamed",
+        "_scanned",
+        "_separator",
+        "_text_decoder",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the decoder."""
+        self._device_data: Final[dict[str, Any]] = {}
+        self._text_decoder: Final = codecs.getincrementaldecoder(UTF_8)()
+        self._envelope_head = ""
+        self._envelope_tail: str | None = None
+        self._pending = ""
+        self._entries = ""
+        self._object_started = False
+        self._result_streamed = False
+        self._in_string = False
+        self._escaped = False
+        self._scanned = 0
+        self._separator = -1
+
+    @property
+    def device_data(self) -> dict[str, Any]:
+        """Return the decoded device data."""
+        return self._device_data
+
+    def add_entries(self, *, entries: Mapping[str, Any]) -> None:
+        """Add parsed entries with unquoted names and string values to the device data."""
+        for name, value in entries.items():
+            self._device_data[unquote(string=name, encoding=ISO_8859_1)] = (
+                unquote(string=value, encoding=ISO_8859_1) if isinstance(value, str) else value
+            )
+
+    def close(self) -> dict[str, Any] | Any:
+        """
+        Finish decoding and return the JSON-RPC response.
+
+        If the result has been streamed, it is replaced by device_data.
+        """
+        self._feed_text(text=self._text_decoder.decode(b"", final=True))
+        if not self._result_streamed:
+            return _loads_sanitized(data=self._envelope_head)
+        if self._envelope_tail is None:
+            raise JSONDecodeError("Unterminated result string in JSON-RPC response")
+        self._parse_entries(final=True)
+        response = _loads_sanitized(data=f"{self._envelope_head}null{self._envelope_tail}")
+        response[_JsonKey.RESULT] = self._device_data
+        return response
+
+    def feed(self, *, chunk: bytes) -> None:
+        """Decode the next chunk of the response body."""
+        self._feed_text(text=self._text_decoder.decode(chunk))
+
+    def _feed_text(self, *, text: str) -> None:
+        """Dispatch decoded text to the envelope or the result string."""
+        if self._envelope_tail is not None:
+            self._envelope_tail += text
+            return
+        if self._result_streamed:
+            self._feed_result(text=text)
+            return
+        self._envelope_head += text
+        if (match := _RESULT_KEY_PATTERN.search(self._envelope_head)) is None or match.end() == len(
+            self._envelope_head
+        ):
+            return
+        if self._envelope_head[match.end()] == '"':
+            text = self._envelope_head[match.end() + 1 :]
+            self._envelope_head = self._envelope_head[: match.end()]
+            self._result_streamed = True
+            self._feed_result(text=text)
+
+    def _feed_result(self, *, text: str) -> None:
+        """Unescape the complete part of the result string and parse the entries it contains."""
+        pending = self._pending + text
+        end = match.end() if (match := _STRING_BODY_PATTERN.match(pending)) else 0
+        if pending.startswith('"', end):
+            self._envelope_tail = pending[end + 1 :]
+            self._pending = ""
+        else:
+            # Keep an incomplete escape sequence until the next chunk arrives
+            self._pending = pending[end:]
+        if end:
+            escaped = pending[:end]
+            if _CONTROL_CHAR_PATTERN.search(escaped):
+                # Workaround for bug in CCU: the result may contain unescaped control characters
+                escaped = _CONTROL_CHAR_PATTERN.sub(lambda char: f"\\u{ord(char.group()):04x}", escaped)
+            self._entries += compat.loads(data=f'"{escaped}"')
+            self._parse_entries(final=False)
+
+    def _parse_entries(self, *, final: bool) -> None:
+        """Parse the complete entries of the device data object."""
+        entries = self._entries
+        if not self._object_started:
+            if not (entries := entries.lstrip()):
+                self._entries = ""
+                return
+            if not entries.startswith("{"):
+                raise JSONDecodeError("Device data is not a JSON object")
+            entries = entries[1:]
+            self._object_started = True
+        if final:
+            if not (entries := entries.rstrip()).endswith("}"):
+                raise JSONDecodeError("Unterminated device data object")
+            batch, self._entries = entries[:-1], ""
+        else:
+            # Split after the last entry separator outside of a string
+            self._scan_entries(entries=entries)
+            if (cut := self._separator) < 0:
+                self._entries = entries
+                return
+            batch, self._entries = entries[:cut], entries[cut + 1 :]
+            self._scanned -= cut + 1
+            self._separator = -1
+        if batch.strip():
+            self.add_entries(entries=_loads_sanitized(data=f"{{{batch}}}"))
+
+    def _scan_entries(self, *, entries: str) -> None:
+        """
+        Scan the entries received since the last call for the last entry separator.
+
+        The string and escape state is kept between the calls, so an escaped quote
+        or a chunk boundary within an escape sequence does not end a string.
+        """
+        pos, end = self._scanned, len(entries)
+        if self._escaped and pos < end:
+            self._escaped = False
+            pos += 1
+        while pos < end:
+            if self._in_string:
+                if (match := _STRING_TOKEN_PATTERN.search(entries, pos)) is None:
+                    break
+                pos = match.end()
+                if match.group() == '"':
+                    self._in_string = False
+                elif pos < end:
+                    pos += 1
+                else:
+                    self._escaped = True
+            else:
+                if (match := _ENTRY_TOKEN_PATTERN.search(entries, pos)) is None:
+                    break
+                pos = match.end()
+                if match.group() == '"':
+                    self._in_string = True
+                else:
+                    self._separator = match.start()
+        self._scanned = end
+
+
+class AioJsonRpcAioHttpClient(LogContextMixin, JsonRpcClientForMetricsProtocol):
     """Connection to CCU JSON-RPC Server."""
 
     def __init__(
@@ -385,10 +628,13 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         circuit_breaker_config: CircuitBreakerConfig | None = None,
         event_bus: EventBus | None = None,
         incident_recorder: IncidentRecorderProtocol | None = None,
+        compression: bool = DEFAULT_JSON_RPC_COMPRESSION,
     ) -> None:
         """Session setup."""
         self._client_session: Final = (
-            ClientSession(connector=TCPConnector(limit=MAX_CONCURRENT_HTTP_SESSIONS))
+            ClientSession(
+                connector=TCPConnector(limit=MAX_CONCURRENT_HTTP_SESSIONS, keepalive_timeout=JSON_RPC_KEEPALIVE_TIMEOUT)
+            )
             if client_session is None
             else client_session
         )
@@ -402,7 +648,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         self._url: Final = f"{device_url}{PATH_JSON_RPC}"
         if not tls:
             _LOGGER.info(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.tls_disabled",
                     url=device_url,
                 )
@@ -414,6 +660,12 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         self._supported_methods: tuple[str, ...] | None = None
         self._http_session_semaphore: Final = Semaphore(value=MAX_CONCURRENT_HTTP_SESSIONS)
         self._session_lock: Final = asyncio.Lock()
+        self._accept_encoding: Final = _ACCEPT_ENCODING_COMPRESSED if compression else _ACCEPT_ENCODING_IDENTITY
+        self._method_stats: Final[dict[str, RpcMethodStats]] = {}
+        # Checksum over the sysvar ids and timestamps computed by the ReGa scripts, and the
+        # checksum over the sysvar metadata they returned when it last changed.
+        self._sysvar_rega_checksum: str = ""
+        self._sysvar_metadata_checksum: str = ""
 
         # Login rate limiting state
         self._failed_login_attempts: int = 0
@@ -515,6 +767,11 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         """If session exists, then it is activated."""
         return self._session_id is not None
 
+    @property
+    def method_stats(self) -> Mapping[str, RpcMethodStats]:
+        """Return a copy of the traffic statistics per method (scripts as method:script)."""
+        return {key: replace(stats) for key, stats in self._method_stats.items()}
+
     async def accept_device_in_inbox(self, *, device_address: str) -> bool:
         """
         Accept a device from the CCU inbox.
@@ -528,7 +785,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         """
         if not is_device_address(address=device_address):
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.accept_device_in_inbox.invalid_address",
                     device_address=device_address,
                 )
@@ -545,7 +802,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 return bool(json_result.get(_JsonKey.SUCCESS, False))
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.accept_device_in_inbox.failed",
                     device_address=device_address,
                     reason=extract_exc_args(exc=jderr),
@@ -576,7 +833,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 return bool(json_result.get(_JsonKey.SUCCESS, False))
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.acknowledge_message.decode_failed",
                     message_id=message_id,
                     reason=extract_exc_args(exc=jderr),
@@ -599,7 +856,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 return bool(json_result.get(_JsonKey.SUCCESS, False))
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.create_backup_start.failed",
                     reason=extract_exc_args(exc=jderr),
                 )
@@ -628,7 +885,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 )
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.create_backup_status.failed",
                     reason=extract_exc_args(exc=jderr),
                 )
@@ -713,13 +970,13 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
         """
         if not self._client_session:
-            _LOGGER.error(i18n.tr(key="exception.client.json_post.no_session"))
+            _LOGGER.error(i18n.lazy_tr(key="exception.client.json_post.no_session"))
             return None
 
         # Get session ID for authentication
         await self._login_or_renew()
         if not self._session_id:
-            _LOGGER.error(i18n.tr(key="log.client.json_rpc.download_backup.no_session"))
+            _LOGGER.error(i18n.lazy_tr(key="log.client.json_rpc.download_backup.no_session"))
             return None
 
         # Build download URL - CCU creates and serves backup via cp_security.cgi
@@ -738,14 +995,14 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                     _LOGGER.debug("DOWNLOAD_BACKUP: Downloaded %d bytes", len(content))
                     return content
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.client.json_rpc.download_backup.failed",
                         status=response.status,
                     )
                 )
         except ClientError as cerr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.download_backup.error",
                     reason=extract_exc_args(exc=cerr),
                 )
@@ -765,12 +1022,12 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
         """
         if not self._client_session:
-            _LOGGER.error(i18n.tr(key="exception.client.json_post.no_session"))
+            _LOGGER.error(i18n.lazy_tr(key="exception.client.json_post.no_session"))
             return False
 
         if not firmware_url.startswith(("http://", "https://")):
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.download_firmware.invalid_url",
                     url=firmware_url,
                 )
@@ -785,7 +1042,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             # Get session ID for authentication
             await self._login_or_renew()
             if not self._session_id:
-                _LOGGER.error(i18n.tr(key="log.client.json_rpc.download_firmware.no_session"))
+                _LOGGER.error(i18n.lazy_tr(key="log.client.json_rpc.download_firmware.no_session"))
                 return False
 
             # CCU expects firmware URL to be passed to maintenance CGI
@@ -805,14 +1062,14 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                     _LOGGER.debug("DOWNLOAD_FIRMWARE: Firmware download initiated")
                     return True
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.client.json_rpc.download_firmware.failed",
                         status=response.status,
                     )
                 )
         except ClientError as cerr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.download_firmware.error",
                     reason=extract_exc_args(exc=cerr),
                 )
@@ -839,41 +1096,23 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
     async def get_alarm_messages(self) -> tuple[AlarmMessageData, ...]:
         """Get all active alarm messages from the backend."""
-        messages: list[AlarmMessageData] = []
+        messages: tuple[AlarmMessageData, ...] = ()
 
         try:
             response = await self._post_script(script_name=RegaScript.GET_ALARM_MESSAGES)
 
             _LOGGER.debug("GET_ALARM_MESSAGES: Getting alarm messages")
             if json_result := response[_JsonKey.RESULT]:
-                for msg in json_result:
-                    name = unquote(string=msg[_JsonKey.NAME], encoding=ISO_8859_1)
-                    message_code = _extract_message_code(name=name)
-                    messages.append(
-                        AlarmMessageData(
-                            alarm_id=msg[_JsonKey.ID],
-                            name=name,
-                            display_name=_resolve_message_display_name(message_code=message_code),
-                            description=unquote(string=msg.get(_JsonKey.DESCRIPTION, ""), encoding=ISO_8859_1),
-                            device_name=unquote(string=msg.get(_JsonKey.DEVICE_NAME, ""), encoding=ISO_8859_1),
-                            timestamp=msg.get(_JsonKey.TIMESTAMP, ""),
-                            last_timestamp=msg.get(_JsonKey.LAST_TIMESTAMP, ""),
-                            counter=msg.get(_JsonKey.COUNTER, 0),
-                            last_trigger=unquote(string=msg.get(_JsonKey.LAST_TRIGGER, ""), encoding=ISO_8859_1),
-                            rooms=_parse_tab_separated(
-                                value=msg.get(_JsonKey.ROOMS, ""),
-                            ),
-                        )
-                    )
+                messages = _convert_alarm_messages(json_result=json_result)
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.get_alarm_messages.decode_failed",
                     reason=extract_exc_args(exc=jderr),
                 )
             )
 
-        return tuple(messages)
+        return messages
 
     async def get_all_channel_ise_ids_function(self) -> Mapping[int, set[str]]:
         """Get all ise_ids per function from the backend."""
@@ -921,23 +1160,26 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
         return ise_ids_room
 
-    async def get_all_device_data(self, *, interface: Interface) -> Mapping[str, Any]:
-        """Get the all device data of the backend."""
-        all_device_data: dict[str, Any] = {}
+    async def get_all_device_data(self, *, interface: Interface) -> dict[str, Any]:
+        """
+        Get the all device data of the backend.
+
+        The script response is decoded while it is received, so the returned
+        dict is the only complete copy of the device data.
+        """
+        decoder = _DeviceDataDecoder()
         params = {
             _JsonKey.INTERFACE: interface,
         }
         try:
-            response = await self._post_script(script_name=RegaScript.FETCH_ALL_DEVICE_DATA, extra_params=params)
+            response = await self._post_script(
+                script_name=RegaScript.FETCH_ALL_DEVICE_DATA, extra_params=params, result_decoder=decoder
+            )
 
             _LOGGER.debug("GET_ALL_DEVICE_DATA: Getting all device data for interface %s", interface)
-            if json_result := response[_JsonKey.RESULT]:
-                all_device_data = {
-                    unquote(string=k, encoding=ISO_8859_1): unquote(string=v, encoding=ISO_8859_1)
-                    if isinstance(v, str)
-                    else v
-                    for k, v in json_result.items()
-                }
+            if (json_result := response[_JsonKey.RESULT]) and json_result is not decoder.device_data:
+                # The result has not been streamed (e.g. the backend returned an object)
+                decoder.add_entries(entries=json_result)
 
         except (ContentTypeError, JSONDecodeError) as cerr:
             raise ClientException(
@@ -947,99 +1189,17 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 )
             ) from cerr
 
-        return all_device_data
+        return decoder.device_data
 
     async def get_all_programs(self, *, markers: tuple[DescriptionMarker | str, ...]) -> tuple[ProgramData, ...]:
         """Get the all programs of the backend."""
-        all_programs: list[ProgramData] = []
-
-        response = await self._post(
-            method=_JsonRpcMethod.PROGRAM_GET_ALL,
-        )
-
-        _LOGGER.debug("GET_ALL_PROGRAMS: Getting all programs")
-        if json_result := response[_JsonKey.RESULT]:
-            descriptions = await self._get_program_descriptions()
-            for prog in json_result:
-                enabled_default = False
-                if (is_internal := prog[_JsonKey.IS_INTERNAL]) is True:
-                    if markers:
-                        if DescriptionMarker.INTERNAL not in markers:
-                            continue
-                        enabled_default = True
-                    elif DEFAULT_INCLUDE_INTERNAL_PROGRAMS is False:
-                        continue
-
-                pid = prog[_JsonKey.ID]
-                description = descriptions.get(pid)
-                if not is_internal and markers:
-                    if not element_matches_key(
-                        search_elements=markers,
-                        compare_with=description,
-                        ignore_case=False,
-                        do_left_wildcard_search=True,
-                    ):
-                        continue
-                    enabled_default = True
-                if description:
-                    # Remove default markers from description
-                    description = _DESCRIPTION_MARKER_PATTERN.sub("", description).strip()
-                name = prog[_JsonKey.NAME]
-                is_active = prog[_JsonKey.IS_ACTIVE]
-                last_execute_time = prog[_JsonKey.LAST_EXECUTE_TIME]
-
-                all_programs.append(
-                    ProgramData(
-                        pid=pid,
-                        legacy_name=name,
-                        description=description,
-                        is_active=is_active,
-                        is_internal=is_internal,
-                        last_execute_time=last_execute_time,
-                        enabled_default=enabled_default,
-                    )
-                )
-
-        return tuple(all_programs)
+        return await self._get_all_programs(markers=markers, descriptions=None)
 
     async def get_all_system_variables(
         self, *, markers: tuple[DescriptionMarker | str, ...]
     ) -> tuple[SystemVariableData, ...]:
         """Get all system variables from the backend."""
-        variables: list[SystemVariableData] = []
-
-        response = await self._post(
-            method=_JsonRpcMethod.SYSVAR_GET_ALL,
-        )
-
-        _LOGGER.debug("GET_ALL_SYSTEM_VARIABLES: Getting all system variables")
-        if json_result := response[_JsonKey.RESULT]:
-            descriptions = await self._get_system_variable_descriptions()
-            for var in json_result:
-                if (var_id := var[_JsonKey.ID]) in IGNORE_SYSVARS_BY_ID:
-                    continue
-                enabled_default, include = _resolve_sysvar_enabled_default(
-                    var_id=var_id,
-                    is_internal=var[_JsonKey.IS_INTERNAL],
-                    description=descriptions.get(var_id),
-                    markers=markers,
-                )
-                if not include:
-                    continue
-
-                legacy_name = RENAME_SYSVAR_BY_NAME.get(var[_JsonKey.NAME], var[_JsonKey.NAME])
-                if (
-                    variable := _build_sysvar_record(
-                        var=var,
-                        var_id=var_id,
-                        legacy_name=legacy_name,
-                        description=descriptions.get(var_id),
-                        enabled_default=enabled_default,
-                    )
-                ) is not None:
-                    variables.append(variable)
-
-        return tuple(variables)
+        return await self._get_all_system_variables(markers=markers, descriptions=None)
 
     async def get_device_description(self, *, interface: Interface, address: str) -> DeviceDescription | None:
         """Get device descriptions from the backend."""
@@ -1071,34 +1231,110 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
         return device_details
 
+    async def get_hub_snapshot(
+        self,
+        *,
+        program_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_markers: tuple[DescriptionMarker | str, ...] | None,
+        sysvar_since: int = 0,
+        sysvar_checksum: str | None = None,
+    ) -> HubSnapshotData | None:
+        """
+        Get the hub data of one scan interval with a single ReGa script run.
+
+        The script returns the program and system variable descriptions together with
+        the service messages, alarm messages and inbox devices. Programs and system
+        variables are still read with Program.getAll and SysVar.getAll, but without the
+        separate description scripts. A marker argument of None skips that section.
+
+        The script also returns the system variable values changed since sysvar_since
+        and a checksum over the ids and timestamps of all system variables. Descriptions
+        and metadata are only returned when that checksum changed. SysVar.getAll only
+        runs if the checksum of the metadata differs from sysvar_checksum; otherwise the
+        changed values are sufficient.
+
+        Returns None if the backend does not return a complete snapshot.
+        """
+        # Without a known metadata checksum the descriptions are required for a full fetch
+        rega_checksum = (
+            self._sysvar_rega_checksum
+            if sysvar_checksum is not None and sysvar_checksum == self._sysvar_metadata_checksum
+            else ""
+        )
+        try:
+            response = await self._post_script(
+                script_name=RegaScript.GET_HUB_SNAPSHOT,
+                extra_params={_JsonKey.SINCE: sysvar_since, _JsonKey.CHECKSUM: rega_checksum},
+            )
+        except JSONDecodeError as jderr:
+            _LOGGER.error(
+                i18n.lazy_tr(
+                    key="log.client.json_rpc.get_hub_snapshot.decode_failed",
+                    reason=extract_exc_args(exc=jderr),
+                )
+            )
+            return None
+
+        _LOGGER.debug("GET_HUB_SNAPSHOT: Getting hub snapshot")
+        if not isinstance(json_result := response[_JsonKey.RESULT], dict) or any(
+            section not in json_result for section in _HUB_SNAPSHOT_SECTIONS
+        ):
+            _LOGGER.debug("GET_HUB_SNAPSHOT: Backend returned no complete hub snapshot")
+            return None
+
+        programs: tuple[ProgramData, ...] | None = None
+        if program_markers is not None:
+            programs = await self._get_all_programs(
+                markers=program_markers,
+                descriptions=_convert_descriptions(json_result=json_result[_JsonKey.PROGRAM_DESCRIPTIONS]),
+            )
+        system_variables: tuple[SystemVariableData, ...] | None = None
+        system_variable_changes: SystemVariableChangesData | None = None
+        if sysvar_markers is not None:
+            system_variable_changes = SystemVariableChangesData(
+                checksum=self._update_sysvar_metadata_checksum(
+                    rega_checksum=json_result[_JsonKey.SYSVAR_CHECKSUM],
+                    metadata=json_result[_JsonKey.SYSVAR_DESCRIPTIONS],
+                ),
+                timestamp=int(json_result[_JsonKey.SYSVAR_TIMESTAMP]),
+                values=_convert_sysvar_values(json_result=json_result[_JsonKey.SYSVAR_VALUES]),
+            )
+            if system_variable_changes.checksum != sysvar_checksum:
+                system_variables = await self._get_all_system_variables(
+                    markers=sysvar_markers,
+                    descriptions=_convert_descriptions(json_result=json_result[_JsonKey.SYSVAR_DESCRIPTIONS] or []),
+                )
+
+        return HubSnapshotData(
+            alarm_messages=_convert_alarm_messages(json_result=json_result[_JsonKey.ALARM_MESSAGES]),
+            inbox_devices=_convert_inbox_devices(json_result=json_result[_JsonKey.INBOX_DEVICES]),
+            programs=programs,
+            service_messages=_convert_service_messages(
+                json_result=json_result[_JsonKey.SERVICE_MESSAGES], message_type=None
+            ),
+            system_variable_changes=system_variable_changes,
+            system_variables=system_variables,
+        )
+
     async def get_inbox_devices(self) -> tuple[InboxDeviceData, ...]:
         """Get all devices in the inbox (not yet configured)."""
-        devices: list[InboxDeviceData] = []
+        devices: tuple[InboxDeviceData, ...] = ()
 
         try:
             response = await self._post_script(script_name=RegaScript.GET_INBOX_DEVICES)
 
             _LOGGER.debug("GET_INBOX_DEVICES: Getting inbox devices")
             if json_result := response[_JsonKey.RESULT]:
-                devices.extend(
-                    InboxDeviceData(
-                        device_id=dev[_JsonKey.ID],
-                        address=dev.get(_JsonKey.ADDRESS, ""),
-                        name=unquote(string=dev.get(_JsonKey.NAME, ""), encoding=ISO_8859_1),
-                        device_type=dev.get(_JsonKey.TYPE, ""),
-                        interface=dev.get(_JsonKey.INTERFACE, ""),
-                    )
-                    for dev in json_result
-                )
+                devices = _convert_inbox_devices(json_result=json_result)
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.get_inbox_devices.decode_failed",
                     reason=extract_exc_args(exc=jderr),
                 )
             )
 
-        return tuple(devices)
+        return devices
 
     async def get_install_mode(self, *, interface: Interface) -> int:
         """Get the remaining install mode time for an interface."""
@@ -1208,50 +1444,23 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             message_type: Filter by message type. If None, return all messages.
 
         """
-        messages: list[ServiceMessageData] = []
+        messages: tuple[ServiceMessageData, ...] = ()
 
         try:
             response = await self._post_script(script_name=RegaScript.GET_SERVICE_MESSAGES)
 
             _LOGGER.debug("GET_SERVICE_MESSAGES: Getting service messages")
             if json_result := response[_JsonKey.RESULT]:
-                for msg in json_result:
-                    msg_type = msg[_JsonKey.TYPE]
-                    if message_type is not None and msg_type != message_type:
-                        continue
-                    name = unquote(string=msg[_JsonKey.NAME], encoding=ISO_8859_1)
-                    message_code = _extract_message_code(name=name)
-                    messages.append(
-                        ServiceMessageData(
-                            msg_id=msg[_JsonKey.ID],
-                            name=name,
-                            timestamp=msg[_JsonKey.TIMESTAMP],
-                            msg_type=msg_type,
-                            message_code=message_code,
-                            display_name=_resolve_message_display_name(message_code=message_code),
-                            msg_type_name=_resolve_msg_type_name(msg_type=msg_type),
-                            address=msg.get(_JsonKey.ADDRESS, ""),
-                            device_name=unquote(string=msg.get(_JsonKey.DEVICE_NAME, ""), encoding=ISO_8859_1),
-                            last_timestamp=msg.get(_JsonKey.LAST_TIMESTAMP, ""),
-                            counter=msg.get(_JsonKey.COUNTER, 0),
-                            rooms=_parse_tab_separated(
-                                value=msg.get(_JsonKey.ROOMS, ""),
-                            ),
-                            functions=_parse_tab_separated(
-                                value=msg.get(_JsonKey.FUNCTIONS, ""),
-                            ),
-                            quittable=msg.get(_JsonKey.QUITTABLE, False),
-                        )
-                    )
+                messages = _convert_service_messages(json_result=json_result, message_type=message_type)
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.get_service_messages.decode_failed",
                     reason=extract_exc_args(exc=jderr),
                 )
             )
 
-        return tuple(messages)
+        return messages
 
     async def get_suppressed_service_messages(
         self,
@@ -1295,7 +1504,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 is_ha_app = json_result.get(_JsonKey.IS_HA_APP, False)
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.get_backend_info.failed",
                     reason=extract_exc_args(exc=jderr),
                 )
@@ -1327,7 +1536,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 )
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.get_system_update_info.decode_failed",
                     reason=extract_exc_args(exc=jderr),
                 )
@@ -1350,6 +1559,45 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         _LOGGER.debug("GET_SYSTEM_VARIABLE: Getting System variable")
         return response[_JsonKey.RESULT]
 
+    async def get_system_variable_changes(self, *, since: int) -> SystemVariableChangesData | None:
+        """
+        Get the raw values of the system variables changed since the given backend timestamp.
+
+        The metadata of the system variables is only returned and hashed when the checksum
+        over their ids and timestamps changed since the last call.
+
+        Returns None if the backend does not return a valid result.
+        """
+        try:
+            response = await self._post_script(
+                script_name=RegaScript.GET_SYSTEM_VARIABLE_CHANGES,
+                extra_params={_JsonKey.SINCE: since, _JsonKey.CHECKSUM: self._sysvar_rega_checksum},
+            )
+        except JSONDecodeError as jderr:
+            _LOGGER.error(
+                i18n.lazy_tr(
+                    key="log.client.json_rpc.get_system_variable_changes.decode_failed",
+                    reason=extract_exc_args(exc=jderr),
+                )
+            )
+            return None
+
+        _LOGGER.debug("GET_SYSTEM_VARIABLE_CHANGES: Getting system variables changed since %i", since)
+        if not isinstance(json_result := response[_JsonKey.RESULT], dict) or any(
+            key not in json_result
+            for key in (_JsonKey.CHECKSUM, _JsonKey.METADATA, _JsonKey.TIMESTAMP, _JsonKey.VALUES)
+        ):
+            _LOGGER.debug("GET_SYSTEM_VARIABLE_CHANGES: Backend returned no valid result")
+            return None
+
+        return SystemVariableChangesData(
+            checksum=self._update_sysvar_metadata_checksum(
+                rega_checksum=json_result[_JsonKey.CHECKSUM], metadata=json_result[_JsonKey.METADATA]
+            ),
+            timestamp=int(json_result[_JsonKey.TIMESTAMP]),
+            values=_convert_sysvar_values(json_result=json_result[_JsonKey.VALUES]),
+        )
+
     async def get_value(self, *, interface: Interface, address: str, paramset_key: ParamsetKey, parameter: str) -> Any:
         """Get value from the backend."""
         value: Any = None
@@ -1597,7 +1845,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             if (clean_text := cleanup_text_from_html_tags(text=value)) != value:
                 params[_JsonKey.VALUE] = clean_text
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.client.json_rpc.set_system_variable.value_contains_html",
                         value=value,
                     )
@@ -1694,14 +1942,14 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
                 if success:
                     _LOGGER.info(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.client.json_rpc.trigger_firmware_update.success",
                             message=message,
                         )
                     )
                 else:
                     _LOGGER.warning(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.client.json_rpc.trigger_firmware_update.not_triggered",
                             message=message,
                         )
@@ -1709,7 +1957,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 return success
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.trigger_firmware_update.failed",
                     reason=extract_exc_args(exc=jderr),
                 )
@@ -1732,7 +1980,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
     async def _do_login(self) -> str | None:
         """Login to the backend and return session with rate limiting."""
         if not self._has_credentials:
-            _LOGGER.error(i18n.tr(key="log.client.json_rpc.do_login.no_credentials"))
+            _LOGGER.error(i18n.lazy_tr(key="log.client.json_rpc.do_login.no_credentials"))
             return None
 
         # Apply rate limiting if we've had recent failed attempts
@@ -1743,7 +1991,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         ):
             wait_time = self._current_backoff - elapsed
             _LOGGER.warning(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.do_login.rate_limited",
                     attempts=self._failed_login_attempts,
                     wait_time=wait_time,
@@ -1782,7 +2030,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             )
             if self._failed_login_attempts >= LOGIN_MAX_FAILED_ATTEMPTS:
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.client.json_rpc.do_login.max_attempts_reached",
                         max_attempts=LOGIN_MAX_FAILED_ATTEMPTS,
                     )
@@ -1817,6 +2065,8 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         method: _JsonRpcMethod,
         extra_params: Mapping[Any, Any] | None = None,
         use_default_params: bool = True,
+        result_decoder: _DeviceDataDecoder | None = None,
+        script_name: RegaScript | None = None,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST function."""
         if not self._client_session:
@@ -1832,13 +2082,21 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             raise CircuitBreakerOpenException(i18n.tr(key="exception.client.json_rpc.circuit_open", url=self._url))
 
         params = _get_params(session_id=session_id, extra_params=extra_params, use_default_params=use_default_params)
+        started: float | None = None
+        succeeded = False
+        bytes_sent = 0
+        bytes_received = 0
+        compressed = False
+        response: ClientResponse | None = None
 
         try:
             payload = compat.dumps(obj={"method": method, "params": params, "jsonrpc": "1.1", "id": 0})
+            bytes_sent = len(payload)
 
             headers = {
                 "Content-Type": "application/json",
-                "Content-Length": str(len(payload)),
+                "Content-Length": str(bytes_sent),
+                "Accept-Encoding": self._accept_encoding,
             }
 
             post_call = partial(
@@ -1851,11 +2109,17 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             )
             # Limit all JSON-RPC requests to prevent CCU session overload
             async with self._http_session_semaphore:
+                started = time.monotonic()
                 if (response := await asyncio.shield(post_call())) is None:
                     raise ClientException(i18n.tr(key="exception.client.json_post.no_response"))
+            compressed = response.headers.get("Content-Encoding", "") in _COMPRESSED_ENCODINGS
 
             if response.status == 200:
-                json_response = await asyncio.shield(self._get_json_reponse(response=response))
+                json_response = await asyncio.shield(
+                    self._get_json_reponse(response=response)
+                    if result_decoder is None
+                    else self._get_streamed_json_response(response=response, result_decoder=result_decoder)
+                )
                 self._record_session(method=method, params=params, response=json_response)
                 if error := json_response[_JsonKey.ERROR]:
                     # Map JSON-RPC error to actionable exception with context
@@ -1885,6 +2149,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
                 self._connection_state.remove_issue(issuer=self, iid=self._url)
                 self._circuit_breaker.record_success()
+                succeeded = True
                 return json_response
 
             message = i18n.tr(key="exception.client.json_post.http_status", status=response.status)
@@ -2001,6 +2266,23 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 error_message=str(exc),
             )
             raise ClientException(exc) from exc
+        finally:
+            if response is not None:
+                # Content-Length of a compressed response is the size on the wire. Chunked responses
+                # have none, so the body bytes received before decompression are counted once it is read.
+                bytes_received = (
+                    length if (length := response.content_length) is not None else response.content.total_raw_bytes
+                )
+                record_rpc_transfer(bytes_sent=bytes_sent, bytes_received=bytes_received)
+            if started is not None:
+                self._record_method_stats(
+                    key=f"{method}:{script_name}" if script_name else str(method),
+                    bytes_sent=bytes_sent,
+                    bytes_received=bytes_received,
+                    latency_ms=(time.monotonic() - started) * 1000,
+                    compressed=compressed,
+                    had_error=not succeeded,
+                )
 
     async def _do_renew_login(self, *, session_id: str) -> str | None:
         """Renew JSON-RPC session or perform login."""
@@ -2030,6 +2312,42 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
         return await self._do_login()
 
+    async def _get_all_programs(
+        self,
+        *,
+        markers: tuple[DescriptionMarker | str, ...],
+        descriptions: Mapping[str, str] | None,
+    ) -> tuple[ProgramData, ...]:
+        """Get all programs, reading the descriptions via script if not provided."""
+        response = await self._post(
+            method=_JsonRpcMethod.PROGRAM_GET_ALL,
+        )
+
+        _LOGGER.debug("GET_ALL_PROGRAMS: Getting all programs")
+        if not (json_result := response[_JsonKey.RESULT]):
+            return ()
+        if descriptions is None:
+            descriptions = await self._get_program_descriptions()
+        return _convert_programs(json_result=json_result, descriptions=descriptions, markers=markers)
+
+    async def _get_all_system_variables(
+        self,
+        *,
+        markers: tuple[DescriptionMarker | str, ...],
+        descriptions: Mapping[str, str] | None,
+    ) -> tuple[SystemVariableData, ...]:
+        """Get all system variables, reading the descriptions via script if not provided."""
+        response = await self._post(
+            method=_JsonRpcMethod.SYSVAR_GET_ALL,
+        )
+
+        _LOGGER.debug("GET_ALL_SYSTEM_VARIABLES: Getting all system variables")
+        if not (json_result := response[_JsonKey.RESULT]):
+            return ()
+        if descriptions is None:
+            descriptions = await self._get_system_variable_descriptions()
+        return _convert_system_variables(json_result=json_result, descriptions=descriptions, markers=markers)
+
     async def _get_auth_enabled(self) -> bool:
         """
         Get the auth_enabled flag of the backend.
@@ -2074,21 +2392,26 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             raw_data = (await response.read()).decode(encoding=UTF_8)
             return compat.loads(data=_sanitize_json_control_chars(data=raw_data))
 
+    async def _get_streamed_json_response(
+        self, *, response: ClientResponse, result_decoder: _DeviceDataDecoder
+    ) -> dict[str, Any] | Any:
+        """Return the json object from response, decoding the body chunk by chunk while it is received."""
+        async for chunk in response.content.iter_chunked(_STREAM_CHUNK_SIZE):
+            result_decoder.feed(chunk=chunk)
+        return result_decoder.close()
+
     async def _get_program_descriptions(self) -> Mapping[str, str]:
         """Get all program descriptions from the backend via script."""
-        descriptions: dict[str, str] = {}
+        descriptions: Mapping[str, str] = {}
         try:
             response = await self._post_script(script_name=RegaScript.GET_PROGRAM_DESCRIPTIONS)
 
             _LOGGER.debug("GET_PROGRAM_DESCRIPTIONS: Getting program descriptions")
             if json_result := response[_JsonKey.RESULT]:
-                for data in json_result:
-                    descriptions[data[_JsonKey.ID]] = cleanup_text_from_html_tags(
-                        text=unquote(string=data[_JsonKey.DESCRIPTION], encoding=ISO_8859_1)
-                    )
+                descriptions = _convert_descriptions(json_result=json_result)
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.get_program_descriptions.decode_failed",
                     reason=extract_exc_args(exc=jderr),
                 )
@@ -2111,7 +2434,9 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
                 return None
             return None
 
-        return await self._looper.async_add_executor_job(_load_script, script_name, name=f"load_script-{script_name}")
+        return await self._looper.async_add_executor_job(
+            _load_script, script_name, name=f"load_script-{script_name}", lane=ExecutorLane.STORAGE
+        )
 
     async def _get_serial(self) -> str | None:
         """Get the serial of the backend."""
@@ -2162,19 +2487,16 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
     async def _get_system_variable_descriptions(self) -> Mapping[str, str]:
         """Get all system variable descriptions from the backend via script."""
-        descriptions: dict[str, str] = {}
+        descriptions: Mapping[str, str] = {}
         try:
             response = await self._post_script(script_name=RegaScript.GET_SYSTEM_VARIABLE_DESCRIPTIONS)
 
             _LOGGER.debug("GET_SYSTEM_VARIABLE_DESCRIPTIONS: Getting system variable descriptions")
             if json_result := response[_JsonKey.RESULT]:
-                for data in json_result:
-                    descriptions[data[_JsonKey.ID]] = cleanup_text_from_html_tags(
-                        text=unquote(string=data[_JsonKey.DESCRIPTION], encoding=ISO_8859_1)
-                    )
+                descriptions = _convert_descriptions(json_result=json_result)
         except JSONDecodeError as jderr:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.client.json_rpc.get_system_variable_descriptions.decode_failed",
                     reason=extract_exc_args(exc=jderr),
                 )
@@ -2258,6 +2580,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         script_name: RegaScript,
         extra_params: dict[_JsonKey, Any] | None = None,
         keep_session: bool = True,
+        result_decoder: _DeviceDataDecoder | None = None,
     ) -> dict[str, Any] | Any:
         """Reusable JSON-RPC POST_SCRIPT function."""
         # Load and validate script first to avoid any network when script is missing
@@ -2286,6 +2609,8 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             session_id=session_id,
             method=method,
             extra_params={_JsonKey.SCRIPT: script},
+            result_decoder=result_decoder,
+            script_name=script_name,
         )
 
         _LOGGER.debug("POST_SCRIPT: method: %s [%s]", method, script_name)
@@ -2306,6 +2631,27 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
 
         return response
 
+    def _record_method_stats(
+        self,
+        *,
+        key: str,
+        bytes_sent: int,
+        bytes_received: int,
+        latency_ms: float,
+        compressed: bool,
+        had_error: bool,
+    ) -> None:
+        """Record bytes and latency of a JSON-RPC request."""
+        if (stats := self._method_stats.get(key)) is None:
+            stats = self._method_stats[key] = RpcMethodStats()
+        stats.record(
+            bytes_sent=bytes_sent,
+            bytes_received=bytes_received,
+            latency_ms=latency_ms,
+            compressed=compressed,
+            had_error=had_error,
+        )
+
     def _record_rpc_error_incident(
         self,
         *,
@@ -2365,6 +2711,7 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
         self._looper.create_task(
             target=_record(),
             name=f"record_rpc_error_incident_{interface_id}",
+            category=TaskCategory.INCIDENT,
         )
 
     def _record_session(
@@ -2393,6 +2740,196 @@ class AioJsonRpcAioHttpClient(LogContextMixin):
             return True
         return False
 
+    def _update_sysvar_metadata_checksum(self, *, rega_checksum: str, metadata: list[dict[str, Any]] | None) -> str:
+        """Hash the sysvar metadata if the ReGa script returned it and return the current checksum."""
+        if metadata is not None:
+            self._sysvar_metadata_checksum = _convert_sysvar_checksum(json_result=metadata)
+            self._sysvar_rega_checksum = rega_checksum
+        return self._sysvar_metadata_checksum
+
+
+def _convert_alarm_messages(*, json_result: list[dict[str, Any]]) -> tuple[AlarmMessageData, ...]:
+    """Convert the alarm messages written by a ReGa script."""
+    messages: list[AlarmMessageData] = []
+    for msg in json_result:
+        name = unquote(string=msg[_JsonKey.NAME], encoding=ISO_8859_1)
+        message_code = _extract_message_code(name=name)
+        messages.append(
+            AlarmMessageData(
+                alarm_id=msg[_JsonKey.ID],
+                name=name,
+                display_name=_resolve_message_display_name(message_code=message_code),
+                description=unquote(string=msg.get(_JsonKey.DESCRIPTION, ""), encoding=ISO_8859_1),
+                device_name=unquote(string=msg.get(_JsonKey.DEVICE_NAME, ""), encoding=ISO_8859_1),
+                timestamp=msg.get(_JsonKey.TIMESTAMP, ""),
+                last_timestamp=msg.get(_JsonKey.LAST_TIMESTAMP, ""),
+                counter=msg.get(_JsonKey.COUNTER, 0),
+                last_trigger=unquote(string=msg.get(_JsonKey.LAST_TRIGGER, ""), encoding=ISO_8859_1),
+                rooms=_parse_tab_separated(
+                    value=msg.get(_JsonKey.ROOMS, ""),
+                ),
+            )
+        )
+    return tuple(messages)
+
+
+def _convert_descriptions(*, json_result: list[dict[str, Any]]) -> Mapping[str, str]:
+    """Convert the program or system variable descriptions written by a ReGa script."""
+    return {
+        data[_JsonKey.ID]: cleanup_text_from_html_tags(
+            text=unquote(string=data[_JsonKey.DESCRIPTION], encoding=ISO_8859_1)
+        )
+        for data in json_result
+    }
+
+
+def _convert_inbox_devices(*, json_result: list[dict[str, Any]]) -> tuple[InboxDeviceData, ...]:
+    """Convert the inbox devices written by a ReGa script."""
+    return tuple(
+        InboxDeviceData(
+            device_id=dev[_JsonKey.ID],
+            address=dev.get(_JsonKey.ADDRESS, ""),
+            name=unquote(string=dev.get(_JsonKey.NAME, ""), encoding=ISO_8859_1),
+            device_type=dev.get(_JsonKey.TYPE, ""),
+            interface=dev.get(_JsonKey.INTERFACE, ""),
+        )
+        for dev in json_result
+    )
+
+
+def _convert_programs(
+    *,
+    json_result: list[dict[str, Any]],
+    descriptions: Mapping[str, str],
+    markers: tuple[DescriptionMarker | str, ...],
+) -> tuple[ProgramData, ...]:
+    """Convert the Program.getAll result, filtered by the description markers."""
+    all_programs: list[ProgramData] = []
+    for prog in json_result:
+        enabled_default = False
+        if (is_internal := prog[_JsonKey.IS_INTERNAL]) is True:
+            if markers:
+                if DescriptionMarker.INTERNAL not in markers:
+                    continue
+                enabled_default = True
+            elif DEFAULT_INCLUDE_INTERNAL_PROGRAMS is False:
+                continue
+
+        pid = prog[_JsonKey.ID]
+        description = descriptions.get(pid)
+        if not is_internal and markers:
+            if not element_matches_key(
+                search_elements=markers,
+                compare_with=description,
+                ignore_case=False,
+                do_left_wildcard_search=True,
+            ):
+                continue
+            enabled_default = True
+        if description:
+            # Remove default markers from description
+            description = _DESCRIPTION_MARKER_PATTERN.sub("", description).strip()
+
+        all_programs.append(
+            ProgramData(
+                pid=pid,
+                legacy_name=prog[_JsonKey.NAME],
+                description=description,
+                is_active=prog[_JsonKey.IS_ACTIVE],
+                is_internal=is_internal,
+                last_execute_time=prog[_JsonKey.LAST_EXECUTE_TIME],
+                enabled_default=enabled_default,
+            )
+        )
+    return tuple(all_programs)
+
+
+def _convert_service_messages(
+    *,
+    json_result: list[dict[str, Any]],
+    message_type: ServiceMessageType | None,
+) -> tuple[ServiceMessageData, ...]:
+    """Convert the service messages written by a ReGa script, optionally filtered by type."""
+    messages: list[ServiceMessageData] = []
+    for msg in json_result:
+        msg_type = msg[_JsonKey.TYPE]
+        if message_type is not None and msg_type != message_type:
+            continue
+        name = unquote(string=msg[_JsonKey.NAME], encoding=ISO_8859_1)
+        message_code = _extract_message_code(name=name)
+        messages.append(
+            ServiceMessageData(
+                msg_id=msg[_JsonKey.ID],
+                name=name,
+                timestamp=msg[_JsonKey.TIMESTAMP],
+                msg_type=msg_type,
+                message_code=message_code,
+                display_name=_resolve_message_display_name(message_code=message_code),
+                msg_type_name=_resolve_msg_type_name(msg_type=msg_type),
+                address=msg.get(_JsonKey.ADDRESS, ""),
+                device_name=unquote(string=msg.get(_JsonKey.DEVICE_NAME, ""), encoding=ISO_8859_1),
+                last_timestamp=msg.get(_JsonKey.LAST_TIMESTAMP, ""),
+                counter=msg.get(_JsonKey.COUNTER, 0),
+                rooms=_parse_tab_separated(
+                    value=msg.get(_JsonKey.ROOMS, ""),
+                ),
+                functions=_parse_tab_separated(
+                    value=msg.get(_JsonKey.FUNCTIONS, ""),
+                ),
+                quittable=msg.get(_JsonKey.QUITTABLE, False),
+            )
+        )
+    return tuple(messages)
+
+
+def _convert_system_variables(
+    *,
+    json_result: list[dict[str, Any]],
+    descriptions: Mapping[str, str],
+    markers: tuple[DescriptionMarker | str, ...],
+) -> tuple[SystemVariableData, ...]:
+    """Convert the SysVar.getAll result, filtered by the description markers."""
+    variables: list[SystemVariableData] = []
+    for var in json_result:
+        if (var_id := var[_JsonKey.ID]) in IGNORE_SYSVARS_BY_ID:
+            continue
+        enabled_default, include = _resolve_sysvar_enabled_default(
+            var_id=var_id,
+            is_internal=var[_JsonKey.IS_INTERNAL],
+            description=descriptions.get(var_id),
+            markers=markers,
+        )
+        if not include:
+            continue
+
+        legacy_name = RENAME_SYSVAR_BY_NAME.get(var[_JsonKey.NAME], var[_JsonKey.NAME])
+        if (
+            variable := _build_sysvar_record(
+                var=var,
+                var_id=var_id,
+                legacy_name=legacy_name,
+                description=descriptions.get(var_id),
+                enabled_default=enabled_default,
+            )
+        ) is not None:
+            variables.append(variable)
+    return tuple(variables)
+
+
+def _convert_sysvar_checksum(*, json_result: list[dict[str, Any]]) -> str:
+    """
+    Return a checksum over the system variable metadata written by a ReGa script.
+
+    The metadata holds the name, description, type, range, unit and value list of
+    each system variable in backend order, so every change of it changes the checksum.
+    """
+    return hash_sha256(value=[(data[_JsonKey.ID], data[_JsonKey.META]) for data in json_result])
+
+
+def _convert_sysvar_values(*, json_result: list[dict[str, Any]]) -> Mapping[str, str]:
+    """Convert the raw system variable values written by a ReGa script."""
+    return {var[_JsonKey.ID]: unquote(string=var[_JsonKey.VALUE], encoding=ISO_8859_1) for var in json_result}
+
 
 def _determine_ccu_type(*, product: str) -> CCUType:
     """
@@ -2505,7 +3042,7 @@ def _build_sysvar_record(
             min_value = parse_sys_var(data_type=data_type, raw_value=raw_min_value)
     except (ValueError, TypeError) as vterr:
         _LOGGER.error(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.client.json_rpc.get_all_system_variables.parse_failed",
                 exc_type=vterr.__class__.__name__,
                 reason=extract_exc_args(exc=vterr),
@@ -6,7 +6,8 @@ XML-RPC transport proxy with concurrency control and connection awareness.
 Overview
 --------
 XmlRpcProxy extends xmlrpc.client.ServerProxy to:
-- Execute RPC calls in a thread pool to avoid blocking the event loop
+- Execute RPC calls in the RPC lane of the shared executor pool to avoid blocking the event loop
+- Limit the concurrent requests per proxy to max_workers (ServerProxy is not thread-safe)
 - Integrate with CentralConnectionState to mark/report connection issues
 - Optionally use TLS with configurable certificate verification
 - Filter unsupported methods at runtime via system.listMethods
@@ -22,7 +23,6 @@ Notes
 from abc import ABC, abstractmethod
 import asyncio
 from collections.abc import Mapping
-from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from enum import Enum, IntEnum, StrEnum, unique
 import errno
@@ -38,7 +38,7 @@ from aiohomematic.async_support import Looper
 from aiohomematic.central.events import EventBus
 from aiohomematic.client._rpc_errors import RpcContext, map_xmlrpc_fault, sanitize_error_message
 from aiohomematic.client.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
-from aiohomematic.const import ISO_8859_1
+from aiohomematic.const import ISO_8859_1, ExecutorLane, TaskCategory
 from aiohomematic.exceptions import (
     AuthFailure,
     BaseHomematicException,
@@ -48,6 +48,7 @@ from aiohomematic.exceptions import (
     UnsupportedException,
 )
 from aiohomematic.interfaces import IncidentRecorderProtocol
+from aiohomematic.metrics import record_rpc_transfer
 from aiohomematic.property_decorators import DelegatedProperty
 from aiohomematic.store.persistent import SessionRecorder
 from aiohomematic.store.types import IncidentSeverity, IncidentType
@@ -158,6 +159,7 @@ class _TimeoutTransport(xmlrpc.client.Transport):
         """Initialize transport with timeout and optional headers."""
         super().__init__(headers=headers or [])
         self._timeout = timeout
+        self._request_size = 0
 
     def make_connection(  # kwonly: disable
         self, host: tuple[str, dict[str, str]] | str
@@ -168,6 +170,18 @@ class _TimeoutTransport(xmlrpc.client.Transport):
             conn.timeout = self._timeout
         return conn
 
+    def parse_response(self, response: http.client.HTTPResponse) -> tuple[Any, ...]:  # kwonly: disable
+        """Parse the response and attribute the request to the active startup phase."""
+        record_rpc_transfer(
+            bytes_sent=self._request_size, bytes_received=int(response.getheader("Content-Length") or 0)
+        )
+        return super().parse_response(response)
+
+    def send_content(self, connection: http.client.HTTPConnection, request_body: bytes) -> None:  # kwonly: disable
+        """Send the request body and remember its size."""
+        self._request_size = len(request_body)
+        super().send_content(connection, request_body)
+
 
 class _TimeoutSafeTransport(xmlrpc.client.SafeTransport):
     """HTTPS Transport with configurable socket timeout and extra headers."""
@@ -182,6 +196,7 @@ class _TimeoutSafeTransport(xmlrpc.client.SafeTransport):
         """Initialize transport with timeout, optional SSL context, and headers."""
         super().__init__(context=context, headers=headers or [])
         self._timeout = timeout
+        self._request_size = 0
 
     def make_connection(  # kwonly: disable
         self, host: tuple[str, dict[str, str]] | str
@@ -192,10 +207,22 @@ class _TimeoutSafeTransport(xmlrpc.client.SafeTransport):
             conn.timeout = self._timeout
         return conn
 
+    def parse_response(self, response: http.client.HTTPResponse) -> tuple[Any, ...]:  # kwonly: disable
+        """Parse the response and attribute the request to the active startup phase."""
+        record_rpc_transfer(
+            bytes_sent=self._request_size, bytes_received=int(response.getheader("Content-Length") or 0)
+        )
+        return super().parse_response(response)
+
+    def send_content(self, connection: http.client.HTTPConnection, request_body: bytes) -> None:  # kwonly: disable
+        """Send the request body and remember its size."""
+        self._request_size = len(request_body)
+        super().send_content(connection, request_body)
+
 
 # noinspection PyProtectedMember,PyUnresolvedReferences
 class BaseRpcProxy(ABC):
-    """ServerProxy implementation with ThreadPoolExecutor when request is executing."""
+    """ServerProxy implementation executing requests in the RPC lane of the shared executor pool."""
 
     def __init__(
         self,
@@ -217,9 +244,7 @@ class BaseRpcProxy(ABC):
         self._session_recorder: Final = session_recorder
         self._magic_method: Final = magic_method
         self._looper: Final = Looper()
-        self._proxy_executor: Final = (
-            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=interface_id) if max_workers > 0 else None
-        )
+        self._request_semaphore: Final = asyncio.Semaphore(max_workers) if max_workers > 0 else None
         self._tls: Final[bool | SSLContext] = get_tls_context(verify_tls=verify_tls) if tls else False
         self._supported_methods: tuple[str, ...] = ()
         self._kwargs: dict[str, Any] = {}
@@ -266,13 +291,18 @@ class BaseRpcProxy(ABC):
     async def stop(self) -> None:
         """Stop depending services."""
         await self._looper.block_till_done()
-        if self._proxy_executor:
-            self._proxy_executor.shutdown()
 
     @abstractmethod
     async def _async_request(self, *args, **kwargs):  # type: ignore[no-untyped-def]
         """Call method on server side."""
 
+    async def _execute_request(self, *, target: CallableAny, args: tuple[Any, ...]) -> Any:
+        """Run a blocking request in the RPC lane, at most max_workers at a time for this proxy."""
+        if self._request_semaphore is None:
+            return await self._looper.async_add_executor_job(target, *args, name="xmp_rpc_proxy", lane=ExecutorLane.RPC)
+        async with self._request_semaphore:
+            return await self._looper.async_add_executor_job(target, *args, name="xmp_rpc_proxy", lane=ExecutorLane.RPC)
+
     def _record_rpc_error_incident(
         self,
         *,
@@ -332,6 +362,7 @@ class BaseRpcProxy(ABC):
         self._looper.create_task(
             target=_record(),
             name=f"record_rpc_error_incident_{self._interface_id}",
+            category=TaskCategory.INCIDENT,
         )
 
     def _record_session(
@@ -348,7 +379,7 @@ class BaseRpcProxy(ABC):
 
 # noinspection PyProtectedMember,PyUnresolvedReferences
 class AioXmlRpcProxy(BaseRpcProxy, xmlrpc.client.ServerProxy):
-    """ServerProxy implementation with ThreadPoolExecutor when request is executing."""
+    """ServerProxy implementation executing requests in the RPC lane of the shared executor pool."""
 
     def __init__(
         self,
@@ -369,7 +400,7 @@ class AioXmlRpcProxy(BaseRpcProxy, xmlrpc.client.ServerProxy):
         Initialize new proxy for server and get local ip.
 
         Args:
-            max_workers: Number of worker threads.
+            max_workers: Maximum number of concurrent requests (0 = unlimited).
             interface_id: Interface identifier.
             connection_state: Connection state tracker.
             uri: XML-RPC server URI.
@@ -444,13 +475,10 @@ class AioXmlRpcProxy(BaseRpcProxy, xmlrpc.client.ServerProxy):
                 args = _cleanup_args(*args)
                 _LOGGER.debug("XmlRPC.__ASYNC_REQUEST: %s", args)
                 result = await asyncio.shield(
-                    self._looper.async_add_executor_job(
+                    self._execute_request(
                         # pylint: disable=protected-access
-                        parent._ServerProxy__request,  # type: ignore[attr-defined]
-                        self,
-                        *args,
-                        name="xmp_rpc_proxy",
-                        executor=self._proxy_executor,
+                        target=parent._ServerProxy__request,  # type: ignore[attr-defined]
+                        args=(self, *args),
                     )
                 )
                 self._record_session(method=method, params=args[1], response=result)
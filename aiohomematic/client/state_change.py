@@ -14,7 +14,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, Final
 
-from aiohomematic.central.events import DataPointStateChangedEvent
+from aiohomematic.central.events import DataPointsRefreshedEvent, DataPointStateChangedEvent
 from aiohomematic.const import DP_KEY_VALUE, ParamsetKey
 from aiohomematic.decorators import measure_execution_time
 
@@ -56,8 +56,10 @@ async def _track_single_data_point_state_change_or_timeout(
     """
     Wait for a single data point to receive its confirmation callback.
 
-    Subscribes to the data point's update events and waits until the received
-    value matches the sent value (using fuzzy float comparison) or times out.
+    Subscribes to the data point's update and refresh events and waits until
+    the received value matches the sent value (using fuzzy float comparison)
+    or times out. A refresh covers a device that answers with the value it
+    already had.
     """
     ev = asyncio.Event()
     dpk, value = dpk_value
@@ -77,6 +79,10 @@ async def _track_single_data_point_state_change_or_timeout(
                 )
                 ev.set()
 
+    def _async_event_refreshed(*, event: DataPointsRefreshedEvent) -> None:
+        if dp and dp.unique_id in event.unique_ids:
+            _async_event_changed()
+
     if dp := device.get_generic_data_point(
         channel_address=dpk.channel_address,
         parameter=dpk.parameter,
@@ -88,11 +94,17 @@ async def _track_single_data_point_state_change_or_timeout(
                 dpk,
             )
             return
-        unreg = device.event_bus_provider.event_bus.subscribe(
+        event_bus = device.event_bus_provider.event_bus
+        unreg_changed = event_bus.subscribe(
             event_type=DataPointStateChangedEvent,
             event_key=dp.unique_id,
             handler=_async_event_changed,
         )
+        unreg_refreshed = event_bus.subscribe(
+            event_type=DataPointsRefreshedEvent,
+            event_key=None,
+            handler=_async_event_refreshed,
+        )
 
         try:
             async with asyncio.timeout(wait_for_callback):
@@ -104,7 +116,8 @@ async def _track_single_data_point_state_change_or_timeout(
                 dp.value,
             )
         finally:
-            unreg()
+            unreg_changed()
+            unreg_refreshed()
 
 
 def _isclose(*, value1: Any, value2: Any) -> bool:
@@ -34,6 +34,7 @@ DEFAULT_ENABLE_SYSVAR_SCAN: Final = True
 DEFAULT_IGNORE_CUSTOM_DEVICE_DEFINITION_MODELS: Final[frozenset[str]] = frozenset()
 DEFAULT_INCLUDE_INTERNAL_PROGRAMS: Final = False
 DEFAULT_INCLUDE_INTERNAL_SYSVARS: Final = True
+DEFAULT_JSON_RPC_COMPRESSION: Final = True
 DEFAULT_LOCALE: Final = "en"
 DEFAULT_MAX_READ_WORKERS: Final = 1
 DEFAULT_MAX_WORKERS: Final = 1
@@ -119,6 +120,26 @@ class TimeoutConfig(BaseModel):
     probability of packet loss during bulk operations.
     """
 
+    command_throttle_adaptive: bool = False
+    """Use the duty-cycle-aware token bucket instead of the fixed interval (default: False).
+
+    In adaptive mode, commands are granted from a token bucket of
+    ``command_throttle_bucket_size`` tokens, so short bursts such as scenes are sent
+    without delay. The bucket refills at one token per ``command_throttle_interval``
+    (or 0.2s if no interval is set). The refill rate is reduced as the reported
+    DUTY_CYCLE_LEVEL / CARRIER_SENSE_LEVEL approaches ``command_throttle_duty_cycle_target``,
+    and sending pauses after an INSUFFICIENT_DUTYCYCLE or TRANSMISSION_PENDING fault.
+    """
+
+    command_throttle_bucket_size: int = 10
+    """Number of commands the adaptive throttle sends without delay (default: 10)."""
+
+    command_throttle_duty_cycle_target: float = 80.0
+    """Duty cycle / carrier sense level in percent the adaptive throttle keeps below (default: 80.0).
+
+    The refill rate starts to drop at half of this level and reaches its minimum at the target.
+    """
+
     burst_threshold: int = 5
     """Number of commands within burst_window that triggers burst detection (default: 5).
 
@@ -278,15 +299,21 @@ DUMMY_SERIAL: Final = "SN0815"
 FILE_DEVICES: Final = "homematic_devices"
 FILE_INCIDENTS: Final = "homematic_incidents"
 FILE_PARAMSETS: Final = "homematic_paramsets"
+FILE_SCHEDULES: Final = "homematic_schedules"
 FILE_SESSION_RECORDER: Final = "homematic_session_recorder"
+FILE_STARTUP_TRACE: Final = "homematic_startup_trace"
 FILE_NAME_TS_PATTERN: Final = "%Y%m%d_%H%M%S"
 INCIDENT_STORE_MAX_PER_TYPE: Final = 50
 SUB_DIRECTORY_CACHE: Final = "cache"
 SUB_DIRECTORY_SESSION: Final = "session"
+SUB_DIRECTORY_TRACE: Final = "trace"
 HUB_PATH: Final = "hub"
 IDENTIFIER_SEPARATOR: Final = "@"
 INIT_DATETIME: Final = datetime.strptime("01.01.1970 00:00:00", DATETIME_FORMAT)
 IP_ANY_V4: Final = "0.0.0.0"  # noqa: S104  # nosec B104 - XML-RPC callback server must accept connections from CCU on any interface
+# Idle time after which a JSON-RPC keep-alive connection is closed. Kept below the 5 s
+# idle timeout of the lighttpd on the CCU, so that no connection closed by the CCU is reused.
+JSON_RPC_KEEPALIVE_TIMEOUT: Final = 4.0
 JSON_SESSION_AGE: Final = 90
 
 # Login rate limiting constants
@@ -306,10 +333,14 @@ COMMAND_TRACKER_WARNING_THRESHOLD: Final = 400  # Log warning when approaching l
 PING_PONG_CACHE_MAX_SIZE: Final = 100  # Maximum entries in ping/pong cache per interface
 LOCAL_HOST: Final = "127.0.0.1"
 MAX_CACHE_AGE: Final = 10
+MAX_CONCURRENT_DEVICE_INITS: Final = 8  # Devices finalized in parallel per interface during creation
+MAX_CONCURRENT_DEVICE_REFRESHES: Final = 8  # Devices re-read in parallel per interface after a recovery
 MAX_CONCURRENT_HTTP_SESSIONS: Final = 3
 MAX_RPC_BACKGROUND_TASKS: Final = 10000
+TASK_DROP_WARN_INTERVAL: Final = 60  # Minimum seconds between warnings about dropped events or callbacks
 MAX_WAIT_FOR_CALLBACK: Final = 60
 NO_CACHE_ENTRY: Final = "NO_CACHE_ENTRY"
+RESYNC_MAX_STALE_RATIO: Final = 0.5  # Above this share of stale channels a resync does a full refresh
 DEVICE_DESCRIPTIONS_ZIP_DIR: Final = "device_descriptions"
 PARAMSET_DESCRIPTIONS_ZIP_DIR: Final = "paramset_descriptions"
 PATH_JSON_RPC: Final = "/api/homematic.cgi"
@@ -819,6 +850,25 @@ class RecoveryStage(StrEnum):
         return names.get(self.value, "Unknown")
 
 
+@unique
+class RecoveryReloadStep(StrEnum):
+    """
+    Steps of the data reload after a successful reconnect.
+
+    The DATA_LOADING stage runs the device data fetch and the hub data refresh
+    in parallel. The channel re-read starts once the device data is available.
+    """
+
+    DEVICE_DATA = "device_data"
+    """Bulk fetch of all device values of the interface."""
+
+    CHANNEL_DATA = "channel_data"
+    """Re-read of the data points not refreshed during the recovery window."""
+
+    HUB_DATA = "hub_data"
+    """Refresh of system update, programs and system variables."""
+
+
 @unique
 class RecoveryResult(StrEnum):
     """Result of a recovery attempt."""
@@ -839,6 +889,17 @@ class RecoveryResult(StrEnum):
     """Recovery was cancelled (e.g., during shutdown)."""
 
 
+@unique
+class ResyncPriority(IntEnum):
+    """Order in which stale channels are re-read after an event gap."""
+
+    ACTUATOR = 0
+    """Channels that can be switched or set (custom or writable data points)."""
+
+    SENSOR = 1
+    """Channels that only report values."""
+
+
 @unique
 class CommandRxMode(StrEnum):
     """Enum for Homematic rx modes for commands."""
@@ -1320,6 +1381,7 @@ class Parameter(StrEnum):
     BOOST_MODE = "BOOST_MODE"
     BURST_LIMIT_WARNING = "BURST_LIMIT_WARNING"
     BUTTON_LOCK = "BUTTON_LOCK"
+    CARRIER_SENSE_LEVEL = "CARRIER_SENSE_LEVEL"
     CHANNEL_COLOR = "CHANNEL_COLOR"
     CHANNEL_LOCK = "CHANNEL_LOCK"
     CHANNEL_OPERATION_MODE = "CHANNEL_OPERATION_MODE"
@@ -1350,6 +1412,7 @@ class Parameter(StrEnum):
     DURATION_VALUE = "DURATION_VALUE"
     DUTYCYCLE = "DUTYCYCLE"
     DUTY_CYCLE = "DUTY_CYCLE"
+    DUTY_CYCLE_LEVEL = "DUTY_CYCLE_LEVEL"
     EFFECT = "EFFECT"
     ENERGY_COUNTER = "ENERGY_COUNTER"
     ENERGY_COUNTER_FEED_IN = "ENERGY_COUNTER_FEED_IN"
@@ -1505,11 +1568,13 @@ class RegaScript(StrEnum):
     FETCH_ALL_DEVICE_DATA = "fetch_all_device_data.fn"
     GET_ALARM_MESSAGES = "get_alarm_messages.fn"
     GET_BACKEND_INFO = "get_backend_info.fn"
+    GET_HUB_SNAPSHOT = "get_hub_snapshot.fn"
     GET_INBOX_DEVICES = "get_inbox_devices.fn"
     GET_PROGRAM_DESCRIPTIONS = "get_program_descriptions.fn"
     GET_SERIAL = "get_serial.fn"
     GET_SERVICE_MESSAGES = "get_service_messages.fn"
     GET_SYSTEM_UPDATE_INFO = "get_system_update_info.fn"
+    GET_SYSTEM_VARIABLE_CHANGES = "get_system_variable_changes.fn"
     GET_SYSTEM_VARIABLE_DESCRIPTIONS = "get_system_variable_descriptions.fn"
     SET_PROGRAM_STATE = "set_program_state.fn"
     SET_SYSTEM_VARIABLE = "set_system_variable.fn"
@@ -1687,6 +1752,70 @@ class CircuitState(StrEnum):
     """Test mode - one request is allowed to test recovery."""
 
 
+@unique
+class ExecutorLane(StrEnum):
+    """Lanes of the shared executor pool for blocking work."""
+
+    CPU = "cpu"
+    """CPU bound work like parsing archives or writing exports."""
+
+    RPC = "rpc"
+    """Blocking XML-RPC requests to the backend."""
+
+    STORAGE = "storage"
+    """File system access of the persistent stores."""
+
+
+@unique
+class TaskBudgetPolicy(StrEnum):
+    """What the Looper does with a new task of a category that is at its budget."""
+
+    AWAIT = "await"
+    """Queue the task and start it once a running task of the category finished."""
+
+    COALESCE = "coalesce"
+    """Queue the task; it replaces a queued task of the same name (latest wins)."""
+
+    DROP = "drop"
+    """Drop the task."""
+
+
+@unique
+class TaskCategory(StrEnum):
+    """Categories of background tasks scheduled by the Looper."""
+
+    CLEANUP = "cleanup"
+    """Cleanup after device removal."""
+
+    DEFAULT = "default"
+    """Tasks without a category (not budgeted by default)."""
+
+    EVENT = "event"
+    """Publications to the EventBus."""
+
+    INCIDENT = "incident"
+    """Recording of incidents for diagnostics."""
+
+    PERSISTENCE = "persistence"
+    """Delayed saves of the persistent stores."""
+
+    RPC_CALLBACK = "rpc_callback"
+    """Callbacks of the backend (system and value events)."""
+
+
+class TaskBudget(NamedTuple):
+    """Budget of a category of Looper background tasks."""
+
+    limit: int
+    """Maximum number of running tasks of the category."""
+
+    policy: TaskBudgetPolicy
+    """What happens to a new task while the limit is reached."""
+
+    max_queued: int | None = None
+    """Maximum number of waiting tasks (None = unbounded); further tasks are dropped."""
+
+
 @unique
 class RpcServerType(StrEnum):
     """Enum for Homematic rpc server types."""
@@ -1886,6 +2015,31 @@ DEFAULT_INTERFACES_REQUIRING_PERIODIC_REFRESH: Final[frozenset[Interface]] = fro
     INTERFACES_REQUIRING_JSON_RPC_CLIENT - INTERFACES_REQUIRING_XML_RPC
 )
 
+# Worker threads per lane of the process-wide executor pool. The lanes are shared by all
+# interfaces and centrals of the process, so slow storage writes cannot starve RPC calls.
+DEFAULT_EXECUTOR_LANE_SIZES: Final[Mapping[ExecutorLane, int]] = MappingProxyType(
+    {
+        ExecutorLane.CPU: 2,
+        ExecutorLane.RPC: 8,
+        ExecutorLane.STORAGE: 2,
+    }
+)
+
+# Budgets per category of Looper background tasks. A reconnect storm schedules thousands of
+# event publications and callbacks at once; the budgets bound the number of running tasks and
+# the number of tasks waiting for a slot. Categories without budget are not limited.
+DEFAULT_TASK_BUDGETS: Final[Mapping[TaskCategory, TaskBudget]] = MappingProxyType(
+    {
+        TaskCategory.CLEANUP: TaskBudget(limit=100, policy=TaskBudgetPolicy.AWAIT),
+        TaskCategory.EVENT: TaskBudget(limit=1000, policy=TaskBudgetPolicy.AWAIT, max_queued=20000),
+        TaskCategory.INCIDENT: TaskBudget(limit=50, policy=TaskBudgetPolicy.DROP),
+        TaskCategory.PERSISTENCE: TaskBudget(limit=20, policy=TaskBudgetPolicy.COALESCE),
+        TaskCategory.RPC_CALLBACK: TaskBudget(
+            limit=1000, policy=TaskBudgetPolicy.AWAIT, max_queued=MAX_RPC_BACKGROUND_TASKS
+        ),
+    }
+)
+
 # Interfaces for which the per-parameter getValue fallback during init is skipped.
 # For these interfaces a getValue on init cannot return trustworthy device-fresh data,
 # so the bulk fetch (ReGa / JSON get_all_device_data) plus later events are the only
@@ -2132,6 +2286,22 @@ class SystemVariableData(HubData):
     values: tuple[str, ...] | None = None
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SystemVariableChangesData:
+    """
+    Dataclass for the system variable values changed since the last poll.
+
+    The checksum covers the ids and metadata (name, description, type, range, unit and
+    value list) of all system variables. The backend only sends the metadata when the ids
+    or timestamps changed. As long as the checksum is unchanged, applying the raw values
+    is sufficient and no full fetch is required.
+    """
+
+    checksum: str
+    timestamp: int
+    values: Mapping[str, str] = field(default_factory=dict)
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class InstallModeData:
     """Dataclass for install mode data points."""
@@ -2233,6 +2403,18 @@ class SystemUpdateData:
     check_script_available: bool = False
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class HubSnapshotData:
+    """Dataclass for the hub data of one scan interval, read with a single script run."""
+
+    alarm_messages: tuple[AlarmMessageData, ...] = ()
+    inbox_devices: tuple[InboxDeviceData, ...] = ()
+    programs: tuple[ProgramData, ...] | None = None
+    service_messages: tuple[ServiceMessageData, ...] = ()
+    system_variable_changes: SystemVariableChangesData | None = None
+    system_variables: tuple[SystemVariableData, ...] | None = None
+
+
 @unique
 class BackupStatus(StrEnum):
     """Enum with backup status values."""
@@ -11,9 +11,12 @@ The data is shipped by the
 (``openccu_data/data/easymode_extract.json.gz``) and accessed here via
 ``importlib.resources``.
 
-All public functions are pure dict lookups after first access (no I/O),
-making them safe to call from the asyncio event loop. Thread safety is
-ensured via double-checked locking during lazy initialization.
+The archive is loaded on first use rather than at import time, because
+parsing it dominates the import cost of the whole package. Callers that run
+inside the asyncio event loop should call ``load_easymode_data()`` in an
+executor beforehand (``CentralUnit.start()`` does this), after which all public
+functions are pure dict lookups (no I/O). Thread safety is ensured via
+double-checked locking during lazy initialization.
 
 Public API of this module is defined by __all__.
 """
@@ -42,6 +45,7 @@ __all__ = [
     "get_cross_validation_rules",
     "get_option_preset",
     "get_option_presets",
+    "load_easymode_data",
 ]
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -350,14 +354,6 @@ class _EasymodeStore:
 # Module-level singleton
 _store: Final = _EasymodeStore()
 
-# Eager initialization at import time to avoid any later I/O on first use.
-# The first public access can happen inside the asyncio event loop (e.g. Home
-# Assistant's ``ws_get_form_schema``); loading the archive here keeps the
-# blocking file read off the loop. Imports run during integration setup, not
-# inside a running coroutine.
-with contextlib.suppress(Exception):
-    _store.ensure_loaded()
-
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -382,3 +378,16 @@ def get_option_preset(*, preset_type: str) -> OptionPresetDef | None:
 def get_cross_validation_rules() -> list[CrossValidationRule]:
     """Return all cross-parameter validation rules."""
     return _store.get_cross_validation_rules()
+
+
+def load_easymode_data() -> None:
+    """
+    Load the easymode archive if not yet loaded.
+
+    Performs blocking file I/O on the first call. The first public access can
+    happen inside the asyncio event loop (e.g. Home Assistant's
+    ``ws_get_form_schema``), so event-loop callers run this in an executor
+    before any lookup. Subsequent calls return immediately.
+    """
+    with contextlib.suppress(Exception):
+        _store.ensure_loaded()
@@ -8,6 +8,9 @@ Thread-safe implementation using immutable state snapshots for free-threading co
 Usage:
 - Call set_locale("de") early (CentralUnit will do this from CentralConfig).
 - Use tr("key", name="value") to render localized strings with Python str.format.
+- Use lazy_tr("key", name="value") for log messages. The message is translated
+  and formatted only when a handler emits the record, so disabled log levels
+  cost no lookup or formatting (checked by script/lint_lazy_log_i18n.py).
 
 Lookup order:
 1) translations/<locale>.json
@@ -198,6 +201,35 @@ def tr(*, key: str, **kwargs: Any) -> str:
         return template
 
 
+class LazyTranslation:
+    """
+    Translation rendered on str(), e.g. by logging when a record is emitted.
+
+    Created by lazy_tr. Logging stores the object as the record message and
+    calls str() on it only if a handler formats the record.
+    """
+
+    __slots__ = ("_key", "_kwargs")
+
+    def __init__(self, *, key: str, kwargs: dict[str, Any]) -> None:
+        """Initialize the lazy translation."""
+        self._key: Final = key
+        self._kwargs: Final = kwargs
+
+    def __repr__(self) -> str:
+        """Return the representation of the lazy translation."""
+        return f"{type(self).__name__}(key={self._key!r})"
+
+    def __str__(self) -> str:
+        """Return the translated and formatted message."""
+        return tr(key=self._key, **self._kwargs)
+
+
+def lazy_tr(*, key: str, **kwargs: Any) -> LazyTranslation:
+    """Return a translation of key that is only looked up and formatted when converted to str."""
+    return LazyTranslation(key=key, kwargs=kwargs)
+
+
 async def preload_locale(*, locale: str) -> None:
     """
     Asynchronously preload and cache a locale catalog.
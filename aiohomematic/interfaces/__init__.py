@@ -232,12 +232,14 @@ from aiohomematic.interfaces.operations import (
     IncidentRecorderProtocol,
     ParameterVisibilityProviderProtocol,
     ParamsetDescriptionProviderProtocol,
+    ScheduleCacheProtocol,
     TaskSchedulerProtocol,
 )
 
 __all__ = [
     # Cache protocols
     "CacheWithStatisticsProtocol",
+    "ScheduleCacheProtocol",
     # Cache providers
     "DataCacheProviderProtocol",
     "DeviceDescriptionProviderProtocol",
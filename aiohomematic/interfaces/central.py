@@ -10,6 +10,7 @@ to the full CentralUnit implementation.
 
 from abc import abstractmethod
 from collections.abc import Mapping
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol, Unpack, runtime_checkable
 
 from aiohttp import ClientSession
@@ -20,10 +21,12 @@ from aiohomematic.const import (
     ClientState,
     DataPointCategory,
     DataPointType,
+    DataRefreshType,
     DescriptionMarker,
     DeviceFirmwareState,
     DeviceTriggerEventType,
     EventData,
+    ExecutorLane,
     FailureReason,
     Interface,
     Operations,
@@ -33,6 +36,8 @@ from aiohomematic.const import (
     ScheduleTimerConfig,
     SystemEventType,
     SystemInformation,
+    TaskBudget,
+    TaskCategory,
     TimeoutConfig,
 )
 from aiohomematic.metrics._protocols import DeviceProviderForMetricsProtocol, HubDataPointManagerForMetricsProtocol
@@ -52,6 +57,7 @@ if TYPE_CHECKING:
     )
     from aiohomematic.central.coordinators.link import DeviceLink, LinkableChannel
     from aiohomematic.central.events import EventBus
+    from aiohomematic.central.resync import ResyncPlan
     from aiohomematic.client import InterfaceConfig
     from aiohomematic.interfaces import (
         CallbackDataPointProtocol,
@@ -140,6 +146,11 @@ class CentralConfigProtocol(Protocol):
     def enabled_interface_configs(self) -> frozenset[InterfaceConfig]:
         """Return the enabled interface configurations."""
 
+    @property
+    @abstractmethod
+    def executor_lane_sizes(self) -> Mapping[ExecutorLane, int]:
+        """Return the number of worker threads per lane of the shared executor pool."""
+
     @property
     @abstractmethod
     def host(self) -> str:
@@ -160,6 +171,11 @@ class CentralConfigProtocol(Protocol):
     def json_port(self) -> int | None:
         """Return the JSON-RPC port."""
 
+    @property
+    @abstractmethod
+    def json_rpc_compression(self) -> bool:
+        """Return whether compressed JSON-RPC responses are requested."""
+
     @property
     @abstractmethod
     def listen_ip_addr(self) -> str | None:
@@ -240,6 +256,11 @@ class CentralConfigProtocol(Protocol):
     def sysvar_markers(self) -> tuple[DescriptionMarker | str, ...]:
         """Return the system variable markers for filtering."""
 
+    @property
+    @abstractmethod
+    def task_budgets(self) -> Mapping[TaskCategory, TaskBudget]:
+        """Return the budget per category of Looper background tasks."""
+
     @property
     @abstractmethod
     def timeout_config(self) -> TimeoutConfig:
@@ -575,10 +596,26 @@ class DeviceDataRefresherProtocol(Protocol):
     Implemented by CentralUnit.
     """
 
+    @abstractmethod
+    async def execute_resync(self, *, plan: ResyncPlan) -> int:
+        """Re-read the stale channels of a resync plan."""
+
     @abstractmethod
     async def load_and_refresh_data_point_data(self, *, interface: Interface) -> None:
         """Load and refresh data point data for an interface."""
 
+    @abstractmethod
+    async def load_device_data(self, *, interface: Interface) -> None:
+        """Fetch all device values of an interface, regardless of the cache age."""
+
+    @abstractmethod
+    def plan_resync(self, *, interface_id: str, gap_started_at: datetime) -> ResyncPlan:
+        """Plan the resync of the channels of an interface after an event gap."""
+
+    @abstractmethod
+    async def refresh_stale_data_point_data(self, *, interface: Interface, refreshed_before: datetime) -> int:
+        """Re-read the data points of an interface not refreshed since refreshed_before."""
+
 
 @runtime_checkable
 class DataCacheProviderProtocol(Protocol):
@@ -616,6 +653,10 @@ class HubDataFetcherProtocol(Protocol):
     def fetch_connectivity_data(self, *, scheduled: bool) -> None:
         """Refresh connectivity binary sensors with current values."""
 
+    @abstractmethod
+    async def fetch_hub_data(self, *, scheduled: bool) -> frozenset[DataRefreshType] | None:
+        """Fetch programs, sysvars, inbox, service and alarm messages with one hub snapshot."""
+
     @abstractmethod
     async def fetch_inbox_data(self, *, scheduled: bool) -> None:
         """Fetch inbox data from the backend."""
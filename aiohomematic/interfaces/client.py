@@ -45,6 +45,7 @@ from aiohomematic.const import (
     DataPointKey,
     DeviceDescription,
     FailureReason,
+    HubSnapshotData,
     InboxDeviceData,
     Interface,
     ParameterData,
@@ -53,6 +54,7 @@ from aiohomematic.const import (
     ProgramData,
     ProxyInitState,
     SystemInformation,
+    SystemVariableChangesData,
 )
 
 if TYPE_CHECKING:
@@ -68,6 +70,7 @@ if TYPE_CHECKING:
     from aiohomematic.client.backends.capabilities import BackendCapabilities
     from aiohomematic.interfaces.central import CentralConfigProtocol, DeviceQueryFacadeProtocol
     from aiohomematic.interfaces.model import DeviceProtocol
+    from aiohomematic.metrics.stats import ThrottleStats
     from aiohomematic.store.persistent import SessionRecorder
 
 
@@ -544,6 +547,16 @@ class ClientProtocol(
     async def get_all_system_variables(self, *, markers: tuple[Any, ...]) -> tuple[Any, ...] | None:
         """Get all system variables from the backend."""
 
+    async def get_hub_snapshot(
+        self,
+        *,
+        program_markers: tuple[Any, ...] | None,
+        sysvar_markers: tuple[Any, ...] | None,
+        sysvar_since: int = 0,
+        sysvar_checksum: str | None = None,
+    ) -> HubSnapshotData | None:
+        """Get programs, system variables, inbox, service and alarm messages in one backend run."""
+
     async def get_link_info(
         self, *, interface: Interface, sender_address: str, receiver_address: str
     ) -> dict[str, Any]:
@@ -561,6 +574,9 @@ class ClientProtocol(
     async def get_system_variable(self, *, name: str) -> Any:
         """Get single system variable from the backend."""
 
+    async def get_system_variable_changes(self, *, since: int) -> SystemVariableChangesData | None:
+        """Get the system variable values changed since the given backend timestamp."""
+
     def get_virtual_remote(self) -> DeviceProtocol | None:
         """Get the virtual remote for the Client."""
 
@@ -776,6 +792,24 @@ class ParamsetDescriptionWriterProtocol(Protocol):
 
         """
 
+    @abstractmethod
+    def add_device_paramsets(
+        self,
+        *,
+        interface_id: str,
+        paramset_descriptions: Mapping[str, Mapping[ParamsetKey, dict[str, Any]]],
+        device_type: str,
+    ) -> None:
+        """
+        Add all paramset descriptions of a device at once.
+
+        Args:
+            interface_id: Interface identifier.
+            paramset_descriptions: Paramset descriptions by channel address and paramset key.
+            device_type: Device TYPE for patch matching.
+
+        """
+
 
 @runtime_checkable
 class DeviceDetailsWriterProtocol(Protocol):
@@ -857,6 +891,14 @@ class SessionRecorderProviderProtocol(Protocol):
 class CommandThrottleProtocol(Protocol):
     """Protocol for command throttle operations."""
 
+    @property
+    def adaptive(self) -> bool:
+        """Return True if the duty-cycle-aware token bucket is used."""
+
+    @property
+    def backoff_remaining(self) -> float:
+        """Return seconds until commands are sent again after a backend fault."""
+
     @property
     def burst_count(self) -> int:
         """Return number of burst downgrades."""
@@ -869,10 +911,26 @@ class CommandThrottleProtocol(Protocol):
     def burst_window(self) -> float:
         """Return configured burst window in seconds."""
 
+    @property
+    def carrier_sense_level(self) -> float | None:
+        """Return the highest reported carrier sense level in percent."""
+
+    @property
+    def coalesced_count(self) -> int:
+        """Return number of queued commands replaced by a newer command for the same data point."""
+
     @property
     def critical_count(self) -> int:
         """Return number of critical commands that bypassed throttle."""
 
+    @property
+    def duty_cycle_faults(self) -> int:
+        """Return number of INSUFFICIENT_DUTYCYCLE faults."""
+
+    @property
+    def duty_cycle_level(self) -> float | None:
+        """Return the highest reported duty cycle level in percent."""
+
     @property
     def interface_id(self) -> str:
         """Return interface identifier."""
@@ -893,10 +951,22 @@ class CommandThrottleProtocol(Protocol):
     def queue_size(self) -> int:
         """Return current queue size."""
 
+    @property
+    def send_rate(self) -> float:
+        """Return the currently allowed commands per second (0.0 = unthrottled)."""
+
+    @property
+    def stats(self) -> ThrottleStats:
+        """Return a snapshot of the throttle state."""
+
     @property
     def throttled_count(self) -> int:
         """Return number of throttled commands."""
 
+    @property
+    def transmission_pending_faults(self) -> int:
+        """Return number of TRANSMISSION_PENDING faults."""
+
     @abstractmethod
     async def acquire(
         self,
@@ -904,13 +974,26 @@ class CommandThrottleProtocol(Protocol):
         priority: CommandPriority = ...,
         device_address: str = "",
         purge_addresses: frozenset[str] = ...,
+        dpk: DataPointKey | None = None,
     ) -> None:
         """Acquire permission to send device command with priority."""
 
+    @abstractmethod
+    def report_fault(self, *, fault_code: int) -> None:
+        """Feed a backend fault of a sent command back into the throttle."""
+
+    @abstractmethod
+    def report_success(self) -> None:
+        """Restore part of the send rate after a command was accepted by the backend."""
+
     @abstractmethod
     def stop(self) -> None:
         """Stop background worker and reject pending commands."""
 
+    @abstractmethod
+    def update_radio_load(self, *, source: str, parameter: str, value: Any) -> None:
+        """Update the radio load reported by an access point of this interface."""
+
 
 @runtime_checkable
 class CommandTrackerProtocol(Protocol):
@@ -37,6 +37,7 @@ from aiohomematic.const import (
     DataPointKey,
     DataPointType,
     DataPointUsage,
+    DataRefreshType,
     DeviceFirmwareState,
     DeviceTriggerEventType,
     EventData,
@@ -62,6 +63,7 @@ from aiohomematic.interfaces.operations import (
     DeviceDetailsProviderProtocol,
     ParameterVisibilityProviderProtocol,
     ParamsetDescriptionProviderProtocol,
+    ScheduleCacheProtocol,
     TaskSchedulerProtocol,
 )
 from aiohomematic.type_aliases import FirmwareUpdateHandler
@@ -84,7 +86,7 @@ if TYPE_CHECKING:
     from aiohomematic.model.custom.mixins import StateChangeArgs
     from aiohomematic.model.custom.profile import RebasedChannelGroupConfig
     from aiohomematic.model.data_point import CallParameterCollector
-    from aiohomematic.model.schedule_models import TargetChannelInfo
+    from aiohomematic.model.schedule_models import ClimateWeekdaySchedule, TargetChannelInfo
     from aiohomematic.model.support import DataPointNameData
     from aiohomematic.type_aliases import UnsubscribeCallback
 
@@ -218,6 +220,10 @@ class CallbackDataPointProtocol(Protocol):
     def cleanup_subscriptions(self) -> None:
         """Clean up all EventBus subscriptions for this data point."""
 
+    @abstractmethod
+    def publish_data_point_refreshed_event(self) -> None:
+        """Publish a data point refreshed signal for an unchanged value."""
+
     @abstractmethod
     def publish_data_point_updated_event(
         self,
@@ -697,7 +703,7 @@ class BaseParameterDataPointProtocol[ParameterT](BaseDataPointProtocol, Protocol
 
     @property
     @abstractmethod
-    def value_translations(self) -> dict[str, str | None] | None:
+    def value_translations(self) -> Mapping[str, str | None] | None:
         """Return translated names for all enum values."""
 
     @property
@@ -735,7 +741,9 @@ class BaseParameterDataPointProtocol[ParameterT](BaseDataPointProtocol, Protocol
         """Update the unconfirmed value of the data point."""
 
     @abstractmethod
-    def write_value(self, *, value: Any, write_at: datetime) -> tuple[ParameterT, ParameterT]:
+    def write_value(
+        self, *, value: Any, write_at: datetime, confirms_write: bool = False
+    ) -> tuple[ParameterT, ParameterT]:
         """Update value of the data point."""
 
 
@@ -1901,6 +1909,11 @@ class DeviceProtocol(
     def rx_modes(self) -> tuple[RxMode, ...]:
         """Return the rx modes."""
 
+    @property
+    @abstractmethod
+    def schedule_cache(self) -> ScheduleCacheProtocol | None:
+        """Return the persistent week profile schedule cache."""
+
     @property
     @abstractmethod
     def task_scheduler(self) -> TaskSchedulerProtocol:
@@ -2037,6 +2050,10 @@ class HubProtocol(Protocol):
     async def fetch_alarm_messages_data(self, *, scheduled: bool) -> None:
         """Fetch alarm messages data for the hub."""
 
+    @abstractmethod
+    async def fetch_hub_data(self, *, scheduled: bool) -> frozenset[DataRefreshType] | None:
+        """Fetch programs, sysvars, inbox, service and alarm messages with one hub snapshot."""
+
     @abstractmethod
     async def fetch_inbox_data(self, *, scheduled: bool) -> None:
         """Fetch inbox data for the hub."""
@@ -2266,6 +2283,15 @@ class ClimateWeekProfileDataPointProtocol(WeekProfileDataPointProtocol, Protocol
     ) -> None:
         """Write a single weekday to CCU."""
 
+    @abstractmethod
+    async def set_schedule_weekdays(
+        self,
+        *,
+        profile: ScheduleProfile,
+        weekdays_data: Mapping[WeekdayStr, ScheduleDict | ClimateWeekdaySchedule],
+    ) -> None:
+        """Write several weekdays of a profile to CCU with a single write."""
+
 
 @runtime_checkable
 class WeekProfileProtocol[SCHEDULE_DICT_T](Protocol):
@@ -2303,8 +2329,13 @@ class WeekProfileProtocol[SCHEDULE_DICT_T](Protocol):
         """Return the schedule dictionary."""
 
     @abstractmethod
-    async def reload_and_cache_schedule(self, *, force: bool = False) -> None:
-        """Reload schedule entries and update cache."""
+    async def reload_and_cache_schedule(self, *, force: bool = False, from_device: bool = False) -> None:
+        """
+        Reload schedule entries and update cache.
+
+        force reloads even if the device does not report schedule support.
+        from_device reads the MASTER paramset instead of the persisted schedule.
+        """
 
     @abstractmethod
     async def set_schedule(self, *, schedule_data: SCHEDULE_DICT_T) -> None:
@@ -10,10 +10,17 @@ scheduling, caching, and parameter visibility management.
 from abc import abstractmethod
 import asyncio
 from collections.abc import Callable, Mapping
-from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
-from aiohomematic.const import DeviceDescription, Interface, ParameterData, ParamsetKey
+from aiohomematic.const import (
+    RAW_SCHEDULE_DICT,
+    DeviceDescription,
+    ExecutorLane,
+    Interface,
+    ParameterData,
+    ParamsetKey,
+    TaskCategory,
+)
 from aiohomematic.type_aliases import AsyncTaskFactoryAny, CoroutineAny
 
 if TYPE_CHECKING:
@@ -32,9 +39,9 @@ class TaskSchedulerProtocol(Protocol):
 
     @abstractmethod
     def async_add_executor_job[T](
-        self, target: Callable[..., T], *args: Any, name: str, executor: ThreadPoolExecutor | None = None
+        self, target: Callable[..., T], *args: Any, name: str, lane: ExecutorLane = ExecutorLane.CPU
     ) -> asyncio.Future[T]:
-        """Add an executor job from within the event_loop."""
+        """Add an executor job to a lane of the shared executor pool from within the event_loop."""
 
     @abstractmethod
     async def block_till_done(self, *, wait_time: float | None = None) -> None:
@@ -45,8 +52,14 @@ class TaskSchedulerProtocol(Protocol):
         """Cancel running tasks."""
 
     @abstractmethod
-    def create_task(self, *, target: CoroutineAny | AsyncTaskFactoryAny, name: str) -> None:
-        """Create and schedule an async task."""
+    def create_task(
+        self,
+        *,
+        target: CoroutineAny | AsyncTaskFactoryAny,
+        name: str,
+        category: TaskCategory = TaskCategory.DEFAULT,
+    ) -> None:
+        """Create and schedule an async task that counts against the budget of its category."""
 
 
 @runtime_checkable
@@ -221,3 +234,20 @@ class IncidentRecorderProtocol(Protocol):
         journal: PingPongJournal | None = None,
     ) -> IncidentSnapshot:
         """Record a new incident and persist it."""
+
+
+@runtime_checkable
+class ScheduleCacheProtocol(Protocol):
+    """
+    Protocol for persisting raw week profile schedules between runs.
+
+    Implemented by ScheduleRegistry.
+    """
+
+    @abstractmethod
+    def get_raw_schedule(self, *, device_address: str, firmware: str) -> RAW_SCHEDULE_DICT | None:
+        """Return the stored raw schedule, or None if missing or stored for another firmware."""
+
+    @abstractmethod
+    async def set_raw_schedule(self, *, device_address: str, firmware: str, raw_schedule: RAW_SCHEDULE_DICT) -> None:
+        """Store the raw schedule read from the device and schedule a save."""
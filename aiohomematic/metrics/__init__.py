@@ -26,7 +26,16 @@ Event-driven:
 Polling-based:
 - MetricsAggregator, MetricsSnapshot
 - RpcMetrics, RpcServerMetrics, EventMetrics, CacheMetrics, HealthMetrics
-- RecoveryMetrics, ModelMetrics, ServiceMetrics
+- RecoveryMetrics, ModelMetrics, ServiceMetrics, ThrottleMetrics, ExecutorMetrics, TaskMetrics
+- RpcMethodStats (per JSON-RPC method, in RpcMetrics.by_method)
+
+Startup profiling:
+- StartupProfiler, StartupMetrics
+- profile_phase, record_rpc_transfer
+
+Memory accounting (on demand, see CentralUnit.memory_report):
+- MemoryMetrics, MemoryTypeStats
+- approximate_size, collect_memory_metrics
 
 Note: Protocol dependencies for MetricsAggregator are in aiohomematic.interfaces:
 - ClientProviderForMetricsProtocol
@@ -39,13 +48,18 @@ from aiohomematic.metrics.aggregator import MetricsAggregator
 from aiohomematic.metrics.dataclasses import (
     CacheMetrics,
     EventMetrics,
+    ExecutorMetrics,
     HealthMetrics,
+    MemoryMetrics,
     MetricsSnapshot,
     ModelMetrics,
     RecoveryMetrics,
     RpcMetrics,
     RpcServerMetrics,
     ServiceMetrics,
+    StartupMetrics,
+    TaskMetrics,
+    ThrottleMetrics,
 )
 from aiohomematic.metrics.emitter import (
     EventBusProviderProtocol,
@@ -67,6 +81,7 @@ from aiohomematic.metrics.events import (
     MetricType,
 )
 from aiohomematic.metrics.keys import MetricKey, MetricKeys
+from aiohomematic.metrics.memory import approximate_size, collect_memory_metrics
 from aiohomematic.metrics.observer import (
     MAX_METRIC_KEYS,
     HealthState,
@@ -74,7 +89,19 @@ from aiohomematic.metrics.observer import (
     MetricsObserver,
     ObserverSnapshot,
 )
-from aiohomematic.metrics.stats import CacheStats, LatencyStats, ServiceStats, SizeOnlyStats
+from aiohomematic.metrics.profiler import StartupProfiler, profile_phase, record_rpc_transfer
+from aiohomematic.metrics.stats import (
+    CacheStats,
+    ExecutorLaneStats,
+    LatencyStats,
+    MemoryTypeStats,
+    RpcMethodStats,
+    ServiceStats,
+    SizeOnlyStats,
+    StartupPhaseStats,
+    TaskCategoryStats,
+    ThrottleStats,
+)
 
 __all__ = [
     # Aggregator
@@ -82,13 +109,18 @@ __all__ = [
     # Dataclasses
     "CacheMetrics",
     "EventMetrics",
+    "ExecutorMetrics",
     "HealthMetrics",
+    "MemoryMetrics",
     "MetricsSnapshot",
     "ModelMetrics",
     "RecoveryMetrics",
     "RpcMetrics",
     "RpcServerMetrics",
     "ServiceMetrics",
+    "StartupMetrics",
+    "TaskMetrics",
+    "ThrottleMetrics",
     # Emitter
     "EventBusProviderProtocol",
     "LatencyContext",
@@ -109,15 +141,28 @@ __all__ = [
     # Keys
     "MetricKey",
     "MetricKeys",
+    # Memory
+    "approximate_size",
+    "collect_memory_metrics",
     # Observer
     "HealthState",
     "LatencyTracker",
     "MAX_METRIC_KEYS",
     "MetricsObserver",
     "ObserverSnapshot",
+    # Profiler
+    "StartupProfiler",
+    "profile_phase",
+    "record_rpc_transfer",
     # Stats
     "CacheStats",
+    "ExecutorLaneStats",
     "LatencyStats",
+    "MemoryTypeStats",
+    "RpcMethodStats",
     "ServiceStats",
     "SizeOnlyStats",
+    "StartupPhaseStats",
+    "TaskCategoryStats",
+    "ThrottleStats",
 ]
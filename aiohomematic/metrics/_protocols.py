@@ -17,9 +17,11 @@ IMPORTANT: This module must NOT import from interfaces/ to avoid circular import
 """
 
 from abc import abstractmethod
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from aiohomematic.metrics.stats import ExecutorLaneStats, RpcMethodStats, TaskCategoryStats
     from aiohomematic.store.types import CacheStatistics
 
 
@@ -28,12 +30,17 @@ class DeviceProviderForMetricsProtocol(Protocol):
     """
     Minimal protocol for device access in metrics context.
 
-    Provides only the `devices` property needed by MetricsAggregator
+    Provides only the device access needed by MetricsAggregator
     to collect model statistics without requiring the full DeviceProviderProtocol.
 
-    Implemented by CentralUnit.
+    Implemented by DeviceRegistry.
     """
 
+    @property
+    @abstractmethod
+    def device_counts_by_interface(self) -> Mapping[str, int]:
+        """Return the count of devices per interface_id."""
+
     @property
     @abstractmethod
     def devices(self) -> tuple[Any, ...]:
@@ -57,6 +64,20 @@ class ClientProviderForMetricsProtocol(Protocol):
         """Return all connected clients."""
 
 
+@runtime_checkable
+class ExecutorPoolForMetricsProtocol(Protocol):
+    """
+    Minimal protocol for executor pool access in metrics context.
+
+    Implemented by ExecutorPool.
+    """
+
+    @property
+    @abstractmethod
+    def lane_stats(self) -> Mapping[str, ExecutorLaneStats]:
+        """Return a copy of the load statistics per lane."""
+
+
 @runtime_checkable
 class HubDataPointManagerForMetricsProtocol(Protocol):
     """
@@ -116,6 +137,20 @@ class CacheProviderForMetricsProtocol(Protocol):
         """Return visibility cache size."""
 
 
+@runtime_checkable
+class JsonRpcClientForMetricsProtocol(Protocol):
+    """
+    Minimal protocol for JSON-RPC client access in metrics context.
+
+    Implemented by AioJsonRpcAioHttpClient.
+    """
+
+    @property
+    @abstractmethod
+    def method_stats(self) -> Mapping[str, RpcMethodStats]:
+        """Return a copy of the traffic statistics per method."""
+
+
 @runtime_checkable
 class RecoveryProviderForMetricsProtocol(Protocol):
     """
@@ -136,3 +171,17 @@ class RecoveryProviderForMetricsProtocol(Protocol):
     @abstractmethod
     def recovery_states(self) -> dict[str, Any]:
         """Return recovery states for all tracked interfaces."""
+
+
+@runtime_checkable
+class TaskSchedulerForMetricsProtocol(Protocol):
+    """
+    Minimal protocol for task scheduler access in metrics context.
+
+    Implemented by Looper.
+    """
+
+    @property
+    @abstractmethod
+    def task_stats(self) -> Mapping[str, TaskCategoryStats]:
+        """Return a copy of the background task statistics per category."""
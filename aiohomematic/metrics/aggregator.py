@@ -30,20 +30,25 @@ Usage
     snapshot = aggregator.snapshot()
 """
 
+from collections.abc import Mapping
 from datetime import datetime
 from typing import TYPE_CHECKING, Final
 
-from aiohomematic.const import INIT_DATETIME, CircuitState
+from aiohomematic.const import INIT_DATETIME, CircuitState, RecoveryReloadStep, RecoveryStage
 from aiohomematic.metrics._protocols import (
     CacheProviderForMetricsProtocol,
     ClientProviderForMetricsProtocol,
     DeviceProviderForMetricsProtocol,
+    ExecutorPoolForMetricsProtocol,
     HubDataPointManagerForMetricsProtocol,
+    JsonRpcClientForMetricsProtocol,
     RecoveryProviderForMetricsProtocol,
+    TaskSchedulerForMetricsProtocol,
 )
 from aiohomematic.metrics.dataclasses import (
     CacheMetrics,
     EventMetrics,
+    ExecutorMetrics,
     HealthMetrics,
     MetricsSnapshot,
     ModelMetrics,
@@ -51,13 +56,17 @@ from aiohomematic.metrics.dataclasses import (
     RpcMetrics,
     RpcServerMetrics,
     ServiceMetrics,
+    StartupMetrics,
+    TaskMetrics,
+    ThrottleMetrics,
 )
-from aiohomematic.metrics.stats import CacheStats, ServiceStats, SizeOnlyStats
+from aiohomematic.metrics.stats import CacheStats, RpcMethodStats, ServiceStats, SizeOnlyStats, ThrottleStats
 
 if TYPE_CHECKING:
     from aiohomematic.central.events import EventBus
     from aiohomematic.central.health import HealthTracker
     from aiohomematic.metrics.observer import MetricsObserver
+    from aiohomematic.metrics.profiler import StartupProfiler
     from aiohomematic.store.dynamic import CentralDataCache
 
 
@@ -74,6 +83,9 @@ class MetricsAggregator:
     This class collects data from:
     - CircuitBreaker (per client)
     - RequestCoalescer (per client)
+    - CommandThrottle (per client)
+    - ExecutorPool (per lane)
+    - StartupProfiler
     - EventBus
     - HealthTracker
     - RecoveryCoordinator
@@ -108,10 +120,14 @@ class MetricsAggregator:
         "_data_cache",
         "_device_provider",
         "_event_bus",
+        "_executor_pool",
         "_health_tracker",
         "_hub_data_point_manager",
+        "_json_rpc_client",
         "_observer",
         "_recovery_provider",
+        "_startup_profiler",
+        "_task_scheduler",
     )
 
     def __init__(
@@ -127,6 +143,10 @@ class MetricsAggregator:
         hub_data_point_manager: HubDataPointManagerForMetricsProtocol | None = None,
         cache_provider: CacheProviderForMetricsProtocol | None = None,
         recovery_provider: RecoveryProviderForMetricsProtocol | None = None,
+        executor_pool: ExecutorPoolForMetricsProtocol | None = None,
+        startup_profiler: StartupProfiler | None = None,
+        task_scheduler: TaskSchedulerForMetricsProtocol | None = None,
+        json_rpc_client: JsonRpcClientForMetricsProtocol | None = None,
     ) -> None:
         """
         Initialize the metrics aggregator.
@@ -142,6 +162,10 @@ class MetricsAggregator:
             hub_data_point_manager: Optional hub data point manager
             cache_provider: Optional cache provider for cache statistics
             recovery_provider: Optional recovery provider for recovery statistics
+            executor_pool: Optional executor pool for lane load statistics
+            startup_profiler: Optional startup profiler for the startup phase summary
+            task_scheduler: Optional task scheduler for background task statistics
+            json_rpc_client: Optional JSON-RPC client for traffic statistics per method
 
         """
         self._central_name: Final = central_name
@@ -154,6 +178,10 @@ class MetricsAggregator:
         self._hub_data_point_manager: Final = hub_data_point_manager
         self._cache_provider: Final = cache_provider
         self._recovery_provider: Final = recovery_provider
+        self._executor_pool: Final = executor_pool
+        self._startup_profiler: Final = startup_profiler
+        self._task_scheduler: Final = task_scheduler
+        self._json_rpc_client: Final = json_rpc_client
 
     @property
     def cache(self) -> CacheMetrics:
@@ -243,6 +271,21 @@ class MetricsAggregator:
             health_records=health_records,
         )
 
+    @property
+    def executor(self) -> ExecutorMetrics:
+        """Return load metrics of the shared executor pool."""
+        if self._executor_pool is None or not (by_lane := self._executor_pool.lane_stats):
+            return ExecutorMetrics()
+
+        stats = by_lane.values()
+        return ExecutorMetrics(
+            active_jobs=sum(s.active for s in stats),
+            queued_jobs=sum(s.queue_depth for s in stats),
+            saturated_lanes=sum(1 for s in stats if s.saturated),
+            max_wait_ms=max(s.max_wait_ms for s in stats),
+            by_lane=by_lane,
+        )
+
     @property
     def health(self) -> HealthMetrics:
         """Return health metrics."""
@@ -317,6 +360,7 @@ class MetricsAggregator:
         return ModelMetrics(
             devices_total=len(devices),
             devices_available=devices_available,
+            devices_by_interface=dict(sorted(self._device_provider.device_counts_by_interface.items())),
             channels_total=channels_total,
             data_points_generic=generic_count,
             data_points_custom=custom_count,
@@ -344,6 +388,8 @@ class MetricsAggregator:
         failures = 0
         max_retries_reached = 0
         last_recovery_time: datetime | None = None
+        stage_durations_ms: dict[RecoveryStage, float] = {}
+        reload_durations_ms: dict[RecoveryReloadStep, float] = {}
 
         for state in recovery_states.values():
             attempts_total += state.attempt_count
@@ -359,6 +405,11 @@ class MetricsAggregator:
                 last_recovery_time is None or state.last_attempt > last_recovery_time
             ):
                 last_recovery_time = state.last_attempt
+            # Interfaces recover in parallel, so the slowest one determines the duration
+            for stage, duration_ms in state.stage_durations_ms.items():
+                stage_durations_ms[stage] = max(duration_ms, stage_durations_ms.get(stage, 0.0))
+            for step, duration_ms in state.reload_durations_ms.items():
+                reload_durations_ms[step] = max(duration_ms, reload_durations_ms.get(step, 0.0))
 
         return RecoveryMetrics(
             attempts_total=attempts_total,
@@ -367,6 +418,8 @@ class MetricsAggregator:
             max_retries_reached=max_retries_reached,
             in_progress=self._recovery_provider.in_recovery,
             last_recovery_time=last_recovery_time,
+            stage_durations_ms=stage_durations_ms,
+            reload_durations_ms=reload_durations_ms,
         )
 
     @property
@@ -431,6 +484,11 @@ class MetricsAggregator:
         successful_requests = total_requests - failed_requests - rejected_requests
         avg_latency_ms = total_latency_ms / latency_count if latency_count > 0 else 0.0
 
+        # JSON-RPC traffic per method
+        by_method: Mapping[str, RpcMethodStats] = (
+            self._json_rpc_client.method_stats if self._json_rpc_client is not None else {}
+        )
+
         return RpcMetrics(
             total_requests=total_requests,
             successful_requests=successful_requests,
@@ -445,6 +503,9 @@ class MetricsAggregator:
             avg_latency_ms=avg_latency_ms,
             max_latency_ms=max_latency_ms,
             last_failure_time=last_failure_time,
+            bytes_sent=sum(stats.bytes_sent for stats in by_method.values()),
+            bytes_received=sum(stats.bytes_received for stats in by_method.values()),
+            by_method=by_method,
         )
 
     @property
@@ -517,6 +578,53 @@ class MetricsAggregator:
             by_method=stats_by_method,
         )
 
+    @property
+    def startup(self) -> StartupMetrics:
+        """Return the phase summary of the last central start."""
+        if self._startup_profiler is None:
+            return StartupMetrics()
+        return self._startup_profiler.summary()
+
+    @property
+    def tasks(self) -> TaskMetrics:
+        """Return background task metrics of the task scheduler."""
+        if self._task_scheduler is None or not (by_category := self._task_scheduler.task_stats):
+            return TaskMetrics()
+
+        stats = by_category.values()
+        return TaskMetrics(
+            running_tasks=sum(s.running for s in stats),
+            queued_tasks=sum(s.queued for s in stats),
+            dropped_tasks=sum(s.dropped for s in stats),
+            coalesced_tasks=sum(s.coalesced for s in stats),
+            saturated_categories=sum(1 for s in stats if s.saturated),
+            by_category=by_category,
+        )
+
+    @property
+    def throttle(self) -> ThrottleMetrics:
+        """Return command throttle metrics from all clients."""
+        by_interface: dict[str, ThrottleStats] = {}
+        for client in self._client_provider.clients:
+            if (throttle := getattr(client, "command_throttle", None)) is not None:
+                by_interface[throttle.interface_id] = throttle.stats
+
+        if not by_interface:
+            return ThrottleMetrics()
+
+        stats = by_interface.values()
+        return ThrottleMetrics(
+            adaptive_interfaces=sum(1 for s in stats if s.adaptive),
+            interfaces_in_backoff=sum(1 for s in stats if s.backoff_active),
+            max_utilisation=max(s.utilisation for s in stats),
+            duty_cycle_faults=sum(s.duty_cycle_faults for s in stats),
+            transmission_pending_faults=sum(s.transmission_pending_faults for s in stats),
+            throttled_commands=sum(s.throttled_count for s in stats),
+            coalesced_commands=sum(s.coalesced_count for s in stats),
+            queued_commands=sum(s.queue_size for s in stats),
+            by_interface=by_interface,
+        )
+
     def snapshot(self) -> MetricsSnapshot:
         """Return point-in-time snapshot of all metrics."""
         return MetricsSnapshot(
@@ -529,4 +637,8 @@ class MetricsAggregator:
             recovery=self.recovery,
             model=self.model,
             services=self.services,
+            throttle=self.throttle,
+            executor=self.executor,
+            tasks=self.tasks,
+            startup=self.startup,
         )
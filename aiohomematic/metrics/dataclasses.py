@@ -15,6 +15,11 @@ Public API
 - RecoveryMetrics: Recovery statistics
 - ModelMetrics: Model statistics
 - ServiceMetrics: Service call statistics
+- ThrottleMetrics: Command throttle state (radio utilisation, backoff)
+- ExecutorMetrics: Executor pool load per lane (queue depth, wait time)
+- TaskMetrics: Looper background tasks per category (running, queued, dropped)
+- StartupMetrics: Startup phase summary (wall time, RPC requests, bytes)
+- MemoryMetrics: Object count and approximate size per type (on demand)
 - MetricsSnapshot: Point-in-time snapshot of all metrics
 """
 
@@ -23,8 +28,18 @@ from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
 from typing import Any
 
-from aiohomematic.const import INIT_DATETIME
-from aiohomematic.metrics.stats import CacheStats, ServiceStats, SizeOnlyStats
+from aiohomematic.const import INIT_DATETIME, RecoveryReloadStep, RecoveryStage
+from aiohomematic.metrics.stats import (
+    CacheStats,
+    ExecutorLaneStats,
+    MemoryTypeStats,
+    RpcMethodStats,
+    ServiceStats,
+    SizeOnlyStats,
+    StartupPhaseStats,
+    TaskCategoryStats,
+    ThrottleStats,
+)
 
 
 def _convert_value(*, value: Any) -> Any:
@@ -85,7 +100,8 @@ class RpcMetrics:
     """
     RPC communication metrics aggregated from all clients.
 
-    Combines CircuitBreaker and RequestCoalescer metrics.
+    Combines CircuitBreaker and RequestCoalescer metrics with the traffic of
+    the JSON-RPC client.
     """
 
     total_requests: int = 0
@@ -127,6 +143,15 @@ class RpcMetrics:
     last_failure_time: datetime | None = None
     """Timestamp of last failure."""
 
+    bytes_sent: int = 0
+    """Total bytes sent by the JSON-RPC client."""
+
+    bytes_received: int = 0
+    """Total bytes received by the JSON-RPC client as transferred."""
+
+    by_method: Mapping[str, RpcMethodStats] = field(default_factory=dict)
+    """JSON-RPC traffic per method, ReGa scripts per script (e.g. ReGa.runScript:fetch_all_device_data.fn)."""
+
     @property
     def coalesce_rate(self) -> float:
         """Return coalesce rate as percentage."""
@@ -361,6 +386,12 @@ class RecoveryMetrics:
     last_recovery_time: datetime | None = None
     """Timestamp of last recovery attempt."""
 
+    stage_durations_ms: Mapping[RecoveryStage, float] = field(default_factory=dict)
+    """Duration per stage of the last recovery attempt (slowest interface)."""
+
+    reload_durations_ms: Mapping[RecoveryReloadStep, float] = field(default_factory=dict)
+    """Duration per data reload step of the last recovery attempt (slowest interface)."""
+
     @property
     def success_rate(self) -> float:
         """Return recovery success rate."""
@@ -379,6 +410,9 @@ class ModelMetrics:
     devices_available: int = 0
     """Available devices."""
 
+    devices_by_interface: Mapping[str, int] = field(default_factory=dict)
+    """Device counts by interface (interface_id -> count)."""
+
     channels_total: int = 0
     """Total channels."""
 
@@ -436,6 +470,133 @@ class ServiceMetrics:
         return (self.total_errors / self.total_calls) * 100
 
 
+@dataclass(frozen=True, slots=True)
+class ThrottleMetrics:
+    """Command throttle metrics aggregated from all clients."""
+
+    adaptive_interfaces: int = 0
+    """Interfaces using the duty-cycle-aware token bucket."""
+
+    interfaces_in_backoff: int = 0
+    """Interfaces currently pausing commands after a backend fault."""
+
+    max_utilisation: float = 0.0
+    """Highest radio utilisation in percent across all interfaces."""
+
+    duty_cycle_faults: int = 0
+    """Total INSUFFICIENT_DUTYCYCLE faults."""
+
+    transmission_pending_faults: int = 0
+    """Total TRANSMISSION_PENDING faults."""
+
+    throttled_commands: int = 0
+    """Total commands that were delayed."""
+
+    coalesced_commands: int = 0
+    """Total queued commands replaced by a newer command for the same data point."""
+
+    queued_commands: int = 0
+    """Commands currently waiting for a send slot."""
+
+    by_interface: Mapping[str, ThrottleStats] = field(default_factory=dict)
+    """Throttle state per interface (interface_id -> stats)."""
+
+
+@dataclass(frozen=True, slots=True)
+class ExecutorMetrics:
+    """Load of the shared executor pool aggregated over all lanes."""
+
+    active_jobs: int = 0
+    """Jobs currently running."""
+
+    queued_jobs: int = 0
+    """Jobs currently waiting for a worker."""
+
+    saturated_lanes: int = 0
+    """Lanes with all workers busy and jobs waiting."""
+
+    max_wait_ms: float = 0.0
+    """Longest time a job waited for a worker in milliseconds."""
+
+    by_lane: Mapping[str, ExecutorLaneStats] = field(default_factory=dict)
+    """Load per lane (lane -> stats)."""
+
+
+@dataclass(frozen=True, slots=True)
+class TaskMetrics:
+    """Background tasks of the Looper aggregated over all categories."""
+
+    running_tasks: int = 0
+    """Tasks currently running."""
+
+    queued_tasks: int = 0
+    """Tasks currently waiting for a free slot of their category."""
+
+    dropped_tasks: int = 0
+    """Tasks dropped because their category was over budget."""
+
+    coalesced_tasks: int = 0
+    """Waiting tasks replaced by a newer task of the same name."""
+
+    saturated_categories: int = 0
+    """Categories at their limit with tasks waiting."""
+
+    by_category: Mapping[str, TaskCategoryStats] = field(default_factory=dict)
+    """Tasks per category (category -> stats)."""
+
+
+@dataclass(frozen=True, slots=True)
+class StartupMetrics:
+    """Summary of the phases recorded during the last central start."""
+
+    in_progress: bool = False
+    """Whether the start is still running."""
+
+    completed_at: datetime | None = None
+    """When the last start finished (None = not started yet)."""
+
+    total_ms: float = 0.0
+    """Wall time of the whole start in milliseconds."""
+
+    rpc_count: int = 0
+    """RPC requests sent during the start."""
+
+    bytes_sent: int = 0
+    """Bytes sent to the backend during the start."""
+
+    bytes_received: int = 0
+    """Bytes received from the backend during the start."""
+
+    phases: Mapping[str, StartupPhaseStats] = field(default_factory=dict)
+    """Statistics per phase (slash-separated phase path -> stats)."""
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryMetrics:
+    """
+    Object count and approximate size per type of the runtime model.
+
+    Not part of MetricsSnapshot: collecting it walks the whole model, so it is
+    only created on demand by CentralUnit.memory_report.
+    """
+
+    timestamp: datetime = field(default_factory=datetime.now)
+    """When the report was collected."""
+
+    objects_total: int = 0
+    """Total number of accounted objects."""
+
+    approx_bytes_total: int = 0
+    """Approximate total size of the accounted objects in bytes."""
+
+    by_type: Mapping[str, MemoryTypeStats] = field(default_factory=dict)
+    """Statistics per type (type name -> stats), largest first."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        return _dataclass_to_dict(obj=self)
+
+
 @dataclass(frozen=True, slots=True)
 class MetricsSnapshot:
     """Point-in-time snapshot of all system metrics."""
@@ -467,6 +628,18 @@ class MetricsSnapshot:
     services: ServiceMetrics = field(default_factory=ServiceMetrics)
     """Service call statistics."""
 
+    throttle: ThrottleMetrics = field(default_factory=ThrottleMetrics)
+    """Command throttle state."""
+
+    executor: ExecutorMetrics = field(default_factory=ExecutorMetrics)
+    """Executor pool load."""
+
+    tasks: TaskMetrics = field(default_factory=TaskMetrics)
+    """Looper background tasks."""
+
+    startup: StartupMetrics = field(default_factory=StartupMetrics)
+    """Phases of the last central start."""
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert snapshot to a JSON-serializable dictionary.
@@ -180,6 +180,15 @@ class MetricKeys:
         """
         return MetricKey("coalescer", "failure", interface_id)
 
+    @staticmethod
+    def device_creation_stage(*, stage: str) -> MetricKey:
+        """
+        Device creation stage latency.
+
+        Tracks the duration of a device creation stage (construct, finalize).
+        """
+        return MetricKey("device_creation", "stage", stage)
+
     @staticmethod
     def handler_error(*, event_type: str) -> MetricKey:
         """
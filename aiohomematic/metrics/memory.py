@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Approximate memory accounting of the runtime model.
+
+This module walks the model of a central (devices, channels, data points,
+events, hub data points) and further object groups like the EventBus
+subscriptions, and aggregates object count and approximate size per type.
+
+Public API
+----------
+- approximate_size: Approximate size of a single object in bytes
+- collect_memory_metrics: Aggregate count and approximate size per type
+
+Usage
+-----
+    report = central.memory_report()
+    for type_name, stats in report.by_type.items():
+        print(type_name, stats.count, stats.avg_bytes)
+
+Sizes are approximations. An object is counted with its own size plus the
+containers, strings, numbers and bound handlers it holds directly in its
+attributes. Other referenced objects (e.g. the channel of a data point) are
+not followed, model objects are counted under their own type instead. Enum
+members are shared and not counted, other shared objects (interned strings,
+small integers) are counted for every holder. The figures are meant to
+compare types and to spot growth; use tracemalloc for exact numbers.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+from enum import Enum
+from functools import partial
+import sys
+from types import MethodType
+from typing import Any, Final
+from weakref import WeakKeyDictionary
+
+from aiohomematic.metrics.dataclasses import MemoryMetrics
+from aiohomematic.metrics.stats import MemoryTypeStats
+
+_SCALAR_TYPES: Final = (bytes, complex, float, int, str)
+_CONTAINER_TYPES: Final = (frozenset, list, set, tuple)
+_HANDLER_TYPES: Final = (MethodType, partial)
+_SIZED_TYPES: Final = (*_SCALAR_TYPES, *_HANDLER_TYPES)
+_MISSING: Final = object()
+_SKIPPED_SLOTS: Final = frozenset({"__dict__", "__weakref__"})
+_SLOT_NAMES: Final[WeakKeyDictionary[type, tuple[str, ...]]] = WeakKeyDictionary()
+
+
+def approximate_size(*, obj: object) -> int:
+    """
+    Return the approximate size of an object in bytes.
+
+    Counts the object itself, its instance dict and the containers, strings,
+    numbers and bound handlers held directly in its attributes.
+    """
+    size = sys.getsizeof(obj)
+    if (instance_dict := getattr(obj, "__dict__", None)) is not None:
+        size += sys.getsizeof(instance_dict)
+    return size + sum(_owned_size(value=value) for value in _iter_attribute_values(obj=obj))
+
+
+def collect_memory_metrics(
+    *,
+    devices: Iterable[Any],
+    hub_data_points: Iterable[Any] = (),
+    groups: Mapping[str, Iterable[object]] | None = None,
+) -> MemoryMetrics:
+    """
+    Return object count and approximate size per type.
+
+    Devices and hub data points are counted by the name of their type,
+    including the channels, data points and events of the devices. The
+    objects of each entry in groups are counted under the name of the entry.
+    """
+    by_type: dict[str, MemoryTypeStats] = {}
+
+    def record(*, name: str, obj: object) -> None:
+        if (stats := by_type.get(name)) is None:
+            stats = by_type[name] = MemoryTypeStats()
+        stats.record(size=approximate_size(obj=obj))
+
+    for obj in _iter_model_objects(devices=devices, hub_data_points=hub_data_points):
+        record(name=type(obj).__name__, obj=obj)
+    for name, objects in (groups or {}).items():
+        for obj in objects:
+            record(name=name, obj=obj)
+
+    return MemoryMetrics(
+        objects_total=sum(stats.count for stats in by_type.values()),
+        approx_bytes_total=sum(stats.approx_bytes for stats in by_type.values()),
+        by_type=dict(sorted(by_type.items(), key=lambda item: item[1].approx_bytes, reverse=True)),
+    )
+
+
+def _iter_attribute_values(*, obj: object) -> Iterator[Any]:
+    """Yield the values of the instance dict and of all slots of an object."""
+    if (instance_dict := getattr(obj, "__dict__", None)) is not None:
+        yield from instance_dict.values()
+    for slot in _slot_names(cls=type(obj)):
+        if (value := getattr(obj, slot, _MISSING)) is not _MISSING:
+            yield value
+
+
+def _iter_model_objects(*, devices: Iterable[Any], hub_data_points: Iterable[Any]) -> Iterator[object]:
+    """Yield the devices with their channels, data points and events, followed by the hub data points."""
+    for device in devices:
+        yield device
+        for channel in device.channels.values():
+            yield channel
+            yield from channel.generic_data_points
+            yield from channel.generic_events
+            yield from channel.calculated_data_points
+            if (custom_data_point := channel.custom_data_point) is not None:
+                yield custom_data_point
+    yield from hub_data_points
+
+
+def _owned_size(*, value: Any) -> int:
+    """Return the size of a directly held attribute value, 0 for referenced objects."""
+    if value is None or isinstance(value, (bool, Enum)):
+        return 0
+    if isinstance(value, _SIZED_TYPES):
+        return sys.getsizeof(value)
+    if isinstance(value, _CONTAINER_TYPES):
+        return sys.getsizeof(value) + sum(_scalar_size(value=item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            _scalar_size(value=key) + _scalar_size(value=item) for key, item in value.items()
+        )
+    return 0
+
+
+def _scalar_size(*, value: Any) -> int:
+    """Return the size of a scalar container item, 0 for other objects."""
+    if isinstance(value, _SCALAR_TYPES) and not isinstance(value, (bool, Enum)):
+        return sys.getsizeof(value)
+    return 0
+
+
+def _slot_names(*, cls: type) -> tuple[str, ...]:
+    """Return the attribute names of all slots of a class (name-mangled where needed)."""
+    if (names := _SLOT_NAMES.get(cls)) is not None:
+        return names
+    resolved: list[str] = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot in _SKIPPED_SLOTS:
+                continue
+            if slot.startswith("__") and not slot.endswith("__"):
+                slot = f"_{base.__name__.lstrip('_')}{slot}"
+            resolved.append(slot)
+    names = _SLOT_NAMES[cls] = tuple(resolved)
+    return names
@@ -494,7 +494,7 @@ class MetricsObserver:
     async def _handle_counter(self, *, event: CounterMetricEvent) -> None:
         """Handle counter metric event."""
         if len(self._counters) >= MAX_METRIC_KEYS:
-            _LOGGER.warning(i18n.tr(key="log.metrics.observer.counter_key_limit", metric_key=event.metric_key))
+            _LOGGER.warning(i18n.lazy_tr(key="log.metrics.observer.counter_key_limit", metric_key=event.metric_key))
             return
         self._counters[event.metric_key] += event.delta
         self._last_event_time = event.timestamp
@@ -502,7 +502,7 @@ class MetricsObserver:
     async def _handle_gauge(self, *, event: GaugeMetricEvent) -> None:
         """Handle gauge metric event."""
         if len(self._gauges) >= MAX_METRIC_KEYS:
-            _LOGGER.warning(i18n.tr(key="log.metrics.observer.gauge_key_limit", metric_key=event.metric_key))
+            _LOGGER.warning(i18n.lazy_tr(key="log.metrics.observer.gauge_key_limit", metric_key=event.metric_key))
             return
         self._gauges[event.metric_key] = event.value
         self._last_event_time = event.timestamp
@@ -515,7 +515,7 @@ class MetricsObserver:
     async def _handle_latency(self, *, event: LatencyMetricEvent) -> None:
         """Handle latency metric event."""
         if len(self._latency) >= MAX_METRIC_KEYS:
-            _LOGGER.warning(i18n.tr(key="log.metrics.observer.latency_key_limit", metric_key=event.metric_key))
+            _LOGGER.warning(i18n.lazy_tr(key="log.metrics.observer.latency_key_limit", metric_key=event.metric_key))
             return
         self._latency[event.metric_key].record(duration_ms=event.duration_ms)
         self._last_event_time = event.timestamp
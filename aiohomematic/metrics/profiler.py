@@ -0,0 +1,237 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Startup phase profiling.
+
+This module records the phases of CentralUnit.start as nested spans with wall
+time, RPC request count and bytes transferred. The spans can be exported as a
+Chrome trace (loadable in Perfetto or chrome://tracing) and are summarized per
+phase in the metrics snapshot.
+
+Public API
+----------
+- StartupProfiler: Records the spans of one start run
+- profile_phase: Context manager recording a phase below the active span
+- record_rpc_transfer: Attribute an RPC request and its bytes to the active span
+
+Usage
+-----
+    from aiohomematic.metrics import profile_phase
+
+    with profile_phase(name="cache.load_all"):
+        await self._device_descriptions_registry.load()
+
+Spans are only recorded while StartupProfiler.profile() is active in the
+calling context. Outside of a start run, profile_phase and
+record_rpc_transfer do nothing, so instrumented code paths that also run
+later (e.g. device creation on newDevices) cost a single ContextVar lookup.
+Background tasks started during a start run keep the span in their context;
+their later work is ignored once the run has finished.
+
+The active span is kept in a ContextVar. Tasks created within a span (e.g.
+the per-interface tasks of asyncio.gather) and executor jobs inherit it, so
+their spans and RPC transfers are attributed to the correct parent.
+"""
+
+import asyncio
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+import threading
+from time import perf_counter
+from typing import Any, Final
+
+from aiohomematic.metrics.dataclasses import StartupMetrics
+from aiohomematic.metrics.stats import StartupPhaseStats
+
+_ACTIVE_SPAN: Final[ContextVar[_Span | None]] = ContextVar("aiohomematic_startup_span", default=None)
+_PATH_SEPARATOR: Final = "/"
+_TRACE_CATEGORY: Final = "startup"
+_TRACE_PID: Final = 1
+
+
+class _Span:
+    """One recorded phase."""
+
+    __slots__ = (
+        "args",
+        "bytes_received",
+        "bytes_sent",
+        "end",
+        "name",
+        "parent",
+        "path",
+        "profiler",
+        "root",
+        "rpc_count",
+        "start",
+        "tid",
+    )
+
+    def __init__(
+        self, *, profiler: StartupProfiler, name: str, parent: _Span | None, args: Mapping[str, Any], tid: int
+    ) -> None:
+        """Initialize the span."""
+        self.profiler: Final = profiler
+        self.name: Final = name
+        self.parent: Final = parent
+        self.path: Final = f"{parent.path}{_PATH_SEPARATOR}{name}" if parent else name
+        self.root: Final[_Span] = parent.root if parent else self
+        self.args: Final = dict(args)
+        self.tid: Final = tid
+        self.start: Final = perf_counter()
+        self.end: float | None = None
+        self.rpc_count = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    @property
+    def duration_ms(self) -> float:
+        """Return the wall time of the span in milliseconds."""
+        return ((self.end or perf_counter()) - self.start) * 1000
+
+
+class StartupProfiler:
+    """
+    Record the phases of a central start as nested spans.
+
+    Owned by CentralUnit. Each call of profile() starts a new recording and
+    discards the spans of the previous run.
+    """
+
+    __slots__ = ("_central_name", "_completed_at", "_lock", "_origin", "_root", "_spans", "_task_ids")
+
+    def __init__(self, *, central_name: str) -> None:
+        """Initialize the startup profiler."""
+        self._central_name: Final = central_name
+        self._lock: Final = threading.Lock()
+        self._spans: Final[list[_Span]] = []
+        self._task_ids: Final[dict[int, int]] = {}
+        self._origin = 0.0
+        self._root: _Span | None = None
+        self._completed_at: datetime | None = None
+
+    def is_recording(self, *, span: _Span) -> bool:
+        """Return True if span belongs to the start run that is currently recorded."""
+        return span.root is self._root and span.root.end is None
+
+    def open_span(self, *, name: str, parent: _Span, args: Mapping[str, Any]) -> _Span | None:
+        """Open a span below parent, or return None if the run of parent is no longer recorded."""
+        if not self.is_recording(span=parent):
+            return None
+        with self._lock:
+            span = _Span(profiler=self, name=name, parent=parent, args=args, tid=self._get_tid())
+            self._spans.append(span)
+        return span
+
+    @contextmanager
+    def profile(self, *, name: str) -> Iterator[None]:
+        """Record a new start run with a root span of the given name."""
+        with self._lock:
+            self._spans.clear()
+            self._task_ids.clear()
+            self._completed_at = None
+            self._origin = perf_counter()
+            self._root = root = _Span(profiler=self, name=name, parent=None, args={}, tid=self._get_tid())
+            self._spans.append(root)
+        token = _ACTIVE_SPAN.set(root)
+        try:
+            yield
+        finally:
+            _ACTIVE_SPAN.reset(token)
+            root.end = perf_counter()
+            self._completed_at = datetime.now()
+
+    def record_transfer(self, *, span: _Span, bytes_sent: int, bytes_received: int) -> None:
+        """Add one RPC request to the span and all of its parents."""
+        with self._lock:
+            current: _Span | None = span
+            while current is not None:
+                current.rpc_count += 1
+                current.bytes_sent += bytes_sent
+                current.bytes_received += bytes_received
+                current = current.parent
+
+    def summary(self) -> StartupMetrics:
+        """Return the recorded phases aggregated by their path."""
+        if (root := self._root) is None:
+            return StartupMetrics()
+        phases: dict[str, StartupPhaseStats] = {}
+        with self._lock:
+            for span in self._spans:
+                if (stats := phases.get(span.path)) is None:
+                    stats = phases[span.path] = StartupPhaseStats()
+                stats.record(
+                    duration_ms=span.duration_ms,
+                    rpc_count=span.rpc_count,
+                    bytes_sent=span.bytes_sent,
+                    bytes_received=span.bytes_received,
+                )
+        return StartupMetrics(
+            in_progress=root.end is None,
+            completed_at=self._completed_at,
+            total_ms=root.duration_ms,
+            rpc_count=root.rpc_count,
+            bytes_sent=root.bytes_sent,
+            bytes_received=root.bytes_received,
+            phases=phases,
+        )
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Return the recorded spans in the Chrome trace event format."""
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": _TRACE_PID, "args": {"name": self._central_name}},
+        ]
+        with self._lock:
+            spans = sorted(self._spans, key=lambda s: s.start)
+        events.extend(
+            {
+                "name": span.name,
+                "cat": _TRACE_CATEGORY,
+                "ph": "X",
+                "ts": round((span.start - self._origin) * 1_000_000),
+                "dur": round(span.duration_ms * 1000),
+                "pid": _TRACE_PID,
+                "tid": span.tid,
+                "args": span.args
+                | {
+                    "rpc_count": span.rpc_count,
+                    "bytes_sent": span.bytes_sent,
+                    "bytes_received": span.bytes_received,
+                },
+            }
+            for span in spans
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def _get_tid(self) -> int:
+        """Return a trace thread id per asyncio task, so concurrent spans get their own track."""
+        try:
+            task_key = id(asyncio.current_task())
+        except RuntimeError:
+            task_key = 0
+        if (tid := self._task_ids.get(task_key)) is None:
+            tid = self._task_ids[task_key] = len(self._task_ids) + 1
+        return tid
+
+
+@contextmanager
+def profile_phase(*, name: str, **args: Any) -> Iterator[None]:
+    """Record a phase below the active span; does nothing outside of a start run."""
+    parent = _ACTIVE_SPAN.get()
+    if parent is None or (span := parent.profiler.open_span(name=name, parent=parent, args=args)) is None:
+        yield
+        return
+    token = _ACTIVE_SPAN.set(span)
+    try:
+        yield
+    finally:
+        _ACTIVE_SPAN.reset(token)
+        span.end = perf_counter()
+
+
+def record_rpc_transfer(*, bytes_sent: int, bytes_received: int) -> None:
+    """Attribute one RPC request and its bytes to the active span; does nothing outside of a start run."""
+    if (span := _ACTIVE_SPAN.get()) is not None and span.profiler.is_recording(span=span):
+        span.profiler.record_transfer(span=span, bytes_sent=bytes_sent, bytes_received=bytes_received)
@@ -9,8 +9,14 @@ These are used by components to record metrics which are then aggregated.
 Public API
 ----------
 - CacheStats: Cache hit/miss/size statistics
+- ExecutorLaneStats: Executor lane load (queue depth, active workers, wait time)
 - LatencyStats: Request latency statistics (count, min, max, avg)
+- MemoryTypeStats: Object count and approximate size of one object type
+- RpcMethodStats: Requests, bytes and latency of one JSON-RPC method or ReGa script
 - ServiceStats: Service method execution statistics (call count, errors, timing)
+- StartupPhaseStats: Startup phase statistics (wall time, RPC requests, bytes)
+- TaskCategoryStats: Looper background tasks of one category (running, queued, dropped)
+- ThrottleStats: Command throttle state (send rate, radio load, backoff)
 """
 
 from dataclasses import dataclass
@@ -81,6 +87,76 @@ class CacheStats:
         self.evictions = 0
 
 
+@dataclass(slots=True)
+class ExecutorLaneStats:
+    """
+    Load of one lane of the shared executor pool.
+
+    Created by ExecutorPool.lane_stats and aggregated by MetricsAggregator.executor.
+    """
+
+    max_workers: int = 0
+    """Number of worker threads of the lane."""
+
+    submitted: int = 0
+    """Number of jobs submitted to the lane."""
+
+    completed: int = 0
+    """Number of jobs that finished (successfully or with an error)."""
+
+    queue_depth: int = 0
+    """Number of jobs currently waiting for a worker."""
+
+    active: int = 0
+    """Number of jobs currently running."""
+
+    total_wait_ms: float = 0.0
+    """Total time jobs waited for a worker in milliseconds."""
+
+    max_wait_ms: float = 0.0
+    """Longest time a job waited for a worker in milliseconds."""
+
+    @property
+    def avg_wait_ms(self) -> float:
+        """Return the average time a job waited for a worker in milliseconds."""
+        if (started := self.completed + self.active) == 0:
+            return 0.0
+        return self.total_wait_ms / started
+
+    @property
+    def saturated(self) -> bool:
+        """Return True if all workers are busy and jobs are waiting."""
+        return self.queue_depth > 0
+
+    @property
+    def utilisation(self) -> float:
+        """Return the share of busy workers in percent."""
+        if self.max_workers == 0:
+            return 0.0
+        return (self.active / self.max_workers) * 100
+
+    def record_cancel(self) -> None:
+        """Record a job that was cancelled before a worker picked it up."""
+        self.queue_depth -= 1
+
+    def record_done(self) -> None:
+        """Record a finished job."""
+        self.active -= 1
+        self.completed += 1
+
+    def record_start(self, *, wait_ms: float) -> None:
+        """Record a job picked up by a worker."""
+        self.queue_depth -= 1
+        self.active += 1
+        self.total_wait_ms += wait_ms
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+    def record_submit(self) -> None:
+        """Record a job submitted to the lane."""
+        self.submitted += 1
+        self.queue_depth += 1
+
+
 @dataclass(slots=True)
 class LatencyStats:
     """Statistics for request latency tracking."""
@@ -119,6 +195,87 @@ class LatencyStats:
         self.max_ms = 0.0
 
 
+@dataclass(slots=True)
+class MemoryTypeStats:
+    """
+    Object count and approximate size of one object type.
+
+    Created by collect_memory_metrics. Sizes are approximations, see
+    aiohomematic.metrics.memory.
+    """
+
+    count: int = 0
+    """Number of objects of the type."""
+
+    approx_bytes: int = 0
+    """Approximate total size of the objects in bytes."""
+
+    @property
+    def avg_bytes(self) -> float:
+        """Return the approximate size per object in bytes."""
+        return self.approx_bytes / self.count if self.count > 0 else 0.0
+
+    def record(self, *, size: int) -> None:
+        """Record one object of the given approximate size."""
+        self.count += 1
+        self.approx_bytes += size
+
+
+@dataclass(slots=True)
+class RpcMethodStats:
+    """
+    Requests, transferred bytes and latency of one JSON-RPC method.
+
+    ReGa scripts are tracked per script. Received bytes are counted as sent
+    by the backend, i.e. compressed if the response was compressed.
+    """
+
+    request_count: int = 0
+    """Number of requests."""
+
+    error_count: int = 0
+    """Number of requests that failed."""
+
+    bytes_sent: int = 0
+    """Total bytes of the request bodies."""
+
+    bytes_received: int = 0
+    """Total bytes of the response bodies as transferred."""
+
+    compressed_responses: int = 0
+    """Number of responses that were transferred compressed."""
+
+    total_latency_ms: float = 0.0
+    """Total time from sending a request until its response was read in milliseconds."""
+
+    max_latency_ms: float = 0.0
+    """Longest time from sending a request until its response was read in milliseconds."""
+
+    @property
+    def avg_bytes_received(self) -> float:
+        """Return the average bytes received per request."""
+        return self.bytes_received / self.request_count if self.request_count > 0 else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        """Return the average latency in milliseconds."""
+        return self.total_latency_ms / self.request_count if self.request_count > 0 else 0.0
+
+    def record(
+        self, *, bytes_sent: int, bytes_received: int, latency_ms: float, compressed: bool, had_error: bool
+    ) -> None:
+        """Record one request."""
+        self.request_count += 1
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+        self.total_latency_ms += latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        if compressed:
+            self.compressed_responses += 1
+        if had_error:
+            self.error_count += 1
+
+
 @dataclass(slots=True)
 class ServiceStats:
     """
@@ -168,3 +325,153 @@ class ServiceStats:
         self.error_count = 0
         self.total_duration_ms = 0.0
         self.max_duration_ms = 0.0
+
+
+@dataclass(slots=True)
+class StartupPhaseStats:
+    """
+    Statistics of one startup phase.
+
+    Created by StartupProfiler.summary. Phases that run once per interface are
+    recorded once per run, so count can be greater than one.
+    """
+
+    count: int = 0
+    """Number of recorded runs of the phase."""
+
+    duration_ms: float = 0.0
+    """Total wall time of all runs in milliseconds."""
+
+    max_duration_ms: float = 0.0
+    """Longest run in milliseconds."""
+
+    rpc_count: int = 0
+    """Number of RPC requests sent during the phase."""
+
+    bytes_sent: int = 0
+    """Bytes sent to the backend during the phase."""
+
+    bytes_received: int = 0
+    """Bytes received from the backend during the phase."""
+
+    def record(self, *, duration_ms: float, rpc_count: int, bytes_sent: int, bytes_received: int) -> None:
+        """Record one run of the phase."""
+        self.count += 1
+        self.duration_ms += duration_ms
+        self.max_duration_ms = max(self.max_duration_ms, duration_ms)
+        self.rpc_count += rpc_count
+        self.bytes_sent += bytes_sent
+        self.bytes_received += bytes_received
+
+
+@dataclass(slots=True)
+class TaskCategoryStats:
+    """
+    Background tasks of one category of the Looper.
+
+    Created by Looper.task_stats and aggregated by MetricsAggregator.tasks.
+    """
+
+    limit: int = 0
+    """Maximum number of running tasks (0 = unlimited)."""
+
+    running: int = 0
+    """Number of tasks currently running."""
+
+    queued: int = 0
+    """Number of tasks waiting for a free slot."""
+
+    peak_running: int = 0
+    """Highest number of tasks running at the same time."""
+
+    started: int = 0
+    """Number of tasks started."""
+
+    dropped: int = 0
+    """Number of tasks dropped because the category was over budget."""
+
+    coalesced: int = 0
+    """Number of waiting tasks replaced by a newer task of the same name."""
+
+    @property
+    def saturated(self) -> bool:
+        """Return True if the limit is reached and tasks are waiting."""
+        return self.queued > 0
+
+    def record_coalesce(self) -> None:
+        """Record a waiting task replaced by a newer one."""
+        self.coalesced += 1
+
+    def record_dequeue(self) -> None:
+        """Record a waiting task that left the queue."""
+        self.queued -= 1
+
+    def record_done(self) -> None:
+        """Record a finished task."""
+        self.running -= 1
+
+    def record_drop(self) -> None:
+        """Record a dropped task."""
+        self.dropped += 1
+
+    def record_enqueue(self) -> None:
+        """Record a task that waits for a free slot."""
+        self.queued += 1
+
+    def record_start(self) -> None:
+        """Record a started task."""
+        self.running += 1
+        self.started += 1
+        self.peak_running = max(self.peak_running, self.running)
+
+
+@dataclass(slots=True)
+class ThrottleStats:
+    """
+    State of a command throttle for one interface.
+
+    Created by CommandThrottle.stats and aggregated by MetricsAggregator.throttle.
+    """
+
+    adaptive: bool = False
+    """Whether the duty-cycle-aware token bucket is used."""
+
+    send_rate: float = 0.0
+    """Currently allowed commands per second (0.0 = unthrottled)."""
+
+    tokens: float = 0.0
+    """Commands that can currently be sent without delay."""
+
+    duty_cycle_level: float | None = None
+    """Highest reported DUTY_CYCLE_LEVEL in percent (None = not reported)."""
+
+    carrier_sense_level: float | None = None
+    """Highest reported CARRIER_SENSE_LEVEL in percent (None = not reported)."""
+
+    backoff_remaining: float = 0.0
+    """Seconds until commands are sent again after a backend fault."""
+
+    duty_cycle_faults: int = 0
+    """Number of INSUFFICIENT_DUTYCYCLE faults reported by the backend."""
+
+    transmission_pending_faults: int = 0
+    """Number of TRANSMISSION_PENDING faults reported by the backend."""
+
+    throttled_count: int = 0
+    """Number of commands that were delayed."""
+
+    coalesced_count: int = 0
+    """Number of queued commands replaced by a newer command for the same data point."""
+
+    queue_size: int = 0
+    """Number of commands currently waiting."""
+
+    @property
+    def backoff_active(self) -> bool:
+        """Return True if sending is paused after a backend fault."""
+        return self.backoff_remaining > 0.0
+
+    @property
+    def utilisation(self) -> float:
+        """Return the radio utilisation in percent (highest of duty cycle and carrier sense)."""
+        return max(self.duty_cycle_level or 0.0, self.carrier_sense_level or 0.0)
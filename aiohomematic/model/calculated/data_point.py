@@ -12,7 +12,6 @@ from typing import Final, Unpack, cast, override
 import weakref
 
 from aiohomematic import ccu_translations
-from aiohomematic.central.events import DataPointStateChangedEvent
 from aiohomematic.const import (
     INIT_DATETIME,
     CalculatedParameter,
@@ -282,6 +281,10 @@ class CalculatedDataPoint[ParameterT: ParamType](BaseDataPoint, CallbackDataPoin
             await dp.load_data_point_value(call_source=call_source, direct_call=direct_call)
         self.publish_data_point_updated_event()
 
+    def on_fields_changed(self, *, fields: frozenset[str]) -> None:
+        """Handle the source parameters that changed within one ingestion batch; publishes one update."""
+        self.publish_data_point_updated_event()
+
     def unsubscribe_from_data_point_updated(self) -> None:
         """Unsubscribe from all internal update subscriptions."""
         for unreg in self._unsubscribe_callbacks:
@@ -313,10 +316,11 @@ class CalculatedDataPoint[ParameterT: ParamType](BaseDataPoint, CallbackDataPoin
         ):
             self._data_points[key] = generic_data_point
             self._unsubscribe_callbacks.append(
-                self._event_bus_provider.event_bus.subscribe(
-                    event_type=DataPointStateChangedEvent,
-                    event_key=generic_data_point.unique_id,
-                    handler=lambda *, event: self.publish_data_point_updated_event(),  # noqa: PLW0108 - lambda discards event kwarg; publish_data_point_updated_event does not accept it  # pylint: disable=unnecessary-lambda
+                self._event_bus_provider.event_bus.data_point_notifier.subscribe_fields(
+                    unique_id=generic_data_point.unique_id,
+                    dependent_unique_id=self.unique_id,
+                    field=parameter,
+                    handler=self.on_fields_changed,
                 )
             )
             return cast(dpt, generic_data_point)  # type: ignore[valid-type]
@@ -368,10 +372,11 @@ class CalculatedDataPoint[ParameterT: ParamType](BaseDataPoint, CallbackDataPoin
         """Resolve a data point by parameter and paramset_key, returning DpDummy if not found."""
         if generic_data_point := self._channel.get_generic_data_point(parameter=parameter, paramset_key=paramset_key):
             self._unsubscribe_callbacks.append(
-                self._event_bus_provider.event_bus.subscribe(
-                    event_type=DataPointStateChangedEvent,
-                    event_key=generic_data_point.unique_id,
-                    handler=lambda *, event: self.publish_data_point_updated_event(),  # noqa: PLW0108 - lambda discards event kwarg; publish_data_point_updated_event does not accept it  # pylint: disable=unnecessary-lambda
+                self._event_bus_provider.event_bus.data_point_notifier.subscribe_fields(
+                    unique_id=generic_data_point.unique_id,
+                    dependent_unique_id=self.unique_id,
+                    field=parameter,
+                    handler=self.on_fields_changed,
                 )
             )
             return generic_data_point
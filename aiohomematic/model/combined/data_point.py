@@ -12,7 +12,6 @@ from typing import Final, Unpack, override
 import weakref
 
 from aiohomematic import ccu_translations
-from aiohomematic.central.events import DataPointStateChangedEvent
 from aiohomematic.const import (
     INIT_DATETIME,
     CallSource,
@@ -237,6 +236,10 @@ class CombinedDataPoint[ParameterT](BaseDataPoint, CallbackDataPointProtocol):
             await dp.load_data_point_value(call_source=call_source, direct_call=direct_call)
         self.publish_data_point_updated_event()
 
+    def on_fields_changed(self, *, fields: frozenset[str]) -> None:
+        """Handle the source parameters that changed within one ingestion batch; publishes one update."""
+        self.publish_data_point_updated_event()
+
     def unsubscribe_from_data_point_updated(self) -> None:
         """Unsubscribe from all internal update subscriptions."""
         for unreg in self._unsubscribe_callbacks:
@@ -283,9 +286,10 @@ class CombinedDataPoint[ParameterT](BaseDataPoint, CallbackDataPointProtocol):
         """Subscribe to a source data point's updates."""
         if not isinstance(data_point, DpDummy):
             self._unsubscribe_callbacks.append(
-                self._event_bus_provider.event_bus.subscribe(
-                    event_type=DataPointStateChangedEvent,
-                    event_key=data_point.unique_id,
-                    handler=lambda *, event: self.publish_data_point_updated_event(),  # noqa: PLW0108 - lambda discards event kwarg; publish_data_point_updated_event does not accept it  # pylint: disable=unnecessary-lambda
+                self._event_bus_provider.event_bus.data_point_notifier.subscribe_fields(
+                    unique_id=data_point.unique_id,
+                    dependent_unique_id=self.unique_id,
+                    field=data_point.parameter,
+                    handler=self.on_fields_changed,
                 )
             )
@@ -183,6 +183,8 @@ class BaseCustomDpClimate(CustomDataPoint):
     _dp_temperature_maximum: Final = DataPointField(field=Field.TEMPERATURE_MAXIMUM, dpt=DpFloat)
     _dp_temperature_minimum: Final = DataPointField(field=Field.TEMPERATURE_MINIMUM, dpt=DpFloat)
     _validity_relevant_fields: ClassVar[frozenset[Field]] = frozenset({Field.TEMPERATURE, Field.SETPOINT})
+    # Fields whose changes may switch into or out of manual mode (see _manu_temp_changed).
+    _manu_temp_fields: ClassVar[frozenset[Field]] = frozenset({Field.SETPOINT})
 
     def __init__(
         self,
@@ -306,6 +308,13 @@ class BaseCustomDpClimate(CustomDataPoint):
     async def enable_away_mode_by_duration(self, *, hours: int, away_temperature: float) -> None:
         """Enable the away mode by duration on thermostat."""
 
+    @override
+    def on_fields_changed(self, *, fields: frozenset[Field]) -> None:
+        """Track the manual target temperature before publishing one update for the batch."""
+        if not fields.isdisjoint(self._manu_temp_fields):
+            self._manu_temp_changed()
+        super().on_fields_changed(fields=fields)
+
     @override
     def is_state_change(self, **kwargs: Unpack[StateChangeArgs]) -> bool:
         """Check if the state changes due to kwargs."""
@@ -371,14 +380,6 @@ class BaseCustomDpClimate(CustomDataPoint):
         """Post action after initialisation of the data point fields."""
         super()._post_init()
 
-        self._unsubscribe_callbacks.append(
-            self._event_bus_provider.event_bus.subscribe(
-                event_type=DataPointStateChangedEvent,
-                event_key=self._dp_setpoint.unique_id,
-                handler=lambda *, event: self._manu_temp_changed(),  # noqa: PLW0108 - lambda discards event kwarg; _manu_temp_changed does not accept it  # pylint: disable=unnecessary-lambda
-            )
-        )
-
         for ch in self._device.channels.values():
             # subscribe to link-peer change events; store unsubscribe handle
             if (unreg := ch.subscribe_to_link_peer_changed(handler=self._on_link_peer_changed)) is not None:
@@ -470,6 +471,7 @@ class CustomDpRfThermostat(BaseCustomDpClimate):
     _validity_relevant_fields: ClassVar[frozenset[Field]] = frozenset(
         {Field.TEMPERATURE, Field.SETPOINT, Field.CONTROL_MODE}
     )
+    _manu_temp_fields: ClassVar[frozenset[Field]] = frozenset({Field.SETPOINT, Field.CONTROL_MODE})
 
     @property
     def _current_profile_name(self) -> ClimateProfile | None:
@@ -627,20 +629,6 @@ class CustomDpRfThermostat(BaseCustomDpClimate):
         if self.mode == ClimateMode.HEAT:
             self._old_manu_setpoint = self.target_temperature
 
-    @override
-    def _post_init(self) -> None:
-        """Post action after initialisation of the data point fields."""
-        super()._post_init()
-
-        # subscribe to control_mode updates to track manual target temp
-        self._unsubscribe_callbacks.append(
-            self._event_bus_provider.event_bus.subscribe(
-                event_type=DataPointStateChangedEvent,
-                event_key=self._dp_control_mode.unique_id,
-                handler=lambda *, event: self._manu_temp_changed(),  # noqa: PLW0108 - lambda discards event kwarg; _manu_temp_changed does not accept it  # pylint: disable=unnecessary-lambda
-            )
-        )
-
 
 def _party_mode_code(*, start: datetime, end: datetime, away_temperature: float) -> str:
     """
@@ -672,6 +660,7 @@ class CustomDpIpThermostat(BaseCustomDpClimate):
     _validity_relevant_fields: ClassVar[frozenset[Field]] = frozenset(
         {Field.TEMPERATURE, Field.SETPOINT, Field.SET_POINT_MODE}
     )
+    _manu_temp_fields: ClassVar[frozenset[Field]] = frozenset({Field.SETPOINT, Field.SET_POINT_MODE})
 
     optimum_start_stop: Final = DelegatedProperty[bool | None](path="_dp_optimum_start_stop.value")
     temperature_offset: Final = DelegatedProperty[float | None](path="_dp_temperature_offset.value")
@@ -871,20 +860,6 @@ class CustomDpIpThermostat(BaseCustomDpClimate):
         if self.mode == ClimateMode.HEAT:
             self._old_manu_setpoint = self.target_temperature
 
-    @override
-    def _post_init(self) -> None:
-        """Post action after initialisation of the data point fields."""
-        super()._post_init()
-
-        # subscribe to set_point_mode updates to track manual target temp
-        self._unsubscribe_callbacks.append(
-            self._event_bus_provider.event_bus.subscribe(
-                event_type=DataPointStateChangedEvent,
-                event_key=self._dp_set_point_mode.unique_id,
-                handler=lambda *, event: self._manu_temp_changed(),  # noqa: PLW0108 - lambda discards event kwarg; _manu_temp_changed does not accept it  # pylint: disable=unnecessary-lambda
-            )
-        )
-
 
 # =============================================================================
 # DeviceProfileRegistry Registration
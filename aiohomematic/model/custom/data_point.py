@@ -13,7 +13,6 @@ from typing import Any, ClassVar, Final, Unpack, override
 import weakref
 
 from aiohomematic import ccu_translations
-from aiohomematic.central.events import DataPointStateChangedEvent
 from aiohomematic.const import INIT_DATETIME, CallSource, DataPointKey, DataPointUsage, DeviceProfile, Field, Parameter
 from aiohomematic.decorators import inspector
 from aiohomematic.interfaces import ChannelProtocol, CustomDataPointProtocol, GenericDataPointProtocolAny
@@ -219,6 +218,10 @@ class CustomDataPoint(BaseDataPoint, CustomDataPointProtocol):
                 )
         self.publish_data_point_updated_event()
 
+    def on_fields_changed(self, *, fields: frozenset[Field]) -> None:
+        """Handle the fields that changed within one ingestion batch; publishes one update."""
+        self.publish_data_point_updated_event()
+
     def unsubscribe_from_data_point_updated(self) -> None:
         """Unregister all internal update handlers."""
         for unreg in self._unsubscribe_callbacks:
@@ -255,10 +258,11 @@ class CustomDataPoint(BaseDataPoint, CustomDataPointProtocol):
             data_point.force_usage(forced_usage=DataPointUsage.NO_CREATE)
 
         self._unsubscribe_callbacks.append(
-            self._event_bus_provider.event_bus.subscribe(
-                event_type=DataPointStateChangedEvent,
-                event_key=data_point.unique_id,
-                handler=lambda *, event: self.publish_data_point_updated_event(),  # noqa: PLW0108 - lambda discards event kwarg; publish_data_point_updated_event does not accept it  # pylint: disable=unnecessary-lambda
+            self._event_bus_provider.event_bus.data_point_notifier.subscribe_fields(
+                unique_id=data_point.unique_id,
+                dependent_unique_id=self.unique_id,
+                field=field,
+                handler=self.on_fields_changed,
             )
         )
         self._data_points[field] = data_point
@@ -150,7 +150,7 @@ class CustomDpTextDisplay(CustomDataPoint):
         # Warn if burst limit is active
         if self.burst_limit_warning:
             _LOGGER.warning(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.model.custom.text_display.send_text.burst_limit_warning",
                     full_name=self.full_name,
                 )
@@ -70,15 +70,14 @@ from inspect import getfullargspec
 import logging
 from typing import Any, Final, TypeAlias, TypeVar, cast, overload, override
 
-from aiohomematic import ccu_translations, i18n, support as hms
+from aiohomematic import i18n, support as hms
 from aiohomematic.async_support import loop_check
-from aiohomematic.central.events import DataPointStateChangedEvent, DeviceRemovedEvent, OptimisticRollbackEvent
+from aiohomematic.central.events import DeviceRemovedEvent, OptimisticRollbackEvent
 from aiohomematic.client.command_throttle import CommandPriority
 from aiohomematic.const import (
     _CATEGORY_TO_DATA_POINT_TYPE,
     _OPTIONAL_PARAMETERS,
     ACTION_DATA_POINT_CATEGORIES,
-    DEFAULT_MULTIPLIER,
     DP_KEY_VALUE,
     INIT_DATETIME,
     KEY_CHANNEL_OPERATION_MODE_VISIBILITY,
@@ -90,9 +89,7 @@ from aiohomematic.const import (
     DataPointType,
     DataPointUsage,
     EventData,
-    Flag,
     Operations,
-    Parameter,
     ParameterData,
     ParameterStatus,
     ParameterType,
@@ -100,8 +97,8 @@ from aiohomematic.const import (
     ProductGroup,
     Quantity,
     ServiceScope,
+    TaskCategory,
     ValueBehavior,
-    check_ignore_parameter_on_initial_load,
 )
 from aiohomematic.context import (
     RequestContext,
@@ -135,14 +132,8 @@ from aiohomematic.model.data_point_metadata import (
     get_quantity_metadata_by_unit,
 )
 from aiohomematic.model.optimistic import OptimisticValueTracker
-from aiohomematic.model.support import (
-    DataPointNameData,
-    DataPointPathData,
-    PathData,
-    convert_value,
-    generate_translation_key,
-    generate_unique_id,
-)
+from aiohomematic.model.parameter_spec import ParameterSpec, convert_parameter_value, get_parameter_spec
+from aiohomematic.model.support import DataPointNameData, DataPointPathData, PathData, generate_unique_id
 from aiohomematic.property_decorators import DelegatedProperty, _GenericProperty, hm_property
 from aiohomematic.support import log_boundary_error
 from aiohomematic.support.mixins import LogContextMixin
@@ -169,33 +160,6 @@ _CONFIGURABLE_CHANNEL: Final[tuple[str, ...]] = (
 _COLLECTOR_ARGUMENT_NAME: Final = "collector"
 CONTEXT_KEY_PRIORITY: Final = "command_priority"
 CONTEXT_KEY_PURGE_ADDRESSES: Final = "purge_addresses"
-_FIX_UNIT_REPLACE: Final[Mapping[str, str]] = {
-    '"': "",
-    "100%": "%",
-    "% rF": "%",
-    "degree": "°C",
-    "Lux": "lx",
-    "m3": "m³",
-}
-_FIX_UNIT_BY_PARAM: Final[Mapping[str, str]] = {
-    Parameter.ACTUAL_TEMPERATURE: "°C",
-    Parameter.CURRENT_ILLUMINATION: "lx",
-    Parameter.HUMIDITY: "%",
-    Parameter.ILLUMINATION: "lx",
-    Parameter.LEVEL: "%",
-    Parameter.MASS_CONCENTRATION_PM_10_24H_AVERAGE: "µg/m³",
-    Parameter.MASS_CONCENTRATION_PM_1_24H_AVERAGE: "µg/m³",
-    Parameter.MASS_CONCENTRATION_PM_2_5_24H_AVERAGE: "µg/m³",
-    Parameter.OPERATING_VOLTAGE: "V",
-    Parameter.RSSI_DEVICE: "dBm",
-    Parameter.RSSI_PEER: "dBm",
-    Parameter.SUNSHINE_DURATION: "min",
-    Parameter.WIND_DIRECTION: "°",
-    Parameter.WIND_DIRECTION_RANGE: "°",
-}
-_MULTIPLIER_UNIT: Final[Mapping[str, float]] = {
-    "100%": 100.0,
-}
 
 
 class CallbackDataPoint(ABC, CallbackDataPointProtocol, LogContextMixin):
@@ -430,26 +394,18 @@ class CallbackDataPoint(ABC, CallbackDataPointProtocol, LogContextMixin):
         if not self._should_publish_data_point_updated_callback:
             return
         self._published_event_at = datetime.now()
-
-        # Capture values for closure
-        _old_value = old_value
-        _new_value = new_value
-
-        async def _publish_event() -> None:
-            await self._event_bus_provider.event_bus.publish(
-                event=DataPointStateChangedEvent(
-                    timestamp=datetime.now(),
-                    unique_id=self.unique_id,
-                    old_value=_old_value,
-                    new_value=_new_value,
-                )
-            )
-
-        self._task_scheduler.create_task(
-            target=_publish_event,
-            name=f"publish-dp-updated-{self.unique_id}",
+        # Coalesced per loop tick: one DataPointStateChangedEvent per data point and tick.
+        self._event_bus_provider.event_bus.data_point_notifier.mark_changed(
+            unique_id=self.unique_id, old_value=old_value, new_value=new_value
         )
 
+    @loop_check
+    def publish_data_point_refreshed_event(self) -> None:
+        """Signal that the backend confirmed the unchanged value of the data point."""
+        if not self._should_publish_data_point_updated_callback:
+            return
+        self._event_bus_provider.event_bus.data_point_notifier.mark_refreshed(unique_id=self.unique_id)
+
     @loop_check
     def publish_device_removed_event(self) -> None:
         """Do what is needed when the data_point has been removed."""
@@ -468,6 +424,7 @@ class CallbackDataPoint(ABC, CallbackDataPointProtocol, LogContextMixin):
         self._task_scheduler.create_task(
             target=_publish_device_removed_and_cleanup,
             name=f"publish-device-removed-{self.unique_id}",
+            category=TaskCategory.CLEANUP,
         )
 
     def register(self) -> None:
@@ -644,37 +601,20 @@ class BaseParameterDataPoint[
         "_cached_quantity",
         "_cached_value_behavior",
         "_current_value",
-        "_default",
-        "_description",
-        "_enum_value_is_index",
-        "_ignore_on_initial_load",
         "_is_forced_sensor",
         "_is_un_ignored",
         "_last_non_default_value",
-        "_max",
-        "_min",
-        "_multiplier",
-        "_operations",
         "_optimistic",
         "_parameter",
         "_paramset_key",
-        "_raw_unit",
-        "_service",
-        "_special",
+        "_spec",
         "_state_uncertain",
         "_status_dpk",
         "_status_parameter",
         "_status_unsubscriber",
         "_status_value",
         "_status_value_list",
-        "_translation",
-        "_translation_key",
-        "_type",
         "_unconfirmed_value",
-        "_unit",
-        "_value_translations",
-        "_values",
-        "_visible",
     )
 
     def __init__(
@@ -690,8 +630,7 @@ class BaseParameterDataPoint[
         self._paramset_key: Final = paramset_key
         # required for name in BaseDataPoint
         self._parameter: Final[str] = parameter
-        self._translation_key: Final[str] = generate_translation_key(name=parameter)
-        self._ignore_on_initial_load: Final[bool] = check_ignore_parameter_on_initial_load(parameter=parameter)
+        self._spec: ParameterSpec = self._get_parameter_spec(channel=channel, parameter_data=parameter_data)
 
         super().__init__(
             channel=channel,
@@ -711,15 +650,6 @@ class BaseParameterDataPoint[
             parameter=self._parameter,
             custom_only=True,
         )
-        self._translation: Final[str | None] = ccu_translations.get_parameter_translation(
-            parameter=self._parameter,
-            channel_type=channel.type_name,
-            locale=channel.device.config_provider.config.locale,
-        )
-        self._description: Final[str | None] = ccu_translations.get_parameter_help(
-            parameter=self._parameter,
-            locale=channel.device.config_provider.config.locale,
-        )
         self._current_value: ParameterT | None = None
         self._last_non_default_value: ParameterT | None = None
         self._unconfirmed_value: ParameterT | None = None
@@ -729,20 +659,6 @@ class BaseParameterDataPoint[
 
         self._state_uncertain: bool = True
         self._is_forced_sensor: bool = False
-        self._assign_parameter_data(parameter_data=parameter_data)
-        self._value_translations: Final[dict[str, str | None] | None] = (
-            {
-                v: ccu_translations.get_parameter_value_translation(
-                    parameter=self._parameter,
-                    value=v,
-                    channel_type=channel.type_name,
-                    locale=channel.device.config_provider.config.locale,
-                )
-                for v in self._values
-            }
-            if self._values is not None
-            else None
-        )
 
         # Initialize STATUS parameter support
         self._status_parameter: str | None = self._detect_status_parameter()
@@ -769,29 +685,29 @@ class BaseParameterDataPoint[
             # Note: Subscription happens later after device is fully registered
             self._status_unsubscriber: CallableAny | None = None
 
-    default: Final = DelegatedProperty[ParameterT](path="_default")
-    description: Final = DelegatedProperty[str | None](path="_description")
-    hmtype: Final = DelegatedProperty[ParameterType](path="_type")
-    ignore_on_initial_load: Final = DelegatedProperty[bool](path="_ignore_on_initial_load")
+    default: Final = DelegatedProperty[ParameterT](path="_spec.default")
+    description: Final = DelegatedProperty[str | None](path="_spec.description")
+    hmtype: Final = DelegatedProperty[ParameterType](path="_spec.type")
+    ignore_on_initial_load: Final = DelegatedProperty[bool](path="_spec.ignore_on_initial_load")
     is_forced_sensor: Final = DelegatedProperty[bool](path="_is_forced_sensor")
     is_un_ignored: Final = DelegatedProperty[bool](path="_is_un_ignored")
     last_non_default_value: Final = DelegatedProperty[ParameterT | None](path="_last_non_default_value")
-    max: Final = DelegatedProperty[ParameterT](path="_max")
-    min: Final = DelegatedProperty[ParameterT](path="_min")
-    multiplier: Final = DelegatedProperty[float](path="_multiplier")
+    max: Final = DelegatedProperty[ParameterT](path="_spec.max")
+    min: Final = DelegatedProperty[ParameterT](path="_spec.min")
+    multiplier: Final = DelegatedProperty[float](path="_spec.multiplier")
     parameter: Final = DelegatedProperty[str](path="_parameter", log_context=True)
     paramset_key: Final = DelegatedProperty[ParamsetKey](path="_paramset_key")
-    raw_unit: Final = DelegatedProperty[str | None](path="_raw_unit")
-    service: Final = DelegatedProperty[bool](path="_service")
+    raw_unit: Final = DelegatedProperty[str | None](path="_spec.raw_unit")
+    service: Final = DelegatedProperty[bool](path="_spec.service")
     status: Final = DelegatedProperty[ParameterStatus | None](path="_status_value")
     status_dpk: Final = DelegatedProperty[DataPointKey | None](path="_status_dpk")
     status_parameter: Final = DelegatedProperty[str | None](path="_status_parameter")
-    translation: Final = DelegatedProperty[str | None](path="_translation")
-    translation_key: Final = DelegatedProperty[str](path="_translation_key")
-    unit: Final = DelegatedProperty[str | None](path="_unit")
-    value_translations: Final = DelegatedProperty[dict[str, str | None] | None](path="_value_translations")
-    values: Final = DelegatedProperty[tuple[str, ...] | None](path="_values")
-    visible: Final = DelegatedProperty[bool](path="_visible")
+    translation: Final = DelegatedProperty[str | None](path="_spec.translation")
+    translation_key: Final = DelegatedProperty[str](path="_spec.translation_key")
+    unit: Final = DelegatedProperty[str | None](path="_spec.unit")
+    value_translations: Final = DelegatedProperty[Mapping[str, str | None] | None](path="_spec.value_translations")
+    values: Final = DelegatedProperty[tuple[str, ...] | None](path="_spec.values")
+    visible: Final = DelegatedProperty[bool](path="_spec.visible")
 
     @property
     def _value(self) -> ParameterT | None:
@@ -806,7 +722,7 @@ class BaseParameterDataPoint[
     @property
     def has_events(self) -> bool:
         """Return, if data_point is supports events."""
-        return bool(self._operations & Operations.EVENT)
+        return bool(self._spec.operations & Operations.EVENT)
 
     @property
     def has_status_parameter(self) -> bool:
@@ -827,16 +743,16 @@ class BaseParameterDataPoint[
             return self._allows_none_value()
 
         # Type-specific validation
-        if self._type == ParameterType.BOOL:
+        if self._spec.type == ParameterType.BOOL:
             return isinstance(self._value, bool)
-        if self._type in (ParameterType.INTEGER, ParameterType.FLOAT):
+        if self._spec.type in (ParameterType.INTEGER, ParameterType.FLOAT):
             return isinstance(self._value, (int, float))
-        if self._type == ParameterType.STRING:
+        if self._spec.type == ParameterType.STRING:
             return isinstance(self._value, str)
-        if self._type == ParameterType.ENUM:
+        if self._spec.type == ParameterType.ENUM:
             # ENUM can be int (index) or string (value)
             return isinstance(self._value, (int, str))
-        if self._type == ParameterType.ACTION:
+        if self._spec.type == ParameterType.ACTION:
             # ACTION has no persistent value
             return True
 
@@ -850,7 +766,7 @@ class BaseParameterDataPoint[
     @property
     def is_readable(self) -> bool:
         """Return, if data_point is readable."""
-        return bool(self._operations & Operations.READ)
+        return bool(self._spec.operations & Operations.READ)
 
     @property
     def is_status_valid(self) -> bool:
@@ -863,7 +779,7 @@ class BaseParameterDataPoint[
     @property
     def is_unit_fixed(self) -> bool:
         """Return if the unit is fixed."""
-        return self._raw_unit != self._unit
+        return self._spec.raw_unit != self._spec.unit
 
     @property
     @override
@@ -901,21 +817,21 @@ class BaseParameterDataPoint[
             return True  # None handling is done in has_valid_value_type
 
         # ENUM validation
-        if self._type == ParameterType.ENUM and self._values is not None:
+        if self._spec.type == ParameterType.ENUM and self._spec.values is not None:
             if isinstance(self._value, int):
                 # Index-based enum (HM devices)
-                return 0 <= self._value < len(self._values)
+                return 0 <= self._value < len(self._spec.values)
             if isinstance(self._value, str):
                 # String-based enum (HmIP devices)
-                return self._value in self._values
+                return self._value in self._spec.values
             return False
 
         # Numeric range validation
-        if self._type in (ParameterType.INTEGER, ParameterType.FLOAT):
+        if self._spec.type in (ParameterType.INTEGER, ParameterType.FLOAT):
             # mypy doesn't understand that _value can't be None here due to check above
             value = cast(int | float, self._value)
-            min_val = cast(int | float, self._min) if self._min is not None else None
-            max_val = cast(int | float, self._max) if self._max is not None else None
+            min_val = cast(int | float, self._spec.min) if self._spec.min is not None else None
+            max_val = cast(int | float, self._spec.max) if self._spec.max is not None else None
             if min_val is not None and value < min_val:
                 return False
             return not (max_val is not None and value > max_val)
@@ -926,7 +842,7 @@ class BaseParameterDataPoint[
     @property
     def is_writable(self) -> bool:
         """Return, if data_point is writable."""
-        return False if self._is_forced_sensor else bool(self._operations & Operations.WRITE)
+        return False if self._is_forced_sensor else bool(self._spec.operations & Operations.WRITE)
 
     @property
     def optimistic_age(self) -> float | None:
@@ -1005,7 +921,7 @@ class BaseParameterDataPoint[
             return metadata.quantity
         if metadata := get_quantity_metadata_by_param(parameter=self._parameter):
             return metadata.quantity
-        if self._unit and (metadata := get_quantity_metadata_by_unit(unit=self._unit)):
+        if self._spec.unit and (metadata := get_quantity_metadata_by_unit(unit=self._spec.unit)):
             return metadata.quantity
         return None
 
@@ -1038,7 +954,7 @@ class BaseParameterDataPoint[
             return metadata.value_behavior
         if metadata := get_quantity_metadata_by_param(parameter=self._parameter):
             return metadata.value_behavior
-        if self._unit and (metadata := get_quantity_metadata_by_unit(unit=self._unit)):
+        if self._spec.unit and (metadata := get_quantity_metadata_by_unit(unit=self._spec.unit)):
             return metadata.value_behavior
         return None
 
@@ -1129,7 +1045,7 @@ class BaseParameterDataPoint[
     @inspector(re_raise=False)
     async def load_data_point_value(self, *, call_source: CallSource, direct_call: bool = False) -> None:
         """Initialize the data_point data."""
-        if (self._ignore_on_initial_load or self._channel.device.ignore_on_initial_load) and call_source in (
+        if (self._spec.ignore_on_initial_load or self._channel.device.ignore_on_initial_load) and call_source in (
             CallSource.HM_INIT,
             CallSource.HA_INIT,
         ):
@@ -1211,7 +1127,7 @@ class BaseParameterDataPoint[
         # Log rollback with age
         age = self._optimistic.age or 0.0
         _LOGGER.warning(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.model.data_point.optimistic_rollback",
                 full_name=self.full_name,
                 optimistic_value=self._optimistic.value,
@@ -1254,7 +1170,7 @@ class BaseParameterDataPoint[
             paramset_key=self._paramset_key,
             parameter=self._parameter,
         ):
-            self._assign_parameter_data(parameter_data=parameter_data)
+            self._spec = self._get_parameter_spec(channel=self._channel, parameter_data=parameter_data)
 
     def update_status(self, *, status_value: int | str) -> None:
         """Update the status from a STATUS parameter event only if changed."""
@@ -1298,8 +1214,18 @@ class BaseParameterDataPoint[
         self._unconfirmed_value = temp_value
         self.publish_data_point_updated_event(old_value=old_value, new_value=temp_value)
 
-    def write_value(self, *, value: Any, write_at: datetime) -> tuple[ParameterT | None, ParameterT | None]:
-        """Update value of the data_point."""
+    def write_value(
+        self, *, value: Any, write_at: datetime, confirms_write: bool = False
+    ) -> tuple[ParameterT | None, ParameterT | None]:
+        """
+        Update value of the data_point.
+
+        confirms_write marks a value that answers a write of this integration
+        (an optimistic value was pending). It is always published as a state
+        change, even if it equals the previous value, so that an optimistic
+        value shown by consumers is replaced and waiters for the confirmation
+        are released.
+        """
         self._reset_unconfirmed_value()
 
         old_value = self._current_value
@@ -1312,17 +1238,17 @@ class BaseParameterDataPoint[
         # Validate the converted value
         if (new_value := self._convert_value(value=value)) is not None:
             # Check range for numeric types
-            if self._type in (ParameterType.INTEGER, ParameterType.FLOAT):
+            if self._spec.type in (ParameterType.INTEGER, ParameterType.FLOAT):
                 # mypy doesn't understand that new_value can't be None here
                 val = cast(int | float, new_value)
-                min_val = cast(int | float, self._min) if self._min is not None else None
-                max_val = cast(int | float, self._max) if self._max is not None else None
+                min_val = cast(int | float, self._spec.min) if self._spec.min is not None else None
+                max_val = cast(int | float, self._spec.max) if self._spec.max is not None else None
                 if min_val is not None and val < min_val:
                     _LOGGER.debug(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.model.data_point.value_below_minimum",
                             value=new_value,
-                            minimum=self._min,
+                            minimum=self._spec.min,
                             interface_id=self._device.interface_id,
                             channel_address=self._channel.address,
                             parameter=self._parameter,
@@ -1331,21 +1257,21 @@ class BaseParameterDataPoint[
                     # Don't reject, but mark as potentially invalid
                 elif max_val is not None and val > max_val:
                     _LOGGER.debug(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.model.data_point.value_above_maximum",
                             value=new_value,
-                            maximum=self._max,
+                            maximum=self._spec.max,
                             interface_id=self._device.interface_id,
                             channel_address=self._channel.address,
                             parameter=self._parameter,
                         )
                     )
             # Check enum values
-            elif self._type == ParameterType.ENUM and self._values:
+            elif self._spec.type == ParameterType.ENUM and self._spec.values:
                 if isinstance(new_value, int):
-                    if new_value < 0 or new_value >= len(self._values):
+                    if new_value < 0 or new_value >= len(self._spec.values):
                         _LOGGER.debug(
-                            i18n.tr(
+                            i18n.lazy_tr(
                                 key="log.model.data_point.enum_index_out_of_range",
                                 index=new_value,
                                 interface_id=self._device.interface_id,
@@ -1353,9 +1279,9 @@ class BaseParameterDataPoint[
                                 parameter=self._parameter,
                             )
                         )
-                elif isinstance(new_value, str) and new_value not in self._values:
+                elif isinstance(new_value, str) and new_value not in self._spec.values:
                     _LOGGER.debug(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.model.data_point.enum_value_not_in_list",
                             value=new_value,
                             interface_id=self._device.interface_id,
@@ -1370,10 +1296,14 @@ class BaseParameterDataPoint[
             self._current_value = new_value
             # Track last user value: store new value only if it differs from default
             # This is used for "restore last value" scenarios (e.g., dimmer brightness)
-            if new_value != self._default:
+            if new_value != self._spec.default:
                 self._last_non_default_value = new_value
+        # A refresh that only confirms a certain value gets the cheaper refreshed signal.
+        if old_value == new_value and not self._state_uncertain and not confirms_write:
+            self.publish_data_point_refreshed_event()
+        else:
+            self.publish_data_point_updated_event(old_value=old_value, new_value=new_value)
         self._state_uncertain = False
-        self.publish_data_point_updated_event(old_value=old_value, new_value=new_value)
         return (old_value, new_value)
 
     def _allows_none_value(self) -> bool:
@@ -1386,7 +1316,7 @@ class BaseParameterDataPoint[
         - Specific known optional parameters (e.g., LEVEL_2 for blinds without slats)
         """
         # ACTION types don't have persistent values
-        if self._type == ParameterType.ACTION:
+        if self._spec.type == ParameterType.ACTION:
             return True
 
         # Check if parameter is in the known optional list
@@ -1395,65 +1325,15 @@ class BaseParameterDataPoint[
 
         # Check SPECIAL field for optional marker
         # All other cases: None is not valid
-        return bool(self._special and self._special.get("OPTIONAL"))
-
-    def _assign_parameter_data(self, *, parameter_data: ParameterData) -> None:
-        """Assign parameter data to instance variables."""
-        self._type: ParameterType = ParameterType(parameter_data["TYPE"])
-        self._values = tuple(parameter_data["VALUE_LIST"]) if parameter_data.get("VALUE_LIST") else None
-        # Determine if ENUM values should be sent as index (int) or string.
-        # HM devices use integer MIN/MAX/DEFAULT → send as index.
-        # HmIP devices use string MIN/MAX/DEFAULT → send as string.
-        raw_min = parameter_data["MIN"]
-        self._enum_value_is_index: bool = (
-            self._type == ParameterType.ENUM and self._values is not None and isinstance(raw_min, int)
-        )
-        self._max: ParameterT = self._convert_value(value=parameter_data["MAX"])
-        self._min: ParameterT = self._convert_value(value=raw_min)
-        self._default: ParameterT = self._convert_value(value=parameter_data.get("DEFAULT")) or self._min
-        flags: int = parameter_data["FLAGS"]
-        self._visible: bool = flags & Flag.VISIBLE == Flag.VISIBLE
-        self._service: bool = flags & Flag.SERVICE == Flag.SERVICE
-        self._operations: int = parameter_data["OPERATIONS"]
-        self._special: Mapping[str, Any] | None = parameter_data.get("SPECIAL")
-        self._raw_unit: str | None = parameter_data.get("UNIT")
-        self._unit: str | None = self._cleanup_unit(raw_unit=self._raw_unit)
-        self._multiplier: float = self._get_multiplier(raw_unit=self._raw_unit)
-
-    def _cleanup_unit(self, *, raw_unit: str | None) -> str | None:
-        """Replace given unit."""
-        if new_unit := _FIX_UNIT_BY_PARAM.get(self._parameter):
-            return new_unit
-        if not raw_unit:
-            return None
-        for check, fix in _FIX_UNIT_REPLACE.items():
-            if check in raw_unit:
-                return fix
-        return raw_unit
+        return bool(self._spec.special and self._spec.special.get("OPTIONAL"))
 
     def _convert_value(self, *, value: Any) -> ParameterT:
         """Convert to value to ParameterT."""
-        if value is None:
-            return None  # type: ignore[return-value]
-        # Handle empty strings from CCU for numeric types (e.g., "" for LEVEL_2 when no slats)
-        if value == "" and self._type in (ParameterType.FLOAT, ParameterType.INTEGER):
-            return None  # type: ignore[return-value]
         try:
-            if (
-                self._type == ParameterType.BOOL
-                and self._values is not None
-                and value is not None
-                and isinstance(value, str)
-            ):
-                return cast(
-                    ParameterT,
-                    convert_value(
-                        value=self._values.index(value),
-                        target_type=self._type,
-                        value_list=self.values,
-                    ),
-                )
-            return cast(ParameterT, convert_value(value=value, target_type=self._type, value_list=self.values))
+            return cast(
+                ParameterT,
+                convert_parameter_value(value=value, parameter_type=self._spec.type, values=self._spec.values),
+            )
         except ValueError, TypeError:  # pragma: no cover
             _LOGGER.debug(
                 "CONVERT_VALUE: conversion failed for %s, %s, %s, value: [%s]",
@@ -1485,13 +1365,17 @@ class BaseParameterDataPoint[
             pass
         return None
 
-    def _get_multiplier(self, *, raw_unit: str | None) -> float:
-        """Replace given unit."""
-        if not raw_unit:
-            return DEFAULT_MULTIPLIER
-        if multiplier := _MULTIPLIER_UNIT.get(raw_unit):
-            return multiplier
-        return DEFAULT_MULTIPLIER
+    def _get_parameter_spec(self, *, channel: ChannelProtocol, parameter_data: ParameterData) -> ParameterSpec:
+        """Return the shared spec of the parameter."""
+        return get_parameter_spec(
+            model=channel.device.model,
+            channel_no=channel.no,
+            channel_type=channel.type_name,
+            paramset_key=self._paramset_key,
+            parameter=self._parameter,
+            parameter_data=parameter_data,
+            locale=channel.device.config_provider.config.locale,
+        )
 
     @override
     def _get_path_data(self) -> PathData:
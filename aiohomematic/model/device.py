@@ -82,6 +82,7 @@ from aiohomematic.const import (
     DeviceDescription,
     DeviceFirmwareState,
     DeviceTriggerEventType,
+    ExecutorLane,
     ForcedDeviceAvailability,
     Interface,
     Manufacturer,
@@ -91,6 +92,7 @@ from aiohomematic.const import (
     ProductGroup,
     RxMode,
     ServiceScope,
+    TaskCategory,
     check_ignore_model_on_initial_load,
     get_link_source_categories,
     get_link_target_categories,
@@ -127,6 +129,7 @@ from aiohomematic.interfaces import (
     GenericEventProtocolAny,
     ParameterVisibilityProviderProtocol,
     ParamsetDescriptionProviderProtocol,
+    ScheduleCacheProtocol,
     ScheduleChannelSwitchProtocol,
     TaskSchedulerProtocol,
     WeekProfileDataPointProtocol,
@@ -262,6 +265,7 @@ class Device(DeviceProtocol, LogContextMixin):
         "_product_group",
         "_rooms",
         "_rx_modes",
+        "_schedule_cache",
         "_schedule_channel_switches",
         "_sub_model",
         "_task_scheduler",
@@ -294,6 +298,7 @@ class Device(DeviceProtocol, LogContextMixin):
         self._device_description_provider: Final = context.device_description_provider
         self._device_details_provider: Final = context.device_details_provider
         self._paramset_description_provider: Final = context.paramset_description_provider
+        self._schedule_cache: Final = context.schedule_cache
         self._parameter_visibility_provider: Final = context.parameter_visibility_provider
         self._event_bus_provider: Final = context.event_bus_provider
         self._event_publisher: Final = context.event_publisher
@@ -354,7 +359,7 @@ class Device(DeviceProtocol, LogContextMixin):
             try:
                 self._channels[address] = Channel(device=self, channel_address=address)
             except DescriptionNotFoundException:
-                _LOGGER.warning(i18n.tr(key="log.model.device.channel_description_not_found", address=address))
+                _LOGGER.warning(i18n.lazy_tr(key="log.model.device.channel_description_not_found", address=address))
         self._value_cache: Final[_ValueCache] = _ValueCache(device=self)
         self._availability: Final[_DeviceAvailability] = _DeviceAvailability(device=self)
         self._firmware: Final[_DeviceFirmware] = _DeviceFirmware(
@@ -425,6 +430,7 @@ class Device(DeviceProtocol, LogContextMixin):
     product_group: Final = DelegatedProperty[ProductGroup](path="_product_group")
     rooms: Final = DelegatedProperty[set[str]](path="_rooms")
     rx_modes: Final = DelegatedProperty[tuple[RxMode, ...]](path="_rx_modes")
+    schedule_cache: Final = DelegatedProperty[ScheduleCacheProtocol | None](path="_schedule_cache")
     sub_model: Final = DelegatedProperty[str | None](path="_sub_model")
     task_scheduler: Final = DelegatedProperty[TaskSchedulerProtocol](path="_task_scheduler")
     update_data_point: Final = DelegatedProperty[DpUpdate | None](path="_update_data_point")
@@ -786,7 +792,7 @@ class Device(DeviceProtocol, LogContextMixin):
             await self._update_data_point.on_config_changed()
 
         if self._week_profile:
-            await self._week_profile.reload_and_cache_schedule()
+            await self._week_profile.reload_and_cache_schedule(from_device=True)
 
         await self._file_operations.save_files(save_paramset_descriptions=True)
         self.publish_device_updated_event()
@@ -822,6 +828,7 @@ class Device(DeviceProtocol, LogContextMixin):
         self._task_scheduler.create_task(
             target=_publish_device_updated,
             name=f"device-updated-{self._address}",
+            category=TaskCategory.EVENT,
         )
 
     def refresh_firmware_data(self) -> None:
@@ -895,6 +902,7 @@ class Device(DeviceProtocol, LogContextMixin):
             self._task_scheduler.create_task(
                 target=_publish_availability_event,
                 name=f"availability-forced-{self._address}",
+                category=TaskCategory.EVENT,
             )
 
     def set_schedule_channel_switches(self, *, switches: tuple[ScheduleChannelSwitchProtocol, ...]) -> None:
@@ -1427,6 +1435,7 @@ class Channel(ChannelProtocol, LogContextMixin):
         self._device.task_scheduler.create_task(
             target=_publish_link_peer_changed,
             name=f"link-peer-changed-{self._address}",
+            category=TaskCategory.EVENT,
         )
 
     @inspector
@@ -1839,7 +1848,9 @@ class _DeviceFirmware:
                 )
             )
 
-        self._device.task_scheduler.create_task(target=_publish, name=f"firmware-updated-{self._device.address}")
+        self._device.task_scheduler.create_task(
+            target=_publish, name=f"firmware-updated-{self._device.address}", category=TaskCategory.EVENT
+        )
 
 
 class _ValueCache:
@@ -2101,6 +2112,7 @@ class _DefinitionExporter:
                     paramset_descriptions=anonymize_paramset_descriptions,
                 ),
                 name="export-device-definition",
+                lane=ExecutorLane.STORAGE,
             )
         else:
             await asyncio.to_thread(
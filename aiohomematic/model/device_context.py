@@ -33,6 +33,7 @@ if TYPE_CHECKING:
         FileOperationsProtocol,
         ParameterVisibilityProviderProtocol,
         ParamsetDescriptionProviderProtocol,
+        ScheduleCacheProtocol,
         TaskSchedulerProtocol,
     )
     from aiohomematic.interfaces.central import FirmwareDataRefresherProtocol
@@ -78,6 +79,9 @@ class DeviceContext:
 
     **Channel Discovery (1 protocol):**
         - channel_lookup: Channel lookup by address
+
+    **Optional Persistence (1 protocol):**
+        - schedule_cache: Persistent week profile schedules (None disables persistence)
     """
 
     # =========================================================================
@@ -125,3 +129,8 @@ class DeviceContext:
     # Channel Discovery (1 protocol)
     # =========================================================================
     channel_lookup: ChannelLookupProtocol
+
+    # =========================================================================
+    # Optional Persistence (1 protocol)
+    # =========================================================================
+    schedule_cache: ScheduleCacheProtocol | None = None
@@ -32,8 +32,8 @@ class DpAction(GenericDataPoint[None, Any]):
         """Prepare value before sending."""
         # For string-based ENUMs (HmIP), send the string value directly.
         # For index-based ENUMs (HM), convert string to index.
-        if self._values is not None and isinstance(value, str) and value in self._values:
-            if self._enum_value_is_index:
-                return get_index_of_value_from_value_list(value=value, value_list=self._values)
+        if self._spec.values is not None and isinstance(value, str) and value in self._spec.values:
+            if self._spec.enum_value_is_index:
+                return get_index_of_value_from_value_list(value=value, value_list=self._spec.values)
             return value
         return value
@@ -36,20 +36,20 @@ class DpActionSelect(GenericDataPoint[int | str | None, int | str]):
         if (value := get_value_from_value_list(value=self._value, value_list=self.values)) is not None:
             return value
         # For string-based ENUMs (HmIP), return the string value directly if valid.
-        if isinstance(self._value, str) and self._values is not None and self._value in self._values:
+        if isinstance(self._value, str) and self._spec.values is not None and self._value in self._spec.values:
             return self._value
-        return self._default
+        return self._spec.default
 
     def _prepare_value_for_sending(self, *, value: int | str, do_validate: bool = True) -> int | str:
         """Prepare value before sending with validation against value_list."""
         # We allow setting the value via index as well, just in case.
-        if isinstance(value, int | float) and self._values and 0 <= value < len(self._values):
+        if isinstance(value, int | float) and self._spec.values and 0 <= value < len(self._spec.values):
             return int(value)
-        if self._values and value in self._values:
+        if self._spec.values and value in self._spec.values:
             # For string-based ENUMs (HmIP), send the string value directly.
             # For index-based ENUMs (HM), convert string to index.
-            if self._enum_value_is_index:
-                return self._values.index(value)
+            if self._spec.enum_value_is_index:
+                return self._spec.values.index(value)
             return str(value)
         raise ValidationException(
             i18n.tr(
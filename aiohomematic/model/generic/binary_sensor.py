@@ -25,4 +25,4 @@ class DpBinarySensor(GenericDataPoint[bool | None, bool]):
         """Return the value for readings."""
         if self._value is not None:
             return self._value
-        return self._default
+        return self._spec.default
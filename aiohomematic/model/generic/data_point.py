@@ -73,7 +73,9 @@ class GenericDataPoint[ParameterT: ParamType, InputParameterT: ParamType](
     async def event(self, *, value: Any, received_at: datetime) -> None:
         """Handle event for which this data_point has subscribed."""
         # PHASE 3: CCU CONFIRMATION - Handle optimistic value confirmation
-        if self._optimistic.is_active and self._optimistic.confirm_one():
+        # A value received while an optimistic value is pending answers our write.
+        confirms_write = self._optimistic.is_active
+        if confirms_write and self._optimistic.confirm_one():
             # Final confirmation — evaluate mismatch and clear state
 
             # Check for value mismatch (round floats to 2 decimals to avoid
@@ -82,7 +84,7 @@ class GenericDataPoint[ParameterT: ParamType, InputParameterT: ParamType](
             # CCU value is authoritative and silently accepted (not a real rollback).
             if self._values_mismatch(optimistic=self._optimistic.value, actual=value):
                 _LOGGER.debug(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.model.data_point.optimistic_mismatch",
                         full_name=self.full_name,
                         expected=self._optimistic.value,
@@ -98,7 +100,7 @@ class GenericDataPoint[ParameterT: ParamType, InputParameterT: ParamType](
             dpk=self.dpk,
             value=value,
         )
-        old_value, new_value = self.write_value(value=value, write_at=received_at)
+        old_value, new_value = self.write_value(value=value, write_at=received_at, confirms_write=confirms_write)
         if old_value == new_value:
             return
 
@@ -148,7 +150,7 @@ class GenericDataPoint[ParameterT: ParamType, InputParameterT: ParamType](
         """Send value to ccu, or use collector if set."""
         if not self.is_writable:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="log.model.generic_data_point.send_value.not_writable",
                     full_name=self.full_name,
                 )
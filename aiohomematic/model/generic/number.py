@@ -30,18 +30,20 @@ class BaseDpNumber[NumberParameterT: int | float | None](GenericDataPoint[Number
     ) -> NumberParameterT:
         """Prepare value before sending."""
         if not do_validate or (
-            value is not None and isinstance(value, int | float) and self._min <= type_converter(value) <= self._max
+            value is not None
+            and isinstance(value, int | float)
+            and self._spec.min <= type_converter(value) <= self._spec.max
         ):
             return cast(NumberParameterT, type_converter(value))
-        if self._special and isinstance(value, str) and value in self._special:
-            return cast(NumberParameterT, type_converter(self._special[value]))
+        if self._spec.special and isinstance(value, str) and value in self._spec.special:
+            return cast(NumberParameterT, type_converter(self._spec.special[value]))
         raise ValidationException(
             i18n.tr(
                 key="exception.model.number.invalid_value",
                 value=value,
-                min=self._min,
-                max=self._max,
-                special=self._special,
+                min=self._spec.min,
+                max=self._spec.max,
+                special=self._spec.special,
             )
         )
 
@@ -42,7 +42,7 @@ class DpSensor[SensorT: float | int | str | None](SensorValueMixin, GenericDataP
                 raw_value=self._value,
                 value_list=self.values,
                 check_name=self.name,
-                is_string=self._type == ParameterType.STRING,
+                is_string=self._spec.type == ParameterType.STRING,
             ),
         )
 
@@ -47,6 +47,6 @@ class DpSwitch(GenericDataPoint[bool | None, bool]):
 
     def _get_value(self) -> bool | None:
         """Return the value for readings."""
-        if self._type == ParameterType.ACTION:
+        if self._spec.type == ParameterType.ACTION:
             return False
         return self._value
@@ -28,4 +28,4 @@ class DpText(GenericDataPoint[str, str]):
         """Return the value for readings."""
         if (val := check_length_and_log(name=self.name, value=self._value)) is not None:
             return cast(str, val)
-        return self._default
+        return self._spec.default
@@ -24,10 +24,15 @@ Key responsibilities
 
 Data flow
 ---------
-1. Hub.fetch_*_data methods retrieve data from the primary client
-2. Existing data points are updated or new ones created as needed
-3. Removed items are cleaned up from the data point manager
-4. HUB_REFRESHED events notify consumers of new data points
+1. Hub.fetch_hub_data retrieves programs, system variables, inbox, service and
+   alarm messages with one hub snapshot from the primary client; the
+   Hub.fetch_*_data methods retrieve a single category (fallback and manual refresh)
+2. System variables are polled as delta: only values changed since the last
+   poll are read, and a full fetch runs only when the checksum over the
+   system variable ids and metadata changes
+3. Existing data points are updated or new ones created as needed
+4. Removed items are cleaned up from the data point manager
+5. HUB_REFRESHED events notify consumers of new data points
 
 Concurrency
 -----------
@@ -44,17 +49,23 @@ from typing import Final, NamedTuple
 from aiohomematic.central.events.types import ClientStateChangedEvent
 from aiohomematic.const import (
     HUB_CATEGORIES,
+    AlarmMessageData,
     Backend,
     DataPointCategory,
+    DataRefreshType,
     HubValueType,
+    InboxDeviceData,
     InstallModeData,
     Interface,
     ProgramData,
+    ServiceMessageData,
     ServiceScope,
     SystemEventType,
+    SystemVariableChangesData,
     SystemVariableData,
 )
 from aiohomematic.decorators import inspector
+from aiohomematic.exceptions import BaseHomematicException
 from aiohomematic.interfaces.central import (
     CentralInfoProtocol,
     ChannelLookupProtocol,
@@ -66,7 +77,7 @@ from aiohomematic.interfaces.central import (
     HubDataPointManagerProtocol,
     MetricsProviderProtocol,
 )
-from aiohomematic.interfaces.client import ClientProviderProtocol, PrimaryClientProviderProtocol
+from aiohomematic.interfaces.client import ClientProtocol, ClientProviderProtocol, PrimaryClientProviderProtocol
 from aiohomematic.interfaces.model import GenericHubDataPointProtocol, HubProtocol
 from aiohomematic.interfaces.operations import (
     ParameterVisibilityProviderProtocol,
@@ -89,6 +100,7 @@ from aiohomematic.model.hub.switch import ProgramDpSwitch, SysvarDpSwitch
 from aiohomematic.model.hub.text import SysvarDpText
 from aiohomematic.model.hub.update import HmUpdate
 from aiohomematic.property_decorators import DelegatedProperty
+from aiohomematic.support import extract_exc_args
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -151,6 +163,8 @@ class Hub(HubProtocol):
         "_sema_fetch_sysvars",
         "_sema_fetch_update",
         "_service_messages_dp",
+        "_sysvar_changes_since",
+        "_sysvar_checksum",
         "_task_scheduler",
         "_unsubscribers",
         "_update_dp",
@@ -202,6 +216,8 @@ class Hub(HubProtocol):
         self._install_mode_dps: dict[Interface, InstallModeDpType] = {}
         self._metrics_dps: MetricsDpType | None = None
         self._connectivity_dps: dict[str, ConnectivityDpType] = {}
+        self._sysvar_changes_since: int = 0
+        self._sysvar_checksum: str | None = None
         self._unsubscribers: list[Callable[[], None]] = []
 
     alarm_messages_dp: Final = DelegatedProperty[HmAlarmMessagesSensor | None](path="_alarm_messages_dp")
@@ -346,6 +362,66 @@ class Hub(HubProtocol):
         for connectivity_dp in self._connectivity_dps.values():
             connectivity_dp.sensor.refresh(write_at=write_at)
 
+    @inspector(re_raise=False, no_raise_return=frozenset(), scope=ServiceScope.INTERNAL)
+    async def fetch_hub_data(self, *, scheduled: bool) -> frozenset[DataRefreshType] | None:
+        """
+        Fetch programs, sysvars, inbox, service and alarm messages with one hub snapshot.
+
+        The snapshot replaces five separate ReGa script runs per scan interval. Its
+        sections are passed to the same update methods the separate fetches use.
+        Returns the refreshed data categories, which are empty if the fetch failed.
+        Returns None if the backend provides no snapshot, so the caller falls back
+        to the separate fetch methods.
+        """
+        if self._central_info.model is not Backend.CCU:
+            return None
+        # Check primary client availability instead of central availability
+        # to allow hub operations when secondary clients (e.g., CUxD) fail
+        if not (client := self._primary_client_provider.primary_client) or not client.available:
+            return None
+        _LOGGER.debug(
+            "FETCH_HUB_DATA: %s fetching of hub snapshot for %s",
+            "Scheduled" if scheduled else "Manual",
+            self._central_info.name,
+        )
+        config = self._config_provider.config
+        # The snapshot carries the changed sysvar values; system variables are only read in full
+        # if the checksum over their metadata differs from the one of the last full fetch.
+        if (
+            snapshot := await client.get_hub_snapshot(
+                program_markers=config.program_markers if config.enable_program_scan else None,
+                sysvar_markers=config.sysvar_markers if config.enable_sysvar_scan else None,
+                sysvar_since=self._sysvar_changes_since,
+                sysvar_checksum=self._sysvar_checksum,
+            )
+        ) is None:
+            return None
+
+        refreshed: set[DataRefreshType] = set()
+        if snapshot.programs is not None:
+            async with self._sema_fetch_programs:
+                await self._update_program_data_points(programs=snapshot.programs)
+            refreshed.add(DataRefreshType.PROGRAM)
+        if snapshot.system_variables is not None:
+            async with self._sema_fetch_sysvars:
+                await self._update_sysvar_data_points(
+                    variables=snapshot.system_variables, changes=snapshot.system_variable_changes
+                )
+            refreshed.add(DataRefreshType.SYSVAR)
+        elif snapshot.system_variable_changes is not None:
+            async with self._sema_fetch_sysvars:
+                self._apply_sysvar_changes(changes=snapshot.system_variable_changes)
+            refreshed.add(DataRefreshType.SYSVAR)
+        if self._central_info.available:
+            async with self._sema_fetch_inbox:
+                await self._update_inbox_data_point(devices=snapshot.inbox_devices)
+            async with self._sema_fetch_service_messages:
+                await self._update_service_messages_data_point(messages=snapshot.service_messages)
+            async with self._sema_fetch_alarm_messages:
+                await self._update_alarm_messages_data_point(alarms=snapshot.alarm_messages)
+            refreshed.update((DataRefreshType.INBOX, DataRefreshType.SERVICE_MESSAGES, DataRefreshType.ALARM_MESSAGES))
+        return frozenset(refreshed)
+
     @inspector(re_raise=False, scope=ServiceScope.INTERNAL)
     async def fetch_inbox_data(self, *, scheduled: bool) -> None:
         """Fetch inbox data for the hub."""
@@ -460,7 +536,9 @@ class Hub(HubProtocol):
                 # Check primary client availability instead of central availability
                 # to allow hub operations when secondary clients (e.g., CUxD) fail
                 if (client := self._primary_client_provider.primary_client) and client.available:
-                    await self._update_sysvar_data_points()
+                    changes = await self._fetch_sysvar_changes(client=client)
+                    if changes is None or not self._apply_sysvar_changes(changes=changes):
+                        await self._update_sysvar_data_points(changes=changes)
 
     def init_connectivity(self) -> Mapping[str, ConnectivityDpType]:
         """
@@ -565,6 +643,38 @@ class Hub(HubProtocol):
             new_data_points=_get_new_hub_data_points(data_points=data_points),
         )
 
+    def _apply_sysvar_changes(self, *, changes: SystemVariableChangesData) -> bool:
+        """
+        Write the changed sysvar values of a delta poll to their data points.
+
+        Returns False without writing if the checksum differs from the one of the last
+        full fetch, because then system variables were added, removed or modified and
+        a full fetch is required.
+        """
+        if changes.checksum != self._sysvar_checksum:
+            return False
+        _LOGGER.debug(
+            "APPLY_SYSVAR_CHANGES: %i changed sysvars received for %s",
+            len(changes.values),
+            self._central_info.name,
+        )
+        write_at = datetime.now()
+        for vid, raw_value in changes.values.items():
+            if dp := self._hub_data_point_manager.get_sysvar_data_point(vid=vid):
+                try:
+                    dp.write_value(value=raw_value, write_at=write_at)
+                except (TypeError, ValueError) as err:
+                    # One unparsable value must not block the other changes of the poll
+                    _LOGGER.debug(
+                        "APPLY_SYSVAR_CHANGES: Unable to parse value %s of sysvar %s for %s: %s",
+                        raw_value,
+                        vid,
+                        self._central_info.name,
+                        extract_exc_args(exc=err),
+                    )
+        self._sysvar_changes_since = changes.timestamp
+        return True
+
     def _create_install_mode_dp_for_interface(self, *, interface: Interface) -> InstallModeDpType | None:
         """Create install mode data points for a specific interface."""
         if interface in self._install_mode_dps:
@@ -685,6 +795,18 @@ class Hub(HubProtocol):
 
         return SysvarDpSensor(**protocols)  # type: ignore[arg-type]
 
+    async def _fetch_sysvar_changes(self, *, client: ClientProtocol) -> SystemVariableChangesData | None:
+        """Return the sysvar changes since the last poll, or None if a full fetch is required."""
+        try:
+            return await client.get_system_variable_changes(since=self._sysvar_changes_since)
+        except BaseHomematicException as bhexc:
+            _LOGGER.debug(
+                "FETCH_SYSVAR_CHANGES: Delta poll failed for %s, falling back to full fetch: %s",
+                self._central_info.name,
+                extract_exc_args(exc=bhexc),
+            )
+            return None
+
     def _identify_missing_program_ids(self, *, programs: tuple[ProgramData, ...]) -> set[str]:
         """Identify missing programs."""
         return {
@@ -732,12 +854,13 @@ class Hub(HubProtocol):
         for vid in del_data_point_ids:
             self._hub_data_point_manager.remove_sysvar_data_point(vid=vid)
 
-    async def _update_alarm_messages_data_point(self) -> None:
-        """Retrieve alarm messages and update the data point."""
-        if not (client := self._primary_client_provider.primary_client):
-            return
+    async def _update_alarm_messages_data_point(self, *, alarms: tuple[AlarmMessageData, ...] | None = None) -> None:
+        """Update the alarm messages data point, retrieving the alarms unless provided by a hub snapshot."""
+        if alarms is None:
+            if not (client := self._primary_client_provider.primary_client):
+                return
+            alarms = await client.get_alarm_messages()
 
-        alarms = await client.get_alarm_messages()
         is_new = False
 
         if self._alarm_messages_dp is None:
@@ -760,12 +883,13 @@ class Hub(HubProtocol):
                 new_data_points=_get_new_hub_data_points(data_points=[self._alarm_messages_dp]),
             )
 
-    async def _update_inbox_data_point(self) -> None:
-        """Retrieve inbox devices and update the data point."""
-        if not (client := self._primary_client_provider.primary_client):
-            return
+    async def _update_inbox_data_point(self, *, devices: tuple[InboxDeviceData, ...] | None = None) -> None:
+        """Update the inbox data point, retrieving the devices unless provided by a hub snapshot."""
+        if devices is None:
+            if not (client := self._primary_client_provider.primary_client):
+                return
+            devices = await client.get_inbox_devices()
 
-        devices = await client.get_inbox_devices()
         is_new = False
 
         if self._inbox_dp is None:
@@ -788,11 +912,13 @@ class Hub(HubProtocol):
                 new_data_points=_get_new_hub_data_points(data_points=[self._inbox_dp]),
             )
 
-    async def _update_program_data_points(self) -> None:
-        """Retrieve all program data and update program values."""
-        if not (client := self._primary_client_provider.primary_client):
-            return
-        if not (programs := await client.get_all_programs(markers=self._config_provider.config.program_markers)):
+    async def _update_program_data_points(self, *, programs: tuple[ProgramData, ...] | None = None) -> None:
+        """Update program values, retrieving all program data unless provided by a hub snapshot."""
+        if programs is None:
+            if not (client := self._primary_client_provider.primary_client):
+                return
+            programs = await client.get_all_programs(markers=self._config_provider.config.program_markers)
+        if not programs:
             _LOGGER.debug("UPDATE_PROGRAM_DATA_POINTS: Unable to retrieve programs for %s", self._central_info.name)
             return
 
@@ -822,12 +948,15 @@ class Hub(HubProtocol):
                 new_data_points=_get_new_hub_data_points(data_points=new_programs),
             )
 
-    async def _update_service_messages_data_point(self) -> None:
-        """Retrieve service messages and update the data point."""
-        if not (client := self._primary_client_provider.primary_client):
-            return
+    async def _update_service_messages_data_point(
+        self, *, messages: tuple[ServiceMessageData, ...] | None = None
+    ) -> None:
+        """Update the service messages data point, retrieving the messages unless provided by a hub snapshot."""
+        if messages is None:
+            if not (client := self._primary_client_provider.primary_client):
+                return
+            messages = await client.get_service_messages()
 
-        messages = await client.get_service_messages()
         is_new = False
 
         if self._service_messages_dp is None:
@@ -893,13 +1022,23 @@ class Hub(HubProtocol):
                 new_data_points=_get_new_hub_data_points(data_points=[self._update_dp]),
             )
 
-    async def _update_sysvar_data_points(self) -> None:
-        """Retrieve all variable data and update hmvariable values."""
-        if not (client := self._primary_client_provider.primary_client):
-            return
-        if (
-            variables := await client.get_all_system_variables(markers=self._config_provider.config.sysvar_markers)
-        ) is None:
+    async def _update_sysvar_data_points(
+        self,
+        *,
+        variables: tuple[SystemVariableData, ...] | None = None,
+        changes: SystemVariableChangesData | None = None,
+    ) -> None:
+        """
+        Update hmvariable values, retrieving all variable data unless provided by a hub snapshot.
+
+        The checksum and timestamp of the delta poll that triggered the full fetch become
+        the baseline for the following delta polls.
+        """
+        if variables is None:
+            if not (client := self._primary_client_provider.primary_client):
+                return
+            variables = await client.get_all_system_variables(markers=self._config_provider.config.sysvar_markers)
+        if variables is None:
             _LOGGER.debug("UPDATE_SYSVAR_DATA_POINTS: Unable to retrieve sysvars for %s", self._central_info.name)
             return
 
@@ -925,6 +1064,10 @@ class Hub(HubProtocol):
             else:
                 new_sysvars.append(self._create_system_variable(data=sysvar))
 
+        if changes is not None:
+            self._sysvar_checksum = changes.checksum
+            self._sysvar_changes_since = changes.timestamp
+
         if new_sysvars:
             self._event_publisher.publish_system_event(
                 system_event=SystemEventType.HUB_REFRESHED,
@@ -29,7 +29,7 @@ class SysvarDpNumber(GenericSysvarDataPoint):
                 await super().send_variable(value=value)
             else:
                 _LOGGER.error(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="exception.model.hub.number.invalid_value",
                         value=value,
                         min=self.min,
@@ -42,7 +42,7 @@ class SysvarDpSelect(GenericSysvarDataPoint):
                 await super().send_variable(value=self._values.index(value))
         else:
             _LOGGER.error(
-                i18n.tr(
+                i18n.lazy_tr(
                     key="exception.model.select.value_not_in_value_list",
                     name=self.name,
                     unique_id=self.unique_id,
@@ -188,7 +188,7 @@ class HmUpdate(CallbackDataPoint, GenericHubDataPointProtocol):
 
                         if update_info and update_info.current_firmware != self._version_before_update:
                             _LOGGER.info(
-                                i18n.tr(
+                                i18n.lazy_tr(
                                     key="log.model.hub.update.progress_completed",
                                     old_version=self._version_before_update,
                                     new_version=update_info.current_firmware,
@@ -204,14 +204,14 @@ class HmUpdate(CallbackDataPoint, GenericHubDataPointProtocol):
                             break
                     except Exception as err:  # noqa: BLE001 - CCU may be offline during reboot; continue polling until timeout
                         _LOGGER.debug(
-                            i18n.tr(
+                            i18n.lazy_tr(
                                 key="log.model.hub.update.progress_poll_error",
                                 error=str(err),
                             )
                         )
             else:
                 _LOGGER.warning(
-                    i18n.tr(
+                    i18n.lazy_tr(
                         key="log.model.hub.update.progress_timeout",
                         timeout=self._config_provider.config.schedule_timer_config.system_update_progress_timeout,
                     )
@@ -0,0 +1,273 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Shared parameter metadata of parameter-backed data points.
+
+Every generic data point and event describes one parameter of a channel. The
+metadata derived from the paramset description (type, limits, value list,
+unit, flags, operations, translations) is identical for all channels of the
+same model. Large installations contain the same thermostat or switch model
+dozens of times, so keeping a copy per data point wastes memory and time.
+
+ParameterSpec holds this metadata as an immutable flyweight. get_parameter_spec
+returns one shared instance per (model, channel no, paramset key, parameter,
+paramset description, channel type, locale); data points only keep a reference
+next to their address, value and timestamps. Specs are held weakly and
+disappear together with the last data point using them.
+
+Public API of this module is defined by __all__.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import logging
+from types import MappingProxyType
+from typing import Any, Final
+from weakref import WeakValueDictionary
+
+from aiohomematic import ccu_translations
+from aiohomematic.const import (
+    DEFAULT_MULTIPLIER,
+    Flag,
+    Parameter,
+    ParameterData,
+    ParameterType,
+    ParamsetKey,
+    check_ignore_parameter_on_initial_load,
+)
+from aiohomematic.model.support import convert_value, generate_translation_key
+
+__all__ = [
+    "ParameterSpec",
+    "convert_parameter_value",
+    "get_parameter_spec",
+    "parameter_spec_count",
+]
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_FIX_UNIT_REPLACE: Final[Mapping[str, str]] = {
+    '"': "",
+    "100%": "%",
+    "% rF": "%",
+    "degree": "°C",
+    "Lux": "lx",
+    "m3": "m³",
+}
+_FIX_UNIT_BY_PARAM: Final[Mapping[str, str]] = {
+    Parameter.ACTUAL_TEMPERATURE: "°C",
+    Parameter.CURRENT_ILLUMINATION: "lx",
+    Parameter.HUMIDITY: "%",
+    Parameter.ILLUMINATION: "lx",
+    Parameter.LEVEL: "%",
+    Parameter.MASS_CONCENTRATION_PM_10_24H_AVERAGE: "µg/m³",
+    Parameter.MASS_CONCENTRATION_PM_1_24H_AVERAGE: "µg/m³",
+    Parameter.MASS_CONCENTRATION_PM_2_5_24H_AVERAGE: "µg/m³",
+    Parameter.OPERATING_VOLTAGE: "V",
+    Parameter.RSSI_DEVICE: "dBm",
+    Parameter.RSSI_PEER: "dBm",
+    Parameter.SUNSHINE_DURATION: "min",
+    Parameter.WIND_DIRECTION: "°",
+    Parameter.WIND_DIRECTION_RANGE: "°",
+}
+_MULTIPLIER_UNIT: Final[Mapping[str, float]] = {
+    "100%": 100.0,
+}
+
+_SpecKey = tuple[str, int | None, ParamsetKey, str, str | None, str, tuple[Any, ...]]
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class ParameterSpec:
+    """Immutable parameter metadata shared by all data points of the same model parameter."""
+
+    parameter: str
+    """Parameter name."""
+
+    type: ParameterType
+    """Parameter type from the paramset description."""
+
+    values: tuple[str, ...] | None
+    """Value list of ENUM (and retyped) parameters."""
+
+    enum_value_is_index: bool
+    """Whether ENUM values are sent as index (HM) instead of string (HmIP)."""
+
+    min: Any
+    """Converted minimum."""
+
+    max: Any
+    """Converted maximum."""
+
+    default: Any
+    """Converted default (falls back to the minimum)."""
+
+    visible: bool
+    """Whether the VISIBLE flag is set."""
+
+    service: bool
+    """Whether the SERVICE flag is set."""
+
+    operations: int
+    """Operations bit mask (read, write, event)."""
+
+    special: Mapping[str, Any] | None
+    """Special values from the paramset description."""
+
+    raw_unit: str | None
+    """Unit as reported by the backend."""
+
+    unit: str | None
+    """Cleaned up unit."""
+
+    multiplier: float
+    """Multiplier derived from the raw unit."""
+
+    translation_key: str
+    """Translation key of the parameter."""
+
+    ignore_on_initial_load: bool
+    """Whether the parameter is skipped on the initial load."""
+
+    translation: str | None
+    """Translated parameter name for the channel type and locale."""
+
+    description: str | None
+    """Translated parameter help for the locale."""
+
+    value_translations: Mapping[str, str | None] | None
+    """Translated values of the value list (read-only, shared between data points)."""
+
+
+_SPECS: Final[WeakValueDictionary[_SpecKey, ParameterSpec]] = WeakValueDictionary()
+
+
+def convert_parameter_value(*, value: Any, parameter_type: ParameterType, values: tuple[str, ...] | None) -> Any:
+    """
+    Convert a value to the type of a parameter.
+
+    Raise ValueError or TypeError if the value cannot be converted.
+    """
+    if value is None:
+        return None
+    # Handle empty strings from CCU for numeric types (e.g., "" for LEVEL_2 when no slats)
+    if value == "" and parameter_type in (ParameterType.FLOAT, ParameterType.INTEGER):
+        return None
+    if parameter_type == ParameterType.BOOL and values is not None and isinstance(value, str):
+        return convert_value(value=values.index(value), target_type=parameter_type, value_list=values)
+    return convert_value(value=value, target_type=parameter_type, value_list=values)
+
+
+def get_parameter_spec(
+    *,
+    model: str,
+    channel_no: int | None,
+    channel_type: str | None,
+    paramset_key: ParamsetKey,
+    parameter: str,
+    parameter_data: ParameterData,
+    locale: str,
+) -> ParameterSpec:
+    """Return the shared spec of a parameter, creating it on first use."""
+    key: _SpecKey = (
+        model,
+        channel_no,
+        paramset_key,
+        parameter,
+        channel_type,
+        locale,
+        _freeze(value=parameter_data),
+    )
+    if (spec := _SPECS.get(key)) is None:
+        spec = _SPECS[key] = _create_parameter_spec(
+            channel_type=channel_type, parameter=parameter, parameter_data=parameter_data, locale=locale
+        )
+    return spec
+
+
+def parameter_spec_count() -> int:
+    """Return the number of parameter specs currently in use."""
+    return len(_SPECS)
+
+
+def _cleanup_unit(*, parameter: str, raw_unit: str | None) -> str | None:
+    """Replace given unit."""
+    if new_unit := _FIX_UNIT_BY_PARAM.get(parameter):
+        return new_unit
+    if not raw_unit:
+        return None
+    for check, fix in _FIX_UNIT_REPLACE.items():
+        if check in raw_unit:
+            return fix
+    return raw_unit
+
+
+def _create_parameter_spec(
+    *, channel_type: str | None, parameter: str, parameter_data: ParameterData, locale: str
+) -> ParameterSpec:
+    """Derive the spec of a parameter from its paramset description."""
+    parameter_type = ParameterType(parameter_data["TYPE"])
+    values = tuple(parameter_data["VALUE_LIST"]) if parameter_data.get("VALUE_LIST") else None
+
+    def convert(*, value: Any) -> Any:
+        try:
+            return convert_parameter_value(value=value, parameter_type=parameter_type, values=values)
+        except ValueError, TypeError:  # pragma: no cover
+            _LOGGER.debug("PARAMETER_SPEC: conversion failed for %s, value: [%s]", parameter, value)
+            return None
+
+    # Determine if ENUM values should be sent as index (int) or string.
+    # HM devices use integer MIN/MAX/DEFAULT → send as index.
+    # HmIP devices use string MIN/MAX/DEFAULT → send as string.
+    raw_min = parameter_data["MIN"]
+    min_value = convert(value=raw_min)
+    flags: int = parameter_data["FLAGS"]
+    raw_unit: str | None = parameter_data.get("UNIT")
+    return ParameterSpec(
+        parameter=parameter,
+        type=parameter_type,
+        values=values,
+        enum_value_is_index=parameter_type == ParameterType.ENUM and values is not None and isinstance(raw_min, int),
+        min=min_value,
+        max=convert(value=parameter_data["MAX"]),
+        default=convert(value=parameter_data.get("DEFAULT")) or min_value,
+        visible=flags & Flag.VISIBLE == Flag.VISIBLE,
+        service=flags & Flag.SERVICE == Flag.SERVICE,
+        operations=parameter_data["OPERATIONS"],
+        special=parameter_data.get("SPECIAL"),
+        raw_unit=raw_unit,
+        unit=_cleanup_unit(parameter=parameter, raw_unit=raw_unit),
+        multiplier=_get_multiplier(raw_unit=raw_unit),
+        translation_key=generate_translation_key(name=parameter),
+        ignore_on_initial_load=check_ignore_parameter_on_initial_load(parameter=parameter),
+        translation=ccu_translations.get_parameter_translation(
+            parameter=parameter, channel_type=channel_type, locale=locale
+        ),
+        description=ccu_translations.get_parameter_help(parameter=parameter, locale=locale),
+        value_translations=MappingProxyType(
+            {
+                value: ccu_translations.get_parameter_value_translation(
+                    parameter=parameter, value=value, channel_type=channel_type, locale=locale
+                )
+                for value in values
+            }
+        )
+        if values is not None
+        else None,
+    )
+
+
+def _freeze(*, value: Any) -> Any:
+    """Return a hashable representation of a (nested) paramset description value."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(value=item)) for key, item in value.items()))
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(value=item) for item in value)
+    return value
+
+
+def _get_multiplier(*, raw_unit: str | None) -> float:
+    """Return the multiplier of the given unit."""
+    if not raw_unit:
+        return DEFAULT_MULTIPLIER
+    return _MULTIPLIER_UNIT.get(raw_unit) or DEFAULT_MULTIPLIER
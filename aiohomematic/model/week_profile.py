@@ -182,6 +182,11 @@ set_schedule_weekday(*, profile: ScheduleProfile, weekday: WeekdayStr, weekday_d
     Converts simple format (base_temperature + periods) to full 13-slot format automatically.
     Normalizes to 13 slots, validates, updates cache.
 
+set_schedule_weekdays(
+    *, profile: ScheduleProfile, weekdays_data: Mapping[WeekdayStr, ScheduleDict | ClimateWeekdaySchedule]
+) -> None
+    Persists several weekdays of one profile to device with a single write.
+
 Non-Climate Schedule API (SimpleSchedule):
 -------------------------------------------
 
@@ -332,9 +337,19 @@ Device → Python (Reading):
     Raw Paramset → convert_raw_to_dict_schedule() → Cache (13 slots) →
     _filter_*_entries() → User (clean, minimal slots)
 
+    Raw schedules read from the device are persisted per device address and
+    firmware (ScheduleRegistry). Unless from_device is set, reloads use the
+    persisted schedule and do not read the device. CONFIG_PENDING falling
+    (Device.on_config_changed) and explicit reloads read the device.
+
 Python → Device (Writing):
     User Data → _normalize_weekday_data() → Full 13 slots → Validation →
-    convert_dict_to_raw_schedule() → Raw Paramset → Device
+    convert_dict_to_raw_schedule() → Raw Paramset → diff against last read → Device
+
+    Only raw entries that differ from the MASTER paramset last read from the
+    device are sent. Unchanged schedules are not written at all. Without a
+    baseline (nothing read yet, or a write not yet confirmed by CONFIG_PENDING)
+    the full raw paramset is sent.
 
 Simple → Full Format (Writing):
     Simple Tuple (base_temp, list) → _validate_and_convert_simple_to_weekday() →
@@ -389,6 +404,7 @@ from aiohomematic.model.schedule_models import (
     convert_raw_group_to_simple_entry,
     convert_simple_entry_to_raw_group,
 )
+from aiohomematic.parameter_tools import diff_paramset
 from aiohomematic.property_decorators import DelegatedProperty
 
 if TYPE_CHECKING:
@@ -461,6 +477,7 @@ class WeekProfile[SCHEDULE_DICT_T](ABC, WeekProfileProtocol[SCHEDULE_DICT_T]):
         "_client",
         "_data_point",
         "_device",
+        "_raw_schedule_baseline",
         "_schedule_cache",
         "_schedule_channel_no",
         "_week_profile_data_point",
@@ -473,6 +490,8 @@ class WeekProfile[SCHEDULE_DICT_T](ABC, WeekProfileProtocol[SCHEDULE_DICT_T]):
         self._client: Final = data_point.device.client
         self._schedule_channel_no: Final[int | None] = self._data_point.device_config.schedule_channel_no
         self._schedule_cache: SCHEDULE_DICT_T = self._create_empty_schedule()
+        # Raw schedule entries as last read from the device; empty while unknown.
+        self._raw_schedule_baseline: RAW_SCHEDULE_DICT = {}
         self._week_profile_data_point: WeekProfileDataPointProtocol | None = None
 
     @staticmethod
@@ -544,8 +563,13 @@ class WeekProfile[SCHEDULE_DICT_T](ABC, WeekProfileProtocol[SCHEDULE_DICT_T]):
         """Return the schedule dictionary."""
 
     @abstractmethod
-    async def reload_and_cache_schedule(self, *, force: bool = False) -> None:
-        """Reload schedule entries and update cache."""
+    async def reload_and_cache_schedule(self, *, force: bool = False, from_device: bool = False) -> None:
+        """
+        Reload schedule entries and update cache.
+
+        force reloads even if the device does not report schedule support.
+        from_device reads the MASTER paramset instead of the persisted schedule.
+        """
 
     @abstractmethod
     async def set_schedule(self, *, schedule_data: SCHEDULE_DICT_T) -> None:
@@ -559,6 +583,61 @@ class WeekProfile[SCHEDULE_DICT_T](ABC, WeekProfileProtocol[SCHEDULE_DICT_T]):
         """Filter schedule entries by removing invalid/not relevant entries."""
         return schedule_data
 
+    def _get_changed_raw_schedule(self, *, channel_address: str, raw_schedule: RAW_SCHEDULE_DICT) -> RAW_SCHEDULE_DICT:
+        """
+        Return the raw schedule entries that differ from the baseline read from the device.
+
+        Entries without a baseline value are always kept. Without any baseline the
+        raw schedule is returned unchanged.
+        """
+        if not (baseline := self._raw_schedule_baseline):
+            return raw_schedule
+        descriptions = self._device.paramset_description_provider.get_channel_paramset_descriptions(
+            interface_id=self._device.interface_id,
+            channel_address=channel_address,
+        )
+        changes = diff_paramset(
+            descriptions=descriptions.get(ParamsetKey.MASTER, {}),
+            baseline=baseline,
+            current=raw_schedule,
+        )
+        return {key: value for key, value in raw_schedule.items() if key not in baseline or key in changes}
+
+    def _get_persisted_raw_schedule(self) -> RAW_SCHEDULE_DICT | None:
+        """Return the raw schedule persisted for the current firmware, if any."""
+        if (schedule_cache := self._device.schedule_cache) is None:
+            return None
+        return schedule_cache.get_raw_schedule(device_address=self._device.address, firmware=self._device.firmware)
+
+    async def _persist_raw_schedule(self, *, raw_schedule: RAW_SCHEDULE_DICT) -> None:
+        """Persist the raw schedule read from the device."""
+        if (schedule_cache := self._device.schedule_cache) is not None:
+            await schedule_cache.set_raw_schedule(
+                device_address=self._device.address,
+                firmware=self._device.firmware,
+                raw_schedule=raw_schedule,
+            )
+
+    async def _put_raw_schedule(self, *, channel_address: str, raw_schedule: RAW_SCHEDULE_DICT) -> None:
+        """Write only the changed raw schedule entries to the device."""
+        if not (values := self._get_changed_raw_schedule(channel_address=channel_address, raw_schedule=raw_schedule)):
+            _LOGGER.debug(
+                "PUT_RAW_SCHEDULE: Schedule of %s is unchanged, skipping write",
+                self._device.name,
+            )
+            return
+
+        # Write to device - cache will be updated via CONFIG_PENDING event
+        await self._client.put_paramset(
+            channel_address=channel_address,
+            paramset_key_or_link_address=ParamsetKey.MASTER,
+            values=values,
+            check_against_pd=True,
+        )
+        # The baseline is stale until CONFIG_PENDING reloads the schedule.
+        # Until then, send full writes instead of diffing against it.
+        self._raw_schedule_baseline = {}
+
     def _validate_and_get_schedule_channel_address(self) -> str:
         """
         Validate that schedule is supported and return the channel address.
@@ -801,17 +880,18 @@ class DefaultWeekProfile(WeekProfile[SimpleSchedule]):
                     address=self._device.name,
                 )
             )
-        await self.reload_and_cache_schedule(force=force_load)
+        await self.reload_and_cache_schedule(force=force_load, from_device=force_load)
         return self._schedule_cache
 
-    async def reload_and_cache_schedule(self, *, force: bool = False) -> None:
+    async def reload_and_cache_schedule(self, *, force: bool = False, from_device: bool = False) -> None:
         """Reload schedule entries from CCU and update cache with SimpleSchedule format."""
         if not force and not self.has_schedule:
             return
 
         try:
-            new_raw_schedule = await self._get_raw_schedule()
+            new_raw_schedule = await self._get_raw_schedule(from_device=from_device)
         except ValidationException:
+            self._raw_schedule_baseline = {}
             return
 
         old_schedule = self._schedule_cache
@@ -866,17 +946,12 @@ class DefaultWeekProfile(WeekProfile[SimpleSchedule]):
         raw_schedule = _filter_raw_schedule_by_supported_fields(
             raw_schedule=raw_schedule, supported_fields=self.supported_schedule_fields
         )
+        await self._put_raw_schedule(channel_address=sca, raw_schedule=raw_schedule)
 
-        # Write to device - cache will be updated via CONFIG_PENDING event
-        await self._client.put_paramset(
-            channel_address=sca,
-            paramset_key_or_link_address=ParamsetKey.MASTER,
-            values=raw_schedule,
-            check_against_pd=True,
-        )
-
-    async def _get_raw_schedule(self) -> RAW_SCHEDULE_DICT:
-        """Return the raw schedule dictionary filtered to WP entries."""
+    async def _get_raw_schedule(self, *, from_device: bool) -> RAW_SCHEDULE_DICT:
+        """Return the raw schedule dictionary filtered to WP entries, persisted unless read from device."""
+        if not from_device and (persisted := self._get_persisted_raw_schedule()) is not None:
+            return persisted
         try:
             sca = self._validate_and_get_schedule_channel_address()
             raw_data = await self._client.get_paramset(
@@ -899,6 +974,8 @@ class DefaultWeekProfile(WeekProfile[SimpleSchedule]):
                     name=self._device.name,
                 )
             )
+        self._raw_schedule_baseline = dict(schedule)
+        await self._persist_raw_schedule(raw_schedule=schedule)
         return schedule
 
 
@@ -1086,7 +1163,7 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
     @inspector
     async def copy_schedule_to(self, *, target_week_profile: ClimateWeekProfile) -> None:
         """Copy entire schedule to target week profile."""
-        raw_schedule = await self._get_raw_schedule()
+        raw_schedule = await self._get_raw_schedule(from_device=True)
         if not target_week_profile.has_schedule:
             raise ValidationException(
                 i18n.tr(
@@ -1095,11 +1172,9 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
                 )
             )
         if (sca := target_week_profile.schedule_channel_address) is not None:
-            await target_week_profile._client.put_paramset(  # pylint: disable=protected-access
+            await target_week_profile._put_raw_schedule(  # pylint: disable=protected-access
                 channel_address=sca,
-                paramset_key_or_link_address=ParamsetKey.MASTER,
-                values=raw_schedule,
-                check_against_pd=True,
+                raw_schedule=raw_schedule,
             )
 
     @inspector
@@ -1113,7 +1188,7 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
                 )
             )
         if force_load or not self._schedule_cache:
-            await self.reload_and_cache_schedule()
+            await self.reload_and_cache_schedule(from_device=force_load)
         # _schedule_cache is now ClimateSchedule (Pydantic), return profile or empty
         result = self._schedule_cache.get(profile)
         return result if result is not None else ClimateProfileSchedule({})
@@ -1129,7 +1204,7 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
                 )
             )
         if force_load or not self._schedule_cache:
-            await self.reload_and_cache_schedule()
+            await self.reload_and_cache_schedule(from_device=force_load)
         return self._schedule_cache
 
     @inspector
@@ -1145,25 +1220,26 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
                 )
             )
         if force_load or not self._schedule_cache:
-            await self.reload_and_cache_schedule()
+            await self.reload_and_cache_schedule(from_device=force_load)
         # _schedule_cache is now ClimateSchedule (Pydantic), return weekday or empty
         if (profile_data := self._schedule_cache.get(profile)) is None:
             return ClimateWeekdaySchedule(base_temperature=20.0, periods=[])
         weekday_data = profile_data.get(weekday)
         return weekday_data if weekday_data is not None else ClimateWeekdaySchedule(base_temperature=20.0, periods=[])
 
-    async def reload_and_cache_schedule(self, *, force: bool = False) -> None:
+    async def reload_and_cache_schedule(self, *, force: bool = False, from_device: bool = False) -> None:
         """Reload schedules from CCU and update cache, publish events if changed."""
         if not self.has_schedule:
             return
 
         try:
-            new_schedule = await self._get_schedule_profile()
+            new_schedule = await self._get_schedule_profile(from_device=from_device)
         except ValidationException:
             _LOGGER.debug(
                 "RELOAD_AND_CACHE_SCHEDULE: Failed to reload schedules for %s",
                 self._device.name,
             )
+            self._raw_schedule_baseline = {}
             return
 
         # Compare old and new schedules
@@ -1199,13 +1275,9 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
         # Convert simple format to internal 13-slot format
         converted_profile_data = self._validate_and_convert_simple_to_profile(simple_profile_data=profile_data)
         sca = self._validate_and_get_schedule_channel_address()
-
-        # Write to device - cache will be updated via CONFIG_PENDING event
-        await self._client.put_paramset(
+        await self._put_raw_schedule(
             channel_address=sca,
-            paramset_key_or_link_address=ParamsetKey.MASTER,
-            values=self.convert_dict_to_raw_schedule(schedule_data={profile: converted_profile_data}),
-            check_against_pd=True,
+            raw_schedule=self.convert_dict_to_raw_schedule(schedule_data={profile: converted_profile_data}),
         )
 
     @inspector
@@ -1222,13 +1294,9 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
         # Convert simple schedule to internal 13-slot format
         converted_schedule_data = self._validate_and_convert_simple_to_schedule(simple_schedule_data=schedule_data)
         sca = self._validate_and_get_schedule_channel_address()
-
-        # Write to device - cache will be updated via CONFIG_PENDING event
-        await self._client.put_paramset(
+        await self._put_raw_schedule(
             channel_address=sca,
-            paramset_key_or_link_address=ParamsetKey.MASTER,
-            values=self.convert_dict_to_raw_schedule(schedule_data=converted_schedule_data),
-            check_against_pd=True,
+            raw_schedule=self.convert_dict_to_raw_schedule(schedule_data=converted_schedule_data),
         )
 
     @inspector
@@ -1251,13 +1319,36 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
         # Convert simple format to internal 13-slot format
         converted_weekday_data = self._validate_and_convert_simple_to_weekday(simple_weekday_data=weekday_data)
         sca = self._validate_and_get_schedule_channel_address()
+        await self._put_raw_schedule(
+            channel_address=sca,
+            raw_schedule=self.convert_dict_to_raw_schedule(schedule_data={profile: {weekday: converted_weekday_data}}),
+        )
 
-        # Write to device - cache will be updated via CONFIG_PENDING event
-        await self._client.put_paramset(
+    @inspector
+    async def set_weekdays(
+        self,
+        *,
+        profile: ScheduleProfile,
+        weekdays_data: Mapping[WeekdayStr, ScheduleDict | ClimateWeekdaySchedule],
+    ) -> None:
+        """
+        Store several weekdays of a profile to device with a single write.
+
+        Note:
+            The cache is NOT updated optimistically. The cache will be refreshed
+            from CCU when CONFIG_PENDING = False is received, ensuring consistency
+            between cache and CCU state.
+
+        """
+        # Convert all weekdays before writing, so an invalid weekday leaves the device untouched
+        converted_profile_data = {
+            weekday: self._validate_and_convert_simple_to_weekday(simple_weekday_data=weekday_data)
+            for weekday, weekday_data in weekdays_data.items()
+        }
+        sca = self._validate_and_get_schedule_channel_address()
+        await self._put_raw_schedule(
             channel_address=sca,
-            paramset_key_or_link_address=ParamsetKey.MASTER,
-            values=self.convert_dict_to_raw_schedule(schedule_data={profile: {weekday: converted_weekday_data}}),
-            check_against_pd=True,
+            raw_schedule=self.convert_dict_to_raw_schedule(schedule_data={profile: converted_profile_data}),
         )
 
     def _convert_raw_to_pydantic(self, *, raw_schedule: RAW_SCHEDULE_DICT) -> ClimateSchedule:
@@ -1273,8 +1364,10 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
         # Convert to Pydantic
         return self._validate_and_convert_schedule_to_simple(schedule_data=internal_schedule)
 
-    async def _get_raw_schedule(self) -> RAW_SCHEDULE_DICT:
-        """Return the raw schedule."""
+    async def _get_raw_schedule(self, *, from_device: bool) -> RAW_SCHEDULE_DICT:
+        """Return the raw schedule, persisted unless read from device."""
+        if not from_device and (persisted := self._get_persisted_raw_schedule()) is not None:
+            return persisted
         try:
             sca = self._validate_and_get_schedule_channel_address()
             raw_data = await self._client.get_paramset(
@@ -1290,12 +1383,14 @@ class ClimateWeekProfile(WeekProfile[ClimateSchedule]):
                     name=self._device.name,
                 )
             ) from cex
+        self._raw_schedule_baseline = dict(raw_schedule)
+        await self._persist_raw_schedule(raw_schedule=raw_schedule)
         return raw_schedule
 
-    async def _get_schedule_profile(self) -> ClimateSchedule:
+    async def _get_schedule_profile(self, *, from_device: bool) -> ClimateSchedule:
         """Get the schedule as Pydantic model."""
-        # Get raw schedule data from device
-        raw_schedule = await self._get_raw_schedule()
+        # Get raw schedule data from device (or from the previous run unless read from device)
+        raw_schedule = await self._get_raw_schedule(from_device=from_device)
         # Convert directly to Pydantic (optimized path)
         return self._convert_raw_to_pydantic(raw_schedule=raw_schedule)
 
@@ -50,6 +50,7 @@ from aiohomematic.model.data_point import BaseDataPoint
 from aiohomematic.model.schedule_models import (
     SCHEDULE_DOMAINS,
     ClimateSchedule,
+    ClimateWeekdaySchedule,
     SimpleSchedule,
     TargetChannelInfo,
     channel_key_to_bitmask,
@@ -327,7 +328,7 @@ class WeekProfileDataPoint(BaseDataPoint, WeekProfileDataPointProtocol):
 
     async def reload_schedule(self) -> None:
         """Reload schedule from CCU and update data point state."""
-        await self._week_profile.reload_and_cache_schedule(force=True)
+        await self._week_profile.reload_and_cache_schedule(force=True, from_device=True)
         self.publish_data_point_updated_event()
 
     def set_channel_locks_data_point(self, *, data_point: GenericDataPointProtocolAny) -> None:
@@ -644,6 +645,16 @@ class ClimateWeekProfileDataPoint(WeekProfileDataPoint, ClimateWeekProfileDataPo
         """Write a single weekday to CCU."""
         await self._week_profile.set_weekday(profile=profile, weekday=weekday, weekday_data=weekday_data)
 
+    @inspector
+    async def set_schedule_weekdays(
+        self,
+        *,
+        profile: ScheduleProfile,
+        weekdays_data: Mapping[WeekdayStr, ScheduleDict | ClimateWeekdaySchedule],
+    ) -> None:
+        """Write several weekdays of a profile to CCU with a single write."""
+        await self._week_profile.set_weekdays(profile=profile, weekdays_data=weekdays_data)
+
     def _on_profile_pointer_updated(self) -> None:
         """Handle profile pointer DP updates to sync current_schedule_profile."""
         if self._dp_profile_pointer is None:
@@ -7,14 +7,40 @@ from Homematic backends (CCU, Homegear) via XML-RPC and JSON-RPC.
 Public API of this module is defined by __all__.
 """
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Final
 
 from aiohomematic.schemas.device_description import DeviceDescriptionModel
-from aiohomematic.schemas.parameter_description import ParameterDataModel
+from aiohomematic.schemas.parameter_description import VALID_PARAMETER_TYPES, ParameterDataModel
 
 if TYPE_CHECKING:
     from aiohomematic.const import DeviceDescription, ParameterData
 
+# Field names that pydantic also accepts as input keys (populate_by_name=True).
+# Parameter data containing any of them is left to the pydantic model.
+_PARAMETER_FIELD_NAMES: Final = frozenset(ParameterDataModel.model_fields)
+
+# Keys handled explicitly by the fast normaliser; everything else is passed through
+# as an extra field, like pydantic's extra="allow".
+_PARAMETER_KEYS: Final = frozenset(
+    {
+        "CONTROL",
+        "DEFAULT",
+        "FLAGS",
+        "ID",
+        "MAX",
+        "MIN",
+        "OPERATIONS",
+        "SPECIAL",
+        "TAB_ORDER",
+        "TYPE",
+        "UNIT",
+        "VALUE_LIST",
+    }
+)
+# Fields the model types as ``str | None``; other types need pydantic validation.
+_TEXT_KEYS: Final = frozenset({"CONTROL", "ID", "UNIT"})
+
 __all__ = [
     "DeviceDescriptionModel",
     "ParameterDataModel",
@@ -68,6 +94,8 @@ def normalize_parameter_data(
         ValidationError: If validation fails.
 
     """
+    if (normalized := _fast_normalize_parameter_data(parameter_data=parameter_data)) is not None:
+        return normalized
     model = ParameterDataModel.model_validate(parameter_data)
     return model.to_dict()
 
@@ -96,6 +124,85 @@ def normalize_paramset_description(
         return {}
     result: dict[str, ParameterData] = {}
     for param_name, param_data in paramset.items():
-        model = ParameterDataModel.model_validate(param_data)
-        result[param_name] = model.to_dict()
+        if (normalized := _fast_normalize_parameter_data(parameter_data=param_data)) is None:
+            normalized = ParameterDataModel.model_validate(param_data).to_dict()
+        result[param_name] = normalized
     return result
+
+
+def _fast_normalize_parameter_data(*, parameter_data: Any) -> ParameterData | None:
+    """
+    Normalize well-formed parameter data without pydantic.
+
+    Produces exactly what ``ParameterDataModel.model_validate(...).to_dict()``
+    returns, including key order. Paramset descriptions from the backend and
+    from the cache are almost always well-formed, so this avoids building a
+    model instance per parameter during discovery and cache load.
+
+    Returns None if the data needs the full pydantic model, either because it
+    would fail validation or because it uses input forms the fast path does not
+    replicate (lowercase field names, non-string text fields, malformed SPECIAL).
+    """
+    if not isinstance(parameter_data, Mapping) or not _PARAMETER_FIELD_NAMES.isdisjoint(parameter_data):
+        return None
+
+    operations = _to_int(value=parameter_data.get("OPERATIONS"), fallback=0)
+    flags = _to_int(value=parameter_data.get("FLAGS"), fallback=0)
+    if operations is None or flags is None or operations < 0 or flags < 0:
+        return None
+
+    result: dict[str, Any] = {"OPERATIONS": operations, "FLAGS": flags}
+
+    if isinstance(param_type := parameter_data.get("TYPE"), str) and param_type.upper() in VALID_PARAMETER_TYPES:
+        result["TYPE"] = param_type.upper()
+    for key in ("ID", "DEFAULT", "MAX", "MIN", "UNIT", "CONTROL"):
+        if (value := parameter_data.get(key)) is not None:
+            if key in _TEXT_KEYS and not isinstance(value, str):
+                return None
+            result[key] = value
+    if (tab_order := _to_int(value=parameter_data.get("TAB_ORDER"), fallback=None)) is not None:
+        result["TAB_ORDER"] = tab_order
+    if value_list := _to_value_list(value=parameter_data.get("VALUE_LIST")):
+        result["VALUE_LIST"] = value_list
+    if (special := parameter_data.get("SPECIAL")) is not None:
+        if (special_copy := _copy_special(value=special)) is None:
+            return None
+        result["SPECIAL"] = special_copy
+
+    result.update({key: value for key, value in parameter_data.items() if key not in _PARAMETER_KEYS})
+    return result  # type: ignore[return-value]
+
+
+def _copy_special(*, value: Any) -> dict[str, Any] | list[dict[str, Any]] | None:
+    """Return a copy of a well-formed SPECIAL value, None if pydantic has to validate it."""
+    if isinstance(value, dict):
+        return dict(value) if all(isinstance(k, str) for k in value) else None
+    if isinstance(value, list):
+        entries: list[dict[str, Any]] = []
+        for entry in value:
+            if not isinstance(entry, dict) or not all(isinstance(k, str) for k in entry):
+                return None
+            entries.append(dict(entry))
+        return entries
+    return None
+
+
+def _to_int(*, value: Any, fallback: int | None) -> int | None:
+    """Convert a value to int like the model's field validators do."""
+    if value is None:
+        return fallback
+    try:
+        return int(value)
+    except ValueError, TypeError:
+        return fallback
+
+
+def _to_value_list(*, value: Any) -> list[str]:
+    """Convert VALUE_LIST to a list of strings like the model's field validator does."""
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value] if value else []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    return []
@@ -13,7 +13,7 @@ This package groups store implementations used throughout the library:
 Package structure
 -----------------
 - storage.py: Storage abstraction with factory pattern for HA Store integration
-- persistent/: DeviceDescriptionRegistry, ParamsetDescriptionRegistry, SessionRecorder
+- persistent/: DeviceDescriptionRegistry, ParamsetDescriptionRegistry, ScheduleRegistry, SessionRecorder
 - dynamic/: CommandCache, DeviceDetailsCache, CentralDataCache, PingPongTracker
 - visibility/: ParameterVisibilityRegistry
 - patches/: ParamsetPatch, ParamsetPatchMatcher for correcting CCU data
@@ -22,7 +22,7 @@ Package structure
 
 """
 
-from aiohomematic.store.patches import PARAMSET_PATCHES, ParamsetPatch, ParamsetPatchMatcher
+from aiohomematic.store.patches import PARAMSET_PATCHES, ParamsetPatch, ParamsetPatchMatcher, get_paramset_patch_matcher
 from aiohomematic.store.serialization import cleanup_params_for_session, freeze_params, unfreeze_params
 from aiohomematic.store.storage import (
     LocalStorageFactory,
@@ -46,6 +46,7 @@ __all__ = [
     "PARAMSET_PATCHES",
     "ParamsetPatch",
     "ParamsetPatchMatcher",
+    "get_paramset_patch_matcher",
     # Serialization
     "cleanup_params_for_session",
     "freeze_params",
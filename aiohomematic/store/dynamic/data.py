@@ -11,6 +11,8 @@ This avoids background task overhead for a small number of interface-keyed entri
 Stale data causes a cache miss → refresh cycle (self-healing).
 """
 
+import asyncio
+from collections import defaultdict
 from collections.abc import Mapping
 from datetime import datetime
 import logging
@@ -25,7 +27,9 @@ from aiohomematic.interfaces import (
     DataCacheWriterProtocol,
     DataPointProviderProtocol,
     DeviceProviderProtocol,
+    GenericDataPointProtocolAny,
 )
+from aiohomematic.metrics import profile_phase
 from aiohomematic.property_decorators import DelegatedProperty
 from aiohomematic.store.types import CacheName, CacheStatistics
 from aiohomematic.support import changed_within_seconds
@@ -159,7 +163,8 @@ class CentralDataCache(DataCacheProviderProtocol, DataCacheWriterProtocol, Cache
                 max_age=int(MAX_CACHE_AGE / 3),
             ):
                 return
-            await client.fetch_all_device_data()
+            with profile_phase(name="fetch_all_device_data", interface_id=client.interface_id):
+                await client.fetch_all_device_data()
 
     async def refresh_data_point_data(
         self,
@@ -168,7 +173,9 @@ class CentralDataCache(DataCacheProviderProtocol, DataCacheWriterProtocol, Cache
         interface: Interface | None = None,
         direct_call: bool = False,
         call_source: CallSource = CallSource.MANUAL_OR_SCHEDULED,
-    ) -> None:
+        refreshed_before: datetime | None = None,
+        max_concurrent_devices: int = 1,
+    ) -> int:
         """
         Refresh data_point data.
 
@@ -179,12 +186,39 @@ class CentralDataCache(DataCacheProviderProtocol, DataCacheWriterProtocol, Cache
             call_source: The call source for loading values.
                 Use MANUAL_OR_SCHEDULED for periodic polling (default).
                 Use HM_INIT only during initial device creation.
+            refreshed_before: If set, skip data points refreshed at or after this
+                time (e.g. by an event received during a reconnect).
+            max_concurrent_devices: Number of devices read in parallel. The data
+                points of a device are always read one after another.
+
+        Returns:
+            Number of data points that have been loaded.
 
         """
-        for dp in self._data_point_provider.get_readable_generic_data_points(
-            paramset_key=paramset_key, interface=interface
-        ):
-            await dp.load_data_point_value(call_source=call_source, direct_call=direct_call)
+        data_points = [
+            dp
+            for dp in self._data_point_provider.get_readable_generic_data_points(
+                paramset_key=paramset_key, interface=interface
+            )
+            if refreshed_before is None or dp.refreshed_at < refreshed_before
+        ]
+        if max_concurrent_devices <= 1:
+            for dp in data_points:
+                await dp.load_data_point_value(call_source=call_source, direct_call=direct_call)
+            return len(data_points)
+
+        by_device: dict[str, list[GenericDataPointProtocolAny]] = defaultdict(list)
+        for dp in data_points:
+            by_device[dp.device.address].append(dp)
+        semaphore = asyncio.Semaphore(max_concurrent_devices)
+
+        async def _load_device(*, device_data_points: list[GenericDataPointProtocolAny]) -> None:
+            async with semaphore:
+                for dp in device_data_points:
+                    await dp.load_data_point_value(call_source=call_source, direct_call=direct_call)
+
+        await asyncio.gather(*(_load_device(device_data_points=dps) for dps in by_device.values()))
+        return len(data_points)
 
     def set_initialization_complete(self) -> None:
         """
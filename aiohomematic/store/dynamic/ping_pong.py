@@ -5,16 +5,19 @@ Ping/pong tracker for connection health monitoring.
 
 This module provides PingPongTracker which tracks ping/pong timestamps to detect
 connection health issues and publishes interface events on mismatch thresholds.
+When the pending PONGs return to normal, an EventGapDetectedEvent reports since
+when events of the interface may have been lost.
 """
 
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import time
 from typing import TYPE_CHECKING, Final
 
 from aiohomematic import i18n
 from aiohomematic.central.events import IntegrationIssue, SystemStatusChangedEvent
+from aiohomematic.central.events.internal import EventGapDetectedEvent
 from aiohomematic.const import (
     PING_PONG_CACHE_MAX_SIZE,
     PING_PONG_MISMATCH_COUNT,
@@ -22,6 +25,7 @@ from aiohomematic.const import (
     IntegrationIssueSeverity,
     IntegrationIssueType,
     PingPongMismatchType,
+    TaskCategory,
 )
 from aiohomematic.interfaces import CentralInfoProtocol, EventBusProviderProtocol, IncidentRecorderProtocol
 from aiohomematic.interfaces.client import PingPongTrackerProtocol
@@ -55,6 +59,7 @@ class PingPongTracker(PingPongTrackerProtocol):
         "_central_info",
         "_connection_state",
         "_event_bus_provider",
+        "_gap_started_at",
         "_incident_recorder",
         "_interface_id",
         "_journal",
@@ -88,6 +93,7 @@ class PingPongTracker(PingPongTrackerProtocol):
         self._unknown: Final = PongTracker(tokens=set(), seen_at={})
         self._retry_at: Final[set[str]] = set()
         self._journal: Final = PingPongJournal()
+        self._gap_started_at: datetime | None = None
 
     allowed_delta: Final = DelegatedProperty[int](path="_allowed_delta")
     journal: Final = DelegatedProperty[PingPongJournal](path="_journal")
@@ -109,6 +115,7 @@ class PingPongTracker(PingPongTrackerProtocol):
         self._pending.clear()
         self._unknown.clear()
         self._journal.clear()
+        self._gap_started_at = None
 
     def handle_received_pong(self, *, pong_token: str) -> None:
         """Handle received pong token."""
@@ -211,8 +218,9 @@ class PingPongTracker(PingPongTrackerProtocol):
                 # Publish event to inform subscribers about high pending pong count.
                 _publish_event(mismatch_count=count)
                 if self._pending.logged is False:
+                    self._gap_started_at = self._get_oldest_pending_at()
                     _LOGGER.warning(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.store.dynamic.pending_pong_mismatch",
                             interface_id=self._interface_id,
                         )
@@ -231,6 +239,7 @@ class PingPongTracker(PingPongTrackerProtocol):
             elif self._pending.logged:
                 _publish_event(mismatch_count=0)
                 self._pending.logged = False
+                self._publish_event_gap_detected()
             elif count > 0 and count % 2 == 0:
                 _publish_event(mismatch_count=count)
         elif mismatch_type == PingPongMismatchType.UNKNOWN:
@@ -241,7 +250,7 @@ class PingPongTracker(PingPongTrackerProtocol):
                 _publish_event(mismatch_count=count)
                 if self._unknown.logged is False:
                     _LOGGER.warning(
-                        i18n.tr(
+                        i18n.lazy_tr(
                             key="log.store.dynamic.unknown_pong_mismatch",
                             interface_id=self._interface_id,
                         )
@@ -299,6 +308,31 @@ class PingPongTracker(PingPongTrackerProtocol):
                 PING_PONG_CACHE_MAX_SIZE,
             )
 
+    def _get_oldest_pending_at(self) -> datetime:
+        """Return the send time of the oldest pending PING as datetime."""
+        now = datetime.now()
+        if not self._pending.seen_at:
+            return now
+        return now - timedelta(seconds=time.monotonic() - min(self._pending.seen_at.values()))
+
+    def _publish_event_gap_detected(self) -> None:
+        """Publish that events since the oldest unanswered PING may have been lost."""
+        if (gap_started_at := self._gap_started_at) is None:
+            return
+        self._gap_started_at = None
+        _LOGGER.debug(
+            "PING PONG CACHE: Events of %s may have been lost since %s",
+            self._interface_id,
+            gap_started_at,
+        )
+        self._event_bus_provider.event_bus.publish_sync(
+            event=EventGapDetectedEvent(
+                timestamp=datetime.now(),
+                interface_id=self._interface_id,
+                gap_started_at=gap_started_at,
+            )
+        )
+
     def _record_incident_async(
         self,
         *,
@@ -343,7 +377,11 @@ class PingPongTracker(PingPongTrackerProtocol):
                     err,
                 )
 
-        looper.create_task(target=_record, name=f"ppc_incident_{self._interface_id}_{incident_type.value}")
+        looper.create_task(
+            target=_record,
+            name=f"ppc_incident_{self._interface_id}_{incident_type.value}",
+            category=TaskCategory.INCIDENT,
+        )
 
     async def _retry_reconcile_pong(self, *, token: str) -> None:
         """Attempt to reconcile a previously-unknown PONG with a late pending PING."""
@@ -38,14 +38,16 @@ Public API
 ----------
 - ParamsetPatch: Dataclass defining a single patch
 - ParamsetPatchMatcher: Matcher for applying patches to paramset descriptions
+- get_paramset_patch_matcher: Cached matcher per device type
 - PARAMSET_PATCHES: Central registry of all defined patches
 """
 
-from aiohomematic.store.patches.matcher import ParamsetPatchMatcher
+from aiohomematic.store.patches.matcher import ParamsetPatchMatcher, get_paramset_patch_matcher
 from aiohomematic.store.patches.paramset_patches import PARAMSET_PATCHES, ParamsetPatch
 
 __all__ = [
     "PARAMSET_PATCHES",
     "ParamsetPatch",
     "ParamsetPatchMatcher",
+    "get_paramset_patch_matcher",
 ]
@@ -9,6 +9,7 @@ patches to paramset descriptions based on device context.
 Public API of this module is defined by __all__.
 """
 
+from functools import lru_cache
 import logging
 from typing import Any, Final, cast
 
@@ -18,6 +19,7 @@ from aiohomematic.support.address import get_split_channel_address
 
 __all__ = [
     "ParamsetPatchMatcher",
+    "get_paramset_patch_matcher",
 ]
 
 _LOGGER: Final = logging.getLogger(__name__)
@@ -152,3 +154,15 @@ class ParamsetPatchMatcher:
             if (patch := self._patches_by_key.get(key)) is not None:
                 return patch
         return None
+
+
+@lru_cache(maxsize=512)
+def get_paramset_patch_matcher(*, device_type: str) -> ParamsetPatchMatcher:
+    """
+    Return the shared matcher for a device type.
+
+    Matchers are immutable after construction, so one instance per device type
+    is reused for every paramset instead of re-filtering PARAMSET_PATCHES on
+    each call.
+    """
+    return ParamsetPatchMatcher(device_type=device_type)
@@ -14,6 +14,7 @@ Package structure
 - device: DeviceDescriptionRegistry for device/channel metadata
 - incident: IncidentStore for diagnostic incident snapshots
 - paramset: ParamsetDescriptionRegistry for parameter descriptions
+- schedule: ScheduleRegistry for week profile schedules
 - session: SessionRecorder for RPC call/response recording
 
 Key behaviors
@@ -27,6 +28,7 @@ Public API
 - DeviceDescriptionRegistry: Device and channel description storage
 - IncidentStore: Persistent diagnostic incident storage
 - ParamsetDescriptionRegistry: Paramset description storage
+- ScheduleRegistry: Week profile schedule storage
 - SessionRecorder: RPC session recording for testing
 - cleanup_files: Clean up cache files for a central unit
 """
@@ -41,6 +43,7 @@ from aiohomematic.store.persistent.base import get_file_name, get_file_path
 from aiohomematic.store.persistent.device import DeviceDescriptionRegistry
 from aiohomematic.store.persistent.incident import IncidentStore
 from aiohomematic.store.persistent.paramset import ParamsetDescriptionRegistry
+from aiohomematic.store.persistent.schedule import ScheduleRegistry
 from aiohomematic.store.persistent.session import SessionRecorder
 from aiohomematic.support.file_ops import delete_file
 
@@ -51,6 +54,7 @@ __all__ = [
     "DeviceDescriptionRegistry",
     "IncidentStore",
     "ParamsetDescriptionRegistry",
+    "ScheduleRegistry",
     "SessionRecorder",
     # Utilities
     "cleanup_files",
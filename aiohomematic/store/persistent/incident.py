@@ -23,17 +23,27 @@ Each incident includes:
 
 Persistence Strategy
 --------------------
-- Save-on-incident: Automatically saves after each recorded incident
-- Load-on-demand: Only loads from disk when diagnostics are requested
+- Append-only journal: A recorded incident is serialized once and appended to
+  the "journal" section of the stored document; retained incidents are not
+  re-serialized per incident
+- Ring buffers: Incidents are held in one bounded deque per IncidentType, so
+  eviction of the oldest incident is O(1)
+- Compaction: The journal is folded into the "incidents" section on load and
+  whenever it reaches _JOURNAL_COMPACT_THRESHOLD entries
+- Load-on-demand: History is only read from disk on the first recorded
+  incident (so the save does not drop it) or when diagnostics are requested
 - Time-based cleanup: Old incidents are removed on load (default: 7 days)
-- Size-based limit: Maximum number of incidents (default: 50)
+- Size-based limit: Maximum number of incidents per type (default: 50)
 
 Public API
 ----------
 - IncidentStore: Persistent incident storage with size/time limits
 """
 
+from collections import deque
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+import heapq
 import logging
 from typing import TYPE_CHECKING, Any, Final
 import uuid
@@ -55,16 +65,24 @@ _LOGGER: Final = logging.getLogger(__name__)
 # Default retention period for incidents
 DEFAULT_MAX_AGE_DAYS: Final = 7
 
+# Journal entries are folded into the compacted incident list at this size
+_JOURNAL_COMPACT_THRESHOLD: Final = 100
+
+_INCIDENTS: Final = "incidents"
+_JOURNAL: Final = "journal"
+_SAVE_DELAY: Final = 2.0
+
 
 class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
     """
     Persistent store for diagnostic incidents.
 
     Stores incident snapshots that survive application restarts.
-    Uses a "save-on-incident, load-on-demand" strategy:
+    Uses a "journal-on-incident, load-on-demand" strategy:
 
-    - When an incident is recorded, it's automatically persisted
-    - Historical incidents are only loaded when diagnostics are requested
+    - When an incident is recorded, it's appended to the journal and persisted
+    - Historical incidents are only loaded on the first recorded incident or
+      when diagnostics are requested
     - Old incidents (beyond max_age_days) are cleaned up on load
 
     Features:
@@ -105,7 +123,7 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
         super().__init__(storage=storage, config_provider=config_provider)
         self._max_per_type: Final = max_per_type
         self._max_age_days: Final = max_age_days
-        self._incidents_by_type: dict[IncidentType, list[IncidentSnapshot]] = {}
+        self._incidents_by_type: dict[IncidentType, deque[IncidentSnapshot]] = {}
         self._loaded: bool = False
 
     is_loaded: Final = DelegatedProperty[bool](path="_loaded")
@@ -118,16 +136,19 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
     @property
     def incidents(self) -> list[IncidentSnapshot]:
         """Return all incidents as a flat list sorted by timestamp (in-memory only)."""
-        all_incidents: list[IncidentSnapshot] = []
-        for incidents in self._incidents_by_type.values():
-            all_incidents.extend(incidents)
-        all_incidents.sort(key=lambda i: i.timestamp_iso)
-        return all_incidents
+        # Each ring buffer is already ordered by timestamp
+        return list(heapq.merge(*self._incidents_by_type.values(), key=lambda i: i.timestamp_iso))
+
+    @property
+    def journal_size(self) -> int:
+        """Return the number of journal entries not yet compacted."""
+        return len(self._content[_JOURNAL])
 
     def clear_incidents(self) -> None:
         """Clear all incidents from memory (does not affect persistence)."""
         self._incidents_by_type.clear()
-        self._content["incidents"] = []
+        self._content[_INCIDENTS] = []
+        self._content[_JOURNAL] = []
 
     async def get_all_incidents(self) -> list[IncidentSnapshot]:
         """
@@ -196,8 +217,9 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
         """
         Record a new incident and persist it.
 
-        The incident is saved to disk automatically (debounced).
-        Does NOT load historical incidents - only adds to current session.
+        The incident is serialized once and appended to the journal; eviction from
+        the per-type ring buffer is O(1). The save is debounced. The first recorded
+        incident loads the history once, so the save does not drop it.
 
         Args:
             incident_type: Type of incident.
@@ -230,25 +252,21 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
             journal_excerpt=journal_excerpt,
         )
 
-        # Get or create the list for this incident type
-        if incident_type not in self._incidents_by_type:
-            self._incidents_by_type[incident_type] = []
-        type_incidents = self._incidents_by_type[incident_type]
-
-        type_incidents.append(incident)
-
-        # Enforce per-type size limit
-        while len(type_incidents) > self._max_per_type:
-            evicted = type_incidents.pop(0)
+        # The ring buffer drops the oldest incident of this type once it is full
+        type_incidents = self._get_type_incidents(incident_type=incident_type)
+        if len(type_incidents) == self._max_per_type:
             _LOGGER.debug(
                 "INCIDENT STORE: Evicted oldest %s incident %s to maintain per-type limit %d",
                 incident_type.value,
-                evicted.incident_id,
+                type_incidents[0].incident_id,
                 self._max_per_type,
             )
+        type_incidents.append(incident)
 
-        # Update content for persistence (flat list for storage compatibility)
-        self._content["incidents"] = [i.to_dict() for i in self.incidents]
+        # Append-only: evicted incidents are dropped from storage on the next compaction
+        self._content[_JOURNAL].append(incident.to_dict())
+        if len(self._content[_JOURNAL]) >= _JOURNAL_COMPACT_THRESHOLD:
+            self._compact()
 
         # Always log at DEBUG level - the incident store's purpose is to RECORD
         # incidents for later diagnosis, not to actively log them. Active logging
@@ -261,11 +279,19 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
             interface_id or "N/A",
         )
 
+        if self._config_provider.config.use_caches:
+            await self._ensure_loaded()
+
         # Auto-save with debouncing (2 second delay to batch rapid incidents)
-        await self.save_delayed(delay=2.0)
+        await self.save_delayed(delay=_SAVE_DELAY)
 
         return incident
 
+    def _compact(self) -> None:
+        """Fold the journal into the compacted incident list of the retained incidents."""
+        self._content[_INCIDENTS] = [i.to_dict() for i in self.incidents]
+        self._content[_JOURNAL] = []
+
     def _count_by_severity(self) -> dict[str, int]:
         """Count incidents by severity."""
         counts: dict[str, int] = {}
@@ -281,7 +307,7 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
 
     def _create_empty_content(self) -> dict[str, Any]:
         """Create empty content structure."""
-        return {"incidents": []}
+        return {_INCIDENTS: [], _JOURNAL: []}
 
     async def _ensure_loaded(self) -> None:
         """Load historical incidents from disk if not already loaded."""
@@ -289,41 +315,34 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
             return
 
         # Remember current in-memory incidents (from this session)
-        current_session_by_type: dict[IncidentType, list[IncidentSnapshot]] = {}
-        for incident_type, incidents in self._incidents_by_type.items():
-            current_session_by_type[incident_type] = list(incidents)
+        session_incidents = self.incidents
 
         # Load from disk
         await self.load()
 
         # Merge: disk incidents first, then current session incidents
         # (avoiding duplicates by incident_id)
-        for incident_type, session_incidents in current_session_by_type.items():
-            if incident_type not in self._incidents_by_type:
-                self._incidents_by_type[incident_type] = []
-            type_incidents = self._incidents_by_type[incident_type]
-            existing_ids = {i.incident_id for i in type_incidents}
-            for incident in session_incidents:
-                if incident.incident_id not in existing_ids:
-                    type_incidents.append(incident)
-
-        # Re-sort by timestamp and enforce per-type limits
-        for incidents in self._incidents_by_type.values():
-            incidents.sort(key=lambda i: i.timestamp_iso)
-            while len(incidents) > self._max_per_type:
-                incidents.pop(0)
+        if session_incidents:
+            self._set_incidents(incidents=[*self.incidents, *session_incidents])
 
+        self._compact()
         self._loaded = True
 
+    def _get_type_incidents(self, *, incident_type: IncidentType) -> deque[IncidentSnapshot]:
+        """Return the ring buffer of an incident type."""
+        if (type_incidents := self._incidents_by_type.get(incident_type)) is None:
+            type_incidents = self._incidents_by_type[incident_type] = deque(maxlen=self._max_per_type)
+        return type_incidents
+
     def _process_loaded_content(self, *, data: dict[str, Any]) -> None:
         """
-        Rebuild incidents by type from loaded data.
+        Rebuild incidents by type from the compacted incidents and the journal.
 
         Applies time-based cleanup: incidents older than max_age_days are removed.
         Enforces per-type size limits.
         """
-        self._incidents_by_type.clear()
-        incidents_data = data.get("incidents", [])
+        incidents_data = [*data.get(_INCIDENTS, []), *data.get(_JOURNAL, [])]
+        incidents: list[IncidentSnapshot] = []
 
         # Calculate cutoff time for age-based cleanup
         cutoff_time = datetime.now() - timedelta(days=self._max_age_days)
@@ -343,10 +362,7 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
                 except ValueError:
                     pass  # Keep incidents with unparsable timestamps
 
-                # Add to type-specific list
-                if (incident_type := incident.incident_type) not in self._incidents_by_type:
-                    self._incidents_by_type[incident_type] = []
-                self._incidents_by_type[incident_type].append(incident)
+                incidents.append(incident)
                 loaded_count += 1
             except (KeyError, ValueError) as err:
                 _LOGGER.warning(  # i18n-log: ignore
@@ -355,12 +371,10 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
                 )
 
         # Enforce per-type size limits after loading
-        for incidents in self._incidents_by_type.values():
-            # Sort by timestamp first
-            incidents.sort(key=lambda i: i.timestamp_iso)
-            # Remove oldest if over limit
-            while len(incidents) > self._max_per_type:
-                incidents.pop(0)
+        self._set_incidents(incidents=incidents)
+        # Documents written before the journal was introduced have no journal section
+        self._content.setdefault(_INCIDENTS, [])
+        self._content.setdefault(_JOURNAL, [])
 
         if expired_count > 0:
             _LOGGER.debug(
@@ -374,3 +388,10 @@ class IncidentStore(BasePersistentCache, IncidentRecorderProtocol):
                 "INCIDENT STORE: Loaded %d incidents from storage",
                 loaded_count,
             )
+
+    def _set_incidents(self, *, incidents: Iterable[IncidentSnapshot]) -> None:
+        """Replace the ring buffers, keeping the newest incidents per type and dropping duplicate ids."""
+        self._incidents_by_type.clear()
+        unique = {incident.incident_id: incident for incident in incidents}
+        for incident in sorted(unique.values(), key=lambda i: i.timestamp_iso):
+            self._get_type_incidents(incident_type=incident.incident_type).append(incident)
@@ -30,7 +30,7 @@ from aiohomematic.interfaces import ParamsetDescriptionProviderProtocol, Paramse
 from aiohomematic.interfaces.model import DeviceRemovalInfoProtocol
 from aiohomematic.property_decorators import DelegatedProperty
 from aiohomematic.schemas import normalize_paramset_description
-from aiohomematic.store.patches import ParamsetPatchMatcher
+from aiohomematic.store.patches import get_paramset_patch_matcher
 from aiohomematic.store.persistent.base import BasePersistentCache
 from aiohomematic.store.types import InterfaceParamsetMap
 from aiohomematic.support.address import get_split_channel_address
@@ -125,8 +125,7 @@ class ParamsetDescriptionRegistry(
         normalized = normalize_paramset_description(paramset=paramset_description)
 
         # Phase 2: Apply device-specific patches
-        matcher = ParamsetPatchMatcher(device_type=device_type)
-        patched = matcher.apply_patches(
+        patched = get_paramset_patch_matcher(device_type=device_type).apply_patches(
             channel_address=channel_address,
             paramset_key=paramset_key,
             paramset_description=normalized,
@@ -135,6 +134,41 @@ class ParamsetDescriptionRegistry(
         self._raw_paramset_descriptions[interface_id][channel_address][paramset_key] = patched
         self._add_address_parameter(channel_address=channel_address, paramsets=[patched])
 
+    def add_device_paramsets(
+        self,
+        *,
+        interface_id: str,
+        paramset_descriptions: Mapping[str, Mapping[ParamsetKey, dict[str, ParameterData]]],
+        device_type: str,
+    ) -> None:
+        """
+        Add all paramset descriptions of a device in one call (normalized and patched).
+
+        Equivalent to calling add() for every channel and paramset key, but resolves
+        the patch matcher and the interface content once for the whole device.
+
+        Args:
+            interface_id: Interface identifier.
+            paramset_descriptions: Paramset descriptions by channel address and paramset key.
+            device_type: Device TYPE (root device TYPE for channels) for patch matching.
+
+        """
+        matcher = get_paramset_patch_matcher(device_type=device_type)
+        for channel_address, paramsets in paramset_descriptions.items():
+            if not paramsets:
+                continue
+            channel_paramsets = self._raw_paramset_descriptions[interface_id][channel_address]
+            patched_paramsets: list[dict[str, Any]] = []
+            for paramset_key, paramset_description in paramsets.items():
+                patched = matcher.apply_patches(
+                    channel_address=channel_address,
+                    paramset_key=paramset_key,
+                    paramset_description=normalize_paramset_description(paramset=paramset_description),
+                )
+                channel_paramsets[paramset_key] = patched
+                patched_paramsets.append(patched)
+            self._add_address_parameter(channel_address=channel_address, paramsets=patched_paramsets)
+
     async def clear(self) -> None:
         """Remove storage and clear all content including indexes."""
         await super().clear()
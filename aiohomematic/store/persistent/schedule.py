@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Schedule registry for persisting week profile schedules.
+
+This module provides ScheduleRegistry which persists the raw MASTER schedule
+entries of week profiles per device address. Entries are bound to the firmware
+they were read with, so a firmware update makes the stored schedule unusable and
+forces a fresh read from the device.
+
+Reading a schedule requires a full MASTER paramset read, which wakes up battery
+powered devices and costs duty cycle on BidCos-RF. With the registry, schedules
+are read from the device only when CONFIG_PENDING falls or a reload is forced.
+"""
+
+import logging
+from typing import Any, Final
+
+from aiohomematic.const import RAW_SCHEDULE_DICT
+from aiohomematic.interfaces import ScheduleCacheProtocol
+from aiohomematic.interfaces.model import DeviceRemovalInfoProtocol
+from aiohomematic.store.persistent.base import BasePersistentCache
+
+_LOGGER: Final = logging.getLogger(__name__)
+
+_FIRMWARE: Final = "firmware"
+_SCHEDULE: Final = "schedule"
+_SAVE_DELAY: Final = 5.0
+
+
+class ScheduleRegistry(BasePersistentCache, ScheduleCacheProtocol):
+    """Registry for raw week profile schedules."""
+
+    __slots__ = ()
+
+    @property
+    def size(self) -> int:
+        """Return the number of stored schedules."""
+        return len(self._content)
+
+    def get_raw_schedule(self, *, device_address: str, firmware: str) -> RAW_SCHEDULE_DICT | None:
+        """Return the stored raw schedule, or None if missing or stored for another firmware."""
+        if (entry := self._content.get(device_address)) is None or entry[_FIRMWARE] != firmware:
+            return None
+        return dict(entry[_SCHEDULE])
+
+    def remove_device(self, *, device: DeviceRemovalInfoProtocol) -> None:
+        """Remove the schedule of a device."""
+        self._content.pop(device.address, None)
+
+    async def set_raw_schedule(self, *, device_address: str, firmware: str, raw_schedule: RAW_SCHEDULE_DICT) -> None:
+        """Store the raw schedule read from the device and schedule a save."""
+        entry = {_FIRMWARE: firmware, _SCHEDULE: dict(raw_schedule)}
+        if self._content.get(device_address) == entry:
+            return
+        self._content[device_address] = entry
+        _LOGGER.debug("SCHEDULE_REGISTRY: Stored schedule of %s (%s entries)", device_address, len(raw_schedule))
+        await self.save_delayed(delay=_SAVE_DELAY)
+
+    def _create_empty_content(self) -> dict[str, Any]:
+        """Create empty content structure."""
+        return {}
+
+    def _process_loaded_content(self, *, data: dict[str, Any]) -> None:
+        """Drop malformed entries after loading."""
+        for device_address, entry in list(data.items()):
+            if not isinstance(entry, dict) or not isinstance(entry.get(_SCHEDULE), dict) or _FIRMWARE not in entry:
+                self._content.pop(device_address, None)
@@ -153,7 +153,7 @@ class SessionRecorder:
     ) -> bool:
         """Activate the session recorder. Disable after on_time(seconds)."""
         if self._is_recording:
-            _LOGGER.info(i18n.tr(key="log.store.session_recorder.activate.already_running"))
+            _LOGGER.info(i18n.lazy_tr(key="log.store.session_recorder.activate.already_running"))
             return False
         self._store.clear()
         self._active = True
@@ -223,7 +223,7 @@ class SessionRecorder:
     ) -> bool:
         """Deactivate the session recorder. Optionally after a delay(seconds)."""
         if self._is_recording:
-            _LOGGER.info(i18n.tr(key="log.store.session_recorder.deactivate.already_running"))
+            _LOGGER.info(i18n.lazy_tr(key="log.store.session_recorder.deactivate.already_running"))
             return False
         if delay > 0:
             self._task_scheduler.create_task(
@@ -68,6 +68,7 @@ import zipfile
 from slugify import slugify
 
 from aiohomematic import compat
+from aiohomematic.const import ExecutorLane, TaskCategory
 from aiohomematic.property_decorators import DelegatedProperty
 
 if TYPE_CHECKING:
@@ -384,7 +385,9 @@ class Storage(StorageProtocol):
         """Remove storage file asynchronously."""
         async with self._lock:
             if self._task_scheduler:
-                await self._task_scheduler.async_add_executor_job(self._remove_sync, name="storage-remove")
+                await self._task_scheduler.async_add_executor_job(
+                    self._remove_sync, name="storage-remove", lane=ExecutorLane.STORAGE
+                )
             else:
                 await asyncio.to_thread(self._remove_sync)
 
@@ -433,7 +436,9 @@ class Storage(StorageProtocol):
     async def _load_raw(self) -> dict[str, Any] | None:
         """Load raw data without migration."""
         if self._task_scheduler:
-            return await self._task_scheduler.async_add_executor_job(self._load_sync, name="storage-load")
+            return await self._task_scheduler.async_add_executor_job(
+                self._load_sync, name="storage-load", lane=ExecutorLane.STORAGE
+            )
         return await asyncio.to_thread(self._load_sync)
 
     def _load_sync(self) -> dict[str, Any] | None:
@@ -474,7 +479,9 @@ class Storage(StorageProtocol):
     async def _save_internal(self, *, data: dict[str, Any] | list[Any]) -> None:
         """Save data internally without acquiring lock."""
         if self._task_scheduler:
-            await self._task_scheduler.async_add_executor_job(partial(self._save_sync, data=data), name="storage-save")
+            await self._task_scheduler.async_add_executor_job(
+                partial(self._save_sync, data=data), name="storage-save", lane=ExecutorLane.STORAGE
+            )
         else:
             await asyncio.to_thread(self._save_sync, data=data)
 
@@ -519,6 +526,7 @@ class Storage(StorageProtocol):
         self._task_scheduler.create_task(
             target=self._execute_delayed_save(),
             name=f"storage-delayed-save-{self._key}",
+            category=TaskCategory.PERSISTENCE,
         )
 
     def _validate_serializable(self, *, data: dict[str, Any] | list[Any]) -> None:
@@ -605,7 +613,9 @@ class LocalStorageFactory(StorageFactoryProtocol):
         """
         if self._task_scheduler:
             return await self._task_scheduler.async_add_executor_job(
-                partial(self._cleanup_files_sync, sub_directory=sub_directory), name="storage-cleanup"
+                partial(self._cleanup_files_sync, sub_directory=sub_directory),
+                name="storage-cleanup",
+                lane=ExecutorLane.STORAGE,
             )
         return await asyncio.to_thread(self._cleanup_files_sync, sub_directory=sub_directory)
 
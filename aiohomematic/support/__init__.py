@@ -143,7 +143,7 @@ def check_password(*, password: str | None) -> bool:
         return False
     if CCU_PASSWORD_PATTERN.fullmatch(password) is None:
         _LOGGER.error(
-            i18n.tr(
+            i18n.lazy_tr(
                 key="log.support.check_password.invalid_chars",
                 pattern=CCU_PASSWORD_PATTERN.pattern,
             )
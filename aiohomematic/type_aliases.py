@@ -28,6 +28,8 @@ LinkPeerChangedHandler: TypeAlias = ZeroArgHandler
 # Data point update handlers may accept various keyword arguments depending on
 # the data point type, hence we keep them variadic.
 DataPointUpdatedHandler: TypeAlias = Callable[..., None]
+# Dependent data points receive the fields changed within one flush as fields=frozenset(...)
+FieldsChangedHandler: TypeAlias = Callable[..., None]
 
 # Common async/sync callable shapes
 # Factory that returns a coroutine that resolves to None
@@ -37,7 +37,7 @@ Public API of this module is defined by __all__.
 
 import asyncio
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
 import contextlib
 import json
 import logging
@@ -101,6 +101,15 @@ def get_client_session(
     JSON-RPC response in the session player using the provided method and params.
     """
 
+    class _MockStreamReader:
+        def __init__(self, *, data: bytes) -> None:
+            self._data = data
+            self.total_raw_bytes = len(data)
+
+        async def iter_chunked(self, n: int) -> AsyncIterator[bytes]:  # mimic aiohttp API
+            for start in range(0, len(self._data), n):
+                yield self._data[start : start + n]
+
     class _MockResponse:
         def __init__(self, *, json_data: dict[str, Any] | None) -> None:
             # If no match is found, emulate backend error payload
@@ -110,10 +119,16 @@ def get_client_session(
                 _JsonKey.ID: 0,
             }
             self.status = 200
+            self.content_length: int | None = None
+            self.headers: dict[str, str] = {}
 
         async def json(self, *, encoding: str | None = None) -> dict[str, Any]:  # mimic aiohttp API
             return self._json
 
+        @property
+        def content(self) -> _MockStreamReader:  # mimic aiohttp API
+            return _MockStreamReader(data=compat.dumps(obj=self._json, option=compat.OPT_NON_STR_KEYS))
+
         async def read(self) -> bytes:
             return compat.dumps(obj=self._json)
 
@@ -36,6 +36,7 @@ PRAGMA_EXC_INLINE = "i18n-exc: ignore"
 PRAGMA_EXC_NEXT = "i18n-exc: ignore-next"
 PRAGMA_LOG_INLINE = "i18n-log: ignore"
 PRAGMA_LOG_NEXT = "i18n-log: ignore-next"
+TR_FUNCTIONS = frozenset({"lazy_tr", "tr"})
 
 
 @dataclass
@@ -52,14 +53,14 @@ class Finding:
 
 
 def _is_tr_call(node: ast.AST) -> bool:
-    """Return True if node is a call to i18n.tr(...) or tr(...)."""
+    """Return True if node is a call to i18n.tr(...)/i18n.lazy_tr(...) or tr(...)/lazy_tr(...)."""
     if not isinstance(node, ast.Call):
         return False
     func = node.func
     if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
-        return func.attr == "tr" and func.value.id == "i18n"
+        return func.attr in TR_FUNCTIONS and func.value.id == "i18n"
     if isinstance(func, ast.Name):
-        return func.id == "tr"
+        return func.id in TR_FUNCTIONS
     return False
 
 
@@ -5,7 +5,7 @@
 prek hook to validate i18n catalogs and usage.
 
 Checks performed:
-1) Ensure that every translation key used in code via i18n.tr("key")/tr("key")
+1) Ensure that every translation key used in code via i18n.tr("key")/i18n.lazy_tr("key")/tr("key")
    exists in the base catalog `aiohomematic/strings.json`.
 2) Ensure that every key in `strings.json` is actually used in the codebase.
    Unused keys are reported as warnings. With --remove-unused, they are removed.
@@ -38,6 +38,7 @@ EN_JSON = TRANSLATIONS_DIR / "en.json"
 DE_JSON = TRANSLATIONS_DIR / "de.json"
 
 CODE_DIRS = [ROOT / "aiohomematic"]  # scan code here for i18n.tr usage
+TR_FUNCTIONS = frozenset({"lazy_tr", "tr"})  # i18n functions whose key argument is collected
 
 
 @dataclass
@@ -67,23 +68,23 @@ def _iter_py_files() -> Iterable[Path]:
 
 
 def _collect_used_keys() -> set[str]:
-    """Parse Python files and collect keys used in i18n.tr("...") or tr("...")."""
+    """Parse Python files and collect keys used in i18n.tr("...")/i18n.lazy_tr("...") or tr("...")."""
     keys: set[str] = set()
 
     def is_tr_call(node: ast.AST) -> bool:
         if not isinstance(node, ast.Call):
             return False
         func = node.func
-        # i18n.tr("...")
+        # i18n.tr("...") / i18n.lazy_tr("...")
         if (
             isinstance(func, ast.Attribute)
             and isinstance(func.value, ast.Name)
-            and func.attr == "tr"
+            and func.attr in TR_FUNCTIONS
             and func.value.id == "i18n"
         ):
             return True
         # tr("...") imported into scope
-        return isinstance(func, ast.Name) and func.id == "tr"
+        return isinstance(func, ast.Name) and func.id in TR_FUNCTIONS
 
     def extract_literal_key(arg: ast.AST) -> str | None:
         # accept string literal only (Constant with str)
@@ -47,6 +47,7 @@ INTERNAL_EVENTS: frozenset[str] = frozenset(
         "ConnectionHealthChangedEvent",
         "ConnectionLostEvent",
         "ConnectionStageChangedEvent",
+        "EventGapDetectedEvent",
         # Cache
         "CacheInvalidatedEvent",
         # Data refresh
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Lint script to keep translated log messages lazy.
+
+``i18n.tr(...)`` looks up and formats the message immediately. Used as (or
+within) the arguments of a logging call, this work is done even when the log
+level is disabled, e.g. for every out-of-range value of a noisy device while
+debug logging is off. ``i18n.lazy_tr(...)`` defers both until a handler emits
+the record.
+
+This script flags ``i18n.tr(...)`` and ``tr(...)`` calls inside the arguments
+of ``<logger>.<level>(...)`` calls.
+
+Pragmas to skip a single occurrence:
+    - Inline on the line of the tr call: ``# i18n-lazy: ignore``
+    - On the previous line: ``# i18n-lazy: ignore-next``
+
+Usage::
+
+    python script/lint_lazy_log_i18n.py aiohomematic
+
+Exit codes:
+    0 - No violations found
+    1 - Violations detected
+"""
+
+import argparse
+import ast
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+LOG_METHODS = frozenset({"critical", "debug", "error", "exception", "info", "log", "warning"})
+PRAGMA_INLINE = "i18n-lazy: ignore"
+PRAGMA_NEXT = "i18n-lazy: ignore-next"
+SKIP_DIRS = frozenset({"venv", ".venv", "node_modules", "__pycache__", ".git", "site-packages"})
+
+
+@dataclass
+class Finding:
+    """Represents a single eager translation inside a logging call."""
+
+    path: Path
+    line: int
+
+    def __str__(self) -> str:  # pragma: no cover - trivial
+        """Return CLI-friendly representation of the finding."""
+        return f"{self.path}:{self.line}: eager i18n.tr in logging call, use i18n.lazy_tr"
+
+
+def _is_eager_tr_call(node: ast.AST) -> bool:
+    """Return True if node is a call to i18n.tr(...) or tr(...)."""
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Name):
+        return func.attr == "tr" and func.value.id == "i18n"
+    return isinstance(func, ast.Name) and func.id == "tr"
+
+
+def _as_logging_call(node: ast.AST) -> ast.Call | None:
+    """Return the Call if node is a call of the form <logger>.<level>(...)."""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in LOG_METHODS:
+        return node
+    return None
+
+
+def _has_pragma(lines: list[str], line_no: int) -> bool:
+    """Return True if the line or the line before carries a skip pragma."""
+    if 0 < line_no <= len(lines) and PRAGMA_INLINE in lines[line_no - 1]:
+        return True
+    return line_no >= 2 and PRAGMA_NEXT in lines[line_no - 2]
+
+
+def check_file(path: Path) -> list[Finding]:
+    """Return the eager translations inside logging calls of a single Python file."""
+    try:
+        source = path.read_text(encoding="utf-8")
+        tree = ast.parse(source, filename=str(path))
+    except SyntaxError, UnicodeDecodeError:
+        return []
+    lines = source.splitlines()
+
+    seen: set[int] = set()
+    findings: list[Finding] = []
+    for node in ast.walk(tree):
+        if (call := _as_logging_call(node)) is None:
+            continue
+        for argument in (*call.args, *(kw.value for kw in call.keywords)):
+            for sub in ast.walk(argument):
+                if not _is_eager_tr_call(sub) or id(sub) in seen:
+                    continue
+                seen.add(id(sub))
+                if not _has_pragma(lines, sub.lineno):
+                    findings.append(Finding(path=path, line=sub.lineno))
+    return sorted(findings, key=lambda finding: finding.line)
+
+
+def _iter_py_files(paths: Iterable[str]) -> Iterator[Path]:
+    """Yield the Python files of the given files and directories."""
+    for name in paths:
+        path = Path(name)
+        if path.is_dir():
+            for py_file in sorted(path.rglob("*.py")):
+                if not SKIP_DIRS.intersection(py_file.parts):
+                    yield py_file
+        elif path.suffix == ".py" and path.exists():
+            yield path
+
+
+def main(argv: Iterable[str] | None = None) -> int:
+    """CLI entry point: scan files and directories, print findings, and return exit code."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("paths", nargs="+", help="Python files or directories to scan")
+    args = parser.parse_args(list(argv) if argv is not None else None)
+
+    findings = [finding for py_file in _iter_py_files(args.paths) for finding in check_file(py_file)]
+    for finding in findings:
+        print(str(finding))
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI
+    raise SystemExit(main())
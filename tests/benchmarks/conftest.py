@@ -4,12 +4,24 @@
 
 import asyncio
 from collections.abc import AsyncGenerator, Generator
+import contextlib
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
 import time
+from typing import Any, Final
 
 import pytest
 
+from aiohomematic.central import CentralUnit
+from aiohomematic.central.events import DataPointStateChangedEvent
+from aiohomematic.const import RELEVANT_INIT_PARAMETERS, ParameterType, ParamsetKey
+
 
 @pytest.fixture(autouse=True)
 async def _disable_asyncio_debug() -> AsyncGenerator[None]:
@@ -83,3 +95,194 @@ class BenchmarkTimer:
 def bench() -> BenchmarkTimer:
     """Provide a benchmark timer for performance tests."""
     return BenchmarkTimer()
+
+
+# Replay harness
+
+
+REPORT_ENV: Final = "AIOHOMEMATIC_BENCHMARK_REPORT"
+"""Environment variable naming the JSON file the replay benchmarks write their reports to."""
+
+_MIN_PACING_DELAY: Final = 0.005
+
+
+def append_report(*, report: dict[str, Any]) -> None:
+    """Append a report to the file named by AIOHOMEMATIC_BENCHMARK_REPORT, if set."""
+    if not (path := os.environ.get(REPORT_ENV)):
+        return
+    report_file = Path(path)
+    reports: list[dict[str, Any]] = json.loads(report_file.read_text()) if report_file.exists() else []
+    reports.append(report)
+    report_file.write_text(json.dumps(reports, indent=2))
+
+
+def get_peak_rss_mb() -> float | None:
+    """Return the peak resident set size of the test process in MiB, or None if unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+@dataclass
+class StormResult:
+    """Result of one replayed event storm."""
+
+    target_rate: float | None
+    injected: int
+    delivered: int
+    duration_s: float
+    latencies_ms: list[float] = field(default_factory=list, repr=False)
+
+    @property
+    def events_per_sec(self) -> float:
+        """Return the achieved injection rate."""
+        return self.injected / self.duration_s if self.duration_s > 0 else float("inf")
+
+    @property
+    def p50_latency_ms(self) -> float:
+        """Return the median event-to-data-point latency."""
+        return statistics.median(self.latencies_ms) if self.latencies_ms else 0.0
+
+    @property
+    def p99_latency_ms(self) -> float:
+        """Return the p99 event-to-data-point latency."""
+        if len(self.latencies_ms) < 2:
+            return self.latencies_ms[0] if self.latencies_ms else 0.0
+        return statistics.quantiles(self.latencies_ms, n=100)[98]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the result as JSON serializable dict."""
+        return {
+            "target_rate": self.target_rate,
+            "injected": self.injected,
+            "delivered": self.delivered,
+            "events_per_sec": round(self.events_per_sec, 1),
+            "p50_latency_ms": round(self.p50_latency_ms, 3),
+            "p99_latency_ms": round(self.p99_latency_ms, 3),
+        }
+
+
+@dataclass
+class ReplayReport:
+    """Machine-readable report of a replay benchmark run."""
+
+    name: str
+    session: str
+    devices: int = 0
+    data_points: int = 0
+    startup_ms: float = 0.0
+    startup_rpc_count: int = 0
+    cold_storm: StormResult | None = None
+    storms: list[StormResult] = field(default_factory=list)
+    peak_rss_mb: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report as JSON serializable dict."""
+        return {
+            "name": self.name,
+            "session": self.session,
+            "python": platform.python_version(),
+            "devices": self.devices,
+            "data_points": self.data_points,
+            "startup_ms": round(self.startup_ms, 1),
+            "startup_rpc_count": self.startup_rpc_count,
+            "cold_storm": self.cold_storm.as_dict() if self.cold_storm else None,
+            "storms": [storm.as_dict() for storm in self.storms],
+            "peak_rss_mb": round(self.peak_rss_mb, 1) if self.peak_rss_mb is not None else None,
+        }
+
+    def write(self) -> None:
+        """Append the report to the file named by AIOHOMEMATIC_BENCHMARK_REPORT, if set."""
+        append_report(report=self.as_dict())
+
+
+class EventStorm:
+    """
+    Replay data point events against a started central at a controlled rate.
+
+    Events are injected through EventCoordinator.data_point_event, the entry
+    point of the XML-RPC server callbacks. The latency is the time from
+    injection until the DataPointStateChangedEvent of the data point has been
+    published on the event bus. CONFIG_PENDING and the reachability
+    parameters are left out: they reload paramsets and device availability,
+    which is maintenance traffic rather than an event storm.
+    """
+
+    def __init__(self, *, central: CentralUnit) -> None:
+        """Initialize the event storm with all event capable data points of the central."""
+        self._central = central
+        self._data_points = [
+            dp
+            for device in central.device_registry.devices
+            for dp in device.generic_data_points
+            if dp.paramset_key == ParamsetKey.VALUES
+            and dp.has_events
+            and dp.parameter not in RELEVANT_INIT_PARAMETERS
+            and dp.hmtype in (ParameterType.BOOL, ParameterType.FLOAT, ParameterType.INTEGER)
+        ]
+        self._round = 0
+
+    @property
+    def data_points(self) -> int:
+        """Return the number of data points the storm cycles through."""
+        return len(self._data_points)
+
+    async def run(self, *, events: int, rate: float | None, settle_timeout: float = 10.0) -> StormResult:
+        """Inject events at rate per second (None for as fast as possible) and wait for delivery."""
+        pending: dict[str, float] = {}
+        latencies_ms: list[float] = []
+        all_delivered = asyncio.Event()
+        injected_all = False
+
+        def _on_state_changed(*, event: DataPointStateChangedEvent) -> None:
+            if (injected_at := pending.pop(event.unique_id, None)) is not None:
+                latencies_ms.append((time.perf_counter() - injected_at) * 1000)
+                if injected_all and not pending:
+                    all_delivered.set()
+
+        unsubscribe = self._central.event_bus.subscribe(
+            event_type=DataPointStateChangedEvent, event_key=None, handler=_on_state_changed
+        )
+        event_coordinator = self._central.event_coordinator
+        started = time.perf_counter()
+        try:
+            for i in range(events):
+                # Sleeping per event costs more than an event at high rates; catch up in bursts instead.
+                if rate is not None and (delay := started + i / rate - time.perf_counter()) > _MIN_PACING_DELAY:
+                    await asyncio.sleep(delay)
+                dp = self._data_points[(self._round * events + i) % len(self._data_points)]
+                # A data point may come up again before its previous event was delivered;
+                # only the newest injection is measured then.
+                pending[dp.unique_id] = time.perf_counter()
+                await event_coordinator.data_point_event(
+                    interface_id=dp.device.interface_id,
+                    channel_address=dp.channel.address,
+                    parameter=dp.parameter,
+                    value=self._next_value(dp=dp, index=i),
+                )
+            duration = time.perf_counter() - started
+            injected_all = True
+            if pending:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(all_delivered.wait(), timeout=settle_timeout)
+        finally:
+            unsubscribe()
+            self._round += 1
+        return StormResult(
+            target_rate=rate,
+            injected=events,
+            delivered=len(latencies_ms),
+            duration_s=duration,
+            latencies_ms=latencies_ms,
+        )
+
+    def _next_value(self, *, dp: Any, index: int) -> Any:
+        """Return a value that differs from the value of the previous round."""
+        toggle = (self._round + index // len(self._data_points)) % 2 == 0
+        if dp.hmtype == ParameterType.BOOL:
+            return toggle
+        return dp.max if toggle else dp.min
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Import-time regression benchmarks.
+
+Each benchmark runs ``python -X importtime`` in a fresh interpreter, so the
+measurement is a real cold import and not affected by modules already loaded
+by the test session. Byte code is written on a warm-up run first, so the
+numbers reflect a normal (cached) process start.
+"""
+
+from dataclasses import dataclass
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Generous budgets: they only catch gross regressions (e.g. an archive parsed at
+# import time again), not machine-dependent noise.
+_PACKAGE_IMPORT_BUDGET_S = 5.0
+_MODULE_SELF_BUDGET_S = 0.25
+
+
+@dataclass(frozen=True, slots=True)
+class ImportTiming:
+    """Timing of one module import as reported by ``-X importtime``."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def _run_importtime(*, statement: str) -> list[ImportTiming]:
+    """Import in a fresh interpreter and return the parsed ``-X importtime`` report."""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    # Warm-up run writes byte code so the measured run does not include compilation.
+    subprocess.run([sys.executable, "-c", statement], check=True, env=env)  # noqa: S603
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    timings: list[ImportTiming] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line.removeprefix("import time:").split("|")
+        timings.append(ImportTiming(module=module.strip(), self_us=int(self_us), cumulative_us=int(cumulative_us)))
+    return timings
+
+
+@pytest.mark.benchmark
+def test_import_package_budget() -> None:
+    """Benchmark: cold ``import aiohomematic`` stays within the time budget."""
+    timings = _run_importtime(statement="import aiohomematic")
+    package = next(t for t in timings if t.module == "aiohomematic")
+    slowest = sorted((t for t in timings if t.module.startswith("aiohomematic")), key=lambda t: t.self_us)[-5:]
+    summary = ", ".join(f"{t.module}={t.self_us / 1000:.1f}ms" for t in reversed(slowest))
+
+    assert package.cumulative_us / 1_000_000 < _PACKAGE_IMPORT_BUDGET_S, (
+        f"import aiohomematic took {package.cumulative_us / 1000:.0f}ms (slowest: {summary})"
+    )
+
+
+@pytest.mark.benchmark
+def test_import_no_module_dominates() -> None:
+    """Benchmark: no single aiohomematic module does heavy work at import time."""
+    timings = _run_importtime(statement="import aiohomematic")
+    offenders = [
+        f"{t.module}={t.self_us / 1000:.1f}ms"
+        for t in timings
+        if t.module.startswith("aiohomematic") and t.self_us / 1_000_000 > _MODULE_SELF_BUDGET_S
+    ]
+    assert not offenders, f"Modules exceeding the self-time budget: {', '.join(offenders)}"
@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Memory benchmark for installations of growing size.
+
+The central is started against the pydevccu session recording (395 devices).
+Its devices serve as templates: they are cloned under new addresses until the
+requested number of devices (100, 500, 2000) has been created. tracemalloc
+snapshots before and after the creation give the bytes allocated per source
+area of aiohomematic, CentralUnit.memory_report gives object count and
+approximate size per type. Set AIOHOMEMATIC_BENCHMARK_REPORT to a file path
+to collect the reports as JSON for regression tracking.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+import itertools
+from pathlib import Path
+import platform
+import tracemalloc
+from typing import Any
+
+import pytest
+
+import aiohomematic
+from aiohomematic.central import CentralUnit
+from aiohomematic.const import SourceOfDeviceCreation
+from aiohomematic.metrics import MemoryMetrics
+from aiohomematic_test_support import const
+from aiohomematic_test_support.factory import FactoryWithClient
+from aiohomematic_test_support.mock import SessionPlayer
+
+from .conftest import append_report, get_peak_rss_mb
+
+_DEVICE_COUNTS = (100, 500, 2000)
+_PACKAGE_DIR = Path(aiohomematic.__file__).parent
+
+
+@dataclass
+class MemoryReport:
+    """Machine-readable report of a memory benchmark run."""
+
+    name: str
+    session: str
+    devices: int = 0
+    traced_bytes: int = 0
+    bytes_by_area: dict[str, int] = field(default_factory=dict)
+    by_type: dict[str, dict[str, Any]] = field(default_factory=dict)
+    peak_rss_mb: float | None = None
+
+    @property
+    def bytes_per_device(self) -> float:
+        """Return the traced bytes per created device."""
+        return self.traced_bytes / self.devices if self.devices else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the report as JSON serializable dict."""
+        return {
+            "name": self.name,
+            "session": self.session,
+            "python": platform.python_version(),
+            "devices": self.devices,
+            "traced_bytes": self.traced_bytes,
+            "bytes_per_device": round(self.bytes_per_device, 1),
+            "bytes_by_area": self.bytes_by_area,
+            "by_type": self.by_type,
+            "peak_rss_mb": round(self.peak_rss_mb, 1) if self.peak_rss_mb is not None else None,
+        }
+
+    def write(self) -> None:
+        """Append the report to the file named by AIOHOMEMATIC_BENCHMARK_REPORT, if set."""
+        append_report(report=self.as_dict())
+
+
+def _area_of(*, filename: str) -> str:
+    """Return the aiohomematic area (e.g. model/custom) of a source file, or <other>."""
+    try:
+        parts = Path(filename).relative_to(_PACKAGE_DIR).parts
+    except ValueError:
+        return "<other>"
+    return "/".join(parts[:-1][:2]) or parts[-1]
+
+
+async def _clone_devices(*, central: CentralUnit, count: int) -> dict[str, set[str]]:
+    """Register count clones of the devices of the central and return the new addresses by interface."""
+    cache = central.cache_coordinator
+    templates = [(device.interface_id, device.address) for device in central.device_registry.devices]
+    new_addresses: dict[str, set[str]] = defaultdict(set)
+    for index, (interface_id, template_address) in zip(range(count), itertools.cycle(templates), strict=False):
+        address = f"MEM{index:07d}"
+        descriptions = cache.device_descriptions.get_device_with_channels(
+            interface_id=interface_id, device_address=template_address
+        )
+        paramset_descriptions = {}
+        for template_channel_address, description in descriptions.items():
+            channel_address = template_channel_address.replace(template_address, address, 1)
+            clone = dict(description)
+            clone["ADDRESS"] = channel_address
+            if template_channel_address == template_address:
+                clone["CHILDREN"] = [child.replace(template_address, address, 1) for child in clone["CHILDREN"]]
+            else:
+                clone["PARENT"] = address
+            cache.device_descriptions.add_device(interface_id=interface_id, device_description=clone)  # type: ignore[arg-type]
+            paramset_descriptions[channel_address] = {
+                paramset_key: dict(parameters)
+                for paramset_key, parameters in cache.paramset_descriptions.get_channel_paramset_descriptions(
+                    interface_id=interface_id, channel_address=template_channel_address
+                ).items()
+            }
+        cache.paramset_descriptions.add_device_paramsets(
+            interface_id=interface_id,
+            paramset_descriptions=paramset_descriptions,
+            device_type=descriptions[template_address]["TYPE"],
+        )
+        new_addresses[interface_id].add(address)
+    return new_addresses
+
+
+def _types_added(*, before: MemoryMetrics, after: MemoryMetrics) -> dict[str, dict[str, Any]]:
+    """Return count and approximate bytes per type added between two memory reports."""
+    added: dict[str, dict[str, Any]] = {}
+    for type_name, stats in after.by_type.items():
+        previous = before.by_type.get(type_name)
+        if (count := stats.count - (previous.count if previous else 0)) <= 0:
+            continue
+        approx_bytes = stats.approx_bytes - (previous.approx_bytes if previous else 0)
+        added[type_name] = {"count": count, "approx_bytes": approx_bytes, "avg_bytes": round(approx_bytes / count, 1)}
+    return added
+
+
+async def _measure(*, player: SessionPlayer, device_count: int) -> MemoryReport:
+    """Start a central, create device_count cloned devices and return the memory report of the creation."""
+    report = MemoryReport(name=f"memory_{device_count}_devices", session=const.FULL_SESSION_RANDOMIZED_PYDEVCCU)
+    factory = FactoryWithClient(player=player)
+    central = await factory.get_default_central()
+    try:
+        devices_before = len(central.device_registry.devices)
+        memory_before = central.memory_report()
+
+        tracemalloc.start()
+        try:
+            snapshot_before = tracemalloc.take_snapshot()
+            new_addresses = await _clone_devices(central=central, count=device_count)
+            await central.device_coordinator.create_devices(
+                new_device_addresses=new_addresses, source=SourceOfDeviceCreation.NEW
+            )
+            snapshot_after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        report.devices = len(central.device_registry.devices) - devices_before
+        bytes_by_area: dict[str, int] = defaultdict(int)
+        for stat in snapshot_after.compare_to(snapshot_before, "filename"):
+            bytes_by_area[_area_of(filename=stat.traceback[0].filename)] += stat.size_diff
+        report.bytes_by_area = dict(sorted(bytes_by_area.items(), key=lambda item: item[1], reverse=True))
+        report.traced_bytes = sum(bytes_by_area.values())
+        report.by_type = _types_added(before=memory_before, after=central.memory_report())
+        report.peak_rss_mb = get_peak_rss_mb()
+    finally:
+        factory.cleanup()
+        await central.stop()
+        await central.cache_coordinator.clear_all()
+    return report
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("device_count", _DEVICE_COUNTS)
+async def test_memory_per_device(session_player_pydevccu: SessionPlayer, device_count: int) -> None:
+    """Benchmark: bytes per device and per object type when creating device_count devices."""
+    report = await _measure(player=session_player_pydevccu, device_count=device_count)
+    report.write()
+
+    assert report.devices == device_count
+    assert report.by_type["Device"]["count"] == device_count
+    assert report.traced_bytes > 0
@@ -0,0 +1,64 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""
+Whole-system benchmark replaying a recorded large installation.
+
+The central is started against the pydevccu session recording (395 devices)
+and then receives event storms at controlled rates after one cold pass over
+all data points. The run reports startup time, events/sec, p99
+event-to-data-point latency and peak RSS. Set AIOHOMEMATIC_BENCHMARK_REPORT to
+a file path to collect the reports as JSON for regression tracking.
+"""
+
+import time
+
+import pytest
+
+from aiohomematic_test_support import const
+from aiohomematic_test_support.factory import FactoryWithClient
+from aiohomematic_test_support.mock import SessionPlayer
+
+from .conftest import EventStorm, ReplayReport, get_peak_rss_mb
+
+# Events per storm and target rates (events/s); None replays as fast as possible.
+_STORM_EVENTS = 2000
+_STORM_RATES = (500.0, 2000.0, None)
+
+
+@pytest.mark.benchmark
+async def test_replay_large_installation(session_player_pydevccu: SessionPlayer) -> None:
+    """Benchmark: start against a recorded session and replay event storms."""
+    report = ReplayReport(name="replay_large_installation", session=const.FULL_SESSION_RANDOMIZED_PYDEVCCU)
+    factory = FactoryWithClient(player=session_player_pydevccu)
+
+    started = time.perf_counter()
+    central = await factory.get_default_central()
+    report.startup_ms = (time.perf_counter() - started) * 1000
+    try:
+        startup = central.metrics_aggregator.startup
+        report.startup_rpc_count = startup.rpc_count
+        report.devices = len(central.device_registry.devices)
+
+        storm = EventStorm(central=central)
+        report.data_points = storm.data_points
+        # The first event of a data point is slower (first value, cached properties);
+        # one cold pass over all data points keeps the paced storms comparable.
+        report.cold_storm = await storm.run(events=storm.data_points, rate=None)
+        for rate in _STORM_RATES:
+            report.storms.append(await storm.run(events=_STORM_EVENTS, rate=rate))
+        report.peak_rss_mb = get_peak_rss_mb()
+    finally:
+        factory.cleanup()
+        await central.stop()
+        await central.cache_coordinator.clear_all()
+
+    report.write()
+
+    assert report.devices == 395
+    assert startup.in_progress is False
+    assert startup.phases, "Expected recorded startup phases"
+    for result in report.storms:
+        assert result.delivered > 0, f"No events delivered at rate {result.target_rate}"
+        assert result.p99_latency_ms < 1000, f"Expected p99 <1s, got {result.p99_latency_ms:.1f}ms"
+        if result.target_rate is None:
+            assert result.events_per_sec > 500, f"Expected >500 events/s, got {result.events_per_sec:.0f}"
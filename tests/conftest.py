@@ -30,6 +30,7 @@ from aiohomematic.async_support import Looper
 from aiohomematic.central import CentralUnit
 from aiohomematic.central.events import DeviceLifecycleEvent, DeviceTriggerEvent, EventBus
 from aiohomematic.client import CircuitBreaker
+from aiohomematic.const import TaskCategory
 from aiohomematic.interfaces import ClientProtocol
 from aiohomematic_test_support import const
 from aiohomematic_test_support.factory import (
@@ -495,7 +496,7 @@ class NoOpTaskScheduler:
     asyncio.get_event_loop() raises RuntimeError outside async context.
     """
 
-    def create_task(self, *, target: object, name: str) -> None:
+    def create_task(self, *, target: object, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
         """Close coroutine to avoid 'never awaited' warning."""
         if hasattr(target, "close"):
             target.close()  # type: ignore[union-attr]
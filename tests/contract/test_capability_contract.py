@@ -121,6 +121,11 @@ class _FakeCentral:
             timeout_config = SimpleNamespace(
                 callback_warn_interval=callback_warn_interval,
                 connectivity_error_threshold=3,
+                command_retry_duty_cycle_delay=40.0,
+                command_retry_transmission_pending_delay=5.0,
+                command_throttle_adaptive=False,
+                command_throttle_bucket_size=10,
+                command_throttle_duty_cycle_target=80.0,
                 command_throttle_interval=0.0,
                 burst_threshold=5,
                 burst_window=1.0,
@@ -22,6 +22,7 @@ from collections.abc import Callable
 from typing import Any
 
 from aiohomematic.central.events import ClientStateChangedEvent, DataPointValueReceivedEvent, Event, EventBus
+from aiohomematic.const import TaskCategory
 from aiohomematic.type_aliases import AsyncTaskFactoryAny, CoroutineAny
 
 
@@ -29,11 +30,11 @@ class MockTaskScheduler:
     """Mock task scheduler for testing."""
 
     def async_add_executor_job[T](
-        self, target: Callable[..., T], *args: Any, name: str, executor: Any = None
+        self, target: Callable[..., T], *args: Any, name: str, lane: Any = None
     ) -> asyncio.Future[T]:
         """Add an executor job from within the event_loop."""
         loop = asyncio.get_event_loop()
-        return loop.run_in_executor(executor, target, *args)
+        return loop.run_in_executor(None, target, *args)
 
     async def block_till_done(self, *, wait_time: float | None = None) -> None:
         """Block until all pending work is done."""
@@ -41,7 +42,9 @@ class MockTaskScheduler:
     def cancel_tasks(self) -> None:
         """Cancel running tasks."""
 
-    def create_task(self, *, target: CoroutineAny | AsyncTaskFactoryAny, name: str) -> None:
+    def create_task(
+        self, *, target: CoroutineAny | AsyncTaskFactoryAny, name: str, category: TaskCategory = TaskCategory.DEFAULT
+    ) -> None:
         """Create and schedule an async task."""
 
 
@@ -16,11 +16,28 @@ from aiohomematic.const import INIT_DATETIME, ParamsetKey
 __all__ = [
     "FakeCentral",
     "FakeChannel",
+    "FakeDataPointNotifier",
     "FakeDevice",
     "FakeGenericDP",
 ]
 
 
+class FakeDataPointNotifier:
+    """Minimal stand-in for the data point update notifier of the event bus."""
+
+    def mark_changed(self, *, unique_id: str, old_value: Any = None, new_value: Any = None) -> None:
+        """Ignore change notifications."""
+
+    def mark_refreshed(self, *, unique_id: str) -> None:
+        """Ignore refresh notifications."""
+
+    def subscribe_fields(
+        self, *, unique_id: str, dependent_unique_id: str, field: Any, handler: Callable[..., None]
+    ) -> Callable[[], None]:
+        """Mock field subscription that returns a no-op unsubscribe."""
+        return lambda: None
+
+
 class FakeCentral:
     """Minimal stand-in for a central unit."""
 
@@ -48,6 +65,7 @@ class FakeCentral:
         class _EventBus:
             def __init__(self, *, task_scheduler: Any = None) -> None:
                 """Initialize fake event bus."""
+                self.data_point_notifier = FakeDataPointNotifier()
 
             def subscribe(
                 self, *, event_type: Any, event_key: Any, handler: Callable[[Any], None]
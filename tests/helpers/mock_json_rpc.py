@@ -24,6 +24,10 @@ class MockJsonRpc:
     - Interface.listInterfaces -> returns a couple of fake interfaces
     - ReGa.runScript -> echoes a minimal structure to satisfy script-based calls
     - A few other methods can be added on demand
+
+    Set chunked to send the responses with chunked transfer encoding and without
+    a Content-Length header. device_count sets the number of devices returned by
+    the fetch_all_device_data script.
     """
 
     SUPPORTED_METHODS: Final[tuple[str, ...]] = (
@@ -44,6 +48,8 @@ class MockJsonRpc:
         self._runner: web.AppRunner | None = None
         self._site: web.TCPSite | None = None
         self._session_id: str = "sess-1234"
+        self.chunked: bool = False
+        self.device_count: int = 1
 
     async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
         """Start the aiohttp server on a host/port and return the base URL."""
@@ -102,12 +108,36 @@ class MockJsonRpc:
             # Simulate script responses used by client (e.g., get_serial.fn)
             # Client expects 'result' to be a JSON string which it will parse.
             script: str = params.get("script", "")
-            result_obj = {"serial": "ABCDEF123456"} if "get_serial" in script or '{"serial"' in script else {"ok": True}
-            response = {"error": None, "result": compat.dumps(obj=result_obj).decode(UTF_8)}
+            if "fetch_all_device_data" in script:
+                # Line oriented output with URI encoded names and string values, like the CCU
+                entries = ",\r\n".join(
+                    f'"BidCos-RF.OEQ{index:07d}%3A1.STATE":true,\r\n"BidCos-RF.OEQ{index:07d}%3A1.TEXT":"ON%2FOFF"'
+                    for index in range(1, self.device_count + 1)
+                )
+                result = f"{{{entries}}}"
+                response = {"error": None, "result": result}
+            else:
+                result_obj = (
+                    {"serial": "ABCDEF123456"} if "get_serial" in script or '{"serial"' in script else {"ok": True}
+                )
+                response = {"error": None, "result": compat.dumps(obj=result_obj).decode(UTF_8)}
         else:
             response = {"error": {"message": f"method not implemented: {method}"}, "result": None}
 
-        return web.json_response(response)
+        json_response = web.json_response(response)
+        if not self.chunked:
+            # Compress like the CCU webserver if the client accepts it
+            json_response.enable_compression()
+            return json_response
+        body = bytes(json_response.body)  # type: ignore[arg-type]
+        stream = web.StreamResponse(headers={"Content-Type": "application/json"})
+        stream.enable_chunked_encoding()
+        stream.enable_compression()
+        await stream.prepare(request)
+        await stream.write(body[: len(body) // 2])
+        await stream.write(body[len(body) // 2 :])
+        await stream.write_eof()
+        return stream
 
 
 async def create_running_mock_json_rpc() -> tuple[MockJsonRpc, str]:
@@ -7,12 +7,14 @@ from collections.abc import Iterable
 from concurrent.futures import CancelledError as FutCancelledError
 import contextlib
 import logging
+import threading
 from time import monotonic
 
 import pytest
 
 import aiohomematic.async_support as asupp
-from aiohomematic.async_support import Looper, cancelling, loop_check
+from aiohomematic.async_support import ExecutorPool, Looper, cancelling, loop_check
+from aiohomematic.const import DEFAULT_EXECUTOR_LANE_SIZES, ExecutorLane, TaskBudget, TaskBudgetPolicy, TaskCategory
 import aiohomematic.support as hms
 
 
@@ -387,6 +389,252 @@ class TestLooper:
         assert result == 3
 
 
+class TestExecutorPool:
+    """Test the lanes of the shared executor pool."""
+
+    def test_cancelled_job_releases_queue_slot(self) -> None:
+        """A job cancelled before it started must not stay in the queue depth."""
+        pool = ExecutorPool(lane_sizes={ExecutorLane.STORAGE: 1})
+        started = threading.Event()
+        release = threading.Event()
+
+        def _block() -> bool:
+            started.set()
+            return release.wait()
+
+        try:
+            blocker = pool.submit(lane=ExecutorLane.STORAGE, target=_block)
+            assert started.wait(timeout=5)
+            queued = pool.submit(lane=ExecutorLane.STORAGE, target=lambda: None)
+            assert queued.cancel()
+            assert pool.lane_stats["storage"].queue_depth == 0
+        finally:
+            release.set()
+            blocker.result(timeout=5)
+            for executor in pool._executors.values():
+                executor.shutdown()
+        stats = pool.lane_stats["storage"]
+        assert stats.submitted == 2
+        assert stats.completed == 1
+        assert stats.active == 0
+
+    def test_register_adds_rpc_lanes_and_keeps_largest_other_lanes(self) -> None:
+        """The RPC lane is the sum of the registered sizes, the other lanes the largest one."""
+        pool = ExecutorPool()
+        pool.register(name="ccu1", lane_sizes={ExecutorLane.CPU: 4, ExecutorLane.RPC: 8})
+        pool.register(name="ccu2", lane_sizes={ExecutorLane.CPU: 2, ExecutorLane.RPC: 4})
+
+        assert pool.lane_stats["rpc"].max_workers == 12
+        assert pool.lane_stats["cpu"].max_workers == 4
+
+        pool.unregister(name="ccu1")
+        assert pool.lane_stats["rpc"].max_workers == 4
+        assert pool.lane_stats["cpu"].max_workers == 2
+
+        pool.unregister(name="ccu2")
+        assert pool.lane_stats["rpc"].max_workers == DEFAULT_EXECUTOR_LANE_SIZES[ExecutorLane.RPC]
+        assert pool.lane_stats["cpu"].max_workers == DEFAULT_EXECUTOR_LANE_SIZES[ExecutorLane.CPU]
+
+    def test_register_replaces_resized_lane(self) -> None:
+        """Resizing a lane replaces its thread pool; unchanged lanes keep theirs."""
+        pool = ExecutorPool()
+        pool.submit(lane=ExecutorLane.CPU, target=lambda: None).result(timeout=5)
+        pool.submit(lane=ExecutorLane.RPC, target=lambda: None).result(timeout=5)
+        rpc_executor = pool._executors[ExecutorLane.RPC]
+
+        pool.register(name="ccu", lane_sizes={ExecutorLane.CPU: 4, ExecutorLane.RPC: 8})
+
+        assert ExecutorLane.CPU not in pool._executors
+        assert pool._executors[ExecutorLane.RPC] is rpc_executor
+        assert pool.lane_stats["cpu"].max_workers == 4
+        pool.submit(lane=ExecutorLane.CPU, target=lambda: None).result(timeout=5)
+        assert pool._executors[ExecutorLane.CPU]._max_workers == 4
+        for executor in pool._executors.values():
+            executor.shutdown()
+
+    def test_saturated_lane_does_not_block_other_lanes(self) -> None:
+        """Jobs queued behind a busy storage lane must not delay the RPC lane."""
+        pool = ExecutorPool(lane_sizes={ExecutorLane.STORAGE: 1})
+        started = threading.Event()
+        release = threading.Event()
+
+        def _block() -> bool:
+            started.set()
+            return release.wait()
+
+        try:
+            blocker = pool.submit(lane=ExecutorLane.STORAGE, target=_block)
+            assert started.wait(timeout=5)
+            queued = pool.submit(lane=ExecutorLane.STORAGE, target=lambda: "saved")
+            assert pool.submit(lane=ExecutorLane.RPC, target=lambda: "pong").result(timeout=5) == "pong"
+
+            storage = pool.lane_stats["storage"]
+            assert storage.queue_depth == 1
+            assert storage.saturated is True
+            assert pool.lane_stats["rpc"].completed == 1
+        finally:
+            release.set()
+        assert blocker.result(timeout=5) is True
+        assert queued.result(timeout=5) == "saved"
+        for executor in pool._executors.values():
+            executor.shutdown()
+
+        storage = pool.lane_stats["storage"]
+        assert storage.queue_depth == 0
+        assert storage.completed == 2
+        assert storage.max_wait_ms > 0.0
+
+    @pytest.mark.asyncio
+    async def test_looper_submits_to_lane(self) -> None:
+        """async_add_executor_job runs the job on a worker thread of the requested lane."""
+        looper = Looper()
+
+        thread_name = await looper.async_add_executor_job(
+            lambda: threading.current_thread().name, name="thread-name", lane=ExecutorLane.STORAGE
+        )
+
+        assert thread_name.startswith("aiohomematic-storage")
+
+
+class TestTaskBudgets:
+    """Test the per-category task budgets of the Looper."""
+
+    @pytest.mark.asyncio
+    async def test_await_policy_queues_until_slot_is_free(self) -> None:
+        """Tasks over budget wait and start in order once a running task finished."""
+        looper = Looper(task_budgets={TaskCategory.EVENT: TaskBudget(limit=1, policy=TaskBudgetPolicy.AWAIT)})
+        release = asyncio.Event()
+        started: list[str] = []
+
+        async def work(*, label: str) -> None:
+            started.append(label)
+            await release.wait()
+
+        for label in ("a", "b", "c"):
+            looper.create_task(target=work(label=label), name=label, category=TaskCategory.EVENT)
+        await asyncio.sleep(0.01)
+
+        stats = looper.task_stats["event"]
+        assert started == ["a"]
+        assert (stats.running, stats.queued, stats.saturated) == (1, 2, True)
+
+        release.set()
+        await looper.block_till_done()
+
+        stats = looper.task_stats["event"]
+        assert started == ["a", "b", "c"]
+        assert (stats.running, stats.queued, stats.started, stats.peak_running) == (0, 0, 3, 1)
+
+    @pytest.mark.asyncio
+    async def test_cancel_tasks_drops_waiting_tasks(self) -> None:
+        """cancel_tasks closes waiting tasks instead of starting them."""
+        looper = Looper(task_budgets={TaskCategory.CLEANUP: TaskBudget(limit=1, policy=TaskBudgetPolicy.AWAIT)})
+        started: list[str] = []
+
+        async def work(*, label: str) -> None:
+            started.append(label)
+            await asyncio.sleep(10)
+
+        looper._async_create_task(work(label="a"), name="a", category=TaskCategory.CLEANUP)
+        looper._async_create_task(work(label="b"), name="b", category=TaskCategory.CLEANUP)
+        await asyncio.sleep(0)
+
+        looper.cancel_tasks()
+        await looper.block_till_done()
+
+        assert started == ["a"]
+        assert looper.task_stats["cleanup"].queued == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce_policy_keeps_latest_task_per_name(self) -> None:
+        """A waiting task is replaced by a newer task of the same name."""
+        looper = Looper(task_budgets={TaskCategory.PERSISTENCE: TaskBudget(limit=1, policy=TaskBudgetPolicy.COALESCE)})
+        runs: list[int] = []
+
+        async def save(*, revision: int) -> None:
+            await asyncio.sleep(0)
+            runs.append(revision)
+
+        for revision in range(4):
+            looper._async_create_task(save(revision=revision), name="save", category=TaskCategory.PERSISTENCE)
+        await looper.block_till_done()
+
+        assert runs == [0, 3]
+        assert looper.task_stats["persistence"].coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_drop_policy_and_queue_limit(self) -> None:
+        """Tasks are dropped by the DROP policy and when the queue of the category is full."""
+        looper = Looper(
+            task_budgets={
+                TaskCategory.INCIDENT: TaskBudget(limit=1, policy=TaskBudgetPolicy.DROP),
+                TaskCategory.RPC_CALLBACK: TaskBudget(limit=1, policy=TaskBudgetPolicy.AWAIT, max_queued=1),
+            }
+        )
+
+        async def work() -> None:
+            await asyncio.sleep(0)
+
+        assert looper._async_create_task(work(), name="i1", category=TaskCategory.INCIDENT) is not None
+        assert looper._async_create_task(work(), name="i2", category=TaskCategory.INCIDENT) is None
+        for index in range(3):
+            looper._async_create_task(work(), name=f"r{index}", category=TaskCategory.RPC_CALLBACK)
+        await looper.block_till_done()
+
+        assert looper.task_stats["incident"].dropped == 1
+        assert looper.task_stats["incident"].started == 1
+        assert looper.task_stats["rpc_callback"].dropped == 1
+        assert looper.task_stats["rpc_callback"].started == 2
+
+    @pytest.mark.asyncio
+    async def test_dropped_value_tasks_warn_rate_limited(
+        self, caplog: pytest.LogCaptureFixture, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Dropped events and callbacks are logged as warning at most once per interval, other drops at debug."""
+        looper = Looper(
+            task_budgets={
+                TaskCategory.INCIDENT: TaskBudget(limit=1, policy=TaskBudgetPolicy.DROP),
+                TaskCategory.RPC_CALLBACK: TaskBudget(limit=1, policy=TaskBudgetPolicy.AWAIT, max_queued=1),
+            }
+        )
+        now = 1000.0
+        monkeypatch.setattr(asupp, "monotonic", lambda: now)
+
+        async def work() -> None:
+            await asyncio.sleep(0)
+
+        with caplog.at_level(logging.DEBUG, logger="aiohomematic.async_support"):
+            looper._async_create_task(work(), name="i1", category=TaskCategory.INCIDENT)
+            looper._async_create_task(work(), name="i2", category=TaskCategory.INCIDENT)
+            for index in range(5):
+                looper._async_create_task(work(), name=f"r{index}", category=TaskCategory.RPC_CALLBACK)
+            now += asupp.TASK_DROP_WARN_INTERVAL
+            looper._async_create_task(work(), name="r5", category=TaskCategory.RPC_CALLBACK)
+            await looper.block_till_done()
+
+        warnings = [record.getMessage() for record in caplog.records if record.levelno == logging.WARNING]
+        assert len(warnings) == 2
+        assert warnings[0].startswith("CREATE_TASK: Dropped 1 task(s) of category rpc_callback")
+        assert warnings[1].startswith("CREATE_TASK: Dropped 3 task(s) of category rpc_callback")
+        assert looper.task_stats["rpc_callback"].dropped == 4
+        assert any("Dropped task i2" in record.getMessage() for record in caplog.records)
+
+    @pytest.mark.asyncio
+    async def test_unbudgeted_category_is_not_limited(self) -> None:
+        """Categories without budget start every task immediately."""
+        looper = Looper(task_budgets={})
+
+        async def work() -> None:
+            await asyncio.sleep(0)
+
+        for index in range(5):
+            looper._async_create_task(work(), name=f"t{index}", category=TaskCategory.EVENT)
+
+        stats = looper.task_stats["event"]
+        assert (stats.limit, stats.running, stats.queued) == (0, 5, 0)
+        await looper.block_till_done()
+
+
 class TestCancellingHelper:
     """Test cancelling helper function."""
 
@@ -1090,6 +1090,36 @@ class TestCentralCaches:
         assert central.hub_coordinator.get_program_data_point(pid="123") is None
         assert central.hub_coordinator.get_sysvar_data_point(legacy_name="123") is None
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES, True, None, None),
+        ],
+    )
+    async def test_memory_report(
+        self,
+        central_client_factory_with_homegear_client,
+    ) -> None:
+        """Test the memory report of the central model."""
+        central, _, _ = central_client_factory_with_homegear_client
+        report = central.memory_report()
+        assert report.by_type["Device"].count == len(central.device_registry.devices)
+        assert report.by_type["Channel"].count == sum(
+            len(device.channels) for device in central.device_registry.devices
+        )
+        assert report.by_type["EventBus.subscription"].count == central.event_bus.get_total_subscription_count()
+        assert report.objects_total == sum(stats.count for stats in report.by_type.values())
+        assert report.approx_bytes_total == sum(stats.approx_bytes for stats in report.by_type.values())
+        sizes = [stats.approx_bytes for stats in report.by_type.values()]
+        assert sizes == sorted(sizes, reverse=True)
+        assert report.to_dict()["by_type"]["Device"]["avg_bytes"] > 0
+
 
 class TestSchedulerJob:
     """Test scheduler job readiness and execution."""
@@ -1512,6 +1542,7 @@ class TestCentralDeviceCreation:
         device_coordinator._coordinator_provider = mock_coordinator_provider  # type: ignore[attr-defined]
         device_coordinator._central_info = central  # type: ignore[attr-defined]
         device_coordinator._config_provider = central  # type: ignore[attr-defined]
+        device_coordinator._event_bus_provider = MagicMock()  # type: ignore[attr-defined]
 
         mock_cache_coordinator = MagicMock()
         central._cache_coordinator = mock_cache_coordinator  # type: ignore[attr-defined]
@@ -9,7 +9,16 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 import pytest
 
 from aiohomematic.central import BackgroundScheduler, SchedulerJob
-from aiohomematic.const import CentralState, ScheduleTimerConfig
+from aiohomematic.central.events import DataRefreshCompletedEvent
+from aiohomematic.const import CentralState, DataRefreshType, ScheduleTimerConfig
+
+_HUB_DATA_REFRESH_TYPES = (
+    DataRefreshType.PROGRAM,
+    DataRefreshType.SYSVAR,
+    DataRefreshType.INBOX,
+    DataRefreshType.SERVICE_MESSAGES,
+    DataRefreshType.ALARM_MESSAGES,
+)
 
 
 def _create_schedule_timer_config(
@@ -700,6 +709,96 @@ class TestBackgroundSchedulerJobExecution:
 
         central.hub_coordinator.fetch_sysvar_data.assert_called_once()
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("snapshot_result", "central_available", "expected_refreshed"),
+        [
+            (frozenset(_HUB_DATA_REFRESH_TYPES), True, _HUB_DATA_REFRESH_TYPES),
+            (None, True, _HUB_DATA_REFRESH_TYPES),
+            (frozenset({DataRefreshType.PROGRAM, DataRefreshType.SYSVAR}), False, _HUB_DATA_REFRESH_TYPES[:2]),
+            (None, False, _HUB_DATA_REFRESH_TYPES[:2]),
+            (frozenset(), True, ()),
+        ],
+        ids=["snapshot", "fallback", "snapshot-unavailable", "fallback-unavailable", "snapshot-failed"],
+    )
+    async def test_refresh_hub_data(
+        self,
+        snapshot_result: frozenset[DataRefreshType] | None,
+        central_available: bool,
+        expected_refreshed: tuple[DataRefreshType, ...],
+    ) -> None:
+        """_refresh_hub_data should use the hub snapshot, fall back to the separate fetches and report per category."""
+        central = MagicMock()
+        central.name = "test-ccu"
+        central.event_bus = MagicMock()
+        central.event_bus.subscribe = MagicMock(return_value=lambda: None)
+        central.event_bus.publish = AsyncMock()
+        central.event_bus.publish_sync = MagicMock()
+        central.config = MagicMock()
+        central.config.schedule_timer_config = _create_schedule_timer_config()
+        central.config.enable_program_scan = True
+        central.config.enable_sysvar_scan = True
+        central.available = central_available
+        central.hub_coordinator = MagicMock()
+
+        async def fetch_hub_data(*, scheduled: bool) -> frozenset[DataRefreshType] | None:
+            # All categories are reported as triggered before the fetch starts.
+            assert central.event_bus.publish_sync.call_count == len(_HUB_DATA_REFRESH_TYPES)
+            return snapshot_result
+
+        central.hub_coordinator.fetch_hub_data = AsyncMock(side_effect=fetch_hub_data)
+        central.hub_coordinator.fetch_program_data = AsyncMock()
+        central.hub_coordinator.fetch_sysvar_data = AsyncMock()
+        central.hub_coordinator.fetch_inbox_data = AsyncMock()
+        central.hub_coordinator.fetch_service_messages_data = AsyncMock()
+        central.hub_coordinator.fetch_alarm_messages_data = AsyncMock()
+
+        central.connection_state = MagicMock()
+        central.connection_state.is_any_issue = False
+
+        scheduler = BackgroundScheduler(
+            central_info=central,
+            config_provider=central,
+            client_coordinator=central,
+            connection_state_provider=central,
+            device_data_refresher=central,
+            firmware_data_refresher=central,
+            event_coordinator=central,
+            hub_data_fetcher=central.hub_coordinator,
+            event_bus_provider=central,
+        )
+        scheduler._devices_created_event.set()
+
+        assert sum(job.name == "_refresh_hub_data" for job in scheduler._scheduler_jobs) == 1
+        assert not any(job.name == "_refresh_sysvar_data" for job in scheduler._scheduler_jobs)
+
+        await scheduler._refresh_hub_data()
+
+        central.hub_coordinator.fetch_hub_data.assert_called_once_with(scheduled=True)
+        # The separate fetches only run if the backend provides no snapshot, not if the snapshot failed.
+        for refresh_type, fetch in zip(
+            _HUB_DATA_REFRESH_TYPES,
+            (
+                central.hub_coordinator.fetch_program_data,
+                central.hub_coordinator.fetch_sysvar_data,
+                central.hub_coordinator.fetch_inbox_data,
+                central.hub_coordinator.fetch_service_messages_data,
+                central.hub_coordinator.fetch_alarm_messages_data,
+            ),
+            strict=True,
+        ):
+            assert fetch.call_count == (1 if snapshot_result is None and refresh_type in expected_refreshed else 0)
+
+        triggered = [call.kwargs["event"] for call in central.event_bus.publish_sync.call_args_list]
+        assert [event.refresh_type for event in triggered] == list(_HUB_DATA_REFRESH_TYPES)
+
+        # Every category reports its completion, successful only if it was refreshed.
+        completed = [call.kwargs["event"] for call in central.event_bus.publish.call_args_list]
+        assert all(isinstance(event, DataRefreshCompletedEvent) for event in completed)
+        assert [event.refresh_type for event in completed] == list(_HUB_DATA_REFRESH_TYPES)
+        assert [event.refresh_type for event in completed if event.success] == list(expected_refreshed)
+        assert all(event.error_message for event in completed if not event.success)
+
 
 class TestSchedulerJobExecution:
     """Test SchedulerJob execution and scheduling."""
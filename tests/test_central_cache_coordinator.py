@@ -12,7 +12,12 @@ from aiohomematic.central.events import CacheInvalidatedEvent, EventBus
 from aiohomematic.const import CacheInvalidationReason, CacheType
 from aiohomematic.store import LocalStorageFactory
 from aiohomematic.store.dynamic import CentralDataCache, DeviceDetailsCache
-from aiohomematic.store.persistent import DeviceDescriptionRegistry, ParamsetDescriptionRegistry, SessionRecorder
+from aiohomematic.store.persistent import (
+    DeviceDescriptionRegistry,
+    ParamsetDescriptionRegistry,
+    ScheduleRegistry,
+    SessionRecorder,
+)
 from aiohomematic_test_support.event_capture import EventCapture
 
 
@@ -332,6 +337,30 @@ class TestCacheCoordinatorSaveOperations:
             mock_desc_save.assert_called_once()
             mock_param_save.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_save_all_schedules(self, tmp_path) -> None:
+        """Save all should save the week profile schedules only on request."""
+        central = _FakeCentral(tmp_dir=str(tmp_path))
+
+        with patch.object(ScheduleRegistry, "save", new=AsyncMock()) as mock_schedule_save:
+            coordinator = CacheCoordinator(
+                central_info=central,
+                device_provider=central,
+                client_provider=central,
+                data_point_provider=central,
+                event_bus_provider=central,
+                primary_client_provider=central,
+                config_provider=central,
+                storage_factory=central.storage_factory,
+                task_scheduler=central.looper,
+                session_recorder_active=False,
+            )  # type: ignore[arg-type]
+            await coordinator.save_all()
+            mock_schedule_save.assert_not_called()
+
+            await coordinator.save_all(save_schedules=True)
+            mock_schedule_save.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_save_all_handles_exceptions(self, tmp_path) -> None:
         """Save all should raise exceptions from cache saves."""
@@ -9,7 +9,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from aiohomematic.central.coordinators import DeviceCoordinator
-from aiohomematic.const import DeviceDescription, SourceOfDeviceCreation
+from aiohomematic.const import MAX_CONCURRENT_DEVICE_INITS, DeviceDescription, RxMode, SourceOfDeviceCreation
+from aiohomematic.metrics import LatencyMetricEvent
 
 
 class _FakeChannel:
@@ -1578,6 +1579,7 @@ class _BuildableDevice:
         """Initialize a buildable fake device."""
         self.address = address
         self.interface_id = interface_id
+        self.rx_modes: tuple[RxMode, ...] = (RxMode.ALWAYS,)
         self.finalize_init_called = False
 
     async def finalize_init(self) -> None:
@@ -1696,3 +1698,107 @@ class TestDeviceCoordinatorCreateDevicesInterruption:
 
         # Exactly one device made it into the registry before the interruption (stranded).
         assert len(central.device_registry.get_device_addresses()) == 1
+
+
+class _ConcurrencyProbe:
+    """Track how many fake devices are finalized at the same time."""
+
+    def __init__(self) -> None:
+        """Initialize the probe."""
+        self.active: dict[tuple[str, bool], int] = {}
+        self.peak: dict[tuple[str, bool], int] = {}
+
+    async def finalize(self, *, lane: tuple[str, bool]) -> None:
+        """Simulate a backend round trip for one device."""
+        self.active[lane] = self.active.get(lane, 0) + 1
+        self.peak[lane] = max(self.peak.get(lane, 0), self.active[lane])
+        await asyncio.sleep(0.01)
+        self.active[lane] -= 1
+
+
+class _ProbedDevice(_BuildableDevice):
+    """Buildable fake device that reports to a concurrency probe."""
+
+    def __init__(self, *, address: str, interface_id: str, probe: _ConcurrencyProbe) -> None:
+        """Initialize a probed fake device."""
+        super().__init__(address=address, interface_id=interface_id)
+        self._probe = probe
+        if address.startswith("BAT"):
+            self.rx_modes = (RxMode.CONFIG, RxMode.WAKEUP)
+
+    async def finalize_init(self) -> None:
+        """Record concurrency while finalizing."""
+        await self._probe.finalize(lane=(self.interface_id, RxMode.ALWAYS in self.rx_modes))
+        self.finalize_init_called = True
+
+
+class TestDeviceCoordinatorCreateDevicesStages:
+    """Cover the staged, bounded-concurrency finalization of ``create_devices``."""
+
+    @pytest.mark.asyncio
+    async def test_finalize_is_bounded_per_interface_and_rx_mode(self) -> None:
+        """Devices are finalized in parallel, limited per interface; battery devices one at a time."""
+        coordinator, _central = _make_create_devices_coordinator()
+        probe = _ConcurrencyProbe()
+        built: list[_ProbedDevice] = []
+
+        def _build(*, context: object) -> _ProbedDevice:
+            device = _ProbedDevice(
+                address=context.device_address,  # type: ignore[attr-defined]
+                interface_id=context.interface_id,  # type: ignore[attr-defined]
+                probe=probe,
+            )
+            built.append(device)
+            return device
+
+        with (
+            patch("aiohomematic.central.coordinators.device.Device", side_effect=_build),
+            patch("aiohomematic.central.coordinators.device.create_data_points_and_events"),
+            patch("aiohomematic.central.coordinators.device.create_custom_data_points"),
+            patch("aiohomematic.central.coordinators.device.create_week_profile_data_point"),
+            patch("aiohomematic.central.coordinators.device._get_new_data_points", return_value={}),
+            patch("aiohomematic.central.coordinators.device._get_new_event_groups", return_value=()),
+        ):
+            await coordinator.create_devices(
+                new_device_addresses={
+                    "if-a": {f"DEV{i:07d}" for i in range(20)} | {f"BAT{i:07d}" for i in range(3)},
+                    "if-b": {f"DEV{i:07d}" for i in range(20, 24)},
+                },
+                source=SourceOfDeviceCreation.CACHE,
+            )
+
+        assert len(built) == 27
+        assert all(device.finalize_init_called for device in built)
+        assert probe.peak[("if-a", True)] == MAX_CONCURRENT_DEVICE_INITS
+        assert probe.peak[("if-a", False)] == 1
+        assert probe.peak[("if-b", True)] == 4
+
+    @pytest.mark.asyncio
+    async def test_stage_latencies_are_emitted(self) -> None:
+        """Each creation stage publishes a latency metric."""
+        coordinator, central = _make_create_devices_coordinator()
+
+        with (
+            patch(
+                "aiohomematic.central.coordinators.device.Device",
+                side_effect=lambda *, context: _BuildableDevice(
+                    address=context.device_address, interface_id=context.interface_id
+                ),
+            ),
+            patch("aiohomematic.central.coordinators.device.create_data_points_and_events"),
+            patch("aiohomematic.central.coordinators.device.create_custom_data_points"),
+            patch("aiohomematic.central.coordinators.device.create_week_profile_data_point"),
+            patch("aiohomematic.central.coordinators.device._get_new_data_points", return_value={}),
+            patch("aiohomematic.central.coordinators.device._get_new_event_groups", return_value=()),
+        ):
+            await coordinator.create_devices(
+                new_device_addresses={"test-interface": {"VCU0000001"}},
+                source=SourceOfDeviceCreation.CACHE,
+            )
+
+        metric_keys = {
+            call.kwargs["event"].metric_key
+            for call in central.event_bus.publish_sync.call_args_list
+            if isinstance(call.kwargs["event"], LatencyMetricEvent)
+        }
+        assert metric_keys == {"device_creation.stage.construct", "device_creation.stage.finalize"}
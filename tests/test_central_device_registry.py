@@ -5,14 +5,36 @@
 import pytest
 
 from aiohomematic.central import DeviceRegistry
+from aiohomematic.const import DataPointCategory, DataPointUsage, Interface
 
 
 class _FakeChannel:
     """Minimal fake Channel for testing."""
 
-    def __init__(self, *, address: str) -> None:
+    def __init__(self, *, address: str, ise_id: int | None = None) -> None:
         """Initialize a fake channel."""
         self.address = address
+        self.ise_id = ise_id
+
+
+class _FakeDataPoint:
+    """Minimal fake data point for testing."""
+
+    def __init__(
+        self,
+        *,
+        category: DataPointCategory,
+        usage: DataPointUsage = DataPointUsage.DATA_POINT,
+        is_registered: bool = False,
+    ) -> None:
+        """Initialize a fake data point."""
+        self.category = category
+        self.usage = usage
+        self.is_registered = is_registered
+
+
+class _FakeSwitchDataPoint(_FakeDataPoint):
+    """Fake data point subclass for type lookups."""
 
 
 class _FakeDevice:
@@ -23,21 +45,33 @@ class _FakeDevice:
         *,
         address: str,
         channels: dict[str, _FakeChannel] | None = None,
+        data_points: tuple[_FakeDataPoint, ...] = (),
+        interface: Interface = Interface.BIDCOS_RF,
+        interface_id: str = "test-BidCos-RF",
+        ise_id: int | None = None,
+        model: str = "HM-TEST",
     ) -> None:
         """Initialize a fake device."""
         self.address = address
+        self.interface = interface
+        self.interface_id = interface_id
+        self.model = model
+        self.ise_id = ise_id
         self._channels = channels or {}
+        self._data_points = data_points
+
+    @property
+    def channels(self) -> dict[str, _FakeChannel]:
+        """Return the channels."""
+        return self._channels
 
     def get_channel(self, *, channel_address: str) -> _FakeChannel | None:
         """Get a channel by address."""
         return self._channels.get(channel_address)
 
-    def identify_channel(self, *, text: str) -> _FakeChannel | None:
-        """Identify a channel within text."""
-        for channel in self._channels.values():
-            if channel.address in text:
-                return channel
-        return None
+    def get_data_points(self, *, exclude_no_create: bool = True) -> tuple[_FakeDataPoint, ...]:
+        """Return the data points."""
+        return tuple(dp for dp in self._data_points if not exclude_no_create or dp.usage != DataPointUsage.NO_CREATE)
 
 
 class _FakeCentral:
@@ -169,8 +203,8 @@ class TestDeviceRegistryBasics:
         assert device2 in devices  # type: ignore[comparison-overlap]
 
     @pytest.mark.asyncio
-    async def test_devices_property_returns_new_tuple(self) -> None:
-        """Devices property should return a new tuple each time."""
+    async def test_devices_property_is_cached_until_change(self) -> None:
+        """Devices property should return the cached tuple until a device is added or removed."""
         central = _FakeCentral()
         registry = DeviceRegistry(central_info=central, client_provider=central)  # type: ignore[arg-type]
 
@@ -178,11 +212,13 @@ class TestDeviceRegistryBasics:
         await registry.add_device(device=device)  # type: ignore[arg-type]
 
         devices1 = registry.devices
-        devices2 = registry.devices
+        assert registry.devices is devices1
+        assert registry.get_device_addresses() is registry.get_device_addresses()
 
-        # Should be equal but not the same object
-        assert devices1 == devices2
-        assert devices1 is not devices2
+        await registry.add_device(device=_FakeDevice(address="VCU0000002"))  # type: ignore[arg-type]
+        devices2 = registry.devices
+        assert devices2 is not devices1
+        assert len(devices2) == 2
 
     def test_initialization(self) -> None:
         """DeviceRegistry should initialize with empty device collection."""
@@ -514,7 +550,7 @@ class TestDeviceRegistryIdentifyChannel:
         await registry.add_device(device=device1)  # type: ignore[arg-type]
         await registry.add_device(device=device2)  # type: ignore[arg-type]
 
-        identified = registry.identify_channel(text="Channel VCU0000002:1 triggered")
+        identified = registry.identify_channel(text="Channel VCU0000002:1")
         assert identified is channel2  # type: ignore[comparison-overlap]
 
     @pytest.mark.asyncio
@@ -546,7 +582,7 @@ class TestDeviceRegistryIdentifyChannel:
         )
         await registry.add_device(device=device)  # type: ignore[arg-type]
 
-        identified = registry.identify_channel(text="The device VCU0000001:1 is active")
+        identified = registry.identify_channel(text="The device VCU0000001:1")
         assert identified is channel  # type: ignore[comparison-overlap]
 
 
@@ -725,3 +761,135 @@ class TestDeviceRegistryIntegration:
         assert registry.device_count == 2
         assert registry.has_device(address="VCU0000001") is True
         assert registry.has_device(address="VCU0000002") is True
+
+
+class TestDeviceRegistryIndexes:
+    """Test the secondary indexes used for data point and channel lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_data_points_by_category_and_interface(self) -> None:
+        """Data points are returned per category and interface in registry order."""
+        central = _FakeCentral()
+        registry = DeviceRegistry(central_info=central, client_provider=central)  # type: ignore[arg-type]
+
+        switch_a = _FakeSwitchDataPoint(category=DataPointCategory.SWITCH)
+        sensor_a = _FakeDataPoint(category=DataPointCategory.SENSOR)
+        hidden_a = _FakeDataPoint(category=DataPointCategory.SENSOR, usage=DataPointUsage.NO_CREATE)
+        switch_b = _FakeSwitchDataPoint(category=DataPointCategory.SWITCH, is_registered=True)
+
+        await registry.add_device(  # type: ignore[arg-type]
+            device=_FakeDevice(address="VCU0000001", data_points=(switch_a, sensor_a, hidden_a))
+        )
+        await registry.add_device(  # type: ignore[arg-type]
+            device=_FakeDevice(address="VCU0000002", data_points=(switch_b,), interface=Interface.HMIP_RF)
+        )
+
+        assert registry.get_data_points() == (switch_a, sensor_a, switch_b)
+        assert registry.get_data_points(exclude_no_create=False) == (switch_a, sensor_a, hidden_a, switch_b)
+        assert registry.get_data_points(category=DataPointCategory.SWITCH) == (switch_a, switch_b)
+        assert registry.get_data_points(interface=Interface.HMIP_RF) == (switch_b,)
+        assert registry.get_data_points(category=DataPointCategory.SENSOR, interface=Interface.HMIP_RF) == ()
+        assert registry.get_data_points(registered=False) == (switch_a, sensor_a)
+        assert registry.get_data_points_by_type(data_point_class=_FakeSwitchDataPoint) == (switch_a, switch_b)
+        assert registry.get_data_points_by_type(
+            data_point_class=_FakeSwitchDataPoint, interface=Interface.BIDCOS_RF
+        ) == (switch_a,)
+
+    @pytest.mark.asyncio
+    async def test_get_data_points_reflects_add_and_remove(self) -> None:
+        """The indexes are rebuilt after devices are added or removed."""
+        central = _FakeCentral()
+        registry = DeviceRegistry(central_info=central, client_provider=central)  # type: ignore[arg-type]
+        switch_a = _FakeSwitchDataPoint(category=DataPointCategory.SWITCH)
+        switch_b = _FakeSwitchDataPoint(category=DataPointCategory.SWITCH)
+
+        await registry.add_device(device=_FakeDevice(address="VCU0000001", data_points=(switch_a,)))  # type: ignore[arg-type]
+        assert registry.get_data_points_by_type(data_point_class=_FakeSwitchDataPoint) == (switch_a,)
+
+        await registry.add_device(device=_FakeDevice(address="VCU0000002", data_points=(switch_b,)))  # type: ignore[arg-type]
+        assert registry.get_data_points_by_type(data_point_class=_FakeSwitchDataPoint) == (switch_a, switch_b)
+
+        await registry.remove_device(device_address="VCU0000001")
+        assert registry.get_data_points(category=DataPointCategory.SWITCH) == (switch_b,)
+
+        await registry.clear()
+        assert registry.get_data_points() == ()
+
+    @pytest.mark.asyncio
+    async def test_get_data_points_registered_state_is_live(self) -> None:
+        """Registration changes are visible without rebuilding the indexes."""
+        central = _FakeCentral()
+        registry = DeviceRegistry(central_info=central, client_provider=central)  # type: ignore[arg-type]
+        switch = _FakeSwitchDataPoint(category=DataPointCategory.SWITCH)
+        await registry.add_device(device=_FakeDevice(address="VCU0000001", data_points=(switch,)))  # type: ignore[arg-type]
+
+        assert registry.get_data_points(registered=False) == (switch,)
+        switch.is_registered = True
+        assert registry.get_data_points(registered=False) == ()
+        assert registry.get_data_points(registered=True) == (switch,)
+
+    @pytest.mark.asyncio
+    async def test_identify_channel_by_ise_id(self) -> None:
+        """Channels are identified by their own or their device's ise_id as a standalone word."""
+        central = _FakeCentral()
+        registry = DeviceRegistry(central_info=central, client_provider=central)  # type: ignore[arg-type]
+
+        channel1 = _FakeChannel(address="VCU0000001:1", ise_id=1234)
+        channel2 = _FakeChannel(address="VCU0000001:2", ise_id=1235)
+        channel3 = _FakeChannel(address="VCU0000002:1", ise_id=2001)
+        await registry.add_device(  # type: ignore[arg-type]
+            device=_FakeDevice(address="VCU0000001", channels={c.address: c for c in (channel1, channel2)}, ise_id=1200)
+        )
+        await registry.add_device(  # type: ignore[arg-type]
+            device=_FakeDevice(address="VCU0000002", channels={channel3.address: channel3}, ise_id=2000)
+        )
+
+        assert registry.identify_channel(text="svRainCounter.1235.Today") is channel2  # type: ignore[comparison-overlap]
+        assert registry.identify_channel(text="Program 2000") is channel3  # type: ignore[comparison-overlap]
+        assert registry.identify_channel(text="Program 1200") is channel1  # type: ignore[comparison-overlap]
+        assert registry.identify_channel(text="Counter 12345") is None
+        # The earliest channel in registry order wins when several match.
+        assert registry.identify_channel(text="2001 VCU0000001:2") is channel2  # type: ignore[comparison-overlap]
+
+
+class TestDeviceRegistryShards:
+    """Test the per-interface shards of the registry."""
+
+    @pytest.mark.asyncio
+    async def test_devices_are_sharded_per_interface(self) -> None:
+        """Devices are grouped by interface_id with O(1) counts."""
+        central = _FakeCentral()
+        registry = DeviceRegistry(central_info=central, client_provider=central)  # type: ignore[arg-type]
+
+        rf1 = _FakeDevice(address="VCU0000001", interface_id="c-BidCos-RF", model="HM-B")
+        rf2 = _FakeDevice(address="VCU0000002", interface_id="c-BidCos-RF", model="HM-A")
+        ip1 = _FakeDevice(address="VCU0000003", interface_id="c-HmIP-RF", model="HmIP-A")
+        for device in (rf1, rf2, ip1):
+            await registry.add_device(device=device)  # type: ignore[arg-type]
+
+        assert registry.get_devices(interface_id="c-BidCos-RF") == (rf1, rf2)
+        assert registry.get_devices(interface_id="c-HmIP-RF") == (ip1,)
+        assert registry.get_devices(interface_id="unknown") == ()
+        assert registry.get_device_count(interface_id="c-BidCos-RF") == 2
+        assert registry.get_device_count(interface_id="unknown") == 0
+        assert registry.device_counts_by_interface == {"c-BidCos-RF": 2, "c-HmIP-RF": 1}
+        assert registry.models == ("HM-A", "HM-B", "HmIP-A")
+
+        await registry.remove_device(device_address="VCU0000003")
+        assert registry.get_devices(interface_id="c-HmIP-RF") == ()
+        assert registry.device_counts_by_interface == {"c-BidCos-RF": 2}
+        assert registry.models == ("HM-A", "HM-B")
+
+    @pytest.mark.asyncio
+    async def test_readd_device_moves_shard(self) -> None:
+        """Re-adding a device with another interface_id moves it to the new shard."""
+        central = _FakeCentral()
+        registry = DeviceRegistry(central_info=central, client_provider=central)  # type: ignore[arg-type]
+
+        await registry.add_device(device=_FakeDevice(address="VCU0000001", interface_id="old"))  # type: ignore[arg-type]
+        moved = _FakeDevice(address="VCU0000001", interface_id="new")
+        await registry.add_device(device=moved)  # type: ignore[arg-type]
+
+        assert registry.get_devices(interface_id="old") == ()
+        assert registry.get_devices(interface_id="new") == (moved,)
+        assert registry.device_count == 1
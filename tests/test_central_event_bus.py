@@ -10,6 +10,8 @@ import pytest
 
 from aiohomematic.async_support import Looper
 from aiohomematic.central.events import (
+    DataPointsRefreshedEvent,
+    DataPointStateChangedBatchEvent,
     DataPointStateChangedEvent,
     DataPointValueReceivedEvent,
     DeviceLifecycleEvent,
@@ -18,7 +20,14 @@ from aiohomematic.central.events import (
     EventBus,
     RpcParameterReceivedEvent,
 )
-from aiohomematic.const import DataPointKey, DeviceTriggerEventType, ParamsetKey
+from aiohomematic.const import (
+    DataPointKey,
+    DeviceTriggerEventType,
+    ParamsetKey,
+    TaskBudget,
+    TaskBudgetPolicy,
+    TaskCategory,
+)
 
 from tests.conftest import NoOpTaskScheduler
 
@@ -1478,6 +1487,171 @@ class TestEventBatch:
         assert batch.is_flushed is True
 
 
+class TestDataPointUpdateNotifier:
+    """Test the per-tick coalescing of data point update notifications."""
+
+    @pytest.mark.asyncio
+    async def test_batch_event_only_when_subscribed(self) -> None:
+        """The batch event carries all events of a tick and is only built for subscribers."""
+        looper = Looper()
+        bus = EventBus(task_scheduler=looper)
+        batches: list[DataPointStateChangedBatchEvent] = []
+
+        bus.data_point_notifier.mark_changed(unique_id="dp1", new_value=1)
+        await looper.block_till_done()
+        assert bus.get_event_stats().get("DataPointStateChangedBatchEvent") is None
+
+        bus.subscribe(
+            event_type=DataPointStateChangedBatchEvent, event_key=None, handler=lambda *, event: batches.append(event)
+        )
+        bus.data_point_notifier.mark_changed(unique_id="dp1", new_value=2)
+        bus.data_point_notifier.mark_changed(unique_id="dp2", new_value=3)
+        await looper.block_till_done()
+
+        assert len(batches) == 1
+        assert [event.unique_id for event in batches[0].events] == ["dp1", "dp2"]
+
+    @pytest.mark.asyncio
+    async def test_changes_within_tick_are_coalesced(self) -> None:
+        """Several changes of one data point in a tick publish one event with first old and last new value."""
+        looper = Looper()
+        bus = EventBus(task_scheduler=looper)
+        received: list[DataPointStateChangedEvent] = []
+        bus.subscribe(
+            event_type=DataPointStateChangedEvent, event_key="dp1", handler=lambda *, event: received.append(event)
+        )
+
+        notifier = bus.data_point_notifier
+        notifier.mark_changed(unique_id="dp1", old_value=1, new_value=2)
+        notifier.mark_changed(unique_id="dp1", old_value=2, new_value=3)
+        notifier.mark_changed(unique_id="dp2", old_value=None, new_value=True)
+        assert notifier.pending_count == 2
+        await looper.block_till_done()
+
+        assert len(received) == 1
+        assert (received[0].old_value, received[0].new_value) == (1, 3)
+        assert notifier.pending_count == 0
+
+        # The next tick publishes again.
+        notifier.mark_changed(unique_id="dp1", old_value=3, new_value=4)
+        await looper.block_till_done()
+        assert len(received) == 2
+
+    @pytest.mark.asyncio
+    async def test_dependents_get_changed_fields_once_per_tick(self) -> None:
+        """A dependent is called once with all of its fields that changed within a tick."""
+        looper = Looper()
+        bus = EventBus(task_scheduler=looper)
+        calls: list[frozenset[str]] = []
+        refreshed: list[DataPointsRefreshedEvent] = []
+        bus.subscribe(
+            event_type=DataPointsRefreshedEvent, event_key=None, handler=lambda *, event: refreshed.append(event)
+        )
+
+        notifier = bus.data_point_notifier
+        for unique_id, field in (("level", "LEVEL"), ("level_2", "LEVEL_2"), ("activity", "ACTIVITY_STATE")):
+            notifier.subscribe_fields(
+                unique_id=unique_id,
+                dependent_unique_id="cover",
+                field=field,
+                handler=lambda *, fields: calls.append(fields),
+            )
+        notifier.mark_changed(unique_id="level", new_value=0.5)
+        notifier.mark_changed(unique_id="level_2", new_value=0.2)
+        notifier.mark_changed(unique_id="activity", new_value="UP")
+        notifier.mark_changed(unique_id="level", new_value=0.6)
+        await looper.block_till_done()
+
+        assert calls == [frozenset({"LEVEL", "LEVEL_2", "ACTIVITY_STATE"})]
+
+        # Sources that were only refreshed mark the dependent as refreshed.
+        notifier.mark_refreshed(unique_id="level")
+        await looper.block_till_done()
+        assert len(calls) == 1
+        assert [event.unique_ids for event in refreshed] == [frozenset({"level"}), frozenset({"cover"})]
+
+    @pytest.mark.asyncio
+    async def test_field_subscriptions_are_removed(self) -> None:
+        """Field subscriptions end with their unsubscribe callback or with clearing the source key."""
+        looper = Looper()
+        bus = EventBus(task_scheduler=looper)
+        calls: list[frozenset[str]] = []
+        notifier = bus.data_point_notifier
+
+        unsubscribe = notifier.subscribe_fields(
+            unique_id="dp1", dependent_unique_id="custom", field="STATE", handler=lambda *, fields: calls.append(fields)
+        )
+        notifier.subscribe_fields(
+            unique_id="dp2", dependent_unique_id="custom", field="LEVEL", handler=lambda *, fields: calls.append(fields)
+        )
+        assert notifier.field_subscription_count == 2
+
+        unsubscribe()
+        assert bus.clear_subscriptions_by_key(event_key="dp2") == 1
+        assert notifier.field_subscription_count == 0
+
+        notifier.mark_changed(unique_id="dp1", new_value=True)
+        notifier.mark_changed(unique_id="dp2", new_value=1.0)
+        await looper.block_till_done()
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_refresh_only_uses_single_refreshed_event(self) -> None:
+        """Refreshed data points are published together and do not trigger state changed events."""
+        looper = Looper()
+        bus = EventBus(task_scheduler=looper)
+        changed: list[DataPointStateChangedEvent] = []
+        refreshed: list[DataPointsRefreshedEvent] = []
+        bus.subscribe(
+            event_type=DataPointStateChangedEvent, event_key=None, handler=lambda *, event: changed.append(event)
+        )
+        bus.subscribe(
+            event_type=DataPointsRefreshedEvent, event_key=None, handler=lambda *, event: refreshed.append(event)
+        )
+
+        notifier = bus.data_point_notifier
+        notifier.mark_refreshed(unique_id="dp1")
+        notifier.mark_refreshed(unique_id="dp2")
+        notifier.mark_refreshed(unique_id="dp3")
+        notifier.mark_changed(unique_id="dp3", new_value=1)
+        await looper.block_till_done()
+
+        assert [event.unique_id for event in changed] == ["dp3"]
+        assert len(refreshed) == 1
+        assert refreshed[0].unique_ids == frozenset({"dp1", "dp2"})
+
+    @pytest.mark.asyncio
+    async def test_updates_are_published_when_event_budget_is_exhausted(self) -> None:
+        """A full EVENT queue does not drop the flush, so later updates are still published."""
+        looper = Looper(
+            task_budgets={TaskCategory.EVENT: TaskBudget(limit=1, policy=TaskBudgetPolicy.AWAIT, max_queued=1)}
+        )
+        bus = EventBus(task_scheduler=looper)
+        received: list[DataPointStateChangedEvent] = []
+        bus.subscribe(
+            event_type=DataPointStateChangedEvent, event_key="dp1", handler=lambda *, event: received.append(event)
+        )
+        release = asyncio.Event()
+
+        async def block() -> None:
+            await release.wait()
+
+        looper._async_create_task(block(), name="running", category=TaskCategory.EVENT)
+        looper._async_create_task(block(), name="queued", category=TaskCategory.EVENT)
+        assert looper.task_stats["event"].queued == 1
+
+        notifier = bus.data_point_notifier
+        notifier.mark_changed(unique_id="dp1", old_value=0, new_value=1)
+        await asyncio.sleep(0.01)
+        notifier.mark_changed(unique_id="dp1", old_value=1, new_value=2)
+        await asyncio.sleep(0.01)
+
+        assert [event.new_value for event in received] == [1, 2]
+        assert looper.task_stats["event"].dropped == 0
+        release.set()
+        await looper.block_till_done()
+
+
 class TestEventBusAdditionalMethods:
     """Test additional EventBus methods."""
 
@@ -9,7 +9,15 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from aiohomematic.central.coordinators import EventCoordinator
-from aiohomematic.const import DataPointKey, DeviceTriggerEventType, EventData, Parameter, ParamsetKey, SystemEventType
+from aiohomematic.const import (
+    DataPointKey,
+    DeviceTriggerEventType,
+    EventData,
+    Parameter,
+    ParamsetKey,
+    SystemEventType,
+    TaskCategory,
+)
 from aiohomematic.model.generic import GenericDataPoint
 
 
@@ -65,7 +73,7 @@ class _FakeLooper:
         """Initialize a fake looper."""
         self.tasks: list[dict[str, Any]] = []
 
-    def create_task(self, *, target: Any, name: str) -> None:
+    def create_task(self, *, target: Any, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
         """Record task creation."""
         self.tasks.append({"target": target, "name": name})
 
@@ -79,6 +87,7 @@ class _FakeClient:
         self.capabilities.ping_pong = has_ping_pong
         self.ping_pong_tracker = MagicMock()
         self.ping_pong_tracker.handle_received_pong = MagicMock()
+        self.command_throttle = MagicMock()
 
 
 class _FakeHealthTracker:
@@ -280,6 +289,32 @@ class TestEventCoordinatorDataPointEvent:
         # Should have called EventBus publish (use public property)
         coordinator.event_bus.publish.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_data_point_event_radio_load_updates_throttle(self) -> None:
+        """DUTY_CYCLE_LEVEL events should be fed into the command throttle."""
+        central = _FakeCentral()
+        client = _FakeClient()
+        central._clients["HmIP-RF"] = client
+
+        coordinator = EventCoordinator(
+            client_provider=central,
+            device_name_resolver=lambda *, device_address: None,
+            event_bus=central.event_bus,
+            health_tracker=central.health_tracker,
+            task_scheduler=central.looper,
+        )  # type: ignore[arg-type]
+
+        await coordinator.data_point_event(
+            interface_id="HmIP-RF",
+            channel_address="3014F711A0000000000000:0",
+            parameter=Parameter.DUTY_CYCLE_LEVEL,
+            value=27.5,
+        )
+
+        client.command_throttle.update_radio_load.assert_called_once_with(
+            source="3014F711A0000000000000:0", parameter=Parameter.DUTY_CYCLE_LEVEL, value=27.5
+        )
+
 
 class TestEventCoordinatorEmitMethods:
     """Test publish callback methods."""
@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from aiohomematic.central.coordinators import HubCoordinator
-from aiohomematic.const import DataPointCategory, Interface
+from aiohomematic.const import DataPointCategory, DataRefreshType, Interface
 
 
 class _FakeProgramDataPoint:
@@ -85,6 +85,10 @@ class _FakeHub:
     async def fetch_alarm_messages_data(self, *, scheduled: bool) -> None:
         """Fetch alarm messages data."""
 
+    async def fetch_hub_data(self, *, scheduled: bool) -> frozenset[DataRefreshType] | None:
+        """Fetch hub snapshot (unsupported)."""
+        return None
+
     async def fetch_inbox_data(self, *, scheduled: bool) -> None:
         """Fetch inbox data."""
 
@@ -909,6 +913,38 @@ class TestHubCoordinatorInitHub:
         coordinator._hub.fetch_service_messages_data.assert_called_once_with(scheduled=False)
         coordinator._hub.fetch_alarm_messages_data.assert_called_once_with(scheduled=False)
 
+    @pytest.mark.asyncio
+    async def test_init_hub_with_hub_snapshot(self) -> None:
+        """Init hub should skip the separate fetches when the backend provides a hub snapshot, even if it failed."""
+        central = _FakeCentral()
+        coordinator = HubCoordinator(
+            central_info=central,
+            channel_lookup=central,
+            client_provider=central,
+            config_provider=central,
+            event_bus_provider=central,
+            event_publisher=central,
+            health_tracker=central.health_tracker,
+            metrics_provider=central,
+            parameter_visibility_provider=central.cache_coordinator.parameter_visibility,
+            paramset_description_provider=central.cache_coordinator.paramset_descriptions,
+            primary_client_provider=central,
+            task_scheduler=central.looper,
+        )  # type: ignore[arg-type]
+
+        coordinator._hub = _FakeHub()
+        coordinator._hub.fetch_hub_data = AsyncMock(return_value=frozenset())  # type: ignore[method-assign]
+        coordinator._hub.fetch_program_data = AsyncMock()  # type: ignore[method-assign]
+        coordinator._hub.fetch_sysvar_data = AsyncMock()  # type: ignore[method-assign]
+        coordinator._hub.fetch_inbox_data = AsyncMock()  # type: ignore[method-assign]
+
+        await coordinator.init_hub()
+
+        coordinator._hub.fetch_hub_data.assert_called_once_with(scheduled=False)
+        coordinator._hub.fetch_program_data.assert_not_called()
+        coordinator._hub.fetch_sysvar_data.assert_not_called()
+        coordinator._hub.fetch_inbox_data.assert_not_called()
+
 
 class TestHubCoordinatorIntegration:
     """Integration tests for HubCoordinator."""
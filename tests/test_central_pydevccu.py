@@ -115,8 +115,9 @@ class TestCentralPyDevCCU:
 
         parameters: list[tuple[str, int]] = []
         for dp in central.query_facade.get_data_points(exclude_no_create=False):
-            if hasattr(dp, "parameter") and (dp.parameter, dp._operations) not in parameters:
-                parameters.append((dp.parameter, dp._operations))
+            operations = dp._spec.operations if hasattr(dp, "_spec") else getattr(dp, "_operations", None)
+            if hasattr(dp, "parameter") and (dp.parameter, operations) not in parameters:
+                parameters.append((dp.parameter, operations))
         parameters = sorted(parameters)
 
         units = set()
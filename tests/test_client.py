@@ -4,12 +4,14 @@
 
 import asyncio
 from collections.abc import Callable
+from datetime import datetime
 from types import SimpleNamespace
 from typing import Any
 
 import pytest
 
 from aiohomematic import central as hmcu
+from aiohomematic.central.events import DataPointsRefreshedEvent, DataPointStateChangedEvent, EventBus
 from aiohomematic.client import ClientConfig, InterfaceClient, InterfaceConfig, get_client as get_client_by_id
 from aiohomematic.client.backends.capabilities import CCU_CAPABILITIES
 from aiohomematic.client.state_change import (
@@ -103,8 +105,9 @@ class _MatchingEventBus:
             self._handler(event=None)
 
     def subscribe(self, *, event_type: type, event_key: Any, handler: Any) -> Callable[[], None]:
-        """Store handler and return unsub."""
-        self._handler = handler
+        """Store the state change handler and return unsub."""
+        if event_type is DataPointStateChangedEvent:
+            self._handler = handler
 
         def _unsub() -> None:
             self.unsub_called = True
@@ -158,8 +161,9 @@ class _MultiDpEventBus:
             handler(event=None)
 
     def subscribe(self, *, event_type: type, event_key: Any, handler: Any) -> Callable[[], None]:
-        """Store handler by key."""
-        self._handlers[event_key] = handler
+        """Store the state change handler by key."""
+        if event_type is DataPointStateChangedEvent:
+            self._handlers[event_key] = handler
 
         def _unsub() -> None:
             self.unsub_called = True
@@ -324,6 +328,33 @@ class TestClientEventTracking:
         assert dev.get_dp("STATE").resolved
         await _fire_task
 
+    @pytest.mark.asyncio
+    async def test_event_tracker_refreshed_value_match(self) -> None:
+        """Tracker should resolve on a refresh when the device answers with the value it already had."""
+        dpk = DataPointKey(
+            interface_id="i", channel_address="addr:1", paramset_key=ParamsetKey.VALUES, parameter="STATE"
+        )
+        dp = _MultiDP(value=True, unique_id="dp_state")
+        event_bus = EventBus(task_scheduler=NoOpTaskScheduler())
+        dev = SimpleNamespace(
+            event_bus_provider=SimpleNamespace(event_bus=event_bus),
+            get_generic_data_point=lambda **kwargs: dp,
+        )
+
+        async def _refresh() -> None:
+            await asyncio.sleep(0.01)
+            await event_bus.publish(
+                event=DataPointsRefreshedEvent(timestamp=datetime.now(), unique_ids=frozenset({"other", "dp_state"}))
+            )
+
+        refresh_task = asyncio.create_task(_refresh())
+        async with asyncio.timeout(1):
+            await _track_single_data_point_state_change_or_timeout(
+                device=dev, dpk_value=(dpk, True), wait_for_callback=5
+            )
+        await refresh_task
+        assert event_bus.get_total_subscription_count() == 0
+
     @pytest.mark.asyncio
     async def test_event_tracker_timeout_and_unsubscribe(self) -> None:
         """Tracker should timeout and call unsubscribe in finally when event does not meet value condition."""
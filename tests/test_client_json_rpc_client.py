@@ -13,7 +13,13 @@ import pytest
 
 from aiohomematic import central as hmcu, compat
 from aiohomematic.client import AioJsonRpcAioHttpClient
-from aiohomematic.client.json_rpc import _get_params, _JsonKey, _JsonRpcMethod, _sanitize_json_control_chars
+from aiohomematic.client.json_rpc import (
+    _DeviceDataDecoder,
+    _get_params,
+    _JsonKey,
+    _JsonRpcMethod,
+    _sanitize_json_control_chars,
+)
 from aiohomematic.const import (
     UTF_8,
     DescriptionMarker,
@@ -40,6 +46,8 @@ class _FakeResponse:
         self.status = status
         self._json_value = json_value
         self._read_bytes = read_bytes or b"{}"
+        self.content_length = len(self._read_bytes)
+        self.headers: dict[str, str] = {}
 
     async def json(self, encoding: str = UTF_8) -> Any:
         if isinstance(self._json_value, Exception):
@@ -135,6 +143,105 @@ class TestSanitizeJsonControlChars:
         assert compat.loads(data=result) == {"name": "Device\twith tab"}
 
 
+_DEVICE_DATA_SCRIPT_OUTPUT = (
+    '{"BidCos-RF.OEQ0000001%3A1.STATE":true,\r\n'
+    '"HmIP-RF.VCU0000001%3A1.LEVEL":0.500000,\r\n'
+    '"HmIP-RF.VCU0000001%3A1.ERROR_CODE":-3,\r\n'
+    '"HmIP-RF.VCU0000001%3A2.TEXT":"K%FCche, oben 20\u00b0\x01"}'
+)
+_DEVICE_DATA = {
+    "BidCos-RF.OEQ0000001:1.STATE": True,
+    "HmIP-RF.VCU0000001:1.LEVEL": 0.5,
+    "HmIP-RF.VCU0000001:1.ERROR_CODE": -3,
+    "HmIP-RF.VCU0000001:2.TEXT": "Küche, oben 20\u00b0\x01",
+}
+
+
+class TestDeviceDataDecoder:
+    """Test the incremental decoding of the fetch_all_device_data response."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+    def test_decodes_streamed_result(self, chunk_size: int) -> None:
+        """Test that the result string is decoded into device data regardless of chunk boundaries."""
+        body = compat.dumps(obj={"id": 0, "version": "1.1", "result": _DEVICE_DATA_SCRIPT_OUTPUT, "error": None})
+        decoder = _DeviceDataDecoder()
+        for start in range(0, len(body), chunk_size):
+            decoder.feed(chunk=body[start : start + chunk_size])
+
+        response = decoder.close()
+        assert response["error"] is None
+        assert response["version"] == "1.1"
+        assert response["result"] is decoder.device_data
+        assert decoder.device_data == _DEVICE_DATA
+
+    def test_escaped_quotes_and_separators_in_strings(self) -> None:
+        """Test that escaped quotes and commas within strings do not split entries at any chunk boundary."""
+        result = (
+            '{"HmIP-RF.VCU0000001%3A1.TEXT":"say \\"hi, there\\"",\r\n'
+            '"HmIP-RF.VCU0000001%3A2.TEXT":"back\\\\slash, \\"x\\",",\r\n'
+            '"HmIP-RF.VCU0000001%3A3.LEVEL":1.000000}'
+        )
+        body = compat.dumps(obj={"id": 0, "result": result, "error": None})
+        for cut in range(len(body) + 1):
+            decoder = _DeviceDataDecoder()
+            decoder.feed(chunk=body[:cut])
+            decoder.feed(chunk=body[cut:])
+            decoder.close()
+            assert decoder.device_data == {
+                "HmIP-RF.VCU0000001:1.TEXT": 'say "hi, there"',
+                "HmIP-RF.VCU0000001:2.TEXT": 'back\\slash, "x",',
+                "HmIP-RF.VCU0000001:3.LEVEL": 1.0,
+            }
+
+    def test_chunk_split_in_escape_sequence_of_entries(self) -> None:
+        """Test that an entry string split after a backslash is continued with the escaped character."""
+        decoder = _DeviceDataDecoder()
+        decoder.feed(chunk=b'{"result": "{\\"a\\":\\"x\\\\')
+        decoder.feed(chunk=b'\\", \\",\\"b\\":1,\\"c\\":2}", "error": null}')
+        decoder.close()
+        assert decoder.device_data == {"a": 'x", ', "b": 1, "c": 2}
+
+    @pytest.mark.parametrize("chunk_size", [1, 65536])
+    def test_string_result_not_device_data_raises(self, chunk_size: int) -> None:
+        """Test that a string result which is not a JSON object (e.g. an HTML error page) raises JSONDecodeError."""
+        body = compat.dumps(obj={"id": 0, "result": "<html><body>Error, try again</body></html>", "error": None})
+        decoder = _DeviceDataDecoder()
+        with pytest.raises(compat.JSONDecodeError):
+            for start in range(0, len(body), chunk_size):
+                decoder.feed(chunk=body[start : start + chunk_size])
+            decoder.close()
+
+        decoder = _DeviceDataDecoder()
+        with pytest.raises(compat.JSONDecodeError):
+            decoder.feed(chunk=b'{"id": 0, "result": "{ Error, try again }", "error": null}')
+            decoder.close()
+
+    def test_malformed_result_raises(self) -> None:
+        """Test that an unterminated result raises JSONDecodeError."""
+        decoder = _DeviceDataDecoder()
+        decoder.feed(chunk=b'{"id": 0, "result": "{\\"a\\":1,\\"b\\":')
+        with pytest.raises(compat.JSONDecodeError):
+            decoder.close()
+
+        decoder = _DeviceDataDecoder()
+        decoder.feed(chunk=b'{"id": 0, "result": "{\\"a\\":1", "error": null}')
+        with pytest.raises(compat.JSONDecodeError):
+            decoder.close()
+
+    def test_result_not_a_string(self) -> None:
+        """Test that a response with an object or null result is parsed as a whole."""
+        decoder = _DeviceDataDecoder()
+        decoder.feed(chunk=b'{"result": {"HmIP-RF.VCU0000001%3A1.TEXT": "a%2Fb"}, "error": null}')
+        response = decoder.close()
+        assert decoder.device_data == {}
+        decoder.add_entries(entries=response["result"])
+        assert decoder.device_data == {"HmIP-RF.VCU0000001:1.TEXT": "a/b"}
+
+        decoder = _DeviceDataDecoder()
+        decoder.feed(chunk=b'{"result": null, "error": {"code": 1}}')
+        assert decoder.close() == {"result": None, "error": {"code": 1}}
+
+
 class TestHtmlCleanup:
     """Test HTML tag cleanup in JSON responses."""
 
@@ -166,6 +273,30 @@ class TestJsonRpcClientBasics:
         p = _get_params(session_id=False, extra_params={"y": "z"}, use_default_params=False)  # type: ignore[arg-type]
         assert p == {"y": "z"}
 
+    @pytest.mark.asyncio
+    async def test_json_rpc_get_all_device_data_streamed(
+        self, mock_json_rpc_server, aiohttp_session: ClientSession
+    ) -> None:
+        """Ensure get_all_device_data decodes the streamed script response from the mock JSON-RPC server."""
+        (_, base_url) = mock_json_rpc_server
+        conn_state = hmcu.CentralConnectionState()
+
+        client = AioJsonRpcAioHttpClient(
+            username="user",
+            password="pass",
+            device_url=base_url,
+            connection_state=conn_state,
+            client_session=aiohttp_session,
+            tls=False,
+        )
+
+        assert await client.get_all_device_data(interface=Interface.BIDCOS_RF) == {
+            "BidCos-RF.OEQ0000001:1.STATE": True,
+            "BidCos-RF.OEQ0000001:1.TEXT": "ON/OFF",
+        }
+
+        await client.stop()
+
     @pytest.mark.asyncio
     async def test_json_rpc_get_system_information(self, mock_json_rpc_server, aiohttp_session: ClientSession) -> None:
         """Ensure get_system_information returns expected values from the mock JSON-RPC server."""
@@ -190,6 +321,82 @@ class TestJsonRpcClientBasics:
 
         await client.stop()
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compression", [True, False])
+    async def test_json_rpc_method_stats(
+        self, mock_json_rpc_server, aiohttp_session: ClientSession, compression: bool
+    ) -> None:
+        """Ensure bytes and latency are recorded per method and compression is only negotiated if enabled."""
+        (_, base_url) = mock_json_rpc_server
+        conn_state = hmcu.CentralConnectionState()
+
+        client = AioJsonRpcAioHttpClient(
+            username="user",
+            password="pass",
+            device_url=base_url,
+            connection_state=conn_state,
+            client_session=aiohttp_session,
+            tls=False,
+            compression=compression,
+        )
+
+        await client.get_all_device_data(interface=Interface.BIDCOS_RF)
+        method_stats = client.method_stats
+        assert {"Session.login", "ReGa.runScript:fetch_all_device_data.fn"} <= set(method_stats)
+        stats = method_stats["ReGa.runScript:fetch_all_device_data.fn"]
+        assert stats.request_count == 1
+        assert stats.error_count == 0
+        assert stats.bytes_sent > 0
+        assert stats.bytes_received > 0
+        assert stats.max_latency_ms > 0
+        assert all(stats.compressed_responses == int(compression) for stats in method_stats.values())
+
+        # The returned stats are copies
+        stats.request_count = 10
+        assert client.method_stats["ReGa.runScript:fetch_all_device_data.fn"].request_count == 1
+
+        await client.stop()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("compression", [False, True])
+    async def test_json_rpc_method_stats_chunked_response(
+        self, mock_json_rpc_server, aiohttp_session: ClientSession, compression: bool
+    ) -> None:
+        """Ensure the bytes of a response without Content-Length are counted as received on the wire."""
+        (srv, base_url) = mock_json_rpc_server
+        srv.device_count = 200
+        key = "ReGa.runScript:fetch_all_device_data.fn"
+
+        def create_client(*, compression: bool) -> AioJsonRpcAioHttpClient:
+            return AioJsonRpcAioHttpClient(
+                username="user",
+                password="pass",
+                device_url=base_url,
+                connection_state=hmcu.CentralConnectionState(),
+                client_session=aiohttp_session,
+                tls=False,
+                compression=compression,
+            )
+
+        # Size of the uncompressed response, taken from its Content-Length
+        plain_client = create_client(compression=False)
+        await plain_client.get_all_device_data(interface=Interface.BIDCOS_RF)
+        uncompressed = plain_client.method_stats[key].bytes_received
+        await plain_client.stop()
+
+        srv.chunked = True
+        client = create_client(compression=compression)
+        device_data = await client.get_all_device_data(interface=Interface.BIDCOS_RF)
+        assert len(device_data) == 400
+        stats = client.method_stats[key]
+        assert stats.compressed_responses == int(compression)
+        if compression:
+            assert 0 < stats.bytes_received < uncompressed // 2
+        else:
+            assert stats.bytes_received == uncompressed
+
+        await client.stop()
+
     @pytest.mark.asyncio
     async def test_properties_and_supported_methods_error(
         self, aiohttp_session: ClientSession, monkeypatch: pytest.MonkeyPatch
@@ -594,12 +801,20 @@ class TestJsonRpcClientErrorHandling:
         client._supported_methods = None  # type: ignore[attr-defined]
 
         async def raise_json(
-            *, script_name: str, extra_params: Mapping[_JsonKey, Any] | None = None, keep_session: bool = True
+            *,
+            script_name: str,
+            extra_params: Mapping[_JsonKey, Any] | None = None,
+            keep_session: bool = True,
+            result_decoder: Any = None,
         ):
             raise compat.JSONDecodeError("bad")
 
         async def raise_ct(
-            *, script_name: str, extra_params: Mapping[_JsonKey, Any] | None = None, keep_session: bool = True
+            *,
+            script_name: str,
+            extra_params: Mapping[_JsonKey, Any] | None = None,
+            keep_session: bool = True,
+            result_decoder: Any = None,
         ):
             raise ContentTypeError(None, None)
 
@@ -878,7 +1093,11 @@ class TestJsonRpcClientOperations:
             return resp_for(method)
 
         async def fake_post_script(
-            *, script_name: str, extra_params: Mapping[_JsonKey, Any] | None = None, keep_session: bool = True
+            *,
+            script_name: str,
+            extra_params: Mapping[_JsonKey, Any] | None = None,
+            keep_session: bool = True,
+            result_decoder: Any = None,
         ):
             # FETCH_ALL_DEVICE_DATA returns percent-encoded keys/values to test unquote
             if script_name == RegaScript.FETCH_ALL_DEVICE_DATA:
@@ -2555,3 +2774,303 @@ class TestJsonRpcClientNewCoverage:
             client_session=aiohttp_session,
             tls=False,
         )
+
+
+class TestJsonRpcHubSnapshot:
+    """Test the combined hub snapshot script."""
+
+    @staticmethod
+    def _make_client(aiohttp_session: ClientSession) -> AioJsonRpcAioHttpClient:
+        """Create a JSON-RPC client for testing."""
+        return AioJsonRpcAioHttpClient(
+            username="u",
+            password="p",
+            device_url="http://example",
+            connection_state=hmcu.CentralConnectionState(),
+            client_session=aiohttp_session,
+            tls=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_hub_snapshot_distributes_sections(
+        self, aiohttp_session: ClientSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """All sections are read with one script run and the description scripts are not used."""
+        client = self._make_client(aiohttp_session)
+        scripts: list[str] = []
+
+        async def fake_post_script(
+            *, script_name: str, extra_params: Any = None, keep_session: bool = True
+        ) -> dict[str, Any]:
+            scripts.append(script_name)
+            return {
+                _JsonKey.ERROR: None,
+                _JsonKey.RESULT: {
+                    "sysvar_checksum": "1-1-1760000000",
+                    "sysvar_descriptions": [{"id": "sv1", "description": "sysvar%20info", "meta": "SV%09info"}],
+                    "sysvar_values": [{"id": "sv1", "value": "x"}],
+                    "sysvar_timestamp": 1760000000,
+                    "program_descriptions": [{"id": "p1", "description": "program%20info"}],
+                    "service_messages": [
+                        {"id": "10", "name": "UNREACH", "timestamp": "2026-01-01", "type": 0, "address": "VCU0000001"}
+                    ],
+                    "alarm_messages": [{"id": "20", "name": "Alarm%20Zone"}],
+                    "inbox_devices": [{"id": "30", "address": "VCU0000002", "name": "New%20Device"}],
+                },
+            }
+
+        async def fake_post(*, method: _JsonRpcMethod, extra_params: Any = None, **kwargs: Any) -> dict[str, Any]:
+            if method == _JsonRpcMethod.PROGRAM_GET_ALL:
+                result: list[dict[str, Any]] = [
+                    {"id": "p1", "name": "P", "isInternal": False, "isActive": True, "lastExecuteTime": ""}
+                ]
+            else:
+                result = [{"id": "sv1", "name": "SV", "isInternal": False, "type": "STRING", "unit": "", "value": "x"}]
+            return {_JsonKey.ERROR: None, _JsonKey.RESULT: result}
+
+        monkeypatch.setattr(client, "_post_script", fake_post_script)
+        monkeypatch.setattr(client, "_post", fake_post)
+
+        snapshot = await client.get_hub_snapshot(program_markers=(), sysvar_markers=())
+
+        assert scripts == [RegaScript.GET_HUB_SNAPSHOT]
+        assert snapshot is not None
+        assert snapshot.programs is not None
+        assert snapshot.programs[0].description == "program info"
+        assert snapshot.system_variables is not None
+        assert snapshot.system_variables[0].description == "sysvar info"
+        assert snapshot.system_variable_changes is not None
+        assert snapshot.system_variable_changes.timestamp == 1760000000
+        assert snapshot.system_variable_changes.values == {"sv1": "x"}
+        assert snapshot.service_messages[0].address == "VCU0000001"
+        assert snapshot.alarm_messages[0].name == "Alarm Zone"
+        assert snapshot.inbox_devices[0].name == "New Device"
+        await client.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_hub_snapshot_incomplete_result(
+        self, aiohttp_session: ClientSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A backend that does not return a complete snapshot yields None."""
+        client = self._make_client(aiohttp_session)
+
+        async def fake_post_script(
+            *, script_name: str, extra_params: Any = None, keep_session: bool = True
+        ) -> dict[str, Any]:
+            return {_JsonKey.ERROR: None, _JsonKey.RESULT: [{"id": "sv1", "description": ""}]}
+
+        monkeypatch.setattr(client, "_post_script", fake_post_script)
+
+        assert await client.get_hub_snapshot(program_markers=(), sysvar_markers=()) is None
+        await client.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_hub_snapshot_skips_disabled_sections(
+        self, aiohttp_session: ClientSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Programs and system variables are not read when their markers are None."""
+        client = self._make_client(aiohttp_session)
+
+        async def fake_post_script(
+            *, script_name: str, extra_params: Any = None, keep_session: bool = True
+        ) -> dict[str, Any]:
+            return {
+                _JsonKey.ERROR: None,
+                _JsonKey.RESULT: {
+                    "sysvar_checksum": "0-0-0",
+                    "sysvar_descriptions": [],
+                    "sysvar_values": [],
+                    "sysvar_timestamp": 0,
+                    "program_descriptions": [],
+                    "service_messages": [],
+                    "alarm_messages": [],
+                    "inbox_devices": [],
+                },
+            }
+
+        async def fake_post(**kwargs: Any) -> dict[str, Any]:
+            raise AssertionError("Program.getAll and SysVar.getAll must not be called")
+
+        monkeypatch.setattr(client, "_post_script", fake_post_script)
+        monkeypatch.setattr(client, "_post", fake_post)
+
+        snapshot = await client.get_hub_snapshot(program_markers=None, sysvar_markers=None)
+
+        assert snapshot is not None
+        assert snapshot.programs is None
+        assert snapshot.system_variables is None
+        assert snapshot.system_variable_changes is None
+        assert snapshot.service_messages == ()
+        await client.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_hub_snapshot_reads_sysvars_only_on_metadata_change(
+        self, aiohttp_session: ClientSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Metadata is only sent on a changed ReGa checksum and SysVar.getAll only runs if it changed."""
+        client = self._make_client(aiohttp_session)
+        script_params: list[Any] = []
+        posts: list[_JsonRpcMethod] = []
+        rega_checksum = "1-1234-1760000100"
+        meta = "Mode%09%092%0929%090%092%09%09Off%3BOn%09%09"
+
+        async def fake_post_script(
+            *, script_name: str, extra_params: Any = None, keep_session: bool = True
+        ) -> dict[str, Any]:
+            script_params.append(extra_params)
+            descriptions = (
+                None
+                if extra_params[_JsonKey.CHECKSUM] == rega_checksum
+                else [{"id": "sv1", "description": "", "meta": meta}]
+            )
+            return {
+                _JsonKey.ERROR: None,
+                _JsonKey.RESULT: {
+                    "sysvar_checksum": rega_checksum,
+                    "sysvar_descriptions": descriptions,
+                    "sysvar_values": [{"id": "sv1", "value": "1"}],
+                    "sysvar_timestamp": 1760000100,
+                    "program_descriptions": [],
+                    "service_messages": [],
+                    "alarm_messages": [],
+                    "inbox_devices": [],
+                },
+            }
+
+        async def fake_post(*, method: _JsonRpcMethod, extra_params: Any = None, **kwargs: Any) -> dict[str, Any]:
+            posts.append(method)
+            return {_JsonKey.ERROR: None, _JsonKey.RESULT: []}
+
+        monkeypatch.setattr(client, "_post_script", fake_post_script)
+        monkeypatch.setattr(client, "_post", fake_post)
+
+        first = await client.get_hub_snapshot(program_markers=None, sysvar_markers=(), sysvar_since=1760000000)
+        assert first is not None
+        assert first.system_variable_changes is not None
+        assert script_params == [{_JsonKey.SINCE: 1760000000, _JsonKey.CHECKSUM: ""}]
+        assert posts == [_JsonRpcMethod.SYSVAR_GET_ALL]
+
+        # An unchanged ReGa checksum returns no metadata and keeps the known checksum.
+        checksum = first.system_variable_changes.checksum
+        second = await client.get_hub_snapshot(program_markers=None, sysvar_markers=(), sysvar_checksum=checksum)
+        assert script_params[-1] == {_JsonKey.SINCE: 0, _JsonKey.CHECKSUM: rega_checksum}
+        assert second is not None
+        assert second.system_variables is None
+        assert second.system_variable_changes is not None
+        assert second.system_variable_changes.checksum == checksum
+        assert second.system_variable_changes.values == {"sv1": "1"}
+        assert posts == [_JsonRpcMethod.SYSVAR_GET_ALL]
+
+        # A changed value timestamp sends the metadata, but unchanged metadata needs no full fetch.
+        rega_checksum = "1-1234-1760000200"
+        third = await client.get_hub_snapshot(program_markers=None, sysvar_markers=(), sysvar_checksum=checksum)
+        assert third is not None
+        assert third.system_variable_changes is not None
+        assert third.system_variable_changes.checksum == checksum
+        assert posts == [_JsonRpcMethod.SYSVAR_GET_ALL]
+
+        # A reordered value list keeps the length of the metadata, but changes the checksum.
+        rega_checksum = "1-1234-1760000300"
+        meta = "Mode%09%092%0929%090%092%09%09On%3BOff%09%09"
+        fourth = await client.get_hub_snapshot(program_markers=None, sysvar_markers=(), sysvar_checksum=checksum)
+        assert fourth is not None
+        assert fourth.system_variable_changes is not None
+        assert fourth.system_variable_changes.checksum != checksum
+        assert posts == [_JsonRpcMethod.SYSVAR_GET_ALL, _JsonRpcMethod.SYSVAR_GET_ALL]
+
+        # A caller with an unknown checksum gets the metadata again, even if the ReGa checksum is unchanged.
+        fifth = await client.get_hub_snapshot(program_markers=None, sysvar_markers=(), sysvar_checksum="other")
+        assert script_params[-1] == {_JsonKey.SINCE: 0, _JsonKey.CHECKSUM: ""}
+        assert fifth is not None
+        assert posts == [_JsonRpcMethod.SYSVAR_GET_ALL] * 3
+        await client.stop()
+
+
+class TestJsonRpcSystemVariableChanges:
+    """Test the delta poll of system variables."""
+
+    @staticmethod
+    def _make_client(aiohttp_session: ClientSession) -> AioJsonRpcAioHttpClient:
+        """Create a JSON-RPC client for testing."""
+        return AioJsonRpcAioHttpClient(
+            username="u",
+            password="p",
+            device_url="http://example",
+            connection_state=hmcu.CentralConnectionState(),
+            client_session=aiohttp_session,
+            tls=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_system_variable_changes(
+        self, aiohttp_session: ClientSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Changed values are decoded, the timestamp is passed to the script and the metadata is hashed."""
+        client = self._make_client(aiohttp_session)
+        calls: list[tuple[str, Any]] = []
+        rega_checksum = "2-3000-1760000000"
+        metadata: list[dict[str, str]] | None = [
+            {"id": "sv1", "meta": "Greeting%09%0920%0911"},
+            {"id": "sv2", "meta": "Temp%09%094%090%090%0940%09%B0C"},
+        ]
+
+        async def fake_post_script(
+            *, script_name: str, extra_params: Any = None, keep_session: bool = True
+        ) -> dict[str, Any]:
+            calls.append((script_name, extra_params))
+            return {
+                _JsonKey.ERROR: None,
+                _JsonKey.RESULT: {
+                    "values": [{"id": "sv1", "value": "Hello%20World"}, {"id": "sv2", "value": "12.500000"}],
+                    "checksum": rega_checksum,
+                    "metadata": metadata,
+                    "timestamp": 1760000000,
+                },
+            }
+
+        monkeypatch.setattr(client, "_post_script", fake_post_script)
+
+        changes = await client.get_system_variable_changes(since=1750000000)
+
+        assert calls == [(RegaScript.GET_SYSTEM_VARIABLE_CHANGES, {_JsonKey.SINCE: 1750000000, _JsonKey.CHECKSUM: ""})]
+        assert changes is not None
+        assert changes.timestamp == 1760000000
+        assert changes.values == {"sv1": "Hello World", "sv2": "12.500000"}
+
+        # Without metadata the known ReGa checksum is passed and the metadata checksum is kept.
+        metadata = None
+        unchanged = await client.get_system_variable_changes(since=1760000000)
+        assert calls[-1] == (
+            RegaScript.GET_SYSTEM_VARIABLE_CHANGES,
+            {_JsonKey.SINCE: 1760000000, _JsonKey.CHECKSUM: rega_checksum},
+        )
+        assert unchanged is not None
+        assert unchanged.checksum == changes.checksum
+
+        # A rename to a name of the same length changes the checksum.
+        rega_checksum = "2-3000-1760000100"
+        metadata = [
+            {"id": "sv1", "meta": "Welcomes%09%0920%0911"},
+            {"id": "sv2", "meta": "Temp%09%094%090%090%0940%09%B0C"},
+        ]
+        renamed = await client.get_system_variable_changes(since=1760000000)
+        assert renamed is not None
+        assert renamed.checksum != changes.checksum
+        await client.stop()
+
+    @pytest.mark.asyncio
+    async def test_get_system_variable_changes_invalid_result(
+        self, aiohttp_session: ClientSession, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A result without metadata yields None, so the caller runs a full fetch."""
+        client = self._make_client(aiohttp_session)
+
+        async def fake_post_script(
+            *, script_name: str, extra_params: Any = None, keep_session: bool = True
+        ) -> dict[str, Any]:
+            return {_JsonKey.ERROR: None, _JsonKey.RESULT: [{"id": "sv1", "description": ""}]}
+
+        monkeypatch.setattr(client, "_post_script", fake_post_script)
+
+        assert await client.get_system_variable_changes(since=0) is None
+        await client.stop()
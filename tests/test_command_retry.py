@@ -538,6 +538,46 @@ class TestCommandRetryHandlerCancellation:
         assert retry_handler.active_retry_count == 0
 
 
+class TestCommandThrottleFeedback:
+    """Tests for reporting attempt outcomes to the command throttle."""
+
+    @pytest.mark.asyncio
+    async def test_faults_and_successes_reported(self) -> None:
+        """Test that every attempt reports its fault code or success to the throttle."""
+        throttle = MagicMock()
+        handler = CommandRetryHandler(
+            interface_id="test-interface",
+            timeout_config=TimeoutConfig(command_retry_duty_cycle_delay=0.0),
+            event_bus=_make_event_bus(),
+            command_throttle=throttle,
+        )
+        exc = ClientException("failed")
+        exc.__cause__ = XmlRpcFault(-8, "insufficient duty cycle")
+        operation = AsyncMock(side_effect=[exc, "ok"])
+
+        assert await handler.execute_with_retry(operation=operation, dpk=_make_dpk()) == "ok"
+        throttle.report_fault.assert_called_once_with(fault_code=-8)
+        throttle.report_success.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_fault_reported_without_retry(self) -> None:
+        """Test that faults are reported even if retry is disabled for the call."""
+        throttle = MagicMock()
+        handler = CommandRetryHandler(
+            interface_id="test-interface",
+            timeout_config=TimeoutConfig(),
+            event_bus=_make_event_bus(),
+            command_throttle=throttle,
+        )
+        exc = ClientException("failed")
+        exc.__cause__ = XmlRpcFault(-10, "transmission pending")
+
+        with pytest.raises(ClientException):
+            await handler.execute_with_retry(operation=AsyncMock(side_effect=exc), dpk=_make_dpk(), retry=False)
+        throttle.report_fault.assert_called_once_with(fault_code=-10)
+        throttle.report_success.assert_not_called()
+
+
 class TestCommandRetryHandlerProperties:
     """Tests for retry handler properties."""
 
@@ -5,11 +5,12 @@ from datetime import datetime
 import time
 from types import SimpleNamespace
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
 from aiohomematic.client import CommandPriority, CommandThrottle, InterfaceClient, InterfaceConfig
-from aiohomematic.const import Interface, ParamsetKey, TimeoutConfig
+from aiohomematic.const import DataPointKey, Interface, ParameterType, ParamsetKey, TaskCategory, TimeoutConfig
 from aiohomematic.exceptions import CommandSupersededError
 
 
@@ -275,6 +276,7 @@ class _FakeCentral:
         self._event_bus = _FakeEventBus()
         self._devices: dict[str, Any] = {}
         self._data_points: dict[str, Any] = {}
+        self.parameter_data: dict[str, dict[str, Any]] = {}
         self.name = "test-central"
 
         class Cfg:
@@ -296,7 +298,7 @@ class _FakeCentral:
         self._listen_port_xml_rpc = 32001
         self._callback_ip_addr = "127.0.0.1"
 
-        def _close_task(*, target: Any, name: str) -> None:
+        def _close_task(*, target: Any, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
             target.close()
 
         self.looper = SimpleNamespace(create_task=_close_task)
@@ -319,7 +321,9 @@ class _FakeCentral:
                 add_name=lambda **kwargs: None,
                 add_address_ise_id=lambda **kwargs: None,
             ),
-            paramset_descriptions=SimpleNamespace(get_parameter_data=lambda **kwargs: None),
+            paramset_descriptions=SimpleNamespace(
+                get_parameter_data=lambda **kwargs: self.parameter_data.get(kwargs["parameter"])
+            ),
             data_cache=SimpleNamespace(add_data=lambda **kwargs: None),
             device_descriptions=SimpleNamespace(
                 find_device_description=lambda **kwargs: None,
@@ -829,7 +833,7 @@ class TestQueuePurgeIntegration:
                 client.set_value(
                     channel_address="VCU0000001:4",
                     paramset_key=ParamsetKey.VALUES,
-                    parameter="LEVEL",
+                    parameter="LEVEL_2",
                     value=0.8,
                     wait_for_callback=None,
                     priority=CommandPriority.HIGH,
@@ -1100,3 +1104,269 @@ class TestCommandThrottlePurge:
             assert throttle.queue_size == 0
         finally:
             throttle.stop()
+
+
+class TestAdaptiveCommandThrottle:
+    """Tests for the duty-cycle-aware token bucket mode."""
+
+    async def test_adaptive_enabled_without_interval(self) -> None:
+        """Test that adaptive mode throttles even if no interval is configured."""
+        throttle = CommandThrottle(interface_id="TEST", interval=0.0, adaptive=True)
+        try:
+            assert throttle.is_enabled is True
+            assert throttle.send_rate == pytest.approx(5.0)
+            assert throttle._worker_task is not None
+        finally:
+            throttle.stop()
+
+    async def test_bucket_allows_burst_without_delay(self) -> None:
+        """Test that a burst up to the bucket size is granted without delay."""
+        throttle = CommandThrottle(interface_id="TEST", interval=0.5, adaptive=True, bucket_size=5, burst_threshold=0)
+        try:
+            start = time.monotonic()
+            for _ in range(5):
+                await throttle.acquire(priority=CommandPriority.HIGH, device_address="TEST:1")
+            assert time.monotonic() - start < 0.1
+            assert throttle.throttled_count == 0
+
+            # The bucket is empty now, the next command waits for a refill
+            start = time.monotonic()
+            await throttle.acquire(priority=CommandPriority.HIGH, device_address="TEST:1")
+            assert time.monotonic() - start >= 0.4
+            assert throttle.throttled_count == 1
+        finally:
+            throttle.stop()
+
+    async def test_duty_cycle_fault_pauses_and_halves_rate(self) -> None:
+        """Test that INSUFFICIENT_DUTYCYCLE empties the bucket, pauses sending and halves the rate."""
+        throttle = CommandThrottle(
+            interface_id="TEST", interval=0.01, adaptive=True, bucket_size=5, duty_cycle_backoff=0.2, burst_threshold=0
+        )
+        try:
+            throttle.report_fault(fault_code=-8)
+
+            assert throttle.duty_cycle_faults == 1
+            assert throttle.backoff_remaining > 0.0
+            assert throttle.send_rate == pytest.approx(50.0)
+
+            start = time.monotonic()
+            await throttle.acquire(priority=CommandPriority.HIGH, device_address="TEST:1")
+            assert time.monotonic() - start >= 0.2
+
+            # Successful commands restore the rate step by step
+            for _ in range(5):
+                throttle.report_success()
+            assert throttle.send_rate == pytest.approx(100.0)
+        finally:
+            throttle.stop()
+
+    async def test_faults_counted_but_ignored_in_fixed_mode(self) -> None:
+        """Test that faults are counted without backoff when the fixed interval is used."""
+        throttle = CommandThrottle(interface_id="TEST", interval=0.1)
+        try:
+            throttle.report_fault(fault_code=-10)
+            throttle.report_fault(fault_code=-1)
+
+            assert throttle.transmission_pending_faults == 1
+            assert throttle.duty_cycle_faults == 0
+            assert throttle.backoff_remaining == 0.0
+            assert throttle.send_rate == pytest.approx(10.0)
+        finally:
+            throttle.stop()
+
+    async def test_radio_load_reduces_rate(self) -> None:
+        """Test that the send rate drops as the radio load approaches the target."""
+        throttle = CommandThrottle(interface_id="TEST", interval=0.1, adaptive=True, duty_cycle_target=80.0)
+        try:
+            throttle.update_radio_load(source="AP1:0", parameter="DUTY_CYCLE_LEVEL", value=30.0)
+            assert throttle.send_rate == pytest.approx(10.0)
+
+            throttle.update_radio_load(source="AP2:0", parameter="CARRIER_SENSE_LEVEL", value=60.0)
+            assert throttle.carrier_sense_level == 60.0
+            assert throttle.send_rate == pytest.approx(10.0 * (1.0 - 0.5 * 0.95))
+
+            throttle.update_radio_load(source="AP1:0", parameter="DUTY_CYCLE_LEVEL", value=95.0)
+            assert throttle.duty_cycle_level == 95.0
+            assert throttle.send_rate == pytest.approx(0.5)
+
+            # Non-numeric values clear the source
+            throttle.update_radio_load(source="AP1:0", parameter="DUTY_CYCLE_LEVEL", value=None)
+            assert throttle.duty_cycle_level is None
+        finally:
+            throttle.stop()
+
+    async def test_stats_snapshot(self) -> None:
+        """Test that stats expose utilisation and backoff state."""
+        throttle = CommandThrottle(
+            interface_id="TEST", interval=0.1, adaptive=True, bucket_size=3, transmission_pending_backoff=5.0
+        )
+        try:
+            throttle.update_radio_load(source="AP1:0", parameter="DUTY_CYCLE_LEVEL", value=42.0)
+            throttle.report_fault(fault_code=-10)
+
+            stats = throttle.stats
+            assert stats.adaptive is True
+            assert stats.utilisation == 42.0
+            assert stats.backoff_active is True
+            assert stats.tokens == 0.0
+            assert stats.transmission_pending_faults == 1
+        finally:
+            throttle.stop()
+
+
+def _make_dpk(*, channel_address: str = "TEST:1", parameter: str = "LEVEL") -> DataPointKey:
+    """Create a DataPointKey for coalescing tests."""
+    return DataPointKey(
+        interface_id="TEST",
+        channel_address=channel_address,
+        paramset_key=ParamsetKey.VALUES,
+        parameter=parameter,
+    )
+
+
+class TestCommandThrottleCoalescing:
+    """Tests for last-write-wins coalescing of queued commands."""
+
+    async def _occupy_worker(self, *, throttle: CommandThrottle) -> asyncio.Task[None]:
+        """Let the worker hold a command in its throttle delay so new commands stay queued."""
+        await throttle.acquire(priority=CommandPriority.HIGH, device_address="TEST:0")
+        busy = asyncio.create_task(throttle.acquire(priority=CommandPriority.HIGH, device_address="TEST:0"))
+        await asyncio.sleep(0.01)
+        assert throttle.queue_size == 0
+        return busy
+
+    async def test_different_data_points_not_coalesced(self) -> None:
+        """Test that queued commands for different data points are kept."""
+        throttle = CommandThrottle(interface_id="TEST", interval=0.1, burst_threshold=0)
+        try:
+            busy = await self._occupy_worker(throttle=throttle)
+            tasks = [
+                asyncio.create_task(
+                    throttle.acquire(
+                        priority=CommandPriority.HIGH, device_address="TEST:1", dpk=_make_dpk(parameter=parameter)
+                    )
+                )
+                for parameter in ("LEVEL", "LEVEL_2")
+            ]
+            await asyncio.sleep(0.01)
+            assert throttle.queue_size == 2
+
+            await asyncio.gather(busy, *tasks)
+            assert throttle.coalesced_count == 0
+        finally:
+            throttle.stop()
+
+    async def test_newer_command_supersedes_queued_one(self) -> None:
+        """Test that a newer command for the same data point replaces the queued one."""
+        throttle = CommandThrottle(interface_id="TEST", interval=0.1, burst_threshold=0)
+        try:
+            busy = await self._occupy_worker(throttle=throttle)
+            tasks = [
+                asyncio.create_task(
+                    throttle.acquire(priority=CommandPriority.HIGH, device_address="TEST:1", dpk=_make_dpk())
+                )
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.01)
+            assert throttle.queue_size == 1
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            await busy
+
+            assert all(isinstance(result, CommandSupersededError) for result in results[:4])
+            assert results[4] is None
+            assert throttle.coalesced_count == 4
+            assert throttle.stats.coalesced_count == 4
+            assert throttle._pending_by_dpk == {}
+        finally:
+            throttle.stop()
+
+    async def test_queued_action_writes_are_all_sent(self) -> None:
+        """Test that queued writes of an ACTION parameter are not coalesced by set_value."""
+        client, backend = _create_throttled_client(throttle_interval=0.1, burst_threshold=0)
+        client._central.parameter_data["PRESS_SHORT"] = {  # type: ignore[attr-defined]
+            "TYPE": ParameterType.ACTION,
+            "OPERATIONS": 6,
+        }
+        try:
+            await client.set_value(
+                channel_address="dev1:1",
+                paramset_key=ParamsetKey.VALUES,
+                parameter="PRESS_SHORT",
+                value=True,
+                wait_for_callback=None,
+            )
+            presses = [
+                asyncio.create_task(
+                    client.set_value(
+                        channel_address="dev1:1",
+                        paramset_key=ParamsetKey.VALUES,
+                        parameter="PRESS_SHORT",
+                        value=True,
+                        wait_for_callback=None,
+                    )
+                )
+                for _ in range(2)
+            ]
+            await asyncio.gather(*presses)
+
+            assert [call[1][1] for call in backend.calls] == ["PRESS_SHORT"] * 3
+            assert client.command_throttle.coalesced_count == 0
+        finally:
+            client.command_throttle.stop()
+
+    async def test_parameter_type_lookup(self) -> None:
+        """Test that the parameter type is only looked up with throttling and may be missing."""
+        client, backend = _create_throttled_client(throttle_interval=0.0)
+        with patch.object(InterfaceClient, "_is_action_parameter", return_value=False) as is_action_parameter:
+            await client.set_value(
+                channel_address="dev1:1",
+                paramset_key=ParamsetKey.VALUES,
+                parameter="LEVEL",
+                value=0.5,
+                wait_for_callback=None,
+            )
+        is_action_parameter.assert_not_called()
+
+        client, backend = _create_throttled_client(throttle_interval=0.05, burst_threshold=0)
+        client._central.parameter_data["LEVEL"] = {"OPERATIONS": 7}  # type: ignore[attr-defined]
+        try:
+            assert (
+                client._is_action_parameter(
+                    channel_address="dev1:1", paramset_key=ParamsetKey.VALUES, parameter="LEVEL"
+                )
+                is False
+            )
+            await client.set_value(
+                channel_address="dev1:1",
+                paramset_key=ParamsetKey.VALUES,
+                parameter="LEVEL",
+                value=0.5,
+                wait_for_callback=None,
+            )
+            assert [call[1][1] for call in backend.calls] == ["LEVEL"]
+        finally:
+            client.command_throttle.stop()
+
+    async def test_replacement_keeps_queue_slot_and_higher_priority(self) -> None:
+        """Test that the replacement keeps the older slot and the higher priority."""
+        throttle = CommandThrottle(interface_id="TEST", interval=0.2, burst_threshold=0)
+        order: list[str] = []
+
+        async def _acquire(*, name: str, priority: CommandPriority, dpk: DataPointKey | None) -> None:
+            await throttle.acquire(priority=priority, device_address=name, dpk=dpk)
+            order.append(name)
+
+        try:
+            busy = await self._occupy_worker(throttle=throttle)
+            first = asyncio.create_task(_acquire(name="level-old", priority=CommandPriority.HIGH, dpk=_make_dpk()))
+            await asyncio.sleep(0.001)
+            other = asyncio.create_task(_acquire(name="other", priority=CommandPriority.HIGH, dpk=None))
+            await asyncio.sleep(0.001)
+            newer = asyncio.create_task(_acquire(name="level-new", priority=CommandPriority.LOW, dpk=_make_dpk()))
+
+            await asyncio.gather(busy, first, other, newer, return_exceptions=True)
+
+            assert order == ["level-new", "other"]
+        finally:
+            throttle.stop()
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from aiohomematic.async_support import Looper
+from aiohomematic.central import ResyncPlan
 from aiohomematic.central.coordinators import ConnectionRecoveryCoordinator
 from aiohomematic.central.coordinators.connection_recovery import (
     BASE_RETRY_DELAY,
@@ -22,6 +23,7 @@ from aiohomematic.central.events import (
     CircuitBreakerTrippedEvent,
     ConnectionLostEvent,
     EventBus,
+    EventGapDetectedEvent,
     HeartbeatTimerFiredEvent,
     RecoveryAttemptedEvent,
     RecoveryCompletedEvent,
@@ -31,11 +33,31 @@ from aiohomematic.central.events import (
 )
 from aiohomematic.central.state_machine import CentralStateMachine
 from aiohomematic.client import CircuitState
-from aiohomematic.const import CentralState, FailureReason, Interface, RecoveryStage
+from aiohomematic.const import (
+    INIT_DATETIME,
+    CallSource,
+    CentralState,
+    FailureReason,
+    Interface,
+    RecoveryReloadStep,
+    RecoveryStage,
+)
+from aiohomematic.store.dynamic import CentralDataCache
 
 # pylint: disable=protected-access
 
 
+def _resync_plan(*, full_refresh: bool) -> ResyncPlan:
+    """Return a resync plan without stale channels."""
+    return ResyncPlan(
+        interface_id="test-interface",
+        gap_started_at=INIT_DATETIME,
+        stale_channels=(),
+        fresh_count=0,
+        full_refresh=full_refresh,
+    )
+
+
 class TestInterfaceRecoveryState:
     """Tests for InterfaceRecoveryState dataclass."""
 
@@ -171,6 +193,21 @@ class TestInterfaceRecoveryState:
         assert RecoveryStage.IDLE not in state.stages_completed
         assert state.current_stage == RecoveryStage.COOLDOWN
 
+    def test_transition_to_stage_records_duration(self) -> None:
+        """Test that stage durations are recorded and cleared on a new recovery."""
+        state = InterfaceRecoveryState(interface_id="test")
+        state.transition_to_stage(new_stage=RecoveryStage.COOLDOWN)
+        duration_ms = state.transition_to_stage(new_stage=RecoveryStage.TCP_CHECKING)
+        state.record_reload_step(step=RecoveryReloadStep.HUB_DATA, duration_ms=12.5)
+
+        assert state.stage_durations_ms == {RecoveryStage.COOLDOWN: duration_ms}
+        assert state.reload_durations_ms == {RecoveryReloadStep.HUB_DATA: 12.5}
+
+        state.start_recovery()
+
+        assert state.stage_durations_ms == {}
+        assert state.reload_durations_ms == {}
+
 
 class TestConnectionRecoveryCoordinatorInit:
     """Tests for ConnectionRecoveryCoordinator initialization."""
@@ -305,6 +342,70 @@ class TestConnectionRecoveryCoordinatorEventHandlers:
         assert coordinator._device_data_refresher.load_and_refresh_data_point_data.called
         coordinator.stop()
 
+    @pytest.mark.asyncio
+    async def test_on_circuit_breaker_state_changed_skipped_during_recovery(self) -> None:
+        """Test circuit breaker recovery leaves the reload to a running recovery."""
+        coordinator, _event_bus, _ = self._create_coordinator()
+        coordinator._active_recoveries.add("test-interface")
+
+        event = CircuitBreakerStateChangedEvent(
+            timestamp=datetime.now(),
+            interface_id="test-interface",
+            old_state=CircuitState.HALF_OPEN,
+            new_state=CircuitState.CLOSED,
+            failure_count=0,
+            success_count=3,
+            last_failure_time=None,
+        )
+
+        coordinator._on_circuit_breaker_state_changed(event=event)
+
+        await asyncio.sleep(0.05)
+
+        assert not coordinator._device_data_refresher.load_and_refresh_data_point_data.called
+        coordinator.stop()
+
+    @pytest.mark.asyncio
+    async def test_on_event_gap_detected_resyncs_stale_channels(self) -> None:
+        """Test that an event gap re-reads the stale channels without a reconnect."""
+        coordinator, _event_bus, _ = self._create_coordinator()
+        plan = _resync_plan(full_refresh=False)
+        coordinator._device_data_refresher.plan_resync = MagicMock(return_value=plan)
+        gap_started_at = datetime.now()
+
+        coordinator._on_event_gap_detected(
+            event=EventGapDetectedEvent(
+                timestamp=datetime.now(), interface_id="test-interface", gap_started_at=gap_started_at
+            )
+        )
+
+        await asyncio.sleep(0.05)
+
+        coordinator._device_data_refresher.plan_resync.assert_called_once_with(
+            interface_id="test-interface", gap_started_at=gap_started_at
+        )
+        coordinator._device_data_refresher.execute_resync.assert_awaited_once_with(plan=plan)
+        coordinator._device_data_refresher.load_device_data.assert_not_awaited()
+        assert coordinator.get_recovery_state(interface_id="test-interface") is None
+        coordinator.stop()
+
+    @pytest.mark.asyncio
+    async def test_on_event_gap_detected_skipped_during_recovery(self) -> None:
+        """Test that an event gap leaves the reload to a running recovery."""
+        coordinator, _event_bus, _ = self._create_coordinator()
+        coordinator._active_recoveries.add("test-interface")
+
+        coordinator._on_event_gap_detected(
+            event=EventGapDetectedEvent(
+                timestamp=datetime.now(), interface_id="test-interface", gap_started_at=datetime.now()
+            )
+        )
+
+        await asyncio.sleep(0.05)
+
+        assert not coordinator._device_data_refresher.plan_resync.called
+        coordinator.stop()
+
     @pytest.mark.asyncio
     async def test_on_circuit_breaker_tripped_starts_recovery(self) -> None:
         """Test _on_circuit_breaker_tripped starts recovery."""
@@ -435,6 +536,10 @@ class TestConnectionRecoveryCoordinatorEventHandlers:
 
         device_data_refresher = MagicMock()
         device_data_refresher.load_and_refresh_data_point_data = AsyncMock()
+        device_data_refresher.load_device_data = AsyncMock()
+        device_data_refresher.refresh_stale_data_point_data = AsyncMock(return_value=0)
+        device_data_refresher.plan_resync = MagicMock(return_value=_resync_plan(full_refresh=True))
+        device_data_refresher.execute_resync = AsyncMock(return_value=0)
 
         coordinator = ConnectionRecoveryCoordinator(
             central_info=central_info,
@@ -605,9 +710,7 @@ class TestConnectionRecoveryCoordinatorStages:
     async def test_stage_data_load_exception(self) -> None:
         """Test _stage_data_load returns False on exception."""
         coordinator, _, _ = self._create_coordinator()
-        coordinator._device_data_refresher.load_and_refresh_data_point_data = AsyncMock(
-            side_effect=Exception("Load failed")
-        )
+        coordinator._device_data_refresher.load_device_data = AsyncMock(side_effect=Exception("Load failed"))
 
         result = await coordinator._stage_data_load(interface_id="test")
 
@@ -622,7 +725,8 @@ class TestConnectionRecoveryCoordinatorStages:
         result = await coordinator._stage_data_load(interface_id="test")
 
         assert result is True
-        coordinator._device_data_refresher.load_and_refresh_data_point_data.assert_awaited_once()
+        coordinator._device_data_refresher.load_device_data.assert_awaited_once()
+        coordinator._device_data_refresher.refresh_stale_data_point_data.assert_awaited_once()
         coordinator.stop()
 
     @pytest.mark.asyncio
@@ -755,6 +859,10 @@ class TestConnectionRecoveryCoordinatorStages:
 
         device_data_refresher = MagicMock()
         device_data_refresher.load_and_refresh_data_point_data = AsyncMock()
+        device_data_refresher.load_device_data = AsyncMock()
+        device_data_refresher.refresh_stale_data_point_data = AsyncMock(return_value=0)
+        device_data_refresher.plan_resync = MagicMock(return_value=_resync_plan(full_refresh=True))
+        device_data_refresher.execute_resync = AsyncMock(return_value=0)
 
         coordinator = ConnectionRecoveryCoordinator(
             central_info=central_info,
@@ -1525,6 +1633,10 @@ class TestConnectionRecoveryCoordinatorFullRecovery:
 
         device_data_refresher = MagicMock()
         device_data_refresher.load_and_refresh_data_point_data = AsyncMock()
+        device_data_refresher.load_device_data = AsyncMock()
+        device_data_refresher.refresh_stale_data_point_data = AsyncMock(return_value=0)
+        device_data_refresher.plan_resync = MagicMock(return_value=_resync_plan(full_refresh=True))
+        device_data_refresher.execute_resync = AsyncMock(return_value=0)
 
         state_machine = MagicMock()
         state_machine.can_transition_to.return_value = True
@@ -1841,7 +1953,10 @@ class TestConnectionRecoveryStartupFailurePath:
 
         coordinator._client_provider.get_client.side_effect = get_client_after_creation
 
-        coordinator._device_data_refresher.load_and_refresh_data_point_data = AsyncMock()
+        coordinator._device_data_refresher.load_device_data = AsyncMock()
+        coordinator._device_data_refresher.refresh_stale_data_point_data = AsyncMock(return_value=0)
+        coordinator._device_data_refresher.plan_resync = MagicMock(return_value=_resync_plan(full_refresh=True))
+        coordinator._device_data_refresher.execute_resync = AsyncMock(return_value=0)
 
         with patch.object(
             ConnectionRecoveryCoordinator,
@@ -1981,6 +2096,86 @@ class TestConnectionRecoveryStartupFailurePath:
 class TestConnectionRecoveryHubDataRefresh:
     """Tests for _refresh_hub_data_after_recovery."""
 
+    @pytest.mark.asyncio
+    async def test_refresh_hub_data_shared_between_recoveries(self) -> None:
+        """Test that interfaces recovering together refresh the hub data once."""
+        hub_fetcher = MagicMock()
+        hub_fetcher.fetch_system_update_data = AsyncMock()
+        hub_fetcher.fetch_program_data = AsyncMock()
+        hub_fetcher.fetch_sysvar_data = AsyncMock()
+
+        coordinator = self._create_coordinator(hub_data_fetcher=hub_fetcher, enable_programs=True)
+
+        reconnected_at = datetime.now()
+        await asyncio.gather(
+            coordinator._refresh_hub_data_after_recovery(refreshed_since=reconnected_at),
+            coordinator._refresh_hub_data_after_recovery(refreshed_since=reconnected_at),
+        )
+
+        hub_fetcher.fetch_system_update_data.assert_awaited_once()
+        hub_fetcher.fetch_program_data.assert_awaited_once()
+
+        # A later recovery refreshes again
+        await coordinator._refresh_hub_data_after_recovery(refreshed_since=datetime.now())
+
+        assert hub_fetcher.fetch_system_update_data.await_count == 2
+        coordinator.stop()
+
+    @pytest.mark.asyncio
+    async def test_stage_data_load_overlaps_device_and_hub_data(self) -> None:
+        """Test that device data and hub data are reloaded in parallel and timed per step."""
+        hub_refresh_started = asyncio.Event()
+
+        async def fetch_system_update_data(*, scheduled: bool) -> None:
+            hub_refresh_started.set()
+
+        async def load_device_data(*, interface: Interface) -> None:
+            # Completes only if the hub refresh runs at the same time
+            await asyncio.wait_for(hub_refresh_started.wait(), timeout=1)
+
+        hub_fetcher = MagicMock()
+        hub_fetcher.fetch_system_update_data = fetch_system_update_data
+
+        coordinator = self._create_coordinator(hub_data_fetcher=hub_fetcher)
+        coordinator._recovery_states["test"] = state = InterfaceRecoveryState(interface_id="test")
+
+        mock_client = MagicMock()
+        mock_client.interface = Interface.HMIP_RF
+        coordinator._client_provider.get_client.return_value = mock_client
+        coordinator._device_data_refresher.load_device_data = load_device_data
+
+        reconnected_at = datetime.now()
+        result = await coordinator._stage_data_load(interface_id="test", refreshed_since=reconnected_at)
+
+        assert result is True
+        coordinator._device_data_refresher.refresh_stale_data_point_data.assert_awaited_once_with(
+            interface=Interface.HMIP_RF, refreshed_before=reconnected_at
+        )
+        assert set(state.reload_durations_ms) == set(RecoveryReloadStep)
+        coordinator.stop()
+
+    @pytest.mark.asyncio
+    async def test_stage_data_load_targeted_resync(self) -> None:
+        """Test that only the stale channels are re-read if the resync plan allows it."""
+        coordinator = self._create_coordinator()
+        coordinator._recovery_states["test"] = state = InterfaceRecoveryState(interface_id="test")
+        plan = _resync_plan(full_refresh=False)
+        coordinator._device_data_refresher.plan_resync = MagicMock(return_value=plan)
+        coordinator._device_data_refresher.execute_resync = AsyncMock(return_value=2)
+
+        reconnected_at = datetime.now()
+        result = await coordinator._stage_data_load(interface_id="test", refreshed_since=reconnected_at)
+
+        assert result is True
+        coordinator._device_data_refresher.plan_resync.assert_called_once_with(
+            interface_id="test", gap_started_at=reconnected_at
+        )
+        coordinator._device_data_refresher.execute_resync.assert_awaited_once_with(plan=plan)
+        coordinator._device_data_refresher.load_device_data.assert_not_awaited()
+        coordinator._device_data_refresher.refresh_stale_data_point_data.assert_not_awaited()
+        assert set(state.reload_durations_ms) == {RecoveryReloadStep.CHANNEL_DATA, RecoveryReloadStep.HUB_DATA}
+        coordinator.stop()
+
     @pytest.mark.asyncio
     async def test_refresh_hub_data_all_enabled(self) -> None:
         """Test _refresh_hub_data_after_recovery refreshes all data when enabled."""
@@ -2108,7 +2303,10 @@ class TestConnectionRecoveryHubDataRefresh:
         mock_client = MagicMock()
         mock_client.interface = Interface.HMIP_RF
         coordinator._client_provider.get_client.return_value = mock_client
-        coordinator._device_data_refresher.load_and_refresh_data_point_data = AsyncMock()
+        coordinator._device_data_refresher.load_device_data = AsyncMock()
+        coordinator._device_data_refresher.refresh_stale_data_point_data = AsyncMock(return_value=0)
+        coordinator._device_data_refresher.plan_resync = MagicMock(return_value=_resync_plan(full_refresh=True))
+        coordinator._device_data_refresher.execute_resync = AsyncMock(return_value=0)
 
         result = await coordinator._stage_data_load(interface_id="test")
 
@@ -2141,6 +2339,10 @@ class TestConnectionRecoveryHubDataRefresh:
 
         device_data_refresher = MagicMock()
         device_data_refresher.load_and_refresh_data_point_data = AsyncMock()
+        device_data_refresher.load_device_data = AsyncMock()
+        device_data_refresher.refresh_stale_data_point_data = AsyncMock(return_value=0)
+        device_data_refresher.plan_resync = MagicMock(return_value=_resync_plan(full_refresh=True))
+        device_data_refresher.execute_resync = AsyncMock(return_value=0)
 
         return ConnectionRecoveryCoordinator(
             central_info=MagicMock(name="test-central"),
@@ -2702,9 +2904,7 @@ class TestConnectionRecoveryCoordinatorAdditionalCoverage:
         coordinator._recovery_states["test"] = state
 
         # Data load fails
-        coordinator._device_data_refresher.load_and_refresh_data_point_data = AsyncMock(
-            side_effect=Exception("Data load failed")
-        )
+        coordinator._device_data_refresher.load_device_data = AsyncMock(side_effect=Exception("Data load failed"))
 
         with patch.object(
             ConnectionRecoveryCoordinator,
@@ -3282,6 +3482,10 @@ class TestConnectionRecoveryCoordinatorAdditionalCoverage:
 
         device_data_refresher = MagicMock()
         device_data_refresher.load_and_refresh_data_point_data = AsyncMock()
+        device_data_refresher.load_device_data = AsyncMock()
+        device_data_refresher.refresh_stale_data_point_data = AsyncMock(return_value=0)
+        device_data_refresher.plan_resync = MagicMock(return_value=_resync_plan(full_refresh=True))
+        device_data_refresher.execute_resync = AsyncMock(return_value=0)
 
         coordinator = ConnectionRecoveryCoordinator(
             central_info=central_info,
@@ -3296,3 +3500,81 @@ class TestConnectionRecoveryCoordinatorAdditionalCoverage:
         )
 
         return coordinator, mock_client, event_bus
+
+
+class TestRecoveryDataPointReread:
+    """Tests for the re-read of data points after a reconnect."""
+
+    @pytest.mark.asyncio
+    async def test_reread_skips_data_points_with_newer_event(self) -> None:
+        """Test that data points refreshed since the reconnect are not re-read."""
+        reconnected_at = datetime.now()
+        loaded: list[str] = []
+
+        def create_data_point(*, address: str, refreshed_at: datetime) -> MagicMock:
+            async def load_data_point_value(*, call_source: CallSource, direct_call: bool = False) -> None:
+                loaded.append(address)
+
+            dp = MagicMock()
+            dp.device.address = address.split(":")[0]
+            dp.refreshed_at = refreshed_at
+            dp.load_data_point_value = load_data_point_value
+            return dp
+
+        data_point_provider = MagicMock()
+        data_point_provider.get_readable_generic_data_points.return_value = [
+            create_data_point(address="VCU001:1", refreshed_at=INIT_DATETIME),
+            create_data_point(address="VCU001:2", refreshed_at=datetime.now()),
+            create_data_point(address="VCU002:1", refreshed_at=INIT_DATETIME),
+        ]
+        cache = CentralDataCache(
+            device_provider=MagicMock(),
+            client_provider=MagicMock(),
+            data_point_provider=data_point_provider,
+            central_info=MagicMock(),
+        )
+
+        count = await cache.refresh_data_point_data(
+            interface=Interface.HMIP_RF, refreshed_before=reconnected_at, max_concurrent_devices=4
+        )
+
+        assert count == 2
+        assert sorted(loaded) == ["VCU001:1", "VCU002:1"]
+
+    @pytest.mark.asyncio
+    async def test_reread_limits_concurrent_devices(self) -> None:
+        """Test that devices are read in parallel up to the limit, data points of a device in order."""
+        running = 0
+        peak = 0
+        order: list[str] = []
+
+        def create_data_point(*, address: str) -> MagicMock:
+            async def load_data_point_value(*, call_source: CallSource, direct_call: bool = False) -> None:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                order.append(address)
+                running -= 1
+
+            dp = MagicMock()
+            dp.device.address = address.split(":")[0]
+            dp.load_data_point_value = load_data_point_value
+            return dp
+
+        data_point_provider = MagicMock()
+        data_point_provider.get_readable_generic_data_points.return_value = [
+            create_data_point(address=f"VCU00{device}:{channel}") for device in range(4) for channel in range(1, 3)
+        ]
+        cache = CentralDataCache(
+            device_provider=MagicMock(),
+            client_provider=MagicMock(),
+            data_point_provider=data_point_provider,
+            central_info=MagicMock(),
+        )
+
+        assert await cache.refresh_data_point_data(interface=Interface.HMIP_RF, max_concurrent_devices=2) == 8
+
+        assert peak == 2
+        for device in range(4):
+            assert order.index(f"VCU00{device}:1") < order.index(f"VCU00{device}:2")
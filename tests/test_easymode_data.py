@@ -4,25 +4,45 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 from aiohomematic import easymode_data
 
 
-class TestEagerInitialization:
-    """Verify the store is loaded at import time to avoid event-loop I/O."""
+class TestLazyInitialization:
+    """Verify the store is loaded on demand and not at import time."""
+
+    def test_load_is_idempotent(self) -> None:
+        """Explicit loading marks the store as loaded and can be repeated."""
+        easymode_data.load_easymode_data()
+        assert easymode_data._store._loaded is True
+        easymode_data.load_easymode_data()
+        assert easymode_data._store._loaded is True
 
     def test_public_access_does_not_reload(self) -> None:
-        """A public lookup after import performs no I/O (store already loaded)."""
+        """A public lookup after loading performs no I/O (store already loaded)."""
+        easymode_data.load_easymode_data()
         # Lookups are pure dict reads; an unknown key simply returns None.
         assert easymode_data.get_channel_metadata(channel_type="__unknown__") is None
         assert easymode_data._store._loaded is True
 
-    def test_store_loaded_at_import(self) -> None:
+    def test_store_not_loaded_at_import(self) -> None:
         """
-        Verify the module-level store is loaded eagerly at import time.
+        Verify importing the package does not parse the easymode archive.
 
-        The first ``get_*()`` access must not trigger blocking file I/O,
-        because that access can happen inside the asyncio event loop (e.g.
-        Home Assistant's ``ws_get_form_schema``). Eager initialization at
-        import time moves the archive read out of the loop.
+        Parsing the archive dominated the import time of ``aiohomematic``.
+        ``CentralUnit.start()`` loads it in an executor instead, which keeps
+        the blocking file read off the event loop.
         """
-        assert easymode_data._store._loaded is True
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import aiohomematic.central; from aiohomematic import easymode_data; print(easymode_data._store._loaded)",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        assert result.stdout.strip() == "False"
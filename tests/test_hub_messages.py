@@ -5,14 +5,27 @@
 from datetime import datetime
 from types import SimpleNamespace
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from aiohomematic.client.json_rpc import _parse_tab_separated
-from aiohomematic.const import AlarmMessageData, DataPointCategory, HubValueType, ServiceMessageData
+from aiohomematic.const import (
+    AlarmMessageData,
+    Backend,
+    DataPointCategory,
+    DataRefreshType,
+    HubSnapshotData,
+    HubValueType,
+    ServiceMessageData,
+    SystemVariableChangesData,
+    SystemVariableData,
+)
+from aiohomematic.exceptions import ClientException
 from aiohomematic.model.hub import HmAlarmMessagesSensor, HmServiceMessagesSensor, Hub
 
+from tests.helpers.fake_model import FakeDataPointNotifier
+
 # =============================================================================
 # Helper: _parse_tab_separated
 # =============================================================================
@@ -122,7 +135,7 @@ def _make_fake_protocols() -> dict[str, Any]:
     """Create minimal fake protocol implementations for hub sensor construction."""
     config_provider = SimpleNamespace(config=SimpleNamespace(central_id="test-central"))
     central_info = SimpleNamespace(name="test-central", available=True)
-    event_bus_provider = SimpleNamespace(event_bus=SimpleNamespace())
+    event_bus_provider = SimpleNamespace(event_bus=SimpleNamespace(data_point_notifier=FakeDataPointNotifier()))
     event_publisher = SimpleNamespace(
         publish_system_event=lambda **kwargs: None,
     )
@@ -458,3 +471,248 @@ class TestHubFetchAlarmMessages:
         await hub._update_alarm_messages_data_point()
 
         assert hub.alarm_messages_dp is None
+
+
+class TestHubFetchHubData:
+    """Tests for Hub.fetch_hub_data with the combined hub snapshot."""
+
+    @staticmethod
+    def _make_hub(*, fake_client: Any) -> Hub:
+        """Create a CCU hub with program and sysvar scan disabled."""
+        protocols = _make_fake_protocols()
+        protocols["config_provider"] = SimpleNamespace(
+            config=SimpleNamespace(central_id="test-central", enable_program_scan=False, enable_sysvar_scan=False)
+        )
+        return Hub(
+            config_provider=protocols["config_provider"],
+            central_info=SimpleNamespace(name="test", available=True, model=Backend.CCU),
+            client_provider=SimpleNamespace(),
+            hub_data_point_manager=SimpleNamespace(),
+            primary_client_provider=SimpleNamespace(primary_client=fake_client),
+            event_publisher=protocols["event_publisher"],
+            event_bus_provider=protocols["event_bus_provider"],
+            task_scheduler=protocols["task_scheduler"],
+            paramset_description_provider=protocols["paramset_description_provider"],
+            parameter_visibility_provider=protocols["parameter_visibility_provider"],
+            channel_lookup=SimpleNamespace(),
+            hub_data_fetcher=SimpleNamespace(),
+            metrics_provider=SimpleNamespace(),
+            health_tracker=SimpleNamespace(),
+        )  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_sections_update_data_points(self) -> None:
+        """The snapshot sections should be passed to the data points without separate backend calls."""
+        fake_client = SimpleNamespace(
+            available=True,
+            get_hub_snapshot=AsyncMock(
+                return_value=HubSnapshotData(
+                    alarm_messages=(AlarmMessageData(alarm_id="1", name="Fire Alarm"),),
+                    service_messages=(
+                        ServiceMessageData(msg_id="1", name="UNREACH", timestamp="2026-01-01", msg_type=0),
+                        ServiceMessageData(msg_id="2", name="LOW_BAT", timestamp="2026-01-01", msg_type=0),
+                    ),
+                )
+            ),
+            get_alarm_messages=AsyncMock(),
+            get_inbox_devices=AsyncMock(),
+            get_service_messages=AsyncMock(),
+        )
+        hub = self._make_hub(fake_client=fake_client)
+
+        assert await hub.fetch_hub_data(scheduled=True) == frozenset(
+            {DataRefreshType.INBOX, DataRefreshType.SERVICE_MESSAGES, DataRefreshType.ALARM_MESSAGES}
+        )
+
+        fake_client.get_hub_snapshot.assert_awaited_once_with(
+            program_markers=None, sysvar_markers=None, sysvar_since=0, sysvar_checksum=None
+        )
+        assert hub.alarm_messages_dp is not None
+        assert hub.alarm_messages_dp.value == 1
+        assert hub.service_messages_dp is not None
+        assert hub.service_messages_dp.value == 2
+        assert hub.inbox_dp is not None
+        fake_client.get_alarm_messages.assert_not_called()
+        fake_client.get_inbox_devices.assert_not_called()
+        fake_client.get_service_messages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_failed_snapshot_returns_no_refreshed_categories(self) -> None:
+        """A failed snapshot refreshes nothing, but does not make the caller fall back to the separate fetches."""
+        fake_client = SimpleNamespace(
+            available=True, get_hub_snapshot=AsyncMock(side_effect=ClientException("snapshot failed"))
+        )
+        hub = self._make_hub(fake_client=fake_client)
+
+        assert await hub.fetch_hub_data(scheduled=True) == frozenset()
+        assert hub.service_messages_dp is None
+
+    @pytest.mark.asyncio
+    async def test_unavailable_central_skips_messages(self) -> None:
+        """Inbox, service and alarm messages are not refreshed while the central is unavailable."""
+        fake_client = SimpleNamespace(available=True, get_hub_snapshot=AsyncMock(return_value=HubSnapshotData()))
+        hub = self._make_hub(fake_client=fake_client)
+        hub._central_info.available = False  # type: ignore[misc]
+
+        assert await hub.fetch_hub_data(scheduled=True) == frozenset()
+        assert hub.service_messages_dp is None
+
+    @pytest.mark.asyncio
+    async def test_unsupported_snapshot_returns_none(self) -> None:
+        """Without a snapshot the caller has to fall back to the separate fetches."""
+        fake_client = SimpleNamespace(available=True, get_hub_snapshot=AsyncMock(return_value=None))
+        hub = self._make_hub(fake_client=fake_client)
+
+        assert await hub.fetch_hub_data(scheduled=True) is None
+        assert hub.service_messages_dp is None
+
+
+class TestHubSysvarDeltaPolling:
+    """Tests for the delta poll of system variables."""
+
+    @staticmethod
+    def _make_hub(*, fake_client: Any, sysvar_dp: Any) -> Hub:
+        """Create a CCU hub with sysvar scan enabled and one existing sysvar data point."""
+        protocols = _make_fake_protocols()
+        protocols["config_provider"] = SimpleNamespace(
+            config=SimpleNamespace(
+                central_id="test-central", enable_program_scan=False, enable_sysvar_scan=True, sysvar_markers=()
+            )
+        )
+        return Hub(
+            config_provider=protocols["config_provider"],
+            central_info=SimpleNamespace(name="test", available=True, model=Backend.CCU),
+            client_provider=SimpleNamespace(),
+            hub_data_point_manager=SimpleNamespace(
+                sysvar_data_points=[sysvar_dp],
+                get_sysvar_data_point=lambda *, vid: sysvar_dp if vid == sysvar_dp.vid else None,
+            ),
+            primary_client_provider=SimpleNamespace(primary_client=fake_client),
+            event_publisher=protocols["event_publisher"],
+            event_bus_provider=protocols["event_bus_provider"],
+            task_scheduler=protocols["task_scheduler"],
+            paramset_description_provider=protocols["paramset_description_provider"],
+            parameter_visibility_provider=protocols["parameter_visibility_provider"],
+            channel_lookup=SimpleNamespace(),
+            hub_data_fetcher=SimpleNamespace(),
+            metrics_provider=SimpleNamespace(),
+            health_tracker=SimpleNamespace(),
+        )  # type: ignore[arg-type]
+
+    @pytest.mark.asyncio
+    async def test_full_fetch_only_on_checksum_change(self) -> None:
+        """Unchanged checksums apply the delta values; a new checksum triggers a full fetch."""
+        sysvar_dp = Mock(vid="sv1", data_type=HubValueType.INTEGER, is_extended=False)
+        fake_client = SimpleNamespace(
+            available=True,
+            get_all_system_variables=AsyncMock(
+                return_value=(SystemVariableData(vid="sv1", legacy_name="SV", value=1),)
+            ),
+            get_system_variable_changes=AsyncMock(
+                side_effect=[
+                    SystemVariableChangesData(checksum="1:1:2", timestamp=100, values={"sv1": "1"}),
+                    SystemVariableChangesData(checksum="1:1:2", timestamp=160, values={"sv1": "5"}),
+                    SystemVariableChangesData(checksum="2:3:4", timestamp=200, values={}),
+                ]
+            ),
+        )
+        hub = self._make_hub(fake_client=fake_client, sysvar_dp=sysvar_dp)
+
+        # First poll has no baseline and runs a full fetch
+        await hub.fetch_sysvar_data(scheduled=True)
+        assert fake_client.get_all_system_variables.await_count == 1
+        assert sysvar_dp.write_value.call_args.kwargs["value"] == 1
+
+        # Same checksum: only the changed value is written, polled from the last timestamp
+        await hub.fetch_sysvar_data(scheduled=True)
+        assert fake_client.get_all_system_variables.await_count == 1
+        assert sysvar_dp.write_value.call_args.kwargs["value"] == "5"
+        assert fake_client.get_system_variable_changes.await_args_list[1].kwargs == {"since": 100}
+
+        # Added or removed variables change the checksum and require a full fetch
+        await hub.fetch_sysvar_data(scheduled=True)
+        assert fake_client.get_all_system_variables.await_count == 2
+        assert fake_client.get_system_variable_changes.await_args_list[2].kwargs == {"since": 160}
+
+    @pytest.mark.asyncio
+    async def test_snapshot_carries_sysvar_changes(self) -> None:
+        """The hub snapshot delivers the delta poll, so no separate change script runs."""
+        sysvar_dp = Mock(vid="sv1", data_type=HubValueType.INTEGER, is_extended=False)
+        fake_client = SimpleNamespace(
+            available=True,
+            get_hub_snapshot=AsyncMock(
+                side_effect=[
+                    HubSnapshotData(
+                        system_variables=(SystemVariableData(vid="sv1", legacy_name="SV", value=1),),
+                        system_variable_changes=SystemVariableChangesData(
+                            checksum="abc", timestamp=100, values={"sv1": "1"}
+                        ),
+                    ),
+                    HubSnapshotData(
+                        system_variable_changes=SystemVariableChangesData(
+                            checksum="abc", timestamp=160, values={"sv1": "5"}
+                        ),
+                    ),
+                ]
+            ),
+            get_system_variable_changes=AsyncMock(),
+        )
+        hub = self._make_hub(fake_client=fake_client, sysvar_dp=sysvar_dp)
+
+        assert await hub.fetch_hub_data(scheduled=True) == frozenset(
+            {
+                DataRefreshType.SYSVAR,
+                DataRefreshType.INBOX,
+                DataRefreshType.SERVICE_MESSAGES,
+                DataRefreshType.ALARM_MESSAGES,
+            }
+        )
+        assert sysvar_dp.write_value.call_args.kwargs["value"] == 1
+        assert DataRefreshType.SYSVAR in await hub.fetch_hub_data(scheduled=True)
+        assert sysvar_dp.write_value.call_args.kwargs["value"] == "5"
+
+        assert fake_client.get_hub_snapshot.await_args_list[1].kwargs["sysvar_since"] == 100
+        assert fake_client.get_hub_snapshot.await_args_list[1].kwargs["sysvar_checksum"] == "abc"
+        fake_client.get_system_variable_changes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unparsable_change_does_not_block_others(self) -> None:
+        """A value that fails to parse is skipped; the other changes are still written."""
+        broken_dp = Mock(vid="sv1")
+        broken_dp.write_value.side_effect = ValueError("could not convert string to float")
+        sysvar_dp = Mock(vid="sv2")
+        hub = self._make_hub(fake_client=SimpleNamespace(available=True), sysvar_dp=sysvar_dp)
+        data_points = {"sv1": broken_dp, "sv2": sysvar_dp}
+        hub._hub_data_point_manager = SimpleNamespace(  # type: ignore[misc]
+            get_sysvar_data_point=lambda *, vid: data_points.get(vid)
+        )
+        hub._sysvar_checksum = "abc"
+
+        assert hub._apply_sysvar_changes(
+            changes=SystemVariableChangesData(checksum="abc", timestamp=200, values={"sv1": "x", "sv2": "7"})
+        )
+        assert sysvar_dp.write_value.call_args.kwargs["value"] == "7"
+        assert hub._sysvar_changes_since == 200
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "changes_mock",
+        [AsyncMock(return_value=None), AsyncMock(side_effect=ClientException("script failed"))],
+        ids=["unsupported", "failed"],
+    )
+    async def test_without_delta_poll_always_full_fetch(self, changes_mock: AsyncMock) -> None:
+        """Without a usable delta poll all system variables are read on every poll."""
+        sysvar_dp = Mock(vid="sv1", data_type=HubValueType.INTEGER, is_extended=False)
+        fake_client = SimpleNamespace(
+            available=True,
+            get_all_system_variables=AsyncMock(
+                return_value=(SystemVariableData(vid="sv1", legacy_name="SV", value=1),)
+            ),
+            get_system_variable_changes=changes_mock,
+        )
+        hub = self._make_hub(fake_client=fake_client, sysvar_dp=sysvar_dp)
+
+        await hub.fetch_sysvar_data(scheduled=True)
+        await hub.fetch_sysvar_data(scheduled=True)
+
+        assert fake_client.get_all_system_variables.await_count == 2
@@ -3,6 +3,8 @@
 
 
 import asyncio
+import logging
+from unittest.mock import patch
 
 import pytest
 
@@ -50,6 +52,33 @@ class TestI18nBasicTranslation:
         assert len(text) > 0
 
 
+class TestI18nLazyTranslation:
+    """Test lazy translations for log messages."""
+
+    def test_lazy_tr_is_not_rendered_for_disabled_level(self, caplog: pytest.LogCaptureFixture) -> None:
+        """A disabled log level must not translate or format the message."""
+        i18n.set_locale(locale="en")
+        logger = logging.getLogger("aiohomematic.test_lazy_tr")
+        with (
+            caplog.at_level(logging.INFO, logger=logger.name),
+            patch.object(i18n, "tr", wraps=i18n.tr) as tr_mock,
+        ):
+            logger.debug(i18n.lazy_tr(key="exception.create_central.failed", reason="Test"))
+            assert tr_mock.call_count == 0
+            logger.info(i18n.lazy_tr(key="exception.create_central.failed", reason="Test"))
+            # Rendered once per handler that formats the record.
+            assert tr_mock.call_count >= 1
+        assert caplog.records[-1].getMessage() == i18n.tr(key="exception.create_central.failed", reason="Test")
+
+    def test_lazy_tr_renders_like_tr(self) -> None:
+        """str() of a lazy translation uses the active locale like tr()."""
+        i18n.set_locale(locale="de")
+        message = i18n.lazy_tr(key="exception.create_central.failed", reason="Fehler")
+        assert str(message) == "Zentrale konnte nicht erstellt werden: Fehler"
+        assert f"{message}" == str(message)
+        assert "exception.create_central.failed" in repr(message)
+
+
 class TestI18nLocaleManagement:
     """Test locale setting and getting."""
 
@@ -18,7 +18,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from aiohomematic.client import InterfaceClient, InterfaceConfig
-from aiohomematic.const import DEFAULT_TIMEOUT_CONFIG, Interface, ParamsetKey, ServiceMessageType
+from aiohomematic.const import DEFAULT_TIMEOUT_CONFIG, Interface, ParamsetKey, ServiceMessageType, TaskCategory
 
 
 class _FakeEventBus:
@@ -85,7 +85,7 @@ class _FakeCentral:
         self._listen_port_xml_rpc = 32001
         self._callback_ip_addr = "127.0.0.1"
 
-        def _close_task(*, target: Any, name: str) -> None:
+        def _close_task(*, target: Any, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
             target.close()
 
         self.looper = SimpleNamespace(create_task=_close_task)
@@ -123,7 +123,11 @@ class _FakeCentral:
 
     @property
     def device_registry(self) -> Any:
-        return SimpleNamespace(devices=tuple(self._devices.values()))
+        devices = tuple(self._devices.values())
+        return SimpleNamespace(
+            devices=devices,
+            get_devices=lambda *, interface_id: tuple(d for d in devices if d.interface_id == interface_id),
+        )
 
     @property
     def event_bus(self) -> Any:
@@ -27,6 +27,7 @@ from aiohomematic.const import (
     Interface,
     ParamsetKey,
     ProxyInitState,
+    TaskCategory,
 )
 
 
@@ -69,6 +70,23 @@ class _FakeParamsetDescriptions:
             self._raw_paramset_descriptions[interface_id][channel_address] = {}
         self._raw_paramset_descriptions[interface_id][channel_address][paramset_key] = paramset_description
 
+    def add_device_paramsets(
+        self,
+        *,
+        interface_id: str,
+        paramset_descriptions: dict[str, dict[ParamsetKey, dict[str, Any]]],
+        device_type: str,
+    ) -> None:
+        for channel_address, paramsets in paramset_descriptions.items():
+            for paramset_key, paramset_description in paramsets.items():
+                self.add(
+                    interface_id=interface_id,
+                    channel_address=channel_address,
+                    paramset_key=paramset_key,
+                    paramset_description=paramset_description,
+                    device_type=device_type,
+                )
+
     def get_parameter_data(
         self, *, interface_id: str, channel_address: str, paramset_key: ParamsetKey, parameter: str
     ) -> dict[str, Any] | None:
@@ -274,7 +292,7 @@ class _FakeCentral:
         self._listen_port_xml_rpc = 32001
         self._callback_ip_addr = "127.0.0.1"
 
-        def _close_task(*, target: Any, name: str) -> None:
+        def _close_task(*, target: Any, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
             target.close()
 
         self.looper = SimpleNamespace(create_task=_close_task)
@@ -322,7 +340,11 @@ class _FakeCentral:
 
     @property
     def device_registry(self) -> Any:
-        return SimpleNamespace(devices=tuple(self._devices.values()))
+        devices = tuple(self._devices.values())
+        return SimpleNamespace(
+            devices=devices,
+            get_devices=lambda *, interface_id: tuple(d for d in devices if d.interface_id == interface_id),
+        )
 
     @property
     def event_bus(self) -> Any:
@@ -1973,7 +1995,7 @@ class TestPollMasterValues:
         backend = _ExtendedFakeBackend()
         task_calls: list[Any] = []
 
-        def _track_task(*, target: Any, name: str) -> None:
+        def _track_task(*, target: Any, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
             task_calls.append((target, name))
             # Close the coroutine to avoid ResourceWarning
             if hasattr(target, "close"):
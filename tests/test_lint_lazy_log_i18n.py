@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""Tests for the lazy log translation linter (script.lint_lazy_log_i18n)."""
+
+from pathlib import Path
+
+import script.lint_lazy_log_i18n as lazylint
+
+
+class TestLazyLogI18nLint:
+    """Test lazy log translation linter."""
+
+    def test_lint_accepts_lazy_tr_and_tr_outside_logging(self, tmp_path: Path) -> None:
+        """lazy_tr in logging calls and tr outside of logging calls must not be flagged."""
+        code = (
+            "_LOGGER.debug(i18n.lazy_tr(key='a', value=1))\n"
+            "message = i18n.tr(key='b')\n"
+            "raise ValueError(i18n.tr(key='c'))\n"
+        )
+        p = tmp_path / "sample_ok.py"
+        p.write_text(code, encoding="utf-8")
+
+        assert lazylint.check_file(path=p) == []
+
+    def test_lint_detects_eager_tr_in_logging_call(self, tmp_path: Path) -> None:
+        """i18n.tr as message or argument of a logging call must be flagged."""
+        code = (
+            "_LOGGER.debug(i18n.tr(key='a', value=1))\n"
+            "_LOGGER.warning('%s failed', i18n.tr(key='b'))\n"
+            "_LOGGER.info(\n"
+            "    tr(key='c')\n"
+            ")\n"
+        )
+        p = tmp_path / "sample.py"
+        p.write_text(code, encoding="utf-8")
+
+        assert [finding.line for finding in lazylint.check_file(path=p)] == [1, 2, 4]
+
+    def test_lint_respects_pragmas(self, tmp_path: Path) -> None:
+        """Inline and previous-line pragmas skip a single occurrence."""
+        code = (
+            "_LOGGER.debug(i18n.tr(key='a'))  # i18n-lazy: ignore\n"
+            "# i18n-lazy: ignore-next\n"
+            "_LOGGER.debug(i18n.tr(key='b'))\n"
+            "_LOGGER.debug(i18n.tr(key='c'))\n"
+        )
+        p = tmp_path / "sample_pragma.py"
+        p.write_text(code, encoding="utf-8")
+
+        assert [finding.line for finding in lazylint.check_file(path=p)] == [4]
+
+    def test_package_has_no_eager_log_translations(self) -> None:
+        """The package itself must not contain eager translations in logging calls."""
+        package_dir = Path(__file__).resolve().parents[1] / "aiohomematic"
+        assert lazylint.main([str(package_dir)]) == 0
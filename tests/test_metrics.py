@@ -2,23 +2,43 @@
 # Copyright (c) 2021-2026
 """Tests for the metrics aggregation system."""
 
+import asyncio
 from datetime import datetime
+import sys
+from unittest.mock import MagicMock
 
 import pytest
 
 from aiohomematic.async_support import Looper
+from aiohomematic.central.coordinators.connection_recovery import InterfaceRecoveryState
 from aiohomematic.central.events import EventBus, HandlerStats
+from aiohomematic.const import ParamsetKey, RecoveryReloadStep, RecoveryStage
 from aiohomematic.metrics import (
     CacheMetrics,
     CacheStats,
     EventMetrics,
+    ExecutorLaneStats,
+    ExecutorMetrics,
     HealthMetrics,
     LatencyStats,
+    MemoryTypeStats,
+    MetricsAggregator,
     MetricsSnapshot,
     ModelMetrics,
     RecoveryMetrics,
+    RpcMethodStats,
     RpcMetrics,
     SizeOnlyStats,
+    StartupMetrics,
+    StartupProfiler,
+    TaskCategoryStats,
+    TaskMetrics,
+    ThrottleMetrics,
+    ThrottleStats,
+    approximate_size,
+    collect_memory_metrics,
+    profile_phase,
+    record_rpc_transfer,
 )
 
 from tests.conftest import NoOpTaskScheduler
@@ -114,6 +134,32 @@ class TestHandlerStats:
 class TestRpcMetrics:
     """Tests for RpcMetrics dataclass."""
 
+    def test_by_method_aggregated(self) -> None:
+        """Test that traffic per method is collected from the JSON-RPC client and summed up."""
+        json_rpc_client = MagicMock()
+        json_rpc_client.method_stats = {
+            "ReGa.runScript:fetch_all_device_data.fn": RpcMethodStats(
+                request_count=2, bytes_sent=2000, bytes_received=90000, compressed_responses=2, total_latency_ms=800.0
+            ),
+            "Session.renew": RpcMethodStats(request_count=4, bytes_sent=400, bytes_received=160),
+        }
+        aggregator = MetricsAggregator(
+            central_name="c",
+            client_provider=MagicMock(),
+            device_provider=MagicMock(),
+            event_bus=MagicMock(),
+            health_tracker=MagicMock(),
+            data_cache=MagicMock(),
+            json_rpc_client=json_rpc_client,
+        )
+
+        rpc = aggregator.rpc
+        assert rpc.bytes_sent == 2400
+        assert rpc.bytes_received == 90160
+        assert rpc.by_method["ReGa.runScript:fetch_all_device_data.fn"].avg_latency_ms == 400.0
+        assert rpc.by_method["Session.renew"].avg_bytes_received == 40.0
+        assert aggregator.snapshot().to_dict()["rpc"]["by_method"]["Session.renew"]["request_count"] == 4
+
     def test_coalesce_rate(self) -> None:
         """Test coalesce rate calculation."""
         metrics = RpcMetrics(total_requests=100, coalesced_requests=30)
@@ -140,6 +186,31 @@ class TestRpcMetrics:
         assert metrics.success_rate == 100.0
 
 
+class TestRpcMethodStats:
+    """Tests for RpcMethodStats."""
+
+    def test_initial_state(self) -> None:
+        """Test initial state of RpcMethodStats."""
+        stats = RpcMethodStats()
+        assert stats.request_count == 0
+        assert stats.avg_bytes_received == 0.0
+        assert stats.avg_latency_ms == 0.0
+
+    def test_record(self) -> None:
+        """Test recording of requests."""
+        stats = RpcMethodStats()
+        stats.record(bytes_sent=100, bytes_received=300, latency_ms=20.0, compressed=True, had_error=False)
+        stats.record(bytes_sent=100, bytes_received=100, latency_ms=40.0, compressed=False, had_error=True)
+
+        assert stats.request_count == 2
+        assert stats.error_count == 1
+        assert stats.bytes_sent == 200
+        assert stats.compressed_responses == 1
+        assert stats.avg_bytes_received == 200.0
+        assert stats.avg_latency_ms == 30.0
+        assert stats.max_latency_ms == 40.0
+
+
 class TestCacheStats:
     """Tests for CacheStats dataclass."""
 
@@ -213,6 +284,31 @@ class TestRecoveryMetrics:
         metrics = RecoveryMetrics()
         assert metrics.success_rate == 100.0
 
+    def test_stage_durations_of_slowest_interface(self) -> None:
+        """Test that stage and reload durations are aggregated as maximum across interfaces."""
+        hmip = InterfaceRecoveryState(interface_id="c-HmIP-RF")
+        hmip.stage_durations_ms[RecoveryStage.RECONNECTING] = 200.0
+        hmip.record_reload_step(step=RecoveryReloadStep.DEVICE_DATA, duration_ms=900.0)
+        bidcos = InterfaceRecoveryState(interface_id="c-BidCos-RF")
+        bidcos.stage_durations_ms[RecoveryStage.RECONNECTING] = 350.0
+        bidcos.record_reload_step(step=RecoveryReloadStep.DEVICE_DATA, duration_ms=400.0)
+        recovery_provider = MagicMock()
+        recovery_provider.in_recovery = False
+        recovery_provider.recovery_states = {"c-HmIP-RF": hmip, "c-BidCos-RF": bidcos}
+        aggregator = MetricsAggregator(
+            central_name="c",
+            client_provider=MagicMock(),
+            device_provider=MagicMock(),
+            event_bus=MagicMock(),
+            health_tracker=MagicMock(),
+            data_cache=MagicMock(),
+            recovery_provider=recovery_provider,
+        )
+
+        recovery = aggregator.recovery
+        assert recovery.stage_durations_ms == {RecoveryStage.RECONNECTING: 350.0}
+        assert recovery.reload_durations_ms == {RecoveryReloadStep.DEVICE_DATA: 900.0}
+
 
 class TestEventMetrics:
     """Tests for EventMetrics dataclass."""
@@ -270,6 +366,321 @@ class TestMetricsSnapshot:
         assert isinstance(snapshot.model, ModelMetrics)
 
 
+class _SlotHolder:
+    """Object with slots for memory accounting tests."""
+
+    __slots__ = ("__private", "name", "referenced", "values")
+
+    def __init__(self, *, name: str, values: list[int], referenced: object) -> None:
+        self.__private = (1.5, "x")
+        self.name = name
+        self.values = values
+        self.referenced = referenced
+
+
+class TestMemoryMetrics:
+    """Tests for the approximate memory accounting."""
+
+    def test_approximate_size_counts_owned_values(self) -> None:
+        """Test that owned containers and strings are counted, referenced objects and enums are not."""
+        referenced = _SlotHolder(name="ref", values=list(range(100)), referenced=None)
+        small = _SlotHolder(name="a", values=[], referenced=referenced)
+        large = _SlotHolder(name="a" * 1000, values=[1000 + i for i in range(50)], referenced=None)
+
+        assert approximate_size(obj=small) < approximate_size(obj=referenced)
+        assert approximate_size(obj=large) - approximate_size(obj=small) > 1000
+        assert approximate_size(
+            obj=_SlotHolder(name="a", values=[], referenced=ParamsetKey.VALUES)
+        ) == approximate_size(obj=small)
+        # Name-mangled slots are counted as well.
+        assert approximate_size(obj=small) > sys.getsizeof(small) + sys.getsizeof("a") + sys.getsizeof([])
+
+    def test_collect_memory_metrics(self) -> None:
+        """Test aggregation per type, groups and ordering by size."""
+
+        class Channel:
+            def __init__(self) -> None:
+                self.generic_data_points = (_SlotHolder(name="dp", values=[], referenced=None),)
+                self.generic_events = ()
+                self.calculated_data_points = ()
+                self.custom_data_point = None
+
+        class Device:
+            def __init__(self) -> None:
+                self.channels = {"A:0": Channel(), "A:1": Channel()}
+
+        report = collect_memory_metrics(
+            devices=(Device(), Device()),
+            groups={"EventBus.subscription": iter((lambda: None,) * 3)},
+        )
+        assert report.by_type["Device"].count == 2
+        assert report.by_type["Channel"].count == 4
+        assert report.by_type["_SlotHolder"].count == 4
+        assert report.by_type["EventBus.subscription"].count == 3
+        assert report.objects_total == 13
+        assert report.approx_bytes_total == sum(stats.approx_bytes for stats in report.by_type.values())
+        sizes = [stats.approx_bytes for stats in report.by_type.values()]
+        assert sizes == sorted(sizes, reverse=True)
+
+    def test_memory_type_stats(self) -> None:
+        """Test recording and the average size."""
+        stats = MemoryTypeStats()
+        assert stats.avg_bytes == 0.0
+        stats.record(size=100)
+        stats.record(size=300)
+        assert stats.count == 2
+        assert stats.approx_bytes == 400
+        assert stats.avg_bytes == 200.0
+
+
+class TestModelMetrics:
+    """Tests for the model statistics of the MetricsAggregator."""
+
+    def test_devices_by_interface(self) -> None:
+        """Device counts per interface come from the device provider."""
+        device_provider = MagicMock()
+        device_provider.devices = ()
+        device_provider.device_counts_by_interface = {"c-HmIP-RF": 3, "c-BidCos-RF": 2}
+        event_bus = MagicMock()
+        event_bus.get_total_subscription_count.return_value = 0
+        aggregator = MetricsAggregator(
+            central_name="c",
+            client_provider=MagicMock(),
+            device_provider=device_provider,
+            event_bus=event_bus,
+            health_tracker=MagicMock(),
+            data_cache=MagicMock(),
+        )
+
+        model = aggregator.model
+        assert model.devices_by_interface == {"c-BidCos-RF": 2, "c-HmIP-RF": 3}
+        assert list(model.devices_by_interface) == ["c-BidCos-RF", "c-HmIP-RF"]
+
+
+class TestExecutorMetrics:
+    """Tests for executor pool metrics."""
+
+    def test_aggregated_from_lanes(self) -> None:
+        """Test that lane stats are collected from the executor pool and aggregated."""
+        executor_pool = MagicMock()
+        executor_pool.lane_stats = {
+            "cpu": ExecutorLaneStats(max_workers=2, completed=4, total_wait_ms=8.0, max_wait_ms=5.0),
+            "rpc": ExecutorLaneStats(max_workers=1, active=1, queue_depth=2, max_wait_ms=120.0),
+            "storage": ExecutorLaneStats(max_workers=2),
+        }
+        aggregator = MetricsAggregator(
+            central_name="c",
+            client_provider=MagicMock(),
+            device_provider=MagicMock(),
+            event_bus=MagicMock(),
+            health_tracker=MagicMock(),
+            data_cache=MagicMock(),
+            executor_pool=executor_pool,
+        )
+
+        executor = aggregator.executor
+        assert executor.active_jobs == 1
+        assert executor.queued_jobs == 2
+        assert executor.saturated_lanes == 1
+        assert executor.max_wait_ms == 120.0
+        assert executor.by_lane["cpu"].avg_wait_ms == 2.0
+        assert executor.by_lane["rpc"].utilisation == 100.0
+
+    def test_default_values(self) -> None:
+        """Test default values without executor pool."""
+        executor = ExecutorMetrics()
+        assert executor.queued_jobs == 0
+        assert executor.by_lane == {}
+        assert isinstance(MetricsSnapshot().executor, ExecutorMetrics)
+
+
+class TestTaskMetrics:
+    """Tests for Looper background task metrics."""
+
+    def test_aggregated_from_categories(self) -> None:
+        """Test that category stats are collected from the task scheduler and aggregated."""
+        task_scheduler = MagicMock()
+        task_scheduler.task_stats = {
+            "event": TaskCategoryStats(limit=2, running=2, queued=3, started=9),
+            "incident": TaskCategoryStats(limit=1, running=1, dropped=4),
+            "persistence": TaskCategoryStats(limit=1, coalesced=2),
+        }
+        aggregator = MetricsAggregator(
+            central_name="c",
+            client_provider=MagicMock(),
+            device_provider=MagicMock(),
+            event_bus=MagicMock(),
+            health_tracker=MagicMock(),
+            data_cache=MagicMock(),
+            task_scheduler=task_scheduler,
+        )
+
+        tasks = aggregator.tasks
+        assert tasks.running_tasks == 3
+        assert tasks.queued_tasks == 3
+        assert tasks.dropped_tasks == 4
+        assert tasks.coalesced_tasks == 2
+        assert tasks.saturated_categories == 1
+        assert tasks.by_category["event"].saturated is True
+        assert aggregator.snapshot().to_dict()["tasks"]["by_category"]["incident"]["dropped"] == 4
+
+    def test_default_values(self) -> None:
+        """Test default values without task scheduler."""
+        tasks = TaskMetrics()
+        assert tasks.running_tasks == 0
+        assert tasks.by_category == {}
+        assert isinstance(MetricsSnapshot().tasks, TaskMetrics)
+
+
+class TestStartupProfiler:
+    """Tests for the startup phase profiler."""
+
+    def test_aggregator_summary(self) -> None:
+        """Test that the aggregator exposes the startup summary in the snapshot."""
+        profiler = StartupProfiler(central_name="c")
+        aggregator = MetricsAggregator(
+            central_name="c",
+            client_provider=MagicMock(),
+            device_provider=MagicMock(),
+            event_bus=MagicMock(),
+            health_tracker=MagicMock(),
+            data_cache=MagicMock(),
+            startup_profiler=profiler,
+        )
+        assert aggregator.startup.total_ms == 0.0
+
+        with profiler.profile(name="central.start"):
+            assert aggregator.startup.in_progress is True
+            with profile_phase(name="hub.init"):
+                pass
+
+        startup = aggregator.snapshot().startup
+        assert startup.in_progress is False
+        assert startup.completed_at is not None
+        assert set(startup.phases) == {"central.start", "central.start/hub.init"}
+
+    def test_chrome_trace(self) -> None:
+        """Test the Chrome trace export format."""
+        profiler = StartupProfiler(central_name="c")
+        with profiler.profile(name="central.start"), profile_phase(name="cache.load_all", interface_id="c-HmIP-RF"):
+            record_rpc_transfer(bytes_sent=1, bytes_received=2)
+
+        trace = profiler.to_chrome_trace()
+        assert trace["displayTimeUnit"] == "ms"
+        metadata, root, phase = trace["traceEvents"]
+        assert metadata["ph"] == "M"
+        assert metadata["args"] == {"name": "c"}
+        assert root["name"] == "central.start"
+        assert phase["ph"] == "X"
+        assert phase["ts"] >= root["ts"]
+        assert phase["dur"] <= root["dur"]
+        assert phase["args"] == {"interface_id": "c-HmIP-RF", "rpc_count": 1, "bytes_sent": 1, "bytes_received": 2}
+
+    async def test_concurrent_tasks_inherit_span(self) -> None:
+        """Test that tasks and executor jobs started within a phase are attributed to it."""
+        profiler = StartupProfiler(central_name="c")
+        looper = Looper()
+
+        async def _init_client(interface_id: str) -> None:
+            with profile_phase(name="client.init_proxy", interface_id=interface_id):
+                await looper.async_add_executor_job(
+                    lambda: record_rpc_transfer(bytes_sent=10, bytes_received=20), name="rpc"
+                )
+
+        with profiler.profile(name="central.start"), profile_phase(name="clients.init"):
+            await asyncio.gather(_init_client("a"), _init_client("b"))
+
+        phases = profiler.summary().phases
+        init_proxy = phases["central.start/clients.init/client.init_proxy"]
+        assert init_proxy.count == 2
+        assert init_proxy.rpc_count == 2
+        assert phases["central.start/clients.init"].bytes_received == 40
+        tids = {
+            event["tid"] for event in profiler.to_chrome_trace()["traceEvents"] if event["name"] == "client.init_proxy"
+        }
+        assert len(tids) == 2
+
+    def test_nested_phases(self) -> None:
+        """Test that nested phases are aggregated by path and transfers roll up to all parents."""
+        profiler = StartupProfiler(central_name="c")
+        with profiler.profile(name="central.start"):
+            with profile_phase(name="cache.load_all"):
+                with profile_phase(name="cache.data"):
+                    record_rpc_transfer(bytes_sent=100, bytes_received=1000)
+                record_rpc_transfer(bytes_sent=10, bytes_received=20)
+            with profile_phase(name="hub.init"):
+                record_rpc_transfer(bytes_sent=1, bytes_received=2)
+
+        startup = profiler.summary()
+        assert startup.rpc_count == 3
+        assert startup.bytes_sent == 111
+        assert startup.bytes_received == 1022
+        assert startup.phases["central.start/cache.load_all"].rpc_count == 2
+        assert startup.phases["central.start/cache.load_all/cache.data"].bytes_received == 1000
+        assert startup.phases["central.start/hub.init"].bytes_sent == 1
+        assert startup.total_ms >= startup.phases["central.start/cache.load_all"].duration_ms
+
+    def test_no_op_outside_of_start(self) -> None:
+        """Test that phases and transfers outside of a start run are not recorded."""
+        profiler = StartupProfiler(central_name="c")
+        with profile_phase(name="devices.finalize"):
+            record_rpc_transfer(bytes_sent=1, bytes_received=1)
+        assert profiler.summary() == StartupMetrics()
+
+        with profiler.profile(name="central.start"):
+            pass
+        with profile_phase(name="devices.finalize"):
+            record_rpc_transfer(bytes_sent=1, bytes_received=1)
+        startup = profiler.summary()
+        assert startup.rpc_count == 0
+        assert set(startup.phases) == {"central.start"}
+
+
+class TestThrottleMetrics:
+    """Tests for command throttle metrics."""
+
+    def test_aggregated_from_clients(self) -> None:
+        """Test that throttle stats are collected per interface and aggregated."""
+        clients = []
+        for interface_id, stats in (
+            (
+                "c-HmIP-RF",
+                ThrottleStats(adaptive=True, duty_cycle_level=35.0, backoff_remaining=4.0, duty_cycle_faults=2),
+            ),
+            ("c-BidCos-RF", ThrottleStats(carrier_sense_level=12.0, throttled_count=3, queue_size=1)),
+        ):
+            client = MagicMock()
+            client.command_throttle.interface_id = interface_id
+            client.command_throttle.stats = stats
+            clients.append(client)
+        client_provider = MagicMock()
+        client_provider.clients = tuple(clients)
+        aggregator = MetricsAggregator(
+            central_name="c",
+            client_provider=client_provider,
+            device_provider=MagicMock(),
+            event_bus=MagicMock(),
+            health_tracker=MagicMock(),
+            data_cache=MagicMock(),
+        )
+
+        throttle = aggregator.throttle
+        assert throttle.adaptive_interfaces == 1
+        assert throttle.interfaces_in_backoff == 1
+        assert throttle.max_utilisation == 35.0
+        assert throttle.duty_cycle_faults == 2
+        assert throttle.throttled_commands == 3
+        assert throttle.queued_commands == 1
+        assert set(throttle.by_interface) == {"c-BidCos-RF", "c-HmIP-RF"}
+
+    def test_default_values(self) -> None:
+        """Test default values without clients."""
+        throttle = ThrottleMetrics()
+        assert throttle.max_utilisation == 0.0
+        assert throttle.by_interface == {}
+        assert isinstance(MetricsSnapshot().throttle, ThrottleMetrics)
+
+
 class TestEventBusHandlerStats:
     """Tests for EventBus handler statistics integration."""
 
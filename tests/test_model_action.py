@@ -48,7 +48,7 @@ class TestActionSelectDataPoint:
         assert action_select.values == ("LOCKED", "UNLOCKED", "OPEN")
         assert action_select.hmtype == "ENUM"
         # Before setting value, default is returned
-        assert action_select.value == action_select._default
+        assert action_select.value == action_select._spec.default
         await action_select.send_value(value="OPEN")
         assert mock_client.method_calls[-1] == call.set_value(
             channel_address="VCU9724704:1",
@@ -8,6 +8,8 @@ from typing import Any
 from aiohomematic.const import CalculatedParameter, DataPointCategory, Parameter, ParameterType, ParamsetKey
 from aiohomematic.model.calculated import DerivedBinarySensor, DerivedBinarySensorMapping, DerivedBinarySensorRegistry
 
+from tests.helpers.fake_model import FakeDataPointNotifier
+
 # Shared fake helpers ---------------------------------------------------------
 
 
@@ -29,7 +31,7 @@ class _FakeCentral:
 
         class _EventBus:
             def __init__(self, *, task_scheduler: Any = None) -> None:
-                pass
+                self.data_point_notifier = FakeDataPointNotifier()
 
             def subscribe(
                 self, *, event_type: Any, event_key: Any, handler: Callable[[Any], None]
@@ -2,6 +2,7 @@
 # Copyright (c) 2021-2026
 """Tests for climate data points of aiohomematic."""
 
+from dataclasses import replace
 from datetime import datetime
 from types import SimpleNamespace
 from typing import cast
@@ -199,7 +200,7 @@ class TestCustomDpSimpleRfThermostat:
         # This device exposes no dedicated TEMPERATURE_MAXIMUM value.
         assert climate._dp_temperature_maximum.value is None
         # Simulate the incomplete SETPOINT paramset description.
-        climate._dp_setpoint._max = None
+        climate._dp_setpoint._spec = replace(climate._dp_setpoint._spec, max=None)
         assert climate._dp_setpoint.max is None
         # Invariant: max_temp is always a float, never None.
         assert climate.max_temp is not None
@@ -767,19 +768,19 @@ class TestCustomDpRfThermostat:
             assert "temperature" in first_period
 
         # Write schedule profile back (verifies put_paramset is called correctly)
+        baseline = dict(climate.device.week_profile._raw_schedule_baseline)
         await wp_dp.set_schedule_profile(profile=ScheduleProfile.P1, profile_data=profile_data)
         # Verify put_paramset was called with MASTER paramset on device address
         # NOTE: set_schedule_profile normalizes weekday data to 13 slots (fills missing slots with 24:00)
-        # Verify that put_paramset was called (actual values contain normalized 13-slot data)
+        # and only sends the slots that differ from the schedule read before.
         last_call = mock_client.method_calls[-1]
         assert last_call[0] == "put_paramset"
         assert last_call[2]["channel_address"] == "VCU0000341"
         assert last_call[2]["paramset_key_or_link_address"] == ParamsetKey.MASTER
-        # Verify some sample values from the normalized schedule
-        values = last_call[2]["values"]
-        assert "P1_ENDTIME_SATURDAY_1" in values
-        assert "P1_TEMPERATURE_SATURDAY_1" in values
-        # Verify all 13 slots are present for Saturday (normalized)
+        sent = last_call[2]["values"]
+        assert all(key.startswith("P1_") and sent[key] != baseline.get(key) for key in sent)
+        # Verify all 13 slots are present for Saturday once applied to the device (normalized)
+        values = baseline | sent
         for slot_no in range(1, 14):
             assert f"P1_ENDTIME_SATURDAY_{slot_no}" in values
             assert f"P1_TEMPERATURE_SATURDAY_{slot_no}" in values
@@ -2605,6 +2606,7 @@ class TestClimateSimpleScheduleMethods:
         }
 
         # Set simple weekday
+        baseline = dict(climate.device.week_profile._raw_schedule_baseline)
         await wp_dp.set_schedule_weekday(
             profile=ScheduleProfile.P1,
             weekday=WeekdayStr.MONDAY,
@@ -2620,9 +2622,10 @@ class TestClimateSimpleScheduleMethods:
         assert last_call[2]["channel_address"] == "VCU0000341"
         assert last_call[2]["paramset_key_or_link_address"] == ParamsetKey.MASTER
 
-        # Verify the values contain correct schedule data for MONDAY
-        values = last_call[2]["values"]
-        # All 13 slots should be present for Monday
+        # Only changed MONDAY slots are sent; applied to the device all 13 slots are set
+        sent = last_call[2]["values"]
+        assert all(key.startswith("P1_") and "_MONDAY_" in key for key in sent)
+        values = baseline | sent
         for slot_no in range(1, 14):
             assert f"P1_ENDTIME_MONDAY_{slot_no}" in values
             assert f"P1_TEMPERATURE_MONDAY_{slot_no}" in values
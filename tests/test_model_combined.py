@@ -811,11 +811,11 @@ class TestCombinedDataPointBase:
             unit_dp=unit_dp,
         )
 
-        # EventBus subscribe is called once for value_dp (not for DpDummy)
-        channel.device.event_bus_provider.event_bus.subscribe.assert_called_once()
+        # Field subscription is made once for value_dp (not for DpDummy)
+        channel.device.event_bus_provider.event_bus.data_point_notifier.subscribe_fields.assert_called_once()
 
     def test_subscription_to_underlying_dps(self) -> None:
-        """Test that combined DP subscribes to underlying data point updates via EventBus."""
+        """Test that combined DP subscribes to the fields of its underlying data points."""
         channel = _create_mock_channel()
         value_dp = _create_mock_dp()
         unit_dp = _create_mock_dp()
@@ -827,14 +827,14 @@ class TestCombinedDataPointBase:
             unit_dp=unit_dp,
         )
 
-        # EventBus subscribe is called twice (once per non-dummy DP)
-        assert channel.device.event_bus_provider.event_bus.subscribe.call_count == 2
+        # One field subscription per non-dummy DP
+        assert channel.device.event_bus_provider.event_bus.data_point_notifier.subscribe_fields.call_count == 2
 
     def test_unsubscribe_from_data_point_updated(self) -> None:
         """Test unsubscribe clears all subscriptions."""
         channel = _create_mock_channel()
         unsub_mock = MagicMock()
-        channel.device.event_bus_provider.event_bus.subscribe.return_value = unsub_mock
+        channel.device.event_bus_provider.event_bus.data_point_notifier.subscribe_fields.return_value = unsub_mock
 
         value_dp = _create_mock_dp()
         unit_dp = _create_mock_dp()
@@ -1091,17 +1091,18 @@ class TestCombinedDpGarageDoorMode:
             state_dp=_create_mock_door_dp(value=GarageDoorState.POSITION_UNKNOWN),
             command_dp=_create_mock_door_dp(),
         )
-        channel.device.task_scheduler.create_task.reset_mock()
+        notifier = channel.device.event_bus_provider.event_bus.data_point_notifier
+        notifier.mark_changed.reset_mock()
 
         mode.note_command(command=GarageDoorCommand.OPEN)
 
-        channel.device.task_scheduler.create_task.assert_called_once()
+        notifier.mark_changed.assert_called_once()
 
         # An unchanged mode must not re-publish.
-        channel.device.task_scheduler.create_task.reset_mock()
+        notifier.mark_changed.reset_mock()
         mode.note_command(command=GarageDoorCommand.OPEN)
 
-        channel.device.task_scheduler.create_task.assert_not_called()
+        notifier.mark_changed.assert_not_called()
 
     def test_note_command_sets_held_mode(self) -> None:
         """Test a cover-side command updates the mode the select reports while travelling."""
@@ -5,10 +5,11 @@
 import asyncio
 from datetime import datetime
 from typing import cast
-from unittest.mock import DEFAULT, call
+from unittest.mock import DEFAULT, call, patch
 
 import pytest
 
+from aiohomematic.central.events import DataPointStateChangedEvent
 from aiohomematic.client import CommandPriority
 from aiohomematic.const import (
     WAIT_FOR_CALLBACK,
@@ -290,6 +291,57 @@ class TestCustomDpBlind:
         cover._dp_level._set_refreshed_at(refreshed_at=datetime.now())
         assert cover.is_valid is True
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES, True, None, None),
+        ],
+    )
+    async def test_blind_publishes_once_per_batch(
+        self,
+        central_client_factory_with_homegear_client,
+    ) -> None:
+        """Field updates received within one batch publish a single update of the blind."""
+        central, _mock_client, _ = central_client_factory_with_homegear_client
+        cover = cast(CustomDpBlind, get_prepared_custom_data_point(central, "VCU0000144", 1))
+        received: list[DataPointStateChangedEvent] = []
+        central.event_bus.subscribe(
+            event_type=DataPointStateChangedEvent,
+            event_key=cover.unique_id,
+            handler=lambda *, event: received.append(event),
+        )
+
+        # The RPC server schedules the events of a multicall as concurrent tasks.
+        with patch.object(
+            CustomDpBlind,
+            "publish_data_point_updated_event",
+            autospec=True,
+            side_effect=CustomDpBlind.publish_data_point_updated_event,
+        ) as publish:
+            await asyncio.gather(
+                *(
+                    central.event_coordinator.data_point_event(
+                        interface_id=const.INTERFACE_ID,
+                        channel_address="VCU0000144:1",
+                        parameter=parameter,
+                        value=value,
+                    )
+                    for parameter, value in (("LEVEL", 0.4), ("LEVEL_SLATS", 0.6), ("LEVEL", 0.5))
+                )
+            )
+            await central.looper.block_till_done()
+
+        assert publish.call_count == 1
+        assert len(received) == 1
+        assert cover.current_position == 50
+        assert cover.current_tilt_position == 60
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         (
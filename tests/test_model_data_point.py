@@ -2,13 +2,19 @@
 # Copyright (c) 2021-2026
 """Tests for data point functionality of aiohomematic."""
 
+from dataclasses import replace
 from datetime import datetime
 from typing import cast
 from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
-from aiohomematic.central.events import DataPointStateChangedEvent, DeviceLifecycleEvent, DeviceLifecycleEventType
+from aiohomematic.central.events import (
+    DataPointsRefreshedEvent,
+    DataPointStateChangedEvent,
+    DeviceLifecycleEvent,
+    DeviceLifecycleEventType,
+)
 from aiohomematic.const import CallSource, DataPointUsage, Interface, ParameterStatus, ParamsetKey
 from aiohomematic.model.custom import CustomDpSwitch, get_required_parameters
 from aiohomematic.model.generic import DpSensor, DpSwitch
@@ -442,6 +448,51 @@ class TestWrappedDataPoint:
         assert received_events[0].unique_id == property_unique_id
         assert received_events[0].new_value == 0.5
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES, True, None, None),
+        ],
+    )
+    async def test_refresh_only_write_publishes_refreshed_event(
+        self,
+        central_client_factory_with_homegear_client,
+    ) -> None:
+        """Test that an unchanged value is signalled as refreshed instead of changed."""
+        central, _, _ = central_client_factory_with_homegear_client
+        level: DpSensor = cast(
+            DpSensor, central.query_facade.get_generic_data_point(channel_address="VCU3609622:1", parameter="LEVEL")
+        )
+        changed: list[DataPointStateChangedEvent] = []
+        refreshed: list[DataPointsRefreshedEvent] = []
+        central.event_bus.subscribe(
+            event_type=DataPointStateChangedEvent,
+            event_key=level.unique_id,
+            handler=lambda *, event: changed.append(event),
+        )
+        central.event_bus.subscribe(
+            event_type=DataPointsRefreshedEvent,
+            event_key=None,
+            handler=lambda *, event: refreshed.append(event),
+        )
+
+        level.write_value(value=0.3, write_at=datetime.now())
+        await central.looper.block_till_done()
+        level.write_value(value=0.3, write_at=datetime.now())
+        await central.looper.block_till_done()
+
+        assert len(changed) == 1
+        # The source is refreshed first, the custom data point that depends on it one flush later.
+        assert len(refreshed) == 2
+        assert refreshed[0].unique_ids == frozenset({level.unique_id})
+        assert refreshed[1].unique_ids == frozenset({"vcu3609622_1"})
+
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         (
@@ -504,7 +555,7 @@ class TestIgnoreOnInitialLoad:
         call_count_before = len(mock_client.method_calls)
 
         # Mock the data point to have ignore_on_initial_load=True
-        switch._ignore_on_initial_load = True
+        switch._spec = replace(switch._spec, ignore_on_initial_load=True)
 
         # Try to load the value with HA_INIT call source (no cache, should not call backend)
         await switch.load_data_point_value(call_source=CallSource.HA_INIT)
@@ -556,7 +607,7 @@ class TestIgnoreOnInitialLoad:
         call_count_before = len(mock_client.method_calls)
 
         # Mock the data point to have ignore_on_initial_load=True
-        switch._ignore_on_initial_load = True
+        switch._spec = replace(switch._spec, ignore_on_initial_load=True)
 
         # Try to load the value with HA_INIT call source (should use cache, not RPC)
         await switch.load_data_point_value(call_source=CallSource.HA_INIT)
@@ -13,9 +13,9 @@ class TestDataPointValidity:
         """Test that ACTION type allows None."""
         # Create a simple mock that only needs the attributes checked by _allows_none_value
         mock = Mock()
-        mock._type = ParameterType.ACTION
+        mock._spec.type = ParameterType.ACTION
         mock._parameter = "PRESS_SHORT"
-        mock._special = None
+        mock._spec.special = None
 
         # Bind the method
         result = BaseParameterDataPoint._allows_none_value(mock)
@@ -24,9 +24,9 @@ class TestDataPointValidity:
     def test_disallows_none_for_float_type(self) -> None:
         """Test that FLOAT type does not allow None by default."""
         mock = Mock()
-        mock._type = ParameterType.FLOAT
+        mock._spec.type = ParameterType.FLOAT
         mock._parameter = "TEMPERATURE"
-        mock._special = None
+        mock._spec.special = None
 
         result = BaseParameterDataPoint._allows_none_value(mock)
         assert result is False
@@ -34,8 +34,8 @@ class TestDataPointValidity:
     def test_enum_invalid_index(self) -> None:
         """Test enum with invalid index."""
         mock = Mock()
-        mock._type = ParameterType.ENUM
-        mock._values = ("OFF", "AUTO", "MANUAL")
+        mock._spec.type = ParameterType.ENUM
+        mock._spec.values = ("OFF", "AUTO", "MANUAL")
         mock._value = 5  # Out of range
 
         result = BaseParameterDataPoint.is_value_in_range.__get__(mock)
@@ -44,8 +44,8 @@ class TestDataPointValidity:
     def test_enum_invalid_string(self) -> None:
         """Test enum with invalid string value."""
         mock = Mock()
-        mock._type = ParameterType.ENUM
-        mock._values = ("OFF", "AUTO", "MANUAL")
+        mock._spec.type = ParameterType.ENUM
+        mock._spec.values = ("OFF", "AUTO", "MANUAL")
         mock._value = "INVALID"
 
         result = BaseParameterDataPoint.is_value_in_range.__get__(mock)
@@ -54,8 +54,8 @@ class TestDataPointValidity:
     def test_enum_valid_index(self) -> None:
         """Test enum with valid index."""
         mock = Mock()
-        mock._type = ParameterType.ENUM
-        mock._values = ("OFF", "AUTO", "MANUAL")
+        mock._spec.type = ParameterType.ENUM
+        mock._spec.values = ("OFF", "AUTO", "MANUAL")
         mock._value = 1  # "AUTO"
 
         result = BaseParameterDataPoint.is_value_in_range.__get__(mock)
@@ -64,8 +64,8 @@ class TestDataPointValidity:
     def test_enum_valid_string(self) -> None:
         """Test enum with valid string value."""
         mock = Mock()
-        mock._type = ParameterType.ENUM
-        mock._values = ("OFF", "AUTO", "MANUAL")
+        mock._spec.type = ParameterType.ENUM
+        mock._spec.values = ("OFF", "AUTO", "MANUAL")
         mock._value = "AUTO"
 
         result = BaseParameterDataPoint.is_value_in_range.__get__(mock)
@@ -74,11 +74,11 @@ class TestDataPointValidity:
     def test_float_above_max_invalid(self) -> None:
         """Test that float above max is invalid."""
         mock = Mock()
-        mock._type = ParameterType.FLOAT
+        mock._spec.type = ParameterType.FLOAT
         mock._value = 150.0
-        mock._min = 0.0
-        mock._max = 100.0
-        mock._values = None
+        mock._spec.min = 0.0
+        mock._spec.max = 100.0
+        mock._spec.values = None
 
         result = BaseParameterDataPoint.is_value_in_range.__get__(mock)
         assert result is False
@@ -86,11 +86,11 @@ class TestDataPointValidity:
     def test_float_below_min_invalid(self) -> None:
         """Test that float below min is invalid."""
         mock = Mock()
-        mock._type = ParameterType.FLOAT
+        mock._spec.type = ParameterType.FLOAT
         mock._value = -10.0
-        mock._min = 0.0
-        mock._max = 100.0
-        mock._values = None
+        mock._spec.min = 0.0
+        mock._spec.max = 100.0
+        mock._spec.values = None
 
         result = BaseParameterDataPoint.is_value_in_range.__get__(mock)
         assert result is False
@@ -98,11 +98,11 @@ class TestDataPointValidity:
     def test_float_in_range_valid(self) -> None:
         """Test that float within range is valid."""
         mock = Mock()
-        mock._type = ParameterType.FLOAT
+        mock._spec.type = ParameterType.FLOAT
         mock._value = 50.0
-        mock._min = 0.0
-        mock._max = 100.0
-        mock._values = None
+        mock._spec.min = 0.0
+        mock._spec.max = 100.0
+        mock._spec.values = None
 
         result = BaseParameterDataPoint.is_value_in_range.__get__(mock)
         assert result is True
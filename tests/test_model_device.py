@@ -19,6 +19,7 @@ from aiohomematic.const import (
     ForcedDeviceAvailability,
     Interface,
     ParamsetKey,
+    TaskCategory,
 )
 from aiohomematic.exceptions import AioHomematicException, BaseHomematicException
 from aiohomematic_test_support import const
@@ -523,7 +524,7 @@ class TestDeviceFirmware:
 
         created: list[str] = []
 
-        def create_task(*, target: Any, name: str) -> None:
+        def create_task(*, target: Any, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
             created.append(name)
 
         monkeypatch.setattr(central.looper, "create_task", create_task)
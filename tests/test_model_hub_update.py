@@ -16,9 +16,11 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from aiohomematic.const import SystemUpdateData
+from aiohomematic.const import SystemUpdateData, TaskCategory
 from aiohomematic.model.hub import HmUpdate
 
+from tests.helpers.fake_model import FakeDataPointNotifier
+
 
 class _FakeScheduleTimerConfig:
     """Minimal fake ScheduleTimerConfig for testing."""
@@ -67,6 +69,7 @@ class _FakeEventBus:
 
     def __init__(self, *, task_scheduler: Any = None) -> None:
         """Initialize fake event bus."""
+        self.data_point_notifier = FakeDataPointNotifier()
 
     async def publish(self, *, event: Any) -> None:
         """Do nothing for publish in tests."""
@@ -101,7 +104,13 @@ class _FakeTaskScheduler:
         """Initialize fake task scheduler."""
         self._tasks: list[asyncio.Task[Any]] = []
 
-    def create_task(self, *, target: Coroutine[Any, Any, None] | Callable[[], None], name: str) -> None:
+    def create_task(
+        self,
+        *,
+        target: Coroutine[Any, Any, None] | Callable[[], None],
+        name: str,
+        category: TaskCategory = TaskCategory.DEFAULT,
+    ) -> None:
         """Create and track a task."""
         if callable(target) and not asyncio.iscoroutine(target):
             try:
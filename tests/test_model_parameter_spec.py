@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""Tests for the shared parameter specs of generic data points and events."""
+
+import gc
+from typing import Any
+
+import pytest
+
+from aiohomematic.const import Flag, Operations, ParameterType, ParamsetKey
+from aiohomematic.model.generic import GenericDataPoint
+from aiohomematic.model.parameter_spec import convert_parameter_value, get_parameter_spec, parameter_spec_count
+
+TEST_DEVICES: set[str] = {"VCU2128127", "VCU3609622", "VCU6354483"}
+
+
+def _parameter_data(**overrides: Any) -> dict[str, Any]:
+    """Return a FLOAT paramset description entry."""
+    return {
+        "TYPE": ParameterType.FLOAT,
+        "MIN": 0.0,
+        "MAX": 1.0,
+        "DEFAULT": 0.0,
+        "FLAGS": Flag.VISIBLE,
+        "OPERATIONS": Operations.READ | Operations.WRITE | Operations.EVENT,
+        "UNIT": "100%",
+        **overrides,
+    }
+
+
+def _spec(*, model: str = "HmIP-BROLL", parameter_data: dict[str, Any] | None = None) -> Any:
+    return get_parameter_spec(
+        model=model,
+        channel_no=4,
+        channel_type="BLIND_VIRTUAL_RECEIVER",
+        paramset_key=ParamsetKey.VALUES,
+        parameter="LEVEL",
+        parameter_data=parameter_data or _parameter_data(),
+        locale="en",
+    )
+
+
+class TestParameterSpec:
+    """Tests for get_parameter_spec."""
+
+    def test_conversion_and_units(self) -> None:
+        """Test that limits are converted and units are cleaned up once per spec."""
+        spec = _spec()
+        assert spec.type == ParameterType.FLOAT
+        assert (spec.min, spec.max, spec.default) == (0.0, 1.0, 0.0)
+        assert spec.raw_unit == "100%"
+        assert spec.unit == "%"
+        assert spec.multiplier == 100.0
+        assert spec.visible is True
+        assert spec.service is False
+        assert spec.translation_key == "level"
+
+    def test_convert_parameter_value(self) -> None:
+        """Test value conversion including the retyped BOOL and empty numeric cases."""
+        assert convert_parameter_value(value="", parameter_type=ParameterType.FLOAT, values=None) is None
+        assert convert_parameter_value(value="1.5", parameter_type=ParameterType.FLOAT, values=None) == 1.5
+        assert convert_parameter_value(value="OPEN", parameter_type=ParameterType.BOOL, values=("CLOSED", "OPEN"))
+        with pytest.raises(ValueError):
+            convert_parameter_value(value="AJAR", parameter_type=ParameterType.BOOL, values=("CLOSED", "OPEN"))
+
+    def test_shared_per_model_and_description(self) -> None:
+        """Test that equal keys share one spec and different descriptions or models do not."""
+        spec = _spec()
+        assert _spec(parameter_data=_parameter_data()) is spec
+        assert _spec(parameter_data=_parameter_data(MAX=1.01)) is not spec
+        assert _spec(model="HmIP-FROLL") is not spec
+
+    def test_value_translations_are_read_only(self) -> None:
+        """Test that the value translations shared through the spec cannot be modified."""
+        spec = _spec(
+            parameter_data=_parameter_data(
+                TYPE=ParameterType.ENUM, MIN=0, MAX=1, DEFAULT=0, UNIT="", VALUE_LIST=["CLOSED", "OPEN"]
+            )
+        )
+        assert spec.value_translations is not None
+        assert tuple(spec.value_translations) == ("CLOSED", "OPEN")
+        with pytest.raises(TypeError):
+            spec.value_translations["CLOSED"] = "Ajar"  # type: ignore[index]
+
+    def test_specs_are_released(self) -> None:
+        """Test that a spec is dropped with the last data point using it."""
+        count = parameter_spec_count()
+        spec = _spec(parameter_data=_parameter_data(MAX=2.0))
+        assert parameter_spec_count() == count + 1
+        del spec
+        gc.collect()
+        assert parameter_spec_count() == count
+
+
+class TestParameterSpecOfDataPoints:
+    """Tests for the specs of created data points."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES, True, None, None),
+        ],
+    )
+    async def test_data_points_share_specs(self, central_client_factory_with_homegear_client) -> None:
+        """Test that data points use the shared spec of their model parameter."""
+        central, _, _ = central_client_factory_with_homegear_client
+        data_points = [
+            dp
+            for dp in central.query_facade.get_data_points(exclude_no_create=False)
+            if isinstance(dp, GenericDataPoint)
+        ]
+        assert data_points
+        for dp in data_points:
+            assert dp._spec is get_parameter_spec(
+                model=dp.device.model,
+                channel_no=dp.channel.no,
+                channel_type=dp.channel.type_name,
+                paramset_key=dp.paramset_key,
+                parameter=dp.parameter,
+                parameter_data=central.cache_coordinator.paramset_descriptions.get_parameter_data(
+                    interface_id=dp.device.interface_id,
+                    channel_address=dp.channel.address,
+                    paramset_key=dp.paramset_key,
+                    parameter=dp.parameter,
+                ),
+                locale=central.config.locale,
+            )
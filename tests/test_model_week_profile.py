@@ -22,6 +22,7 @@ from aiohomematic.model.custom import CustomDataPoint, CustomDpRfThermostat
 from aiohomematic.model.schedule_models import (
     SCHEDULE_DOMAIN_CONTEXT_KEY,
     ClimateSchedule,
+    ClimateWeekdaySchedule,
     SimpleSchedule,
     SimpleScheduleEntry,
     convert_duration_to_base_factor,
@@ -3533,3 +3534,254 @@ class TestSupportedScheduleFields:
         assert result["SOME_OTHER_PARAM"] == 42
         assert result["01_WP_WEEKDAY"] == 2
         assert "01_WP_CONDITION" not in result
+
+
+class TestMinimalDiffScheduleWrites:
+    """Test that schedule writes only send entries that differ from the device."""
+
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES_SCHEDULE, True, None, None),
+        ],
+    )
+    async def test_changed_weekday_sends_only_changed_slots(self, central_client_factory_with_homegear_client):
+        """Changing one weekday sends only its changed slots."""
+        central, mock_client, _ = central_client_factory_with_homegear_client
+        climate: CustomDpRfThermostat = cast(
+            CustomDpRfThermostat, get_prepared_custom_data_point(central, "VCU0000341", 2)
+        )
+        wp_dp = climate.device.week_profile_data_point
+        assert wp_dp is not None
+        await wp_dp.get_schedule(force_load=True)
+        mock_client.put_paramset.reset_mock()
+
+        await wp_dp.set_schedule_weekday(
+            profile=ScheduleProfile.P1,
+            weekday=WeekdayStr.MONDAY,
+            weekday_data={
+                "base_temperature": 17.0,
+                "periods": [{"starttime": "05:00", "endtime": "23:00", "temperature": 22.5}],
+            },
+        )
+
+        assert mock_client.put_paramset.call_count == 1
+        values = mock_client.put_paramset.call_args.kwargs["values"]
+        assert values
+        assert len(values) < 26
+        assert all(key.startswith("P1_") and "_MONDAY_" in key for key in values)
+
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES_SCHEDULE, True, None, None),
+        ],
+    )
+    async def test_full_write_until_baseline_reloaded(self, central_client_factory_with_homegear_client):
+        """After a write the next write is sent in full until the schedule is reloaded."""
+        central, mock_client, _ = central_client_factory_with_homegear_client
+        climate: CustomDpRfThermostat = cast(
+            CustomDpRfThermostat, get_prepared_custom_data_point(central, "VCU0000341", 2)
+        )
+        wp_dp = climate.device.week_profile_data_point
+        assert wp_dp is not None
+        weekday_data = {
+            "base_temperature": 17.0,
+            "periods": [{"starttime": "05:00", "endtime": "23:00", "temperature": 22.5}],
+        }
+        await wp_dp.get_schedule(force_load=True)
+        await wp_dp.set_schedule_weekday(
+            profile=ScheduleProfile.P1, weekday=WeekdayStr.MONDAY, weekday_data=weekday_data
+        )
+        mock_client.put_paramset.reset_mock()
+
+        await wp_dp.set_schedule_weekday(
+            profile=ScheduleProfile.P1, weekday=WeekdayStr.MONDAY, weekday_data=weekday_data
+        )
+
+        assert mock_client.put_paramset.call_count == 1
+        assert len(mock_client.put_paramset.call_args.kwargs["values"]) == 26
+
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES_SCHEDULE, True, None, None),
+        ],
+    )
+    async def test_set_schedule_weekdays_single_write(self, central_client_factory_with_homegear_client):
+        """Several weekday edits, as dicts or Pydantic models, are sent with a single put_paramset call."""
+        central, mock_client, _ = central_client_factory_with_homegear_client
+        climate: CustomDpRfThermostat = cast(
+            CustomDpRfThermostat, get_prepared_custom_data_point(central, "VCU0000341", 2)
+        )
+        wp_dp = climate.device.week_profile_data_point
+        assert isinstance(wp_dp, ClimateWeekProfileDataPoint)
+        await wp_dp.get_schedule(force_load=True)
+        mock_client.put_paramset.reset_mock()
+        weekday_data = {
+            "base_temperature": 17.0,
+            "periods": [{"starttime": "05:00", "endtime": "23:00", "temperature": 22.5}],
+        }
+
+        await wp_dp.set_schedule_weekdays(
+            profile=ScheduleProfile.P2,
+            weekdays_data={
+                WeekdayStr.TUESDAY: weekday_data,
+                WeekdayStr.THURSDAY: ClimateWeekdaySchedule.model_validate(weekday_data),
+            },
+        )
+
+        assert mock_client.put_paramset.call_count == 1
+        values = mock_client.put_paramset.call_args.kwargs["values"]
+        assert any("_TUESDAY_" in key for key in values)
+        assert any("_THURSDAY_" in key for key in values)
+        assert all(key.startswith("P2_") for key in values)
+
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES_SCHEDULE, True, None, None),
+        ],
+    )
+    async def test_unchanged_schedule_is_not_written(self, central_client_factory_with_homegear_client):
+        """Writing back a schedule the device already has sends nothing."""
+        central, mock_client, _ = central_client_factory_with_homegear_client
+        climate: CustomDpRfThermostat = cast(
+            CustomDpRfThermostat, get_prepared_custom_data_point(central, "VCU0000341", 2)
+        )
+        wp_dp = climate.device.week_profile_data_point
+        assert wp_dp is not None
+        week_profile = climate.device.week_profile
+        assert isinstance(week_profile, ClimateWeekProfile)
+        schedule = await wp_dp.get_schedule(force_load=True)
+        baseline = dict(week_profile._raw_schedule_baseline)
+
+        # Writing back normalizes unused trailing slots; only those differ from the device.
+        await wp_dp.set_schedule(schedule_data=schedule)
+        sent = mock_client.put_paramset.call_args.kwargs["values"]
+        assert len(sent) < len(baseline)
+        assert all(sent[key] != baseline[key] for key in sent)
+
+        # Once the device reports the normalized schedule, the same write is skipped.
+        week_profile._raw_schedule_baseline = baseline | sent
+        mock_client.put_paramset.reset_mock()
+        await wp_dp.set_schedule(schedule_data=schedule)
+
+        mock_client.put_paramset.assert_not_called()
+
+    def test_changed_raw_schedule_uses_type_aware_comparison(self):
+        """FLOAT entries compare numerically and entries without baseline are kept."""
+        week_profile = MagicMock(spec=DefaultWeekProfile)
+        week_profile._raw_schedule_baseline = {"01_WP_LEVEL": 1, "01_WP_FIXED_HOUR": 7}
+        week_profile._device.paramset_description_provider.get_channel_paramset_descriptions.return_value = {
+            "MASTER": {"01_WP_LEVEL": {"TYPE": "FLOAT"}, "01_WP_FIXED_HOUR": {"TYPE": "INTEGER"}}
+        }
+
+        result = DefaultWeekProfile._get_changed_raw_schedule(
+            week_profile,
+            channel_address="VCU0000001:1",
+            raw_schedule={"01_WP_LEVEL": 1.0, "01_WP_FIXED_HOUR": 8, "01_WP_FIXED_MINUTE": 0},
+        )
+
+        assert result == {"01_WP_FIXED_HOUR": 8, "01_WP_FIXED_MINUTE": 0}
+
+    def test_changed_raw_schedule_without_baseline_is_unchanged(self):
+        """Without a baseline the full raw schedule is returned."""
+        week_profile = MagicMock(spec=DefaultWeekProfile)
+        week_profile._raw_schedule_baseline = {}
+        raw_schedule = {"01_WP_LEVEL": 1.0}
+
+        result = DefaultWeekProfile._get_changed_raw_schedule(
+            week_profile, channel_address="VCU0000001:1", raw_schedule=raw_schedule
+        )
+
+        assert result is raw_schedule
+
+
+class TestPersistedSchedules:
+    """Test that schedules are persisted and only re-read from the device when forced."""
+
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES_SCHEDULE, True, None, None),
+        ],
+    )
+    async def test_config_changed_forces_device_read(self, central_client_factory_with_homegear_client):
+        """A falling CONFIG_PENDING (on_config_changed) re-reads the schedule from the device."""
+        central, mock_client, _ = central_client_factory_with_homegear_client
+        climate: CustomDpRfThermostat = cast(
+            CustomDpRfThermostat, get_prepared_custom_data_point(central, "VCU0000341", 2)
+        )
+        device = climate.device
+        schedules = central.cache_coordinator.schedules
+        await schedules.set_raw_schedule(device_address=device.address, firmware=device.firmware, raw_schedule={})
+        mock_client.get_paramset.reset_mock()
+
+        await device.on_config_changed()
+
+        assert any(
+            call.kwargs.get("channel_address") == "VCU0000341" for call in mock_client.get_paramset.call_args_list
+        )
+        assert schedules.get_raw_schedule(device_address=device.address, firmware=device.firmware)
+
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES_SCHEDULE, True, None, None),
+        ],
+    )
+    async def test_reload_uses_persisted_schedule_unless_from_device(self, central_client_factory_with_homegear_client):
+        """A reload uses the persisted schedule and reads the device only if requested."""
+        central, mock_client, _ = central_client_factory_with_homegear_client
+        climate: CustomDpRfThermostat = cast(
+            CustomDpRfThermostat, get_prepared_custom_data_point(central, "VCU0000341", 2)
+        )
+        device = climate.device
+        week_profile = device.week_profile
+        assert isinstance(week_profile, ClimateWeekProfile)
+        schedules = central.cache_coordinator.schedules
+        await week_profile.reload_and_cache_schedule(from_device=True)
+        # The schedule read from the device has been persisted.
+        assert schedules.get_raw_schedule(device_address=device.address, firmware=device.firmware)
+        mock_client.get_paramset.reset_mock()
+
+        await week_profile.reload_and_cache_schedule()
+        mock_client.get_paramset.assert_not_called()
+
+        # force alone does not read the device either.
+        await week_profile.reload_and_cache_schedule(force=True)
+        mock_client.get_paramset.assert_not_called()
+
+        await week_profile.reload_and_cache_schedule(from_device=True)
+        mock_client.get_paramset.assert_called_once()
@@ -1,14 +1,16 @@
 """Tests for optimistic update system."""
 
 import asyncio
+from datetime import datetime
 from typing import cast
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from aiohomematic.central.events import OptimisticRollbackEvent
+from aiohomematic.central.events import DataPointStateChangedEvent, OptimisticRollbackEvent
 from aiohomematic.client import CommandPriority
 from aiohomematic.client.backends.capabilities import BackendCapabilities
+from aiohomematic.client.state_change import wait_for_state_change_or_timeout
 from aiohomematic.const import RollbackReason
 from aiohomematic.exceptions import ClientException
 from aiohomematic.model.data_point import BaseParameterDataPoint, CallParameterCollector
@@ -388,6 +390,97 @@ class TestCollectorSendErrorRollback:
             mock_client.set_value.side_effect = None
 
 
+class TestOptimisticConfirmation:
+    """Test that a confirmation of an optimistic write is published even if the value is unchanged."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES, True, None, None),
+        ],
+    )
+    async def test_rejected_optimistic_write_publishes_state_change(
+        self,
+        central_client_factory_with_homegear_client,
+    ) -> None:
+        """A CCU answering with the previous value replaces the optimistic value shown by consumers."""
+        central, _, _ = central_client_factory_with_homegear_client
+        switch: DpSwitch = cast(
+            DpSwitch,
+            central.query_facade.get_generic_data_point(channel_address="VCU2128127:4", parameter="STATE"),
+        )
+        switch.write_value(value=False, write_at=datetime.now())
+        await central.looper.block_till_done()
+
+        changed: list[DataPointStateChangedEvent] = []
+        unsub = central.event_bus.subscribe(
+            event_type=DataPointStateChangedEvent,
+            event_key=switch.unique_id,
+            handler=lambda *, event: changed.append(event),
+        )
+        try:
+            switch.apply_optimistic_value(value=True)
+            await central.looper.block_till_done()
+            assert switch.is_optimistic is True
+            changed.clear()
+
+            # The device rejects the command and reports the previous value
+            await switch.event(value=False, received_at=datetime.now())
+            await central.looper.block_till_done()
+
+            assert switch.is_optimistic is False
+            assert switch.value is False
+            assert len(changed) == 1
+            assert changed[0].new_value is False
+        finally:
+            unsub()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            (TEST_DEVICES, True, None, None),
+        ],
+    )
+    async def test_same_value_echo_releases_state_change_waiter(
+        self,
+        central_client_factory_with_homegear_client,
+    ) -> None:
+        """A device answering with the value it already had ends the wait for the state change."""
+        central, _, _ = central_client_factory_with_homegear_client
+        switch: DpSwitch = cast(
+            DpSwitch,
+            central.query_facade.get_generic_data_point(channel_address="VCU2128127:4", parameter="STATE"),
+        )
+        switch.write_value(value=True, write_at=datetime.now())
+        await central.looper.block_till_done()
+
+        for optimistic in (True, False):
+            if optimistic:
+                switch.apply_optimistic_value(value=True)
+            waiter = asyncio.create_task(
+                wait_for_state_change_or_timeout(
+                    device=switch.device, dpk_values={(switch.dpk, True)}, wait_for_callback=10
+                )
+            )
+            await asyncio.sleep(0.01)
+            await switch.event(value=True, received_at=datetime.now())
+            async with asyncio.timeout(2):
+                await waiter
+            assert switch.is_optimistic is False
+
+
 class TestPriorityAndOptimisticIntegration:
     """Test that priority detection works with optimistic updates."""
 
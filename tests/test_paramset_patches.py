@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 from aiohomematic.const import Parameter, ParameterData, ParameterType, ParamsetKey
-from aiohomematic.store import PARAMSET_PATCHES, ParamsetPatchMatcher
+from aiohomematic.store import PARAMSET_PATCHES, ParamsetPatchMatcher, get_paramset_patch_matcher
 
 
 def test_hm_cc_vg_1_set_temperature_bounds_patched() -> None:
@@ -59,3 +59,11 @@ def test_hmip_fwi_code_id_patch_is_registered() -> None:
         and p.patches.get("MAX") == 31
         for p in PARAMSET_PATCHES
     )
+
+
+def test_get_paramset_patch_matcher_is_shared_per_device_type() -> None:
+    """The cached matcher is reused per device type and behaves like a fresh one."""
+    matcher = get_paramset_patch_matcher(device_type="HmIP-FWI")
+    assert get_paramset_patch_matcher(device_type="HmIP-FWI") is matcher
+    assert get_paramset_patch_matcher(device_type="HM-CC-VG-1") is not matcher
+    assert matcher.has_patches is ParamsetPatchMatcher(device_type="HmIP-FWI").has_patches
@@ -0,0 +1,225 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""Tests for the targeted resync of data points after an event gap."""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from aiohomematic.central import ResyncPlan
+from aiohomematic.central.resync import execute_resync, plan_resync
+from aiohomematic.const import INIT_DATETIME, CallSource, ParamsetKey
+
+GAP_STARTED_AT = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class _FakeDataPoint:
+    """Data point recording the loads of its value."""
+
+    def __init__(self, *, channel_address: str, writable: bool, loads: list[str], parameter: str = "STATE") -> None:
+        self.channel_address = channel_address
+        self.parameter = parameter
+        self.is_writable = writable
+        self.refreshed_at = INIT_DATETIME
+        self._loads = loads
+
+    async def load_data_point_value(self, *, call_source: CallSource, direct_call: bool = False) -> None:
+        assert call_source == CallSource.MANUAL_OR_SCHEDULED
+        assert direct_call is True
+        await asyncio.sleep(0)
+        self._loads.append(f"{self.channel_address}:{self.parameter}")
+
+
+class _FakeChannel:
+    """Channel with one data point per parameter."""
+
+    def __init__(
+        self,
+        *,
+        address: str,
+        loads: list[str],
+        writable: bool = False,
+        custom: bool = False,
+        readable: bool = True,
+        parameters: tuple[str, ...] = ("STATE",),
+    ) -> None:
+        self.address = address
+        self.device = SimpleNamespace(address=address.split(":")[0])
+        self.custom_data_point = object() if custom else None
+        self.generic_data_points = tuple(
+            _FakeDataPoint(channel_address=address, writable=writable, loads=loads, parameter=parameter)
+            for parameter in parameters
+        )
+        self._readable = readable
+
+    def get_readable_data_points(self, *, paramset_key: ParamsetKey) -> tuple[_FakeDataPoint, ...]:
+        assert paramset_key == ParamsetKey.VALUES
+        return self.generic_data_points if self._readable else ()
+
+
+def _plan(*, channels: list[_FakeChannel], refreshed: dict[str, datetime] | None = None, **kwargs: Any) -> ResyncPlan:
+    """Plan a resync with the data points of the channels refreshed at the given times."""
+    for channel in channels:
+        for dp in channel.generic_data_points:
+            dp.refreshed_at = (refreshed or {}).get(channel.address, INIT_DATETIME)
+    return plan_resync(
+        interface_id="HmIP-RF",
+        channels=channels,  # type: ignore[arg-type]
+        gap_started_at=GAP_STARTED_AT,
+        **kwargs,
+    )
+
+
+class TestPlanResync:
+    """Tests for plan_resync."""
+
+    def test_full_refresh(self) -> None:
+        """Test that a full refresh is planned for many stale data points or without targeted reads."""
+        loads: list[str] = []
+        channels = [_FakeChannel(address=f"VCU000000{no}:1", loads=loads) for no in range(3)]
+        fresh = {"VCU0000000:1": GAP_STARTED_AT, "VCU0000001:1": GAP_STARTED_AT}
+
+        assert _plan(channels=channels).full_refresh is True
+        assert _plan(channels=channels, refreshed=fresh).full_refresh is False
+        assert _plan(channels=channels, refreshed=fresh, targeted=False).full_refresh is True
+        all_fresh = {channel.address: GAP_STARTED_AT for channel in channels}
+        assert _plan(channels=channels, refreshed=all_fresh, targeted=False).full_refresh is False
+
+    def test_skips_fresh_channels_and_orders_actuators_first(self) -> None:
+        """Test that channels refreshed since the gap are skipped and actuators come first."""
+        loads: list[str] = []
+        channels = [
+            _FakeChannel(address="VCU0000002:1", loads=loads),
+            _FakeChannel(address="VCU0000001:1", loads=loads),
+            _FakeChannel(address="VCU0000004:1", loads=loads, custom=True),
+            _FakeChannel(address="VCU0000003:1", loads=loads, writable=True),
+            _FakeChannel(address="VCU0000005:1", loads=loads, writable=True),
+            _FakeChannel(address="VCU0000006:1", loads=loads, readable=False),
+        ]
+        plan = _plan(
+            channels=channels,
+            refreshed={
+                "VCU0000001:1": GAP_STARTED_AT - timedelta(seconds=1),
+                "VCU0000005:1": GAP_STARTED_AT + timedelta(seconds=1),
+            },
+            max_stale_ratio=1.0,
+        )
+
+        assert [channel.address for channel in plan.stale_channels] == [
+            "VCU0000003:1",
+            "VCU0000004:1",
+            "VCU0000001:1",
+            "VCU0000002:1",
+        ]
+        assert plan.fresh_count == 1
+        assert plan.full_refresh is False
+        assert plan.gap_started_at == GAP_STARTED_AT
+
+
+class TestExecuteResync:
+    """Tests for execute_resync."""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_devices(self) -> None:
+        """Test that no more than max_concurrent_devices devices are read at the same time."""
+        active = 0
+        max_active = 0
+        loads: list[str] = []
+        channels = [_FakeChannel(address=f"VCU000000{no}:1", loads=loads) for no in range(6)]
+
+        async def load(*, call_source: CallSource, direct_call: bool = False) -> None:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0)
+            active -= 1
+
+        for channel in channels:
+            channel.generic_data_points[0].load_data_point_value = load  # type: ignore[method-assign]
+
+        plan = _plan(channels=channels, max_stale_ratio=1.0)
+        assert await execute_resync(plan=plan, max_concurrent_devices=2) == 6
+        assert max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_stale_channels_actuators_first(self) -> None:
+        """Test that only stale channels are read, actuators before sensors."""
+        loads: list[str] = []
+        channels = [
+            _FakeChannel(address="VCU0000001:1", loads=loads),
+            _FakeChannel(address="VCU0000001:2", loads=loads),
+            _FakeChannel(address="VCU0000002:1", loads=loads, writable=True),
+            _FakeChannel(address="VCU0000003:1", loads=loads, writable=True),
+        ]
+        plan = _plan(
+            channels=channels,
+            refreshed={"VCU0000003:1": GAP_STARTED_AT},
+            max_stale_ratio=1.0,
+        )
+
+        assert await execute_resync(plan=plan) == 3
+        assert loads[0] == "VCU0000002:1:STATE"
+        assert sorted(loads[1:]) == ["VCU0000001:1:STATE", "VCU0000001:2:STATE"]
+
+    @pytest.mark.asyncio
+    async def test_reads_only_stale_data_points(self) -> None:
+        """Test that data points refreshed since the gap are skipped even if their channel is stale."""
+        loads: list[str] = []
+        channel = _FakeChannel(address="VCU0000001:1", loads=loads, parameters=("LEVEL", "ACTIVITY_STATE", "ERROR"))
+        channel.generic_data_points[0].refreshed_at = GAP_STARTED_AT
+        plan = plan_resync(
+            interface_id="HmIP-RF",
+            channels=[channel],  # type: ignore[list-item]
+            gap_started_at=GAP_STARTED_AT,
+            max_stale_ratio=1.0,
+        )
+        assert plan.stale_channels == (channel,)
+        assert plan.fresh_count == 1
+
+        # A data point refreshed after the plan was made is skipped as well.
+        channel.generic_data_points[1].refreshed_at = GAP_STARTED_AT + timedelta(seconds=1)
+        assert await execute_resync(plan=plan) == 1
+        assert loads == ["VCU0000001:1:ERROR"]
+
+
+class TestCentralResync:
+    """Tests for the resync of a central."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        (
+            "address_device_translation",
+            "do_mock_client",
+            "ignore_devices_on_create",
+            "un_ignore_list",
+        ),
+        [
+            ({"VCU2128127", "VCU3609622"}, True, None, None),
+        ],
+    )
+    async def test_plan_resync_after_event(self, central_client_factory_with_homegear_client) -> None:
+        """Test that the data point of an event since the gap is skipped by the plan of the central."""
+        central, client, _ = central_client_factory_with_homegear_client
+        gap_started_at = datetime.now()
+        plan = central.plan_resync(interface_id=client.interface_id, gap_started_at=gap_started_at)
+        assert plan.fresh_count == 0
+        assert plan.stale_channels
+
+        channel = plan.stale_channels[0]
+        dp = channel.get_readable_data_points(paramset_key=ParamsetKey.VALUES)[0]
+        await central.event_coordinator.data_point_event(
+            interface_id=client.interface_id,
+            channel_address=channel.address,
+            parameter=dp.parameter,
+            value=dp.value,
+        )
+
+        plan = central.plan_resync(interface_id=client.interface_id, gap_started_at=gap_started_at)
+        assert plan.fresh_count == 1
+        assert dp.refreshed_at >= gap_started_at
+        # The channel stays stale as long as another of its data points was not refreshed.
+        readable_count = len(channel.get_readable_data_points(paramset_key=ParamsetKey.VALUES))
+        assert (channel in plan.stale_channels) is (readable_count > 1)
@@ -0,0 +1,68 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2021-2026
+"""Tests for the pydantic schemas and the fast parameter data normalization."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import ValidationError
+import pytest
+
+from aiohomematic.schemas import ParameterDataModel, normalize_parameter_data, normalize_paramset_description
+
+_PARAMETER_DATA_CASES: list[dict[str, Any]] = [
+    {},
+    {"TYPE": "FLOAT", "MIN": 0.0, "MAX": 1.01, "DEFAULT": 0.0, "OPERATIONS": 7, "FLAGS": 1, "UNIT": "100%"},
+    {"TYPE": "enum", "VALUE_LIST": ("OFF", "ON"), "OPERATIONS": "5", "FLAGS": None, "TAB_ORDER": "3"},
+    {"TYPE": "INTEGER", "SPECIAL": [{"ID": "NOT_USED", "VALUE": 111600}], "MIN": 0, "MAX": 111600},
+    {"TYPE": "FLOAT", "SPECIAL": {"ID": "UNKNOWN", "VALUE": -1.0}, "ID": "LEVEL", "CONTROL": "DIMMER.LEVEL"},
+    {"TYPE": "UNKNOWN_TYPE", "VALUE_LIST": "", "OPERATIONS": "bad", "TAB_ORDER": "x"},
+    {"TYPE": 5, "VALUE_LIST": 3, "OPERATIONS": 1.9, "DEFAULT": False},
+    {"TYPE": "ACTION", "OPERATIONS": True, "CUSTOM_FIELD": "kept", "ANOTHER": [1, 2]},
+    {"TYPE": "STRING", "VALUE_LIST": ["A", 2, None]},
+]
+
+
+@pytest.mark.parametrize("parameter_data", _PARAMETER_DATA_CASES)
+def test_normalize_parameter_data_matches_model(parameter_data: dict[str, Any]) -> None:
+    """The fast normalization returns exactly what the pydantic model returns, key order included."""
+    expected = ParameterDataModel.model_validate(parameter_data).to_dict()
+    result = normalize_parameter_data(parameter_data=parameter_data)
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "parameter_data",
+    [
+        {"TYPE": "FLOAT", "OPERATIONS": -1},
+        {"TYPE": "FLOAT", "UNIT": 5},
+        {"TYPE": "FLOAT", "SPECIAL": "invalid"},
+        {"TYPE": "FLOAT", "ID": 7},
+    ],
+)
+def test_normalize_parameter_data_invalid_raises(parameter_data: dict[str, Any]) -> None:
+    """Malformed data is still rejected by the pydantic model."""
+    with pytest.raises(ValidationError):
+        normalize_parameter_data(parameter_data=parameter_data)
+
+
+def test_normalize_parameter_data_field_names_use_model() -> None:
+    """Lowercase field names (populate_by_name) are handled by the pydantic model."""
+    result = normalize_parameter_data(parameter_data={"type": "BOOL", "operations": 3})
+    assert result["TYPE"] == "BOOL"
+    assert result["OPERATIONS"] == 3
+
+
+def test_normalize_paramset_description_does_not_share_mutable_values() -> None:
+    """Normalized paramsets can be patched in place without touching the input."""
+    special = {"ID": "NOT_USED", "VALUE": 0}
+    raw = {"LEVEL": {"TYPE": "FLOAT", "SPECIAL": special}}
+
+    result = normalize_paramset_description(paramset=raw)
+    result["LEVEL"]["MAX"] = 1.0  # type: ignore[typeddict-unknown-key]
+
+    assert "MAX" not in raw["LEVEL"]
+    assert result["LEVEL"]["SPECIAL"] == special
+    assert result["LEVEL"]["SPECIAL"] is not special
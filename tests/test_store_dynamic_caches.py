@@ -18,8 +18,14 @@ from freezegun import freeze_time
 import pytest
 
 from aiohomematic.async_support import Looper
-from aiohomematic.central.events import EventBus, SystemStatusChangedEvent
-from aiohomematic.const import IntegrationIssueSeverity, IntegrationIssueType, ParamsetKey, PingPongMismatchType
+from aiohomematic.central.events import EventBus, EventGapDetectedEvent, SystemStatusChangedEvent
+from aiohomematic.const import (
+    IntegrationIssueSeverity,
+    IntegrationIssueType,
+    ParamsetKey,
+    PingPongMismatchType,
+    TaskCategory,
+)
 from aiohomematic.store.dynamic import CommandTracker, PingPongTracker
 
 
@@ -48,7 +54,7 @@ def get_ping_pong_info(
 class _NoOpTaskScheduler:
     """Task scheduler that does nothing - for sync tests without event loop."""
 
-    def create_task(self, *, target: Any, name: str) -> None:
+    def create_task(self, *, target: Any, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
         """Ignore task creation in sync tests."""
 
 
@@ -103,7 +109,7 @@ class TrackingLooper:
         self.created: list[str] = []
 
     # Match signature used by PingPongTracker
-    def create_task(self, *, target, name: str) -> None:  # type: ignore[no-untyped-def]
+    def create_task(self, *, target, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:  # type: ignore[no-untyped-def]
         self.created.append(name)
 
 
@@ -789,6 +795,35 @@ class TestPingPongTracker:
         # For a single unknown, may or may not exceed high depending on delta; ensure property access ok
         _ = len(ppc._pending) > ppc.allowed_delta
 
+    def test_pingpongcache_publishes_event_gap_on_drop_from_high(self) -> None:
+        """Ensure an event gap starting at the oldest unanswered PING is published when pending PONGs recover."""
+        central = CentralStub()
+        ppc = PingPongTracker(
+            event_bus_provider=central, central_info=central, interface_id="ifGap", allowed_delta=1, ttl=60
+        )
+        gap_events: list[EventGapDetectedEvent] = []
+        publish_sync = central.event_bus.publish_sync
+
+        def capture(*, event: Any) -> None:
+            if isinstance(event, EventGapDetectedEvent):
+                gap_events.append(event)
+            publish_sync(event=event)
+
+        central.event_bus.publish_sync = capture  # type: ignore[method-assign]
+
+        ppc.handle_send_ping(ping_token="ping-1")
+        ppc._pending.seen_at["ping-1"] = time.monotonic() - 30  # test-only: first PING sent 30s ago
+        ppc.handle_send_ping(ping_token="ping-2")  # count=2 (> delta): high state
+        assert gap_events == []
+
+        ppc.handle_received_pong(pong_token="ping-1")  # back to low state
+        ppc.handle_received_pong(pong_token="ping-2")
+
+        assert len(gap_events) == 1
+        assert gap_events[0].interface_id == "ifGap"
+        gap_age = (datetime.now() - gap_events[0].gap_started_at).total_seconds()
+        assert 29 < gap_age < 31
+
     def test_pingpongcache_throttles_low_state_pending_events(self) -> None:
         """Confirm that in low state, PENDING_PONG events are published only on even counts (2, 4, ...)."""
         central = CentralStub()
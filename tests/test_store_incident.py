@@ -8,6 +8,7 @@ from aiohomematic.async_support import Looper
 from aiohomematic.const import FILE_INCIDENTS, SUB_DIRECTORY_CACHE, DataOperationResult
 from aiohomematic.store import IncidentSeverity, IncidentSnapshot, IncidentType, LocalStorageFactory, StorageProtocol
 from aiohomematic.store.persistent import IncidentStore
+from aiohomematic.store.persistent.incident import _JOURNAL_COMPACT_THRESHOLD
 from aiohomematic.store.types import PingPongJournal
 
 
@@ -234,6 +235,40 @@ class TestIncidentStore:
         rpc_errors = await store.get_incidents_by_type(incident_type=IncidentType.RPC_ERROR)
         assert len(rpc_errors) == 1
 
+    @pytest.mark.asyncio
+    async def test_history_preserved_across_sessions(self, tmp_path) -> None:
+        """Test that recording in a new session keeps the incidents of earlier sessions."""
+        central = _CentralStub(name="test-ccu", storage_directory=str(tmp_path))
+        store1 = IncidentStore(
+            storage=central.create_incident_storage(),
+            config_provider=central,
+        )
+        await store1.record_incident(
+            incident_type=IncidentType.CONNECTION_LOST,
+            severity=IncidentSeverity.ERROR,
+            message="First session",
+        )
+        await store1.save()
+
+        # New session records without requesting diagnostics first
+        store2 = IncidentStore(
+            storage=central.create_incident_storage(),
+            config_provider=central,
+        )
+        await store2.record_incident(
+            incident_type=IncidentType.CONNECTION_RESTORED,
+            severity=IncidentSeverity.INFO,
+            message="Second session",
+        )
+        await store2.save()
+
+        store3 = IncidentStore(
+            storage=central.create_incident_storage(),
+            config_provider=central,
+        )
+        await store3.load()
+        assert [i.message for i in store3.incidents] == ["First session", "Second session"]
+
     @pytest.mark.asyncio
     async def test_incident_size_limit_per_type(self, tmp_path) -> None:
         """Test that incidents are evicted per-type when max is exceeded."""
@@ -276,6 +311,45 @@ class TestIncidentStore:
         conn_incidents = [inc for inc in store.incidents if inc.incident_type == IncidentType.CONNECTION_LOST]
         assert len(conn_incidents) == 3
 
+    @pytest.mark.asyncio
+    async def test_journal_append_and_compaction(self, tmp_path) -> None:
+        """Test that incidents are appended to the journal and compacted periodically."""
+        central = _CentralStub(name="test-ccu", storage_directory=str(tmp_path))
+        store = IncidentStore(
+            storage=central.create_incident_storage(),
+            config_provider=central,
+            max_per_type=5,
+        )
+
+        # The first incident loads the (empty) history and compacts
+        await store.record_incident(
+            incident_type=IncidentType.RPC_ERROR,
+            severity=IncidentSeverity.WARNING,
+            message="RPC Error 0",
+        )
+        assert store.journal_size == 0
+
+        # Further incidents are only appended, the compacted list is not rebuilt
+        for i in range(1, 4):
+            await store.record_incident(
+                incident_type=IncidentType.RPC_ERROR,
+                severity=IncidentSeverity.WARNING,
+                message=f"RPC Error {i}",
+            )
+        assert store.journal_size == 3
+        assert len(store._content["incidents"]) == 1
+
+        # Reaching the threshold folds the journal into the retained incidents
+        for i in range(4, 4 + _JOURNAL_COMPACT_THRESHOLD - 3):
+            await store.record_incident(
+                incident_type=IncidentType.RPC_ERROR,
+                severity=IncidentSeverity.WARNING,
+                message=f"RPC Error {i}",
+            )
+        assert store.journal_size == 0
+        assert [i["message"] for i in store._content["incidents"]] == [i.message for i in store.incidents]
+        assert store.incident_count == 5
+
     @pytest.mark.asyncio
     async def test_load_with_invalid_data(self, tmp_path) -> None:
         """Test that invalid incidents are skipped during load."""
@@ -14,6 +14,7 @@ from aiohomematic.const import (
     ADDRESS_SEPARATOR,
     FILE_DEVICES,
     FILE_PARAMSETS,
+    FILE_SCHEDULES,
     SUB_DIRECTORY_CACHE,
     SUB_DIRECTORY_SESSION,
     DataOperationResult,
@@ -24,6 +25,7 @@ from aiohomematic.store import LocalStorageFactory, StorageProtocol, freeze_para
 from aiohomematic.store.persistent import (
     DeviceDescriptionRegistry,
     ParamsetDescriptionRegistry,
+    ScheduleRegistry,
     SessionRecorder,
     cleanup_files,
     get_file_name,
@@ -88,6 +90,13 @@ class _CentralStub:
             sub_directory=SUB_DIRECTORY_CACHE,
         )
 
+    def create_schedule_storage(self) -> StorageProtocol:
+        """Create storage for week profile schedules."""
+        return self.storage_factory.create_storage(
+            key=FILE_SCHEDULES,
+            sub_directory=SUB_DIRECTORY_CACHE,
+        )
+
 
 class TestHelperFunctions:
     """Test helper functions for freezing/unfreezing params and file path generation."""
@@ -561,6 +570,39 @@ class TestParamsetDescriptionRegistry:
         assert set(by_key.keys()) == {ParamsetKey.VALUES, ParamsetKey.MASTER}
         assert set(by_key[ParamsetKey.VALUES]) == {ch1, ch2}
 
+    @pytest.mark.asyncio
+    async def test_add_device_paramsets_matches_add(self, tmp_path) -> None:
+        """Test bulk ingestion of a device yields the same state as per-paramset adds."""
+        central = _CentralStub("C", str(tmp_path))
+        bulk = ParamsetDescriptionRegistry(storage=central.create_paramset_storage(), config_provider=central)
+        single = ParamsetDescriptionRegistry(storage=central.create_paramset_storage(), config_provider=central)
+
+        descriptions = {
+            "D1": {ParamsetKey.MASTER: {"NAME": {"TYPE": "STRING"}}},
+            "D1:1": {
+                ParamsetKey.VALUES: {"LEVEL": {"TYPE": "FLOAT", "MIN": 0.0, "MAX": 1.0, "OPERATIONS": 7}},
+                ParamsetKey.MASTER: {"NORM": {"TYPE": "INTEGER", "OPERATIONS": "3"}},
+            },
+            "D1:2": {ParamsetKey.VALUES: {"LEVEL": {"TYPE": "FLOAT"}}},
+            "D1:3": {},
+        }
+
+        bulk.add_device_paramsets(interface_id="if1", paramset_descriptions=descriptions, device_type="TEST")
+        for channel_address, paramsets in descriptions.items():
+            for paramset_key, paramset_description in paramsets.items():
+                single.add(
+                    interface_id="if1",
+                    channel_address=channel_address,
+                    paramset_key=paramset_key,
+                    paramset_description=paramset_description,
+                    device_type="TEST",
+                )
+
+        assert bulk.raw_paramset_descriptions == single.raw_paramset_descriptions
+        assert "D1:3" not in bulk.raw_paramset_descriptions["if1"]
+        assert bulk.get_channel_nos_for_parameter(channel_address="D1:1", parameter="LEVEL") == frozenset({1, 2})
+        assert bulk.is_in_multiple_channels(channel_address="D1:1", parameter="LEVEL") is True
+
     @pytest.mark.asyncio
     async def test_add_new_device_after_load(self, tmp_path) -> None:
         """
@@ -863,6 +905,78 @@ class TestParamsetDescriptionRegistry:
         assert await pdc2.load() in (DataOperationResult.LOAD_SUCCESS, DataOperationResult.NO_LOAD)
 
 
+class TestScheduleRegistry:
+    """Test ScheduleRegistry functionality."""
+
+    @pytest.mark.asyncio
+    async def test_firmware_change_invalidates_schedule(self, tmp_path) -> None:
+        """A schedule stored for another firmware is not returned."""
+        central = _CentralStub("C", str(tmp_path))
+        registry = ScheduleRegistry(storage=central.create_schedule_storage(), config_provider=central)
+
+        await registry.set_raw_schedule(device_address="D1", firmware="1.0", raw_schedule={"P1_ENDTIME_MONDAY_1": 360})
+
+        assert registry.get_raw_schedule(device_address="D1", firmware="1.0") == {"P1_ENDTIME_MONDAY_1": 360}
+        assert registry.get_raw_schedule(device_address="D1", firmware="1.1") is None
+        assert registry.get_raw_schedule(device_address="D2", firmware="1.0") is None
+
+    @pytest.mark.asyncio
+    async def test_load_drops_malformed_entries(self, tmp_path) -> None:
+        """Entries without firmware or schedule are dropped on load."""
+        central = _CentralStub("C", str(tmp_path))
+        storage = central.create_schedule_storage()
+        await storage.save(
+            data={
+                "D1": {"firmware": "1.0", "schedule": {"01_WP_LEVEL": 1.0}},
+                "D2": {"schedule": {"01_WP_LEVEL": 1.0}},
+                "D3": "invalid",
+            }
+        )
+        registry = ScheduleRegistry(storage=storage, config_provider=central)
+
+        assert await registry.load() == DataOperationResult.LOAD_SUCCESS
+        assert registry.size == 1
+        assert registry.get_raw_schedule(device_address="D1", firmware="1.0") == {"01_WP_LEVEL": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_remove_device(self, tmp_path) -> None:
+        """Removing a device drops its schedule."""
+        central = _CentralStub("C", str(tmp_path))
+        registry = ScheduleRegistry(storage=central.create_schedule_storage(), config_provider=central)
+        await registry.set_raw_schedule(device_address="D1", firmware="1.0", raw_schedule={"01_WP_LEVEL": 1.0})
+
+        registry.remove_device(device=_DeviceObj("D1"))
+
+        assert registry.size == 0
+        assert registry.get_raw_schedule(device_address="D1", firmware="1.0") is None
+
+    @pytest.mark.asyncio
+    async def test_returned_schedule_is_a_copy(self, tmp_path) -> None:
+        """Mutating a returned schedule does not change the stored one."""
+        central = _CentralStub("C", str(tmp_path))
+        registry = ScheduleRegistry(storage=central.create_schedule_storage(), config_provider=central)
+        await registry.set_raw_schedule(device_address="D1", firmware="1.0", raw_schedule={"01_WP_LEVEL": 1.0})
+
+        schedule = registry.get_raw_schedule(device_address="D1", firmware="1.0")
+        assert schedule is not None
+        schedule["01_WP_LEVEL"] = 0.0
+
+        assert registry.get_raw_schedule(device_address="D1", firmware="1.0") == {"01_WP_LEVEL": 1.0}
+
+    @pytest.mark.asyncio
+    async def test_save_and_load_roundtrip(self, tmp_path) -> None:
+        """Stored schedules survive a save/load cycle."""
+        central = _CentralStub("C", str(tmp_path))
+        registry = ScheduleRegistry(storage=central.create_schedule_storage(), config_provider=central)
+        raw_schedule = {"P1_ENDTIME_MONDAY_1": 360, "P1_TEMPERATURE_MONDAY_1": 18.0}
+        await registry.set_raw_schedule(device_address="D1", firmware="1.0", raw_schedule=raw_schedule)
+
+        assert await registry.save() == DataOperationResult.SAVE_SUCCESS
+        registry2 = ScheduleRegistry(storage=central.create_schedule_storage(), config_provider=central)
+        assert await registry2.load() == DataOperationResult.LOAD_SUCCESS
+        assert registry2.get_raw_schedule(device_address="D1", firmware="1.0") == raw_schedule
+
+
 class TestSessionRecorder:
     """Test SessionRecorder functionality."""
 
@@ -12,7 +12,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from aiohomematic.central.events import EventBus
-from aiohomematic.const import Parameter, ParamsetKey
+from aiohomematic.const import Parameter, ParamsetKey, TaskCategory
 from aiohomematic.store.visibility import ParameterVisibilityRegistry, check_ignore_parameters_is_clean
 
 
@@ -26,7 +26,7 @@ class _Cfg:
 class _NoOpTaskScheduler:
     """Task scheduler that does nothing - for sync tests without event loop."""
 
-    def create_task(self, *, target: Any, name: str) -> None:
+    def create_task(self, *, target: Any, name: str, category: TaskCategory = TaskCategory.DEFAULT) -> None:
         """Ignore task creation in sync tests."""
 
 